@@ -4,6 +4,10 @@ from PyInstaller.utils.hooks import collect_submodules
 import sys, os
 sys.path.append(os.path.abspath("."))
 
+# Static rule manifest: frozen apps read rule metadata from it instead of importing every rule module
+from parser.rule_manifest import write_rule_manifest
+write_rule_manifest()
+
 hidden_imports = (
     collect_submodules("parser.rules")
     + collect_submodules("typer")
@@ -22,6 +26,7 @@ a = Analysis(
     ("parser/rules/script", "parser/rules/script"),
     ("parser/rules/structure", "parser/rules/structure"),
     ("parser/pmd_script_grammar.lark", "parser"),
+    ("parser/rule_manifest.json", "parser"),
     ("assets/icons", "assets"),  # Application icon
     ("pyproject.toml", "."),     # Version metadata for __version__
     ],
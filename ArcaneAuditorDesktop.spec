@@ -5,6 +5,10 @@ import sys, os
 from pathlib import Path
 sys.path.append(os.path.abspath("."))
 
+# Static rule manifest: frozen apps read rule metadata from it instead of importing every rule module
+from parser.rule_manifest import write_rule_manifest
+write_rule_manifest()
+
 # ---------------------------------------------------------------------------
 # Hidden imports (modules PyInstaller must bundle explicitly)
 # ---------------------------------------------------------------------------
@@ -45,6 +49,9 @@ datas = [
 
         # --- Grammar for PMD parsing ---
         ("parser/pmd_script_grammar.lark", "parser"),
+
+        # --- Static rule manifest (generated above) ---
+        ("parser/rule_manifest.json", "parser"),
     ]
 
 # ---------------------------------------------------------------------------
@@ -4,6 +4,10 @@ from PyInstaller.utils.hooks import collect_submodules
 import sys, os
 sys.path.append(os.path.abspath("."))
 
+# Static rule manifest: frozen apps read rule metadata from it instead of importing every rule module
+from parser.rule_manifest import write_rule_manifest
+write_rule_manifest()
+
 hidden_imports = (
     collect_submodules("parser.rules")
     + collect_submodules("pydantic")
@@ -38,6 +42,9 @@ a = Analysis(
 
         # --- Grammar for PMD parsing ---
         ("parser/pmd_script_grammar.lark", "parser"),
+
+        # --- Static rule manifest (generated above) ---
+        ("parser/rule_manifest.json", "parser"),
     ],
     hiddenimports=hidden_imports,
     hookspath=[],
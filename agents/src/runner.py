@@ -105,7 +105,11 @@ def _build_cmd(scan_manifest: ScanManifest, config: AgentConfig) -> list[str]:
 
 
 def _parse_json_output(stdout: str, path: Path) -> dict:
-    """Extract and parse the JSON object from noisy stdout.
+    """Parse the JSON report from stdout.
+
+    With --quiet the auditor writes its progress events to stderr, so stdout is
+    the report alone and parses directly. Older auditor versions mixed progress
+    lines into stdout; for those the first JSON object is extracted from the text.
 
     Args:
         stdout: Raw stdout from the Arcane Auditor subprocess.
@@ -114,6 +118,30 @@ def _parse_json_output(stdout: str, path: Path) -> dict:
     Returns:
         The parsed JSON object as a dict.
 
+    Raises:
+        RunnerError: If no JSON is found or parsing fails.
+    """
+    try:
+        data = json.loads(stdout)
+    except json.JSONDecodeError:
+        data = _extract_json_object(stdout, path)
+
+    if not isinstance(data, dict):
+        raise RunnerError(f"Arcane Auditor JSON output is not an object for path '{path}'")
+
+    return data
+
+
+def _extract_json_object(stdout: str, path: Path) -> object:
+    """Decode the first JSON object embedded in noisy stdout.
+
+    Args:
+        stdout: Raw stdout from the Arcane Auditor subprocess.
+        path: The path being scanned, used for error messages.
+
+    Returns:
+        The decoded JSON value.
+
     Raises:
         RunnerError: If no JSON is found or parsing fails.
     """
@@ -132,9 +160,6 @@ def _parse_json_output(stdout: str, path: Path) -> dict:
             f"Failed to parse Arcane Auditor JSON output for path '{path}': {exc}"
         ) from exc
 
-    if not isinstance(data, dict):
-        raise RunnerError(f"Arcane Auditor JSON output is not an object for path '{path}'")
-
     return data
 
 
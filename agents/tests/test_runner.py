@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.models import AgentConfig, ExitCode, RunnerError, ScanManifest, ScanResult, Severity
-from src.runner import run_audit
+from src.runner import _parse_json_output, run_audit
 
 FIXTURES_DIR: Path = Path(__file__).parent / "fixtures"
 CLEAN_APP_FIXTURE: Path = FIXTURES_DIR / "clean_app"
@@ -158,3 +158,18 @@ class TestRunAuditInvalidPath:
             with pytest.raises(RunnerError) as exc_info:
                 run_audit(manifest, config)
             assert "usage: main.py [OPTIONS]" in str(exc_info.value)
+
+
+class TestParseJsonOutput:
+
+    def test_pure_json_stdout(self) -> None:
+        data = _parse_json_output('{"findings": [], "summary": {"total_findings": 0}}\n', CLEAN_APP_FIXTURE)
+        assert data["summary"]["total_findings"] == 0
+
+    def test_noisy_stdout_from_older_auditor(self) -> None:
+        stdout = 'Starting review for \'app\'...\nAnalysis complete.\n{"findings": []}\nDone {not json}\n'
+        assert _parse_json_output(stdout, CLEAN_APP_FIXTURE) == {"findings": []}
+
+    def test_non_object_raises_runner_error(self) -> None:
+        with pytest.raises(RunnerError, match="not an object"):
+            _parse_json_output("[1, 2]", CLEAN_APP_FIXTURE)
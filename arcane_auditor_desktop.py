@@ -251,6 +251,8 @@ def main():
         # Heavy imports happen here (after splash is visible)
         from utils.arcane_paths import is_frozen
         from web.server import app, load_web_config, ensure_sample_rule_config
+        from web.services.jobs import set_analysis_execution
+        from utils.events import configure_events, SINK_CONSOLE
         import uvicorn
         
         DEFAULT_HOST = "127.0.0.1"
@@ -272,6 +274,11 @@ def main():
         # Start server
         def run_server():
             ensure_sample_rule_config()
+            configure_events(SINK_CONSOLE, "warning")
+            try:
+                set_analysis_execution(cfg.get("execution") or {})
+            except ValueError as e:
+                print(f"Invalid execution settings in web config ({e}); using those of each analysis configuration.")
             print(f"Starting Arcane Auditor server on http://{host}:{port}")
             uvicorn_log_level = "critical" if is_frozen() else log_level
             uvicorn.run(app, host=host, port=port, log_level=uvicorn_log_level, access_log=False)
@@ -4,6 +4,7 @@ Context tracking for analysis to inform users about missing cross-file dependenc
 This module tracks which files were analyzed and which validation checks were skipped
 due to missing context files (AMD, SMD, etc.).
 """
+import threading
 from dataclasses import dataclass, field
 from typing import Set, List, Dict, Optional
 
@@ -16,6 +17,15 @@ class SkippedCheck:
     reason: str  # e.g., "Requires SMD file"
 
 
+@dataclass
+class RuleTimeout:
+    """Represents a rule that was cancelled after exceeding its time limit."""
+    rule_name: str
+    time_limit: float  # seconds
+    files_completed: int
+    files_total: int
+
+
 @dataclass
 class AnalysisContext:
     """
@@ -31,6 +41,16 @@ class AnalysisContext:
     # Track validation impact
     skipped_checks: List[SkippedCheck] = field(default_factory=list)
     
+    # Rules cancelled by their time limit (their findings cover files_completed files only)
+    timed_out_rules: List[RuleTimeout] = field(default_factory=list)
+    
+    # Rules the engine did not run because a file type they require was missing, from their
+    # declared REQUIRED_FILE_TYPES (None until an engine has checked them for this analysis)
+    unexecuted_rules: Optional[List[Dict[str, str]]] = None
+    
+    # Rules running on different threads register skips and timeouts concurrently
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    
     def register_skipped_check(self, rule_name: str, check_name: str, reason: str) -> None:
         """
         Register when a rule skips a check due to missing context.
@@ -40,7 +60,49 @@ class AnalysisContext:
             check_name: A descriptive name for the check that was skipped
             reason: Human-readable reason why the check was skipped
         """
-        self.skipped_checks.append(SkippedCheck(rule_name, check_name, reason))
+        skipped = SkippedCheck(rule_name, check_name, reason)
+        with self._lock:
+            # Low-memory analysis runs rules once per file, so the same skip can be reported repeatedly
+            if skipped not in self.skipped_checks:
+                self.skipped_checks.append(skipped)
+    
+    def register_rule_timeout(self, rule_name: str, time_limit: float, files_completed: int, files_total: int) -> None:
+        """
+        Register a rule that exceeded its time limit and was cancelled.
+        
+        Args:
+            rule_name: The class name of the rule
+            time_limit: The time limit it exceeded, in seconds
+            files_completed: Files the rule finished before it was cancelled
+            files_total: Files the rule would have analyzed
+        """
+        timeout = RuleTimeout(rule_name, time_limit, files_completed, files_total)
+        with self._lock:
+            # Low-memory analysis runs rules once per file, so keep one entry per rule
+            for index, existing in enumerate(self.timed_out_rules):
+                if existing.rule_name == rule_name:
+                    self.timed_out_rules[index] = RuleTimeout(
+                        rule_name, time_limit,
+                        existing.files_completed + files_completed, existing.files_total + files_total)
+                    return
+            self.timed_out_rules.append(timeout)
+    
+    def register_rules_not_executed(self, rules: Dict[str, str]) -> None:
+        """
+        Register the rules the engine skipped for missing file types.
+        
+        Args:
+            rules: Maps rule class names to the reason (e.g. "Requires SMD file"); empty
+                   when every rule could run
+        """
+        with self._lock:
+            if self.unexecuted_rules is None:
+                self.unexecuted_rules = []
+            for rule_name, reason in rules.items():
+                entry = {"rule": rule_name, "reason": reason}
+                # An analysis can run the engine more than once (e.g. process pool fallback)
+                if entry not in self.unexecuted_rules:
+                    self.unexecuted_rules.append(entry)
     
     @property
     def files_missing(self) -> Set[str]:
@@ -73,10 +135,15 @@ class AnalysisContext:
         
         This identifies rules that are file-type specific and couldn't run because
         those file types weren't provided (e.g., AMD-only rules when no AMD file).
+        Once an engine has run, these are the rules it skipped for their declared
+        REQUIRED_FILE_TYPES; before that, they are inferred from the files present.
         
         Returns:
             List of dicts with 'rule' and 'reason' keys
         """
+        if self.unexecuted_rules is not None:
+            return list(self.unexecuted_rules)
+        
         not_executed = []
         
         # AMD-specific rules
@@ -140,6 +207,15 @@ class AnalysisContext:
                         "reason": details["reason"]
                     }
                     for rule_name, details in self.rules_partially_executed.items()
+                ],
+                "rules_timed_out": [
+                    {
+                        "rule": timeout.rule_name,
+                        "time_limit": timeout.time_limit,
+                        "files_completed": timeout.files_completed,
+                        "files_total": timeout.files_total
+                    }
+                    for timeout in self.timed_out_rules
                 ]
             }
         }
@@ -3,16 +3,18 @@ Core file processing functionality for Workday Extend source files.
 """
 
 import zipfile
-import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tempfile
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 
 from .config import FileProcessorConfig, DEFAULT_RELEVANT_EXTENSIONS
 from .models import SourceFile
+from utils.concurrency import AUTO, SERIAL, plan_execution
+from utils.events import get_logger
 
-# Configure logging
-logger = logging.getLogger(__name__)
+# Routed to the event sink the entry point configures (see utils.events)
+logger = get_logger(__name__)
 
 class FileProcessingError(Exception):
     """Custom exception for file processing errors."""
@@ -29,6 +31,7 @@ class FileReadError(FileProcessingError):
 # Configuration constants (fallback values)
 DEFAULT_MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
 DEFAULT_MAX_ZIP_SIZE = 500 * 1024 * 1024  # 500MB
+DEFAULT_READ_BYTES_PER_WORKER = 1024 * 1024  # 1MB of files per reading thread
 
 class FileProcessor:
     """Handles file processing operations with practical resource management."""
@@ -39,8 +42,21 @@ class FileProcessor:
         max_file_size: int = DEFAULT_MAX_FILE_SIZE,
         max_zip_size: int = DEFAULT_MAX_ZIP_SIZE,
         relevant_extensions: Optional[Set[str]] = None,
-        encoding: str = "utf-8"
+        encoding: str = "utf-8",
+        executor: str = AUTO,
+        workers: int = 0,
+        bytes_per_worker: int = DEFAULT_READ_BYTES_PER_WORKER
     ):
+        """
+        Args:
+            executor: How source files are read: auto (serially or on threads, chosen
+                      from the total size of the files), serial or thread
+            workers: Reading threads (0 = derived from the input size, -1 = one per CPU)
+            bytes_per_worker: Input each automatically sized thread is given
+        """
+        self.executor = executor
+        self.workers = workers
+        self.bytes_per_worker = bytes_per_worker
         if config:
             self.config = config
             self.max_file_size = config.max_file_size
@@ -129,6 +145,48 @@ class FileProcessor:
         logger.warning(f"Failed to read {file_path.name} with any encoding")
         return None
     
+    def _read_source_file(self, file_path: Path) -> Optional[SourceFile]:
+        """Read a file into a SourceFile, or None if it cannot be read."""
+        content = self._read_file_safely(file_path)
+        if content is None:
+            return None
+        try:
+            return SourceFile(
+                path=file_path,
+                content=content,
+                size=len(content.encode(self.encoding))
+            )
+        except ValueError as e:
+            logger.warning(f"Invalid source file data for {file_path.name}: {e}")
+            return None
+    
+    def _read_source_files(self, candidates: List[Tuple[str, Path]]) -> Dict[str, SourceFile]:
+        """
+        Read the candidate files, serially or on a thread pool (see self.executor).
+        
+        Args:
+            candidates: (key, path) pairs; the result keeps their order
+            
+        Returns:
+            Dictionary mapping keys to the SourceFile objects that could be read
+        """
+        input_bytes = 0
+        for _, file_path in candidates:
+            try:
+                input_bytes += file_path.stat().st_size
+            except OSError:
+                pass
+        plan = plan_execution(self.executor, self.workers, len(candidates), input_bytes, self.bytes_per_worker, 8)
+        paths = [file_path for _, file_path in candidates]
+        if plan.executor == SERIAL:
+            source_files = map(self._read_source_file, paths)
+        else:
+            logger.debug(f"Reading {len(paths)} files on {plan.workers} threads")
+            with ThreadPoolExecutor(max_workers=plan.workers) as executor:
+                source_files = list(executor.map(self._read_source_file, paths))
+        return {key: source_file for (key, _), source_file in zip(candidates, source_files)
+                if source_file is not None}
+    
     def process_zip_file(self, zip_path: Path) -> Dict[str, SourceFile]:
         """
         Extracts a zip file to a temporary directory and discovers all
@@ -154,8 +212,6 @@ class FileProcessor:
         # Validate zip file
         self._validate_zip_file(zip_path)
         
-        source_files = {}
-        
         # Using a temporary directory is a best practice. It's automatically
         # cleaned up when the 'with' block is exited, even if errors occur.
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -176,6 +232,7 @@ class FileProcessor:
             logger.info("Searching for relevant source files...")
             
             # Path.rglob('*') is a powerful way to recursively search a directory.
+            candidates = []
             for file_path in temp_path.rglob('*'):
                 # Skip macOS metadata artifacts (__MACOSX/ dirs, ._ resource forks)
                 relative = file_path.relative_to(temp_path)
@@ -186,22 +243,11 @@ class FileProcessor:
                 # Check if the file has one of our target extensions.
                 if file_path.is_file() and file_path.suffix in self.relevant_extensions:
                     logger.debug(f"Found relevant file: {file_path.name}")
-                    
-                    # Read the file content safely
-                    content = self._read_file_safely(file_path)
-                    if content is not None:
-                        # We use a relative path as the key to keep it clean.
-                        relative_path_str = str(file_path.relative_to(temp_path))
-                        
-                        try:
-                            source_file = SourceFile(
-                                path=file_path,
-                                content=content,
-                                size=len(content.encode(self.encoding))
-                            )
-                            source_files[relative_path_str] = source_file
-                        except ValueError as e:
-                            logger.warning(f"Invalid source file data for {file_path.name}: {e}")
+                    # We use a relative path as the key to keep it clean.
+                    candidates.append((str(relative), file_path))
+            
+            # Read the file contents safely
+            source_files = self._read_source_files(candidates)
 
             found_count = len(source_files)
             logger.info(f"Found {found_count} source file(s) to analyze")
@@ -224,7 +270,7 @@ class FileProcessor:
         Raises:
             FileProcessingError: If file processing fails
         """
-        source_files = {}
+        candidates = []
         
         for file_path in file_paths:
             # Validate file exists
@@ -241,20 +287,13 @@ class FileProcessor:
                 logger.warning(f"File {file_path.name} has unsupported extension {file_path.suffix}, skipping")
                 continue
             
-            # Read the file content safely
-            content = self._read_file_safely(file_path)
-            if content is not None:
-                try:
-                    source_file = SourceFile(
-                        path=file_path,
-                        content=content,
-                        size=len(content.encode(self.encoding))
-                    )
-                    # Use just the filename as the key for individual files
-                    source_files[file_path.name] = source_file
-                    logger.info(f"Successfully processed: {file_path.name}")
-                except ValueError as e:
-                    logger.warning(f"Invalid source file data for {file_path.name}: {e}")
+            # Use just the filename as the key for individual files
+            candidates.append((file_path.name, file_path))
+        
+        # Read the file contents safely
+        source_files = self._read_source_files(candidates)
+        for key in source_files:
+            logger.info(f"Successfully processed: {key}")
         
         logger.info(f"Processed {len(source_files)} file(s)")
         return source_files
@@ -278,10 +317,10 @@ class FileProcessor:
         if not dir_path.is_dir():
             raise FileProcessingError(f"Path is not a directory: {dir_path}")
         
-        source_files = {}
         logger.info(f"Scanning directory: {dir_path}")
         
         # Recursively find all relevant files
+        candidates = []
         for file_path in dir_path.rglob('*'):
             # Skip macOS metadata artifacts (__MACOSX/ dirs, ._ resource forks)
             relative = file_path.relative_to(dir_path)
@@ -291,22 +330,11 @@ class FileProcessor:
                 continue
             if file_path.is_file() and file_path.suffix in self.relevant_extensions:
                 logger.debug(f"Found relevant file: {file_path.name}")
-                
-                # Read the file content safely
-                content = self._read_file_safely(file_path)
-                if content is not None:
-                    # Use relative path from the base directory
-                    relative_path_str = str(file_path.relative_to(dir_path))
-                    
-                    try:
-                        source_file = SourceFile(
-                            path=file_path,
-                            content=content,
-                            size=len(content.encode(self.encoding))
-                        )
-                        source_files[relative_path_str] = source_file
-                    except ValueError as e:
-                        logger.warning(f"Invalid source file data for {file_path.name}: {e}")
+                # Use relative path from the base directory
+                candidates.append((str(relative), file_path))
+        
+        # Read the file contents safely
+        source_files = self._read_source_files(candidates)
         
         found_count = len(source_files)
         logger.info(f"Found {found_count} source file(s) in directory")
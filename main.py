@@ -1,15 +1,21 @@
 import typer
 import time
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 from file_processing import FileProcessor
 from parser.rules_engine import RulesEngine
 from parser.app_parser import ModelParser
-from parser.config import ArcaneAuditorConfig
+from parser.models import ModelLoadError
+from parser.config import ArcaneAuditorConfig, ExecutionConfig
 from parser.config_manager import load_configuration, get_config_manager
 from output.formatter import OutputFormatter, OutputFormat
 from utils.arcane_paths import ensure_sample_rule_config
+from utils.concurrency import PROCESS
+from utils.events import SINK_CONSOLE, SINK_JSONL, SINK_QUIET, SINKS, configure_events, get_logger
 from __version__ import __version__
 
+log = get_logger("cli")
+
 app = typer.Typer(add_completion=False, help="Arcane Auditor CLI: A mystical code review tool for Workday Extend applications - part of Developers and Dragons")
 
 @app.callback(invoke_without_command=True)
@@ -25,6 +31,32 @@ def main_callback(
 # Ensure sample rule config is seeded
 ensure_sample_rule_config()
 
+def _execution_overrides(executors: Optional[List[str]], jobs: Optional[List[str]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-stage execution settings from --executor and --jobs values ("[stage=]value").
+    
+    A value without a stage applies to every stage, except process, which only rule
+    execution supports.
+    """
+    overrides: Dict[str, Dict[str, Any]] = {}
+    for option, setting, values in (("--executor", "executor", executors), ("--jobs", "workers", jobs)):
+        for value in values or []:
+            stage, _, stage_value = value.rpartition("=")
+            if setting == "workers":
+                try:
+                    stage_value = int(stage_value)
+                except ValueError:
+                    raise ValueError(f"{option} expects a number of workers, got '{value}'")
+            if stage:
+                stages = [stage]
+            elif stage_value == PROCESS:
+                stages = ["rules"]
+            else:
+                stages = list(ExecutionConfig.model_fields)
+            for stage in stages:
+                overrides.setdefault(stage, {})[setting] = stage_value
+    return overrides
+
 # Review app command
 @app.command()
 def review_app(
@@ -35,8 +67,21 @@ def review_app(
     output_file: Path = typer.Option(None, "--output", "-o", help="Output file path (optional)"),
     show_timing: bool = typer.Option(False, "--timing", "-t", help="Show detailed timing information"),
     fail_on_advice: bool = typer.Option(False, "--fail-on-advice", help="Exit with error code when ADVICE issues are found (CI mode)"),
+    fail_fast: bool = typer.Option(False, "--fail-fast", help="Run ACTION rules first and stop at the first failing issue, reporting only that issue (CI mode)"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output mode (CI-friendly)"),
-    single_tab: bool = typer.Option(False, "--single-tab", help="Export all findings to a single Excel tab with File column (Excel format only)")
+    single_tab: bool = typer.Option(False, "--single-tab", help="Export all findings to a single Excel tab with File column (Excel format only)"),
+    low_memory: bool = typer.Option(False, "--low-memory", help="Parse and analyze one file at a time to bound peak memory on large applications"),
+    executor: list[str] = typer.Option(None, "--executor", help="How stages run: auto, serial, thread, or process (rules only); prefix a stage (ingestion=, parsing=, rules=) to set one stage"),
+    jobs: list[str] = typer.Option(None, "--jobs", "-j", help="Worker threads or processes (0 = from the input size, -1 = one per CPU); prefix a stage (e.g. rules=4) to set one stage"),
+    rule_time_limit: float = typer.Option(None, "--rule-time-limit", help="Seconds each rule may run before it is cancelled and reported as timed out (0 = no limit)"),
+    profile_rules: bool = typer.Option(False, "--profile-rules", help="Profile each rule's wall/CPU time, files visited, ASTs consumed and findings, with the slowest (rule, file) pairs"),
+    profile_output: Path = typer.Option(Path("rule_profile.json"), "--profile-output", help="JSON file for the --profile-rules report"),
+    cache: bool = typer.Option(False, "--cache", help="Reuse findings of unchanged files from previous runs (files answered from the cache are not parsed)"),
+    cache_path: Path = typer.Option(None, "--cache-path", help="Findings cache file for --cache (default: in the per-user cache directory)"),
+    cost_profile: bool = typer.Option(False, "--cost-profile", help="Keep measured rule costs between runs to schedule the most expensive rules first (default: cost_profile from the configuration, off)"),
+    no_cost_profile: bool = typer.Option(False, "--no-cost-profile", help="Keep no rule costs between runs, even if the configuration enables cost_profile"),
+    log_format: str = typer.Option(SINK_CONSOLE, "--log-format", help="Progress and diagnostics on stderr: console, jsonl (one JSON object per event) or quiet (errors only)"),
+    log_level: str = typer.Option("info", "--log-level", help="Lowest level of progress and diagnostics shown: debug, info, warning, error")
 ):
     """
     Analyze a Workday Extend application.
@@ -51,12 +96,37 @@ def review_app(
     - 1: Code Quality Issues - ACTION issues found, or ADVICE with --fail-on-advice
     - 2: Usage Error - Invalid config, bad file path, no files found, invalid format
     - 3: Runtime Error - Parsing failed, analysis crashed, unexpected errors
+    
+    With --fail-fast only the rules that can fail the run execute (ACTION, then ADVICE
+    with --fail-on-advice) and analysis stops at the first such issue, so exit code 1
+    comes with a report of that issue alone.
+    
+    With --cache the findings of each (rule, file) pair are stored between runs and
+    reused while the rule, its settings and the files it reads are unchanged, so
+    re-running after a small change only analyzes the changed files.
+    
+    --executor and --jobs choose serial, thread or process execution and the worker
+    count for reading files (ingestion), parsing and rules, for every stage or, with a
+    stage= prefix, for one; both can be repeated. By default each stage runs serially
+    or on threads depending on the size of its input.
+    
+    Rules are scheduled most expensive first, from static estimates or, with
+    --cost-profile (or cost_profile in the configuration), from the costs measured in
+    previous runs and kept in the per-user cache directory.
+    
+    Progress and diagnostics go to stderr (see --log-format), so stdout carries only
+    the report; --quiet keeps errors only unless --log-format jsonl is requested.
     """
     # Start overall timing
     overall_start_time = time.time()
     
-    if not quiet:
-        typer.echo(f"Starting review for '{path.name}'...")
+    try:
+        configure_events(SINK_QUIET if quiet and log_format != SINK_JSONL else log_format, log_level)
+    except ValueError as e:
+        typer.secho(f"Usage Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(2)  # Exit code 2 for usage errors
+    
+    log.info("Starting review for '%s'...", path.name)
     
     # Load configuration using the layered configuration system
     config_start_time = time.time()
@@ -81,46 +151,64 @@ def review_app(
         else:
             config_display_name = "Built-in defaults"
         
-        if not quiet:
-            if source_info["type"] == "custom_file":
-                typer.echo(f"Using Custom ({source_info['name']}) configuration from {source_info['path']}")
-            else:
-                typer.echo(f"Using {config_display_name} configuration")
+        if source_info["type"] == "custom_file":
+            log.info("Using Custom (%s) configuration from %s", source_info['name'], source_info['path'])
+        else:
+            log.info("Using %s configuration", config_display_name)
     except Exception as e:
         typer.secho(f"Configuration Error: {e}", fg=typer.colors.RED)
         typer.echo("Try using --config with a valid configuration file, or run without --config for defaults")
         raise typer.Exit(2)  # Exit code 2 for usage errors
     
+    if rule_time_limit is not None:
+        config.rule_time_limit = rule_time_limit
+    if profile_rules:
+        config.profile_rules = True
+    if cache or cache_path is not None:
+        config.findings_cache = True
+    if cache_path is not None:
+        config.findings_cache_path = str(cache_path)
+    # Either flag overrides the configuration's cost_profile; without one it applies as is
+    if cost_profile or no_cost_profile:
+        config.cost_profile = not no_cost_profile
+    try:
+        config.execution = config.execution.with_overrides(_execution_overrides(executor, jobs))
+    except ValueError as e:
+        typer.secho(f"Usage Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(2)  # Exit code 2 for usage errors
+    
     config_time = time.time() - config_start_time
     if show_timing and not quiet:
         typer.echo(f"Configuration loading: {config_time:.2f}s")
     
     # Detect input type and process accordingly
     file_processing_start_time = time.time()
-    processor = FileProcessor()
+    ingestion = config.execution.ingestion
+    processor = FileProcessor(executor=ingestion.executor, workers=ingestion.workers,
+                              bytes_per_worker=ingestion.bytes_per_worker)
     
     try:
         if path.suffix == '.zip':
             # ZIP file mode
-            typer.echo("Processing ZIP archive...")
+            log.info("Processing ZIP archive...")
             source_files_map = processor.process_zip_file(path)
         elif path.is_dir():
             # Directory mode
-            typer.echo(f"Scanning directory: {path}")
+            log.info("Scanning directory: %s", path)
             source_files_map = processor.process_directory(path)
         else:
             # Individual file(s) mode
             files_to_process = [path]
             if additional_files:
                 files_to_process.extend(additional_files)
-            typer.echo(f"Processing {len(files_to_process)} individual file(s)...")
+            log.info("Processing %d individual file(s)...", len(files_to_process))
             source_files_map = processor.process_individual_files(files_to_process)
     except Exception as e:
         typer.secho(f"File Processing Error: {e}", fg=typer.colors.RED)
         raise typer.Exit(2)  # Exit code 2 for usage errors
     
     file_processing_time = time.time() - file_processing_start_time
-    typer.echo(f"Found {len(source_files_map)} relevant files to analyze")
+    log.info("Found %d relevant files to analyze", len(source_files_map))
     if show_timing:
         typer.echo(f"File processing: {file_processing_time:.2f}s")
 
@@ -134,72 +222,105 @@ def review_app(
     # asts = parse_all_files(source_files_map)
     # ... and so on.
     
-    typer.echo("\nPipeline Input:")
-    for path_key, source_file in source_files_map.items():
-        typer.echo(f"  - Ready to parse: {path_key}")
+    for path_key in source_files_map:
+        log.debug("  - Ready to parse: %s", path_key)
 
     # --- Parse Files into App File Models ---
-    typer.echo("Parsing files into App File models...")
-    parsing_start_time = time.time()
-    try:
-        pmd_parser = ModelParser()
-        context = pmd_parser.parse_files(source_files_map)
-        parsing_time = time.time() - parsing_start_time
+    low_memory = low_memory or config.low_memory_mode
+    if fail_fast and low_memory:
+        # Fail-fast parses lazily, so only the file types the failing rules read are parsed
+        log.info("Fail-fast mode: ignoring low-memory mode")
+        low_memory = False
+    parsing_time = 0.0
+    if low_memory:
+        # Files are parsed inside the analysis loop, one at a time
+        log.info("Low-memory mode: files will be parsed and analyzed one at a time")
+    else:
+        log.info("Parsing files into App File models...")
+        parsing_start_time = time.time()
+        try:
+            # Each file type is parsed when a rule first reads it, so types that no
+            # enabled rule touches are never parsed
+            pmd_parser = ModelParser(config.execution.parsing)
+            context = pmd_parser.parse_files(source_files_map, lazy=True)
+            parsing_time = time.time() - parsing_start_time
         
-        # Better summary of what was parsed
-        parsed_summary = []
-        if context.pmds: parsed_summary.append(f"{len(context.pmds)} PMD files")
-        if context.scripts: parsed_summary.append(f"{len(context.scripts)} script files")
-        if context.pods: parsed_summary.append(f"{len(context.pods)} Pod files")
-        if context.smd: parsed_summary.append("SMD file")
-        if context.amd: parsed_summary.append("AMD file")
+            # Summary of what will be parsed on demand
+            extensions = [Path(p).suffix.lower() for p in source_files_map]
+            parsed_summary = []
+            if '.pmd' in extensions: parsed_summary.append(f"{extensions.count('.pmd')} PMD files")
+            if '.script' in extensions: parsed_summary.append(f"{extensions.count('.script')} script files")
+            if '.pod' in extensions: parsed_summary.append(f"{extensions.count('.pod')} Pod files")
+            if '.smd' in extensions: parsed_summary.append("SMD file")
+            if '.amd' in extensions: parsed_summary.append("AMD file")
         
-        if parsed_summary:
-            typer.echo(f"Parsed: {', '.join(parsed_summary)}")
-        else:
-            typer.echo("No files were successfully parsed")
+            if parsed_summary:
+                log.info("Parsing on first use: %s", ', '.join(parsed_summary))
+            else:
+                log.info("No files to parse")
         
-        if show_timing:
-            typer.echo(f"File parsing: {parsing_time:.2f}s")
+            if show_timing:
+                typer.echo(f"File parsing setup: {parsing_time:.2f}s (files are parsed on first use, timed below)")
         
-    except Exception as e:
-        typer.secho(f"Parsing Error: {e}", fg=typer.colors.RED)
-        typer.echo("Check that your files are valid Workday Extend format")
-        raise typer.Exit(3)  # Exit code 3 for runtime errors
+        except Exception as e:
+            typer.secho(f"Parsing Error: {e}", fg=typer.colors.RED)
+            typer.echo("Check that your files are valid Workday Extend format")
+            raise typer.Exit(3)  # Exit code 3 for runtime errors
 
     # --- Run Rules Analysis ---
-    typer.echo("Initializing rules engine...")
+    log.info("Initializing rules engine...")
     findings = []  # Initialize findings before try block
     try:
         rules_init_start_time = time.time()
         rules_engine = RulesEngine(config)
         rules_init_time = time.time() - rules_init_start_time
-        typer.echo(f"Loaded {len(rules_engine.rules)} validation rules")
+        log.info("Loaded %d validation rules", len(rules_engine.rules))
         if show_timing:
             typer.echo(f"Rules engine initialization: {rules_init_time:.2f}s")
         
-        typer.echo("Invoking analysis...")
+        log.info("Invoking analysis...")
         analysis_start_time = time.time()
-        findings = rules_engine.run(context)
-        analysis_time = time.time() - analysis_start_time
+        if fail_fast:
+            fail_severities = ("ACTION", "ADVICE") if fail_on_advice else ("ACTION",)
+            findings = rules_engine.run_fail_fast(context, fail_severities)
+        elif low_memory:
+            findings, context = rules_engine.run_file_major(source_files_map)
+        else:
+            findings = rules_engine.run(context)
+        # Files are parsed while the analysis runs; report that time as parsing
+        parsing_time += context.parse_time
+        analysis_time = max(0.0, time.time() - analysis_start_time - context.parse_time)
         
-        if findings:
-            typer.echo(f"Analysis complete. Found {len(findings)} issue(s).")
+        if fail_fast and findings:
+            # The verdict, not progress: shown even with --quiet, on stderr to keep the report on stdout clean
+            typer.echo("Fail-fast: analysis stopped at the first failing issue; remaining rules and files were not analyzed.",
+                       err=True)
+        elif fail_fast:
+            typer.echo(f"Fail-fast: no {' or '.join(fail_severities)} issues found.", err=True)
+        elif findings:
+            log.info("Analysis complete. Found %d issue(s).", len(findings))
         else:
-            typer.echo("Analysis complete. No issues found!")
+            log.info("Analysis complete. No issues found!")
         
         if show_timing:
+            typer.echo(f"File parsing (on first use): {context.parse_time:.2f}s")
             typer.echo(f"Analysis execution: {analysis_time:.2f}s")
         
+        if rules_engine.profiler is not None:
+            # stderr, so a report written to stdout (e.g. --format json) stays parseable
+            typer.echo("\n" + rules_engine.profiler.format_table(), err=True)
+            rules_engine.profiler.write_json(str(profile_output))
+            log.info("Rule profile written to: %s", profile_output)
+        
         # Auto-detect format based on output file extension if not explicitly specified
         if output_file and output_format == "console":  # Default format
             file_ext = output_file.suffix.lower()
             if file_ext == '.xlsx':
                 output_format = "excel"
-                typer.echo("Auto-detected Excel format based on .xlsx extension")
+                log.info("Auto-detected Excel format based on .xlsx extension")
             elif file_ext == '.json':
                 output_format = "json" 
-                typer.echo("Auto-detected JSON format based on .json extension")
+                log.info("Auto-detected JSON format based on .json extension")
         
         # Format output based on selected format
         try:
@@ -216,14 +337,21 @@ def review_app(
         
         formatting_start_time = time.time()
         formatter = OutputFormatter(format_type)
-        total_files = len(context.pmds) + len(context.scripts) + (1 if context.amd else 0)
+        # Files that failed to parse, or that no rule read (lazy parsing, fail-fast), are not counted
+        total_files = len([p for p in context.parsed_files() if p.lower().endswith(('.pmd', '.script', '.amd'))])
         total_rules = len(rules_engine.rules)
+        skipped_severities = None
+        if fail_fast:
+            # Only the rules of the severities fail-fast reached ran; say which were skipped
+            total_rules = rules_engine.fail_fast_rules_run
+            skipped_severities = rules_engine.fail_fast_skipped_severities
         
         # Pass single_tab parameter only for Excel format
         if format_type == OutputFormat.EXCEL:
             formatted_output = formatter.format_results(findings, total_files, total_rules, context, None, None, single_tab)
         else:
-            formatted_output = formatter.format_results(findings, total_files, total_rules, context)
+            formatted_output = formatter.format_results(findings, total_files, total_rules, context,
+                                                        skipped_severities=skipped_severities)
         formatting_time = time.time() - formatting_start_time
         
         if show_timing:
@@ -236,20 +364,25 @@ def review_app(
                 import shutil
                 try:
                     shutil.move(formatted_output, str(output_file))
-                    typer.echo(f"Excel file written to: {output_file}")
+                    log.info("Excel file written to: %s", output_file)
                 except Exception as e:
                     typer.secho(f"Error moving Excel file: {e}", fg=typer.colors.RED)
                     typer.echo(f"Excel file created at: {formatted_output}")
             else:
                 with open(output_file, 'w', encoding='utf-8') as f:
                     f.write(formatted_output)
-                typer.echo(f"Results written to: {output_file}")
+                log.info("Results written to: %s", output_file)
         else:
             if format_type == OutputFormat.EXCEL:
                 typer.echo(f"Excel file created at: {formatted_output}")
             else:
                 typer.echo(formatted_output)
                 
+    except ModelLoadError as e:
+        # Deferred files are parsed during the analysis; report their failure as before
+        typer.secho(f"Parsing Error: {e}", fg=typer.colors.RED)
+        typer.echo("Check that your files are valid Workday Extend format")
+        raise typer.Exit(3)  # Exit code 3 for runtime errors
     except Exception as e:
         typer.secho(f"Analysis Error: {e}", fg=typer.colors.RED)
         typer.echo("This might be due to unsupported syntax or corrupted files")
@@ -297,15 +430,19 @@ def review_app(
         # Bottleneck identification
         if analysis_pct > 70:
             typer.echo("  Analysis execution is the primary bottleneck")
-            typer.echo("  Consider disabling CPU-intensive rules for faster analysis")
+            if rules_engine.profiler is not None:
+                slowest_rules = [rule["rule"] for rule in rules_engine.profiler.rule_totals()[:3]]
+                typer.echo(f"  Slowest rules: {', '.join(slowest_rules)}")
+            else:
+                typer.echo("  Use --profile-rules to find the CPU-intensive rules")
         elif parsing_pct > 30:
             typer.echo("  File parsing is a significant bottleneck")
             typer.echo("  Consider reducing parallel workers or file size limits")
         
         typer.echo("="*60)
     else:
-        typer.echo(f"\nTotal analysis time: {total_time:.2f}s")
-        typer.echo("Use --timing flag for detailed performance breakdown")
+        log.info("Total analysis time: %.2fs", total_time)
+        log.info("Use --timing flag for detailed performance breakdown")
     
     # Set appropriate exit code based on findings (outside try block)
     if findings:
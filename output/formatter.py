@@ -45,19 +45,32 @@ class OutputFormatter:
     
     def format_results(self, findings: List[Finding], total_files: int = 0, total_rules: int = 0, 
                       context: Optional['ProjectContext'] = None, config_name: Optional[str] = None,
-                      config_source: Optional[str] = None, single_tab: bool = False) -> str:
-        """Format analysis results based on the selected format."""
+                      config_source: Optional[str] = None, single_tab: bool = False,
+                      skipped_severities: Optional[List[str]] = None) -> str:
+        """
+        Format analysis results based on the selected format.
+        
+        skipped_severities lists the severities whose rules never ran (--fail-fast), so
+        an empty result is not reported as a clean bill of health.
+        """
+        skipped_severities = skipped_severities or []
         if self.format_type == OutputFormat.JSON:
-            return self._format_json(findings, total_files, total_rules, context)
+            return self._format_json(findings, total_files, total_rules, context, skipped_severities)
         elif self.format_type == OutputFormat.SUMMARY:
-            return self._format_summary(findings, total_files, total_rules)
+            return self._format_summary(findings, total_files, total_rules, skipped_severities)
         elif self.format_type == OutputFormat.EXCEL:
             return self._format_excel(findings, total_files, total_rules, context, config_name, config_source, single_tab)
         else:
-            return self._format_console(findings, total_files, total_rules, context)
+            return self._format_console(findings, total_files, total_rules, context, skipped_severities)
+    
+    @staticmethod
+    def _skipped_note(skipped_severities: List[str]) -> str:
+        """Describe the severities whose rules were skipped, e.g. "ADVICE rules were skipped (--fail-fast)"."""
+        return f"{' and '.join(skipped_severities)} rules were skipped (--fail-fast)"
     
     def _format_console(self, findings: List[Finding], total_files: int, total_rules: int,
-                        context: Optional['ProjectContext'] = None) -> str:
+                        context: Optional['ProjectContext'] = None,
+                        skipped_severities: Optional[List[str]] = None) -> str:
         """Format results for console output with emojis and better formatting."""
         output = []
         
@@ -77,9 +90,14 @@ class OutputFormatter:
             output.append(f"📊 **Analysis Summary:**")
             output.append(f"   📁 Files analyzed: {total_files}")
             output.append(f"   🔍 Rules executed: {total_rules}")
+            if skipped_severities:
+                output.append(f"   ⏭️  {self._skipped_note(skipped_severities)}")
             output.append(f"   ⚠️  Issues found: {len(findings)}")
             output.append("")
         
+        if not findings and skipped_severities:
+            output.append(f"✅ **No issues found by the rules that ran.** {self._skipped_note(skipped_severities)}.")
+            return "\n".join(output)
         if not findings:
             output.append("✅ **No issues found!** Your code looks great!")
             return "\n".join(output)
@@ -120,7 +138,8 @@ class OutputFormatter:
         
         return "\n".join(output)
     
-    def _format_summary(self, findings: List[Finding], total_files: int, total_rules: int) -> str:
+    def _format_summary(self, findings: List[Finding], total_files: int, total_rules: int,
+                        skipped_severities: Optional[List[str]] = None) -> str:
         """Format a concise summary of results."""
         output = []
         
@@ -128,6 +147,8 @@ class OutputFormatter:
         action_count = len([f for f in findings if f.severity == "ACTION"])
         advice_count = len([f for f in findings if f.severity == "ADVICE"])
         
+        if not findings and skipped_severities:
+            return f"✅ No issues found by the rules that ran; {self._skipped_note(skipped_severities)}."
         if not findings:
             return "✅ No issues found!"
         
@@ -145,7 +166,8 @@ class OutputFormatter:
         return "\n".join(output)
     
     def _format_json(self, findings: List[Finding], total_files: int, total_rules: int,
-                    context: Optional['ProjectContext'] = None) -> str:
+                    context: Optional['ProjectContext'] = None,
+                    skipped_severities: Optional[List[str]] = None) -> str:
         """Format results as JSON."""
         result = {
             "summary": {
@@ -169,6 +191,9 @@ class OutputFormatter:
             ]
         }
         
+        if skipped_severities:
+            result["summary"]["skipped_severities"] = list(skipped_severities)
+        
         # Add context information if available
         if context and context.analysis_context:
             result["context"] = context.analysis_context.to_dict()
@@ -249,6 +274,13 @@ class OutputFormatter:
             
             lines.append("   💡 Provide AMD/SMD files for complete cross-file validation")
         
+        if analysis_context.timed_out_rules:
+            lines.append("")
+            lines.append(f"⏱️  Rules Timed Out ({len(analysis_context.timed_out_rules)}):")
+            for timeout in analysis_context.timed_out_rules:
+                lines.append(f"   • {timeout.rule_name} - exceeded {timeout.time_limit:g}s limit, "
+                             f"{timeout.files_completed} of {timeout.files_total} file(s) analyzed")
+        
         lines.append("━" * 60)
         
         return "\n".join(lines)
@@ -357,6 +389,23 @@ class OutputFormatter:
             
             context_sheet.append([])
         
+        # Rules Timed Out
+        if analysis_context.timed_out_rules:
+            context_sheet.append([f"Rules Timed Out ({len(analysis_context.timed_out_rules)})"])
+            context_sheet[f'A{context_sheet.max_row}'].font = Font(bold=True)
+            context_sheet.append(["Rule", "Time Limit (s)", "Files Analyzed"])
+            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            header_font = Font(color="FFFFFF", bold=True)
+            for col in ['A', 'B', 'C']:
+                context_sheet[f'{col}{context_sheet.max_row}'].fill = header_fill
+                context_sheet[f'{col}{context_sheet.max_row}'].font = header_font
+            
+            for timeout in analysis_context.timed_out_rules:
+                context_sheet.append([timeout.rule_name, timeout.time_limit,
+                                      f"{timeout.files_completed} of {timeout.files_total}"])
+            
+            context_sheet.append([])
+        
         # Recommendation
         if not analysis_context.is_complete:
             context_sheet.append(["Recommendation", "Provide AMD and SMD files for complete cross-file validation"])
@@ -2,26 +2,60 @@
 Parser to convert source files into PMD models for analysis.
 """
 import json
+import logging
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from .config import StageExecutionConfig, ExecutionConfig
 from .models import ProjectContext, PMDModel, ScriptModel, AMDModel, PMDIncludes, PMDPresentation, PodModel, PodSeed, SMDModel
 from .pmd_preprocessor import PMDPreprocessor
+from .json_source_index import build_json_source_index
+from utils.concurrency import SERIAL
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class ModelParser:
     """Parses source files into PMD models for analysis."""
     
-    def __init__(self):
+    def __init__(self, execution: Optional[StageExecutionConfig] = None):
+        """
+        Args:
+            execution: How files are parsed (default: serially or on threads, chosen
+                       from the total size of the files)
+        """
         self.supported_extensions = {'.pmd', '.script', '.amd', '.pod', '.smd'}
+        self.execution = execution or ExecutionConfig().parsing
+    
+    @staticmethod
+    def _drop_commented_pairs(pairs):
+        """
+        JSON object_pairs_hook that drops keys starting with underscore (commented out).
+        
+        In Extend, keys starting with underscore are considered commented out
+        and should be ignored by all rules and analysis. Filtering while decoding
+        means commented-out keys are never materialized and the tree is built once.
+        
+        Args:
+            pairs: List of (key, value) pairs for a single JSON object
+            
+        Returns:
+            Dictionary without underscore-prefixed keys
+        """
+        return {k: v for k, v in pairs if not k.startswith('_')}
+    
+    def _load_json(self, content: str):
+        """Decode JSON content, dropping commented-out keys during decoding."""
+        return json.loads(content, object_pairs_hook=self._drop_commented_pairs)
     
     def _filter_commented_keys(self, data):
         """
         Recursively remove keys starting with underscore (commented out).
         
-        In Extend, keys starting with underscore are considered commented out
-        and should be ignored by all rules and analysis.
+        File parsing filters during decoding via _load_json; this is kept for
+        data structures that were decoded elsewhere.
         
         Args:
             data: The data structure to filter (dict, list, or primitive)
@@ -38,37 +72,97 @@ class ModelParser:
         else:
             return data
     
-    def parse_files(self, source_files_map: Dict[str, Any]) -> ProjectContext:
+    def parse_files(self, source_files_map: Dict[str, Any], lazy: bool = False) -> ProjectContext:
         """
         Parse source files into a ProjectContext with populated models.
         Uses parallel processing for improved performance with large applications.
         
         Args:
             source_files_map: Dictionary mapping file paths to SourceFile objects
+            lazy: Defer parsing until rules first access each file type. The files of
+                  that type are parsed then, and ASTs are parsed as rules need them,
+                  so file types that no enabled rule touches are never parsed.
             
         Returns:
-            ProjectContext with all parsed models
+            ProjectContext with all parsed models (or models parsed on first access if lazy)
         """
         context = ProjectContext()
         
-        # For small numbers of files, use serial processing to avoid overhead
-        if len(source_files_map) <= 3:
-            print("Using serial file parsing (small file count)")
+        if lazy:
+            sources_by_extension: Dict[str, Dict[str, Any]] = {}
+            for file_path, source_file in source_files_map.items():
+                extension = Path(file_path).suffix.lower()
+                sources_by_extension.setdefault(extension, {})[file_path] = source_file
+            context.set_lazy_sources(sources_by_extension, self._load_deferred_files)
+            log.info("Deferred parsing of %d files until first use", len(source_files_map))
+        else:
+            ast_count, ast_error_count = self._parse_into_context(source_files_map, context, precompute=True)
+            log.info("Pre-computed script fields for %d PMD files and %d POD files", len(context.pmds), len(context.pods))
+            log.info("Pre-computed %d ASTs (errors: %d)", ast_count, ast_error_count)
+        
+        # Initialize analysis context for tracking missing cross-file dependencies
+        self._initialize_analysis_context(context, source_files_map)
+        
+        return context
+    
+    def _load_deferred_files(self, source_files_map: Dict[str, Any], context: ProjectContext):
+        """
+        Parse the files of one deferred file type into the context (called on first access).
+        
+        With context.precompute_deferred set, script fields and ASTs are pre-computed as
+        well, in the parse workers. The files are then parsed into a separate context and
+        merged, so pre-computing never reads (and parses) other pending file types.
+        """
+        if not context.precompute_deferred:
+            self._parse_into_context(source_files_map, context, precompute=False)
+            return
+        parsed_context = ProjectContext()
+        ast_count, ast_error_count = self._parse_into_context(source_files_map, parsed_context, precompute=True)
+        self._merge_context(context, parsed_context)
+        log.debug("Pre-computed %d ASTs (errors: %d) for %d deferred files",
+                  ast_count, ast_error_count, len(source_files_map))
+    
+    def _parse_into_context(self, source_files_map: Dict[str, Any], context: ProjectContext,
+                            precompute: bool = True) -> Tuple[int, int]:
+        """
+        Parse source files into an existing context, serially or in parallel.
+        
+        Args:
+            source_files_map: Dictionary mapping file paths to SourceFile objects
+            context: The ProjectContext to populate
+            precompute: Also pre-compute script fields and ASTs for each file
+            
+        Returns:
+            Tuple of (ASTs pre-computed, AST parse errors)
+        """
+        ast_count = 0
+        ast_error_count = 0
+        
+        input_bytes = sum(len(getattr(source_file, 'content', None) or '') for source_file in source_files_map.values())
+        plan = self.execution.plan(len(source_files_map), input_bytes, 10)
+        
+        # Small inputs are parsed serially to avoid the thread overhead
+        if plan.executor == SERIAL:
+            # Files loaded one at a time (see ProjectContext.file_context) are not announced
+            if len(source_files_map) > 1:
+                log.debug("Using serial file parsing (%d files, %d bytes)", len(source_files_map), input_bytes)
             for file_path, source_file in source_files_map.items():
                 try:
                     self._parse_single_file(file_path, source_file, context)
                 except Exception as e:
-                    print(f"Failed to parse {file_path}: {e}")
-                    context.parsing_errors.append(f"{file_path}: {e}")
+                    log.warning("Failed to parse %s: %s", file_path, e)
+                    context.add_parsing_error(f"{file_path}: {e}")
+            
+            if precompute:
+                ast_count, ast_error_count = self._precompute_file_analysis(context)
         else:
             # Use parallel processing for larger applications
-            max_workers = min(10, len(source_files_map))  # Cap at 10 workers
-            print(f"Using parallel file parsing ({max_workers} workers for {len(source_files_map)} files)")
+            log.debug("Using parallel file parsing (%d workers for %d files)", plan.workers, len(source_files_map))
             
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all parsing tasks
+            with ThreadPoolExecutor(max_workers=plan.workers) as executor:
+                # Submit all parsing tasks (each worker also pre-computes its file's script fields and ASTs)
                 future_to_file = {
-                    executor.submit(self._parse_single_file_safe, file_path, source_file): file_path
+                    executor.submit(self._parse_single_file_safe, file_path, source_file, precompute): file_path
                     for file_path, source_file in source_files_map.items()
                 }
                 
@@ -80,43 +174,53 @@ class ModelParser:
                         if result:
                             # Merge the result into the main context
                             parsed_context, error = result
-                            self._merge_context(context, parsed_context)
+                            if parsed_context is not None:
+                                self._merge_context(context, parsed_context)
+                                ast_count += parsed_context.precomputed_ast_count
+                                ast_error_count += parsed_context.precomputed_ast_error_count
                             if error:
-                                context.parsing_errors.append(f"{file_path}: {error}")
+                                context.add_parsing_error(f"{file_path}: {error}")
                     except Exception as e:
-                        print(f"Failed to parse {file_path}: {e}")
-                        context.parsing_errors.append(f"{file_path}: {e}")
-        
-        # Pre-compute script fields for all PMD and POD models to improve rule performance
-        self._precompute_script_fields(context)
+                        log.warning("Failed to parse %s: %s", file_path, e)
+                        context.add_parsing_error(f"{file_path}: {e}")
         
-        # Pre-compute ASTs for all script fields to avoid repeated parsing
-        self._precompute_asts(context)
-        
-        # Initialize analysis context for tracking missing cross-file dependencies
-        self._initialize_analysis_context(context, source_files_map)
-        
-        return context
+        return ast_count, ast_error_count
     
-    def _parse_single_file_safe(self, file_path: str, source_file: Any):
-        """Thread-safe version of _parse_single_file that returns a new context."""
+    def _parse_single_file_safe(self, file_path: str, source_file: Any, precompute: bool = True):
+        """
+        Thread-safe version of _parse_single_file that returns a new context.
+        
+        Script field extraction and AST parsing for the file run here as well, so
+        that work is spread across the parse workers instead of running serially
+        after all files are merged.
+        """
         try:
             temp_context = ProjectContext()
             self._parse_single_file(file_path, source_file, temp_context)
+            if precompute:
+                ast_count, error_count = self._precompute_file_analysis(temp_context)
+                temp_context.precomputed_ast_count = ast_count
+                temp_context.precomputed_ast_error_count = error_count
             return temp_context, None
         except Exception as e:
             return None, str(e)
     
     def _merge_context(self, main_context: ProjectContext, temp_context: ProjectContext):
         """Merge a temporary context into the main context (thread-safe)."""
+        # Only touch the model types the file produced, so that merging into a lazy
+        # context never triggers parsing of other file types
+        
         # Merge PMDs
-        main_context.pmds.update(temp_context.pmds)
+        if temp_context.pmds:
+            main_context.pmds.update(temp_context.pmds)
         
         # Merge Scripts
-        main_context.scripts.update(temp_context.scripts)
+        if temp_context.scripts:
+            main_context.scripts.update(temp_context.scripts)
         
         # Merge Pods
-        main_context.pods.update(temp_context.pods)
+        if temp_context.pods:
+            main_context.pods.update(temp_context.pods)
         
         # Handle SMD (only one expected)
         if temp_context.smd:
@@ -125,6 +229,10 @@ class ModelParser:
         # Handle AMD (only one expected)
         if temp_context.amd:
             main_context.amd = temp_context.amd
+        
+        # Merge per-file pre-computed script fields and ASTs, and the script parsing
+        # errors recorded while pre-computing (rule threads may be reading the caches)
+        main_context.merge_caches(temp_context)
     
     def _parse_single_file(self, file_path: str, source_file: Any, context: ProjectContext):
         """Parse a single source file based on its extension."""
@@ -151,14 +259,13 @@ class ModelParser:
             
             # Use the preprocessor to handle newlines in PMD script blocks and brace disambiguation
             # This now also provides hash-to-lines mapping for accurate line number tracking
-            from .pmd_preprocessor import preprocess_pmd_content
-            processed_content, line_mappings, hash_to_lines = preprocess_pmd_content(content)
+            from .pmd_preprocessor import preprocess_pmd_source
+            processed_content, hash_to_lines, script_blocks = preprocess_pmd_source(content)
             
             # Try to parse as JSON
             try:
-                pmd_data = json.loads(processed_content)
-                # Filter out commented-out keys (starting with underscore)
-                pmd_data = self._filter_commented_keys(pmd_data)
+                # Commented-out keys (starting with underscore) are dropped while decoding
+                pmd_data = self._load_json(processed_content)
 
                 # Extract presentation data - handle the nested structure properly
                 presentation_data = pmd_data.get('presentation', {})
@@ -197,21 +304,23 @@ class ModelParser:
                 )
                 
                 # Set line mappings for proper error reporting
-                pmd_model.set_line_mappings(line_mappings)
                 pmd_model.set_hash_to_lines_mapping(hash_to_lines)
+                pmd_model.set_script_blocks(script_blocks)
+                pmd_model.set_source_index(build_json_source_index(content))
                 
                 context.pmds[pmd_model.pageId] = pmd_model
-                # Show cleaned filename for consistency with "Parsed Script" messages
-                from utils.file_path_utils import strip_uuid_prefix
-                cleaned_filename = os.path.basename(strip_uuid_prefix(file_path))
-                print(f"Parsed PMD: {cleaned_filename}")
+                if log.isEnabledFor(logging.DEBUG):
+                    # Show cleaned filename for consistency with "Parsed Script" messages
+                    from utils.file_path_utils import strip_uuid_prefix
+                    log.debug("Parsed PMD: %s", os.path.basename(strip_uuid_prefix(file_path)),
+                              extra={"event": "file_parsed", "file_path": file_path})
                 
             except json.JSONDecodeError as e:
-                print(f"JSON parsing failed for {file_path}: {e}")
+                log.debug("JSON parsing failed for %s: %s", file_path, e)
                 raise
                 
         except Exception as e:
-            print(f"Failed to parse PMD file {file_path}: {e}")
+            log.debug("Failed to parse PMD file %s: %s", file_path, e)
             raise
     
     def _parse_script_file(self, file_path: str, source_file: Any, context: ProjectContext):
@@ -223,13 +332,14 @@ class ModelParser:
             )
             # Use the full filename (including extension) as the key since that's how it's referenced in PMD files
             context.scripts[Path(file_path).name] = script_model
-            # Show cleaned filename without UUID prefix for consistency
-            from utils.file_path_utils import strip_uuid_prefix
-            cleaned_filename = os.path.basename(strip_uuid_prefix(file_path))
-            print(f"Parsed Script: {cleaned_filename}")
+            if log.isEnabledFor(logging.DEBUG):
+                # Show cleaned filename without UUID prefix for consistency
+                from utils.file_path_utils import strip_uuid_prefix
+                log.debug("Parsed Script: %s", os.path.basename(strip_uuid_prefix(file_path)),
+                          extra={"event": "file_parsed", "file_path": file_path})
             
         except Exception as e:
-            print(f"Failed to parse script file {file_path}: {e}")
+            log.debug("Failed to parse script file %s: %s", file_path, e)
             raise
     
     def _parse_amd_file(self, file_path: str, source_file: Any, context: ProjectContext):
@@ -238,9 +348,8 @@ class ModelParser:
             content = source_file.content.strip()
             
             try:
-                amd_data = json.loads(content)
-                # Filter out commented-out keys (starting with underscore)
-                amd_data = self._filter_commented_keys(amd_data)
+                # Commented-out keys (starting with underscore) are dropped while decoding
+                amd_data = self._load_json(content)
                 amd_model = AMDModel(
                     routes=amd_data.get('routes', {}),
                     baseUrls=amd_data.get('baseUrls', {}),
@@ -249,15 +358,16 @@ class ModelParser:
                     file_path=file_path,
                     source_content=content
                 )
+                amd_model.set_source_index(build_json_source_index(content))
                 context.amd = amd_model
-                print(f"Parsed AMD: {file_path}")
+                log.debug("Parsed AMD: %s", file_path, extra={"event": "file_parsed", "file_path": file_path})
                 
             except json.JSONDecodeError as e:
-                print(f"JSON parsing error in AMD file {file_path}: {e}")
+                log.debug("JSON parsing error in AMD file %s: %s", file_path, e)
                 raise
                 
         except Exception as e:
-            print(f"Failed to parse AMD file {file_path}: {e}")
+            log.debug("Failed to parse AMD file %s: %s", file_path, e)
             raise
     
     def _parse_pod_file(self, file_path: str, source_file: Any, context: ProjectContext):
@@ -267,13 +377,12 @@ class ModelParser:
             
             # Always preprocess POD files to create hash mappings for line number tracking
             # This ensures script content gets precise line numbers
-            from .pmd_preprocessor import preprocess_pmd_content
-            processed_content, line_mappings, hash_to_lines = preprocess_pmd_content(content)
+            from .pmd_preprocessor import preprocess_pmd_source
+            processed_content, hash_to_lines, script_blocks = preprocess_pmd_source(content)
             
             try:
-                pod_data = json.loads(processed_content)
-                # Filter out commented-out keys (starting with underscore)
-                pod_data = self._filter_commented_keys(pod_data)
+                # Commented-out keys (starting with underscore) are dropped while decoding
+                pod_data = self._load_json(processed_content)
                 
                 # Extract seed data
                 seed_data = pod_data.get('seed', {})
@@ -292,17 +401,19 @@ class ModelParser:
                 
                 # Set hash-based line mappings for POD files too
                 pod_model.set_hash_to_lines_mapping(hash_to_lines)
+                pod_model.set_script_blocks(script_blocks)
+                pod_model.set_source_index(build_json_source_index(content))
                 
                 context.pods[pod_model.podId] = pod_model
-                print(f"Parsed Pod: {pod_model.podId}")
+                log.debug("Parsed Pod: %s", pod_model.podId, extra={"event": "file_parsed", "file_path": file_path})
                 
             except json.JSONDecodeError as e:
                 # If preprocessing and parsing didn't work, fail
-                print(f"JSON parsing error in Pod file {file_path}: {e}")
+                log.debug("JSON parsing error in Pod file %s: %s", file_path, e)
                 raise
                 
         except Exception as e:
-            print(f"Failed to parse Pod file {file_path}: {e}")
+            log.debug("Failed to parse Pod file %s: %s", file_path, e)
             raise
 
     def _parse_smd_file(self, file_path: str, source_file: Any, context: ProjectContext):
@@ -312,9 +423,8 @@ class ModelParser:
             path_obj = Path(file_path)
             
             # Parse JSON content
-            smd_data = json.loads(content)
-            # Filter out commented-out keys (starting with underscore)
-            smd_data = self._filter_commented_keys(smd_data)
+            # Commented-out keys (starting with underscore) are dropped while decoding
+            smd_data = self._load_json(content)
             
             # Create SMD model
             smd_model = SMDModel(
@@ -328,31 +438,49 @@ class ModelParser:
                 source_content=content
             )
             
+            smd_model.set_source_index(build_json_source_index(content))
+            
             # Add to context (only one SMD file allowed)
             if context.smd is not None:
-                print(f"Warning: Multiple SMD files found. Ignoring {file_path} (already have {context.smd.id})")
+                log.warning("Multiple SMD files found. Ignoring %s (already have %s)", file_path, context.smd.id)
             else:
                 context.smd = smd_model
-                print(f"Parsed SMD: {smd_model.id}")
+                log.debug("Parsed SMD: %s", smd_model.id, extra={"event": "file_parsed", "file_path": file_path})
             
         except json.JSONDecodeError as e:
-            print(f"JSON parsing error in SMD file {file_path}: {e}")
+            log.debug("JSON parsing error in SMD file %s: %s", file_path, e)
             raise
             
         except Exception as e:
-            print(f"Failed to parse SMD file {file_path}: {e}")
+            log.debug("Failed to parse SMD file %s: %s", file_path, e)
             raise
     
-    def _precompute_script_fields(self, context: ProjectContext):
-        """Pre-compute script fields for all PMD and POD models to improve rule performance."""
+    def _get_precompute_rule(self):
+        """Get a concrete rule instance to use its script field extraction and parsing methods."""
         from .rules.base import Rule
         
-        # Create a concrete rule instance to use its script field extraction methods
         class TempRule(Rule):
             def analyze(self, context):
                 yield from []
         
-        temp_rule = TempRule()
+        return TempRule()
+    
+    def _precompute_file_analysis(self, context: ProjectContext) -> Tuple[int, int]:
+        """
+        Pre-compute script fields and ASTs for the models in a context.
+        
+        Runs inside each parse worker on that file's temporary context (or once on
+        the whole context for serial parsing).
+        
+        Returns:
+            Tuple of (ASTs parsed, AST parse errors)
+        """
+        self._precompute_script_fields(context)
+        return self._precompute_asts(context)
+    
+    def _precompute_script_fields(self, context: ProjectContext):
+        """Pre-compute script fields for all PMD and POD models to improve rule performance."""
+        temp_rule = self._get_precompute_rule()
         
         # Pre-compute PMD script fields
         for pmd_id, pmd_model in context.pmds.items():
@@ -361,79 +489,57 @@ class ModelParser:
         
         # Pre-compute POD script fields
         for pod_id, pod_model in context.pods.items():
-            script_fields = temp_rule.find_pod_script_fields(pod_model)
+            script_fields = temp_rule._extract_pod_script_fields(pod_model)
             context.set_cached_pod_script_fields(pod_id, script_fields)
-        
-        print(f"Pre-computed script fields for {len(context.pmds)} PMD files and {len(context.pods)} POD files")
     
-    def _precompute_asts(self, context: ProjectContext):
-        """Pre-compute ASTs for all script fields to avoid repeated parsing."""
-        from .rules.base import Rule
-        from .pmd_script_parser import parse_with_preprocessor
-        
-        # Create a concrete rule instance to use its script field extraction methods
-        class TempRule(Rule):
-            def analyze(self, context):
-                yield from []
+    def _precompute_asts(self, context: ProjectContext) -> Tuple[int, int]:
+        """
+        Pre-compute ASTs for all script fields to avoid repeated parsing.
         
-        temp_rule = TempRule()
+        Returns:
+            Tuple of (ASTs parsed, AST parse errors)
+        """
+        temp_rule = self._get_precompute_rule()
         
         ast_count = 0
         error_count = 0
         
-        # Pre-compute ASTs for PMD script fields
-        for pmd_id, pmd_model in context.pmds.items():
-            cached_fields = context.get_cached_pmd_script_fields(pmd_id)
-            if cached_fields:
-                for field_path, field_value, field_name, line_offset in cached_fields:
-                    if field_value and len(field_value.strip()) > 0:
-                        try:
-                            parsed_script = temp_rule._strip_pmd_wrappers(field_value)
-                            if parsed_script:
-                                # Check if AST is already cached
-                                cache_key = hash(parsed_script)
-                                if context.get_cached_ast(cache_key) is None:
-                                    # Use _parse_script_content to handle string extraction properly
-                                    ast = temp_rule._parse_script_content(field_value, context)
-                                    context.set_cached_ast(cache_key, ast)
-                                    ast_count += 1
-                        except Exception as e:
-                            error_count += 1
-        
-        # Pre-compute ASTs for POD script fields
-        for pod_id, pod_model in context.pods.items():
-            cached_fields = context.get_cached_pod_script_fields(pod_id)
-            if cached_fields:
-                for field_path, field_value, field_name, line_offset in cached_fields:
-                    if field_value and len(field_value.strip()) > 0:
-                        try:
-                            parsed_script = temp_rule._strip_pmd_wrappers(field_value)
-                            if parsed_script:
-                                # Check if AST is already cached
-                                cache_key = hash(parsed_script)
-                                if context.get_cached_ast(cache_key) is None:
-                                    # Use _parse_script_content to handle string extraction properly
-                                    ast = temp_rule._parse_script_content(field_value, context)
-                                    context.set_cached_ast(cache_key, ast)
-                                    ast_count += 1
-                        except Exception as e:
-                            error_count += 1
-        
-        # Pre-compute ASTs for standalone script files
+        # Script fields of PMD and POD models
+        cached_field_lists = [context.get_cached_pmd_script_fields(pmd_id) for pmd_id in context.pmds]
+        cached_field_lists += [context.get_cached_pod_script_fields(pod_id) for pod_id in context.pods]
+        
+        for cached_fields in cached_field_lists:
+            if not cached_fields:
+                continue
+            for field_path, field_value, field_name, line_offset in cached_fields:
+                if field_value and len(field_value.strip()) > 0:
+                    try:
+                        parsed_script = temp_rule._strip_pmd_wrappers(field_value)
+                        if parsed_script:
+                            # Check if AST is already cached
+                            cache_key = hash(parsed_script)
+                            if context.get_cached_ast(cache_key) is None:
+                                # Use _parse_script_content to handle string extraction properly
+                                ast = temp_rule._parse_script_content(field_value, context)
+                                context.set_cached_ast(cache_key, ast)
+                                ast_count += 1
+                    except Exception as e:
+                        error_count += 1
+        
+        # Standalone script files - parsed through the same path the script rules use,
+        # so the cache key matches what _analyze_script looks up
         for script_name, script_model in context.scripts.items():
             if script_model.source and len(script_model.source.strip()) > 0:
                 try:
-                    # Check if AST is already cached
-                    cache_key = hash(script_model.source)
+                    cache_key = hash(temp_rule._strip_pmd_wrappers(script_model.source))
                     if context.get_cached_ast(cache_key) is None:
-                        # Use _parse_script_content to handle any preprocessing needed
                         ast = temp_rule._parse_script_content(script_model.source, context)
                         context.set_cached_ast(cache_key, ast)
                         ast_count += 1
                 except Exception as e:
                     error_count += 1
         
-        print(f"Pre-computed {ast_count} ASTs (errors: {error_count})")
+        return ast_count, error_count
     
     def _initialize_analysis_context(self, context: ProjectContext, source_files_map: Dict[str, Any]):
         """
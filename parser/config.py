@@ -5,10 +5,12 @@ This module defines the configuration structure for controlling rule execution,
 file processing settings, and other tool behaviors.
 """
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
 from enum import Enum
 import json
 
+from utils.concurrency import ExecutionPlan, plan_execution
+
 
 class SeverityLevel(str, Enum):
     """Severity levels for findings."""
@@ -21,6 +23,7 @@ class RuleConfig(BaseModel):
     enabled: bool = Field(default=True, description="Whether this rule is enabled")
     severity_override: Optional[SeverityLevel] = Field(default=None, description="Override the rule's default severity")
     custom_settings: Dict[str, Any] = Field(default_factory=dict, description="Custom settings for the rule")
+    time_limit: Optional[float] = Field(default=None, description="Seconds the rule may run before it is cancelled (overrides rule_time_limit; 0 = no limit)")
 
 
 class RulesConfig(BaseModel):
@@ -108,6 +111,49 @@ class OutputConfig(BaseModel):
     max_findings_per_rule: Optional[int] = Field(default=None, description="Maximum findings per rule (None = unlimited)")
 
 
+class StageExecutionConfig(BaseModel):
+    """Executor and parallelism of one analysis stage."""
+    executor: Literal["auto", "serial", "thread"] = Field(default="auto", description="auto (serial or a thread pool, chosen from the input size), serial or thread")
+    workers: int = Field(default=0, description="Worker threads or processes (0 = derived from the input size, -1 = one per CPU)")
+    bytes_per_worker: int = Field(default=65536, description="Input each automatically sized worker is given; an input under two workers' share runs serially")
+    
+    def plan(self, tasks: int, input_bytes: int, gil_cap: int) -> ExecutionPlan:
+        """Executor and worker count for a run of tasks over input_bytes of input."""
+        return plan_execution(self.executor, self.workers, tasks, input_bytes, self.bytes_per_worker, gil_cap)
+
+
+class RuleExecutionConfig(StageExecutionConfig):
+    """Executor and parallelism of rule execution, which can also use worker processes."""
+    executor: Literal["auto", "serial", "thread", "process"] = Field(default="auto", description="auto (serial or a thread pool, chosen from the input size), serial, thread, or process to run per-file rules as (rule, file) work units on worker processes")
+
+
+class ExecutionConfig(BaseModel):
+    """
+    Execution backend and parallelism of each analysis stage.
+    
+    Only rule execution can use processes: the text read during ingestion and the models
+    built by parsing would have to be copied back from the workers, which costs more
+    than reading or parsing them.
+    """
+    ingestion: StageExecutionConfig = Field(default_factory=lambda: StageExecutionConfig(bytes_per_worker=1048576), description="Reading source files from the ZIP, directory or file list")
+    parsing: StageExecutionConfig = Field(default_factory=lambda: StageExecutionConfig(bytes_per_worker=262144), description="Parsing source files into models")
+    rules: RuleExecutionConfig = Field(default_factory=RuleExecutionConfig, description="Running the rules")
+    
+    def with_overrides(self, overrides: Dict[str, Dict[str, Any]]) -> 'ExecutionConfig':
+        """
+        A copy with the given per-stage settings replaced, e.g. {"rules": {"executor": "process"}}.
+        
+        Raises:
+            pydantic.ValidationError: If a stage or setting is unknown or invalid
+        """
+        data = self.model_dump()
+        for stage, settings in overrides.items():
+            if stage not in data:
+                raise ValueError(f"Unknown execution stage '{stage}' (expected one of: {', '.join(data)})")
+            data[stage].update(settings)
+        return ExecutionConfig.model_validate(data)
+
+
 class ArcaneAuditorConfig(BaseModel):
     """Main configuration model for the Arcane Auditor tool."""
     rules: RulesConfig = Field(default_factory=RulesConfig, description="Rule configuration")
@@ -118,6 +164,14 @@ class ArcaneAuditorConfig(BaseModel):
     fail_on_severe: bool = Field(default=False, description="Exit with error code if any SEVERE severity findings are found")
     fail_on_warning: bool = Field(default=False, description="Exit with error code if any WARNING severity findings are found")
     quiet: bool = Field(default=False, description="Suppress non-essential output")
+    low_memory_mode: bool = Field(default=False, description="Parse and analyze one file at a time, releasing each file's models, source and ASTs once its findings are emitted")
+    rule_time_limit: float = Field(default=0, description="Seconds each rule may run before it is cancelled between files and reported as timed out (0 = no limit)")
+    profile_rules: bool = Field(default=False, description="Run rules file by file and record per-rule and per-(rule, file) wall/CPU time, files visited, ASTs consumed and findings")
+    execution: ExecutionConfig = Field(default_factory=ExecutionConfig, description="Executor and parallelism of file ingestion, parsing and rule execution")
+    findings_cache: bool = Field(default=False, description="Reuse the findings of (rule, file) units whose rule, settings and file contents are unchanged since a previous run")
+    findings_cache_path: str = Field(default="", description="Findings cache file (empty = findings_cache.json in the per-user cache directory)")
+    cost_profile: bool = Field(default=False, description="Keep the per-rule costs measured in each run between runs, to schedule the most expensive rules first (without it, static per-rule estimates are used)")
+    cost_profile_path: str = Field(default="", description="Rule cost profile file (empty = rule_costs.json in the per-user cache directory)")
     
     @classmethod
     def from_layers(cls) -> 'ArcaneAuditorConfig':
@@ -197,6 +251,21 @@ class ArcaneAuditorConfig(BaseModel):
         
         return default_severity
     
+    def get_rule_time_limit(self, rule_class_name: str) -> float:
+        """Get the time limit for a rule in seconds (0 = no limit), using the rule's own limit if configured."""
+        # First check if it's a predefined rule
+        rule_config = getattr(self.rules, rule_class_name, None)
+        if rule_config is not None and rule_config.time_limit is not None:
+            return rule_config.time_limit
+        
+        # If not predefined, check if it's in the original JSON config
+        if hasattr(self, '_original_config_data') and 'rules' in self._original_config_data:
+            custom_rule = self._original_config_data['rules'].get(rule_class_name)
+            if custom_rule and custom_rule.get('time_limit') is not None:
+                return custom_rule['time_limit']
+        
+        return self.rule_time_limit
+    
     def get_rule_settings(self, rule_class_name: str) -> Dict[str, Any]:
         """Get custom settings for a rule using class name."""
         # First check if it's a predefined rule
@@ -15,6 +15,9 @@ from pathlib import Path
 from typing import Dict, Optional
 from .config import ArcaneAuditorConfig
 from utils.arcane_paths import get_config_dirs
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class ConfigurationManager:
@@ -91,7 +94,7 @@ class ConfigurationManager:
                         overlay_config = ArcaneAuditorConfig.from_file(config_file.as_posix())
                         merged_config = self._merge_configurations(merged_config, overlay_config)
                 except Exception as e:
-                    print(f"Warning: Failed to load configuration {config_file}: {e}")
+                    log.warning("Failed to load configuration %s: %s", config_file, e)
                     continue
             
             result = merged_config or ArcaneAuditorConfig()
@@ -101,7 +104,7 @@ class ConfigurationManager:
             try:
                 result = ArcaneAuditorConfig.from_file(highest_priority_config.as_posix())
             except Exception as e:
-                print(f"Warning: Failed to load configuration {highest_priority_config}: {e}")
+                log.warning("Failed to load configuration %s: %s", highest_priority_config, e)
                 result = ArcaneAuditorConfig()
         
         # Update cache (future enhancement)
@@ -253,7 +256,7 @@ class ConfigurationManager:
             
             return merged_config
         except Exception as e:
-            print(f"Warning: Failed to create merged configuration: {e}")
+            log.warning("Failed to create merged configuration: %s", e)
             return base  # Return base configuration as fallback
     
     def list_available_configs(self) -> Dict[str, list]:
@@ -0,0 +1,187 @@
+"""
+Persistent cache of rule findings across runs (--cache).
+
+Between commits most files of an application do not change, yet every run analyzes
+every file again. The cache stores the findings (and skipped checks) of each
+(rule, file) unit under a key made of the tool version, the rule's fingerprint (its
+class, source, severity and effective settings) and the content digests of the
+files the unit read: the file itself plus the files of the types the rule reads for
+context (Rule.CONTEXT_FILE_TYPES, the SMD by default), or every file of its types for
+CROSS_FILE rules. Unchanged units are answered from the cache without parsing their
+file, so a warm run costs roughly the size of the diff.
+
+The cache is a single JSON file, rewritten only by runs that add entries. Each entry
+records the last run that used it; entries not used by a run are kept until the cache
+grows beyond MAX_ENTRIES, least recently used first.
+"""
+import functools
+import hashlib
+import json
+import os
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.arcane_paths import user_root
+from utils.events import get_logger
+from utils.json_io import atomic_write_json
+
+log = get_logger(__name__)
+
+CACHE_FORMAT = 1
+
+# Entries kept on disk (enough for several applications of a few thousand files)
+MAX_ENTRIES = 200_000
+
+# A cached unit: findings as (rule class name, message, line, file_path) and skipped
+# checks as (rule name, check name, reason)
+CachedUnit = Tuple[List[Tuple[str, str, int, str]], List[Tuple[str, str, str]]]
+
+
+def default_cache_path() -> str:
+    """The findings cache file in the per-user data directory."""
+    return os.path.join(user_root(), "cache", "findings_cache.json")
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# The parser package: built-in rules depend on its detectors, models and helpers
+_PARSER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _source_digest(paths: List[str]) -> str:
+    """Digest of the given source files; empty if one cannot be read."""
+    hasher = hashlib.sha256()
+    try:
+        for path in paths:
+            with open(path, 'rb') as f:
+                hasher.update(path.encode('utf-8'))
+                hasher.update(f.read())
+    except OSError:
+        return ""
+    return hasher.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_package_digest() -> str:
+    """Digest of the parser package sources (built-in code is not reloaded within a process)."""
+    return _source_digest(sorted(os.path.join(directory, name)
+                                 for directory, _, names in os.walk(_PARSER_DIR)
+                                 for name in names if name.endswith('.py')))
+
+
+def rule_code_digest(rule_class: type) -> str:
+    """
+    Digest of the code a rule runs, so editing a rule invalidates its cached findings.
+
+    Built-in rules use the whole parser package (their detectors and the models they
+    read live in other modules); user rules use the file they were loaded from, read
+    again on every call as the registry reloads changed user rules. Frozen builds have
+    no sources to read and rely on the tool version alone.
+    """
+    module_file = getattr(sys.modules.get(rule_class.__module__), '__file__', None)
+    if not module_file:
+        # User rule modules are executed from their file without being registered
+        functions = [member for member in vars(rule_class).values() if hasattr(member, '__code__')]
+        module_file = functions[0].__code__.co_filename if functions else None
+    if not module_file or not os.path.isfile(module_file):
+        return ""
+    module_file = os.path.abspath(module_file)
+    if module_file.startswith(_PARSER_DIR + os.sep):
+        return _parser_package_digest()
+    return _source_digest([module_file])
+
+
+class FindingsCache:
+    """Findings of (rule, file) units, persisted between runs."""
+
+    def __init__(self, path: Optional[str] = None, tool_version: Optional[str] = None):
+        """
+        Args:
+            path: Cache file (None = default_cache_path())
+            tool_version: Version of the tool; entries of other versions are never reused
+        """
+        if tool_version is None:
+            from __version__ import __version__
+            tool_version = __version__
+        self.path = path or default_cache_path()
+        self.tool_version = tool_version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Number of this run; entries record the last run that used them
+        self._run = 1
+        self._loaded = False
+        self._dirty = False
+
+    def key(self, rule_fingerprint: str, file_digests: Sequence[Tuple[str, str]]) -> str:
+        """
+        Cache key of a unit.
+
+        Args:
+            rule_fingerprint: See RulesEngine._rule_fingerprint
+            file_digests: (file path, content digest) of every file the unit reads
+        """
+        return _digest(json.dumps([self.tool_version, rule_fingerprint, sorted(file_digests)]))
+
+    def get(self, key: str) -> Optional[CachedUnit]:
+        """The cached findings and skipped checks of a unit, or None on a miss."""
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            # Recency alone does not make the cache dirty: a run without new entries
+            # leaves the file as it is, and the stamp is written by the next run that saves
+            entry["used"] = self._run
+            self.hits += 1
+        return ([tuple(finding) for finding in entry["findings"]],
+                [tuple(skipped) for skipped in entry["skipped"]])
+
+    def put(self, key: str, findings: List[Tuple[str, str, int, str]],
+            skipped: List[Tuple[str, str, str]]) -> None:
+        """Store the findings and skipped checks of a unit that ran to completion."""
+        with self._lock:
+            self._load()
+            self._entries[key] = {"findings": [list(finding) for finding in findings],
+                                  "skipped": [list(check) for check in skipped],
+                                  "used": self._run}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if entries were added, dropping the least recently used beyond MAX_ENTRIES."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = self._entries
+            if len(entries) > MAX_ENTRIES:
+                # Stable sort: entries last used by the same run keep their insertion order
+                entries = dict(sorted(entries.items(), key=lambda item: item[1].get("used", 0))[-MAX_ENTRIES:])
+                self._entries = entries
+            try:
+                atomic_write_json(self.path, {"format": CACHE_FORMAT, "run": self._run, "entries": entries},
+                                  indent=None)
+                self._dirty = False
+            except OSError as e:
+                log.warning("[FindingsCache] Could not write %s: %s", self.path, e)
+
+    def _load(self) -> None:
+        """Read the cache file on first use; a missing or unreadable cache starts empty."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning("[FindingsCache] Ignoring unreadable cache %s: %s", self.path, e)
+            return
+        if isinstance(data, dict) and data.get("format") == CACHE_FORMAT and isinstance(data.get("entries"), dict):
+            self._entries = data["entries"]
+            self._run = data.get("run", 0) + 1
@@ -0,0 +1,240 @@
+"""
+Source position index for Extend JSON files (PMD, POD, AMD, SMD).
+
+The file parsers build one index per file while parsing. It records the source
+span of every object member and array element keyed by its JSON path, so rules
+can resolve line numbers with a dictionary lookup instead of re-splitting and
+scanning source_content for every finding.
+
+Paths are tuples of object keys (str) and array indices (int), e.g.
+("presentation", "body", "children", 0). Use parse_json_path() to convert the
+dotted / bracketed path strings used by the rules into this form.
+
+The scanner runs over the ORIGINAL file content, which may contain raw newlines
+inside <% %> script blocks, so string scanning is deliberately tolerant.
+"""
+
+import json
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+JsonPath = Tuple[Union[str, int], ...]
+
+_WHITESPACE = re.compile(r'\s*')
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_SCALAR = re.compile(r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null')
+_NEWLINE = re.compile(r'\n')
+_PATH_SEGMENT = re.compile(r'[^.\[\]]+')
+
+
+class JsonSpan(NamedTuple):
+    """Source span of a JSON node. Lines are 1-based, offsets are 0-based."""
+    start_line: int
+    end_line: int
+    start_offset: int
+    end_offset: int
+
+
+def parse_json_path(path: str) -> JsonPath:
+    """
+    Convert a rule path string into a JSON path tuple.
+
+    Examples:
+        "body.children.1.columns.0" -> ("body", "children", 1, "columns", 0)
+        "seed.template.children[0]" -> ("seed", "template", "children", 0)
+    """
+    if not path:
+        return ()
+    return tuple(int(segment) if segment.isdigit() else segment
+                 for segment in _PATH_SEGMENT.findall(path))
+
+
+class JsonSourceIndex:
+    """JSON path -> source span index for a single file."""
+
+    def __init__(self, content: str):
+        self._content = content
+        self._lowered_content: Optional[str] = None
+        self._newline_offsets: List[int] = [m.start() for m in _NEWLINE.finditer(content)]
+
+        # JSON path -> span (object members start at their key, array elements at their value)
+        self.spans: Dict[JsonPath, JsonSpan] = {}
+        # key -> paths in document order
+        self._key_paths: Dict[str, List[JsonPath]] = {}
+        # (key, scalar value) -> paths in document order
+        self._value_paths: Dict[Tuple[str, Any], List[JsonPath]] = {}
+
+        end = self._scan_value(self._skip_whitespace(0), (), None, True)
+        if self._skip_whitespace(end) != len(content):
+            raise ValueError(f"Unexpected content after JSON document at offset {end}")
+
+    # --- Lookups ---------------------------------------------------------
+
+    def line_at_offset(self, offset: int) -> int:
+        """Convert a character offset into a 1-based line number."""
+        return bisect_left(self._newline_offsets, offset) + 1
+
+    def get_span(self, path: JsonPath) -> Optional[JsonSpan]:
+        """Get the source span for a JSON path."""
+        return self.spans.get(tuple(path))
+
+    def line_for_path(self, path: JsonPath) -> Optional[int]:
+        """Get the starting line for a JSON path, or None if the path is not in the file."""
+        span = self.spans.get(tuple(path))
+        return span.start_line if span else None
+
+    def paths_for_key(self, key: str) -> List[JsonPath]:
+        """Get all paths of object members named `key`, in document order."""
+        return self._key_paths.get(key, [])
+
+    def line_for_key(self, key: str, occurrence: int = 0) -> Optional[int]:
+        """Get the line of the nth object member named `key`."""
+        paths = self._key_paths.get(key)
+        if not paths or occurrence >= len(paths):
+            return None
+        return self.spans[paths[occurrence]].start_line
+
+    def paths_for_value(self, key: str, value: Any) -> List[JsonPath]:
+        """Get all paths where member `key` holds the scalar `value`, in document order."""
+        return self._value_paths.get((key, self._value_key(value)), [])
+
+    def line_for_value(self, key: str, value: Any, occurrence: int = 0) -> Optional[int]:
+        """Get the line of the nth member `key` holding the scalar `value`."""
+        paths = self.paths_for_value(key, value)
+        if not paths or occurrence >= len(paths):
+            return None
+        return self.spans[paths[occurrence]].start_line
+
+    def line_for_text(self, text: str, case_sensitive: bool = True) -> Optional[int]:
+        """
+        Find the line of the first occurrence of raw text in the source.
+
+        Used for free-text patterns that are not tied to a single JSON node. The
+        lowered copy of the source is built once and reused.
+        """
+        if not text:
+            return None
+        if case_sensitive:
+            position = self._content.find(text)
+        else:
+            if self._lowered_content is None:
+                self._lowered_content = self._content.lower()
+            position = self._lowered_content.find(text.lower())
+        return self.line_at_offset(position) if position >= 0 else None
+
+    # --- Scanner ---------------------------------------------------------
+
+    @staticmethod
+    def _value_key(value: Any) -> Any:
+        """Normalize a scalar so that strings and JSON literals never collide (True vs 1)."""
+        if isinstance(value, str):
+            return value
+        return ('json', json.dumps(value))
+
+    def _skip_whitespace(self, pos: int) -> int:
+        return _WHITESPACE.match(self._content, pos).end()
+
+    def _record(self, path: JsonPath, key: Optional[str], start: int, end: int, scalar: Any = None, has_scalar: bool = False):
+        self.spans[path] = JsonSpan(self.line_at_offset(start), self.line_at_offset(max(start, end - 1)), start, end)
+        if key is not None:
+            self._key_paths.setdefault(key, []).append(path)
+            if has_scalar:
+                self._value_paths.setdefault((key, scalar), []).append(path)
+
+    def _scan_value(self, pos: int, path: JsonPath, key: Optional[str], record: bool, member_start: Optional[int] = None) -> int:
+        """Scan one JSON value starting at pos and return the offset just past it."""
+        content = self._content
+        start = pos if member_start is None else member_start
+        if pos >= len(content):
+            raise ValueError("Unexpected end of JSON content")
+        char = content[pos]
+
+        if char == '{':
+            end = self._scan_object(pos, path, record)
+            if record and path:
+                self._record(path, key, start, end)
+            return end
+
+        if char == '[':
+            end = self._scan_array(pos, path, record)
+            if record and path:
+                self._record(path, key, start, end)
+            return end
+
+        if char == '"':
+            match = _STRING.match(content, pos)
+            if not match:
+                raise ValueError(f"Unterminated string at offset {pos}")
+            if record and path:
+                token = match.group()
+                value = json.loads(token, strict=False) if '\\' in token else token[1:-1]
+                self._record(path, key, start, match.end(), value, True)
+            return match.end()
+
+        match = _SCALAR.match(content, pos)
+        if not match:
+            raise ValueError(f"Unexpected character {char!r} at offset {pos}")
+        if record and path:
+            self._record(path, key, start, match.end(), ('json', match.group()), True)
+        return match.end()
+
+    def _scan_object(self, pos: int, path: JsonPath, record: bool) -> int:
+        content = self._content
+        pos = self._skip_whitespace(pos + 1)
+        if content.startswith('}', pos):
+            return pos + 1
+        while True:
+            key_match = _STRING.match(content, pos)
+            if not key_match:
+                raise ValueError(f"Expected object key at offset {pos}")
+            key_token = key_match.group()
+            key = json.loads(key_token, strict=False) if '\\' in key_token else key_token[1:-1]
+            member_start = pos
+            pos = self._skip_whitespace(key_match.end())
+            if not content.startswith(':', pos):
+                raise ValueError(f"Expected ':' at offset {pos}")
+            pos = self._skip_whitespace(pos + 1)
+            # Commented-out keys (starting with underscore) are not part of the model,
+            # so they are scanned but never indexed
+            member_record = record and not key.startswith('_')
+            pos = self._scan_value(pos, path + (key,), key, member_record, member_start)
+            pos = self._skip_whitespace(pos)
+            if content.startswith(',', pos):
+                pos = self._skip_whitespace(pos + 1)
+                continue
+            if content.startswith('}', pos):
+                return pos + 1
+            raise ValueError(f"Expected ',' or '}}' at offset {pos}")
+
+    def _scan_array(self, pos: int, path: JsonPath, record: bool) -> int:
+        content = self._content
+        pos = self._skip_whitespace(pos + 1)
+        if content.startswith(']', pos):
+            return pos + 1
+        index = 0
+        while True:
+            pos = self._scan_value(pos, path + (index,), None, record)
+            index += 1
+            pos = self._skip_whitespace(pos)
+            if content.startswith(',', pos):
+                pos = self._skip_whitespace(pos + 1)
+                continue
+            if content.startswith(']', pos):
+                return pos + 1
+            raise ValueError(f"Expected ',' or ']' at offset {pos}")
+
+
+def build_json_source_index(content: str) -> Optional[JsonSourceIndex]:
+    """
+    Build a source index for JSON file content.
+
+    Returns:
+        JsonSourceIndex, or None if the content is not a JSON document
+    """
+    if not content or not content.strip():
+        return None
+    try:
+        return JsonSourceIndex(content)
+    except (ValueError, RecursionError):
+        return None
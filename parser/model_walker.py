@@ -0,0 +1,342 @@
+"""
+Single-pass walker for PMD and POD models.
+
+Rules used to re-walk the same presentation / template JSON once per helper
+(script field search, widget traversal, POD widget collection, readable widget
+paths), each rebuilding path strings and readable identifiers. The walker visits
+a model once and records a table of script fields, widgets, endpoints and string
+values; the Rule helper APIs are views over that table.
+
+Paths use the notation the rules already use:
+- PMD script fields / strings: model field paths ("presentation.body.children.0.value")
+- PMD widgets: paths relative to presentation ("body.children.0"), as produced by
+  Rule.traverse_presentation_structure()
+- POD: file paths with bracketed indices ("seed.template.children[0].onClick")
+"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+# Known widget container field names
+WIDGET_CONTAINERS = (
+    'children', 'primaryLayout', 'secondaryLayout', 'sections',
+    'items', 'navigationTasks', 'cellTemplate', 'columns'
+)
+
+# Known layout types that may contain nested structures
+LAYOUT_TYPES = frozenset({
+    'areaLayout', 'basicFormLayout', 'section', 'hub',
+    'layout', 'panelList', 'grid', 'fieldSet'
+})
+
+
+class ScriptFieldNode(NamedTuple):
+    """A string field containing <% %> script."""
+    path: str
+    value: str
+    display_name: str
+    parent: int  # index of the enclosing widget in ModelWalkTable.widgets, -1 if none
+
+
+class WidgetNode(NamedTuple):
+    """A widget reached by the presentation / template traversal."""
+    widget: Dict[str, Any]
+    path: str
+    index: int
+    parent_type: Optional[str]
+    container_name: str
+    section: str
+    display_name: str  # readable path, e.g. "body->children[0]->id: area"
+    field_path: str  # path in model notation, for source span lookups
+    parent: int
+
+
+class EndpointNode(NamedTuple):
+    """An inbound / outbound endpoint definition."""
+    endpoint: Dict[str, Any]
+    path: str
+    display_name: str
+
+
+class StringNode(NamedTuple):
+    """A string value of a visited object."""
+    path: str
+    value: str
+    parent: int
+
+
+class _WidgetContext(NamedTuple):
+    """Presentation traversal state for a container reached by the widget walk."""
+    path: str
+    container_name: str
+    parent_type: Optional[str]
+    already_yielded: bool
+    section: str
+    display_name: str
+    field_path: str
+
+
+class ModelWalkTable:
+    """Table of nodes recorded by one walk over a PMD or POD model."""
+
+    def __init__(self):
+        self.script_fields: List[ScriptFieldNode] = []
+        self.widgets: List[WidgetNode] = []
+        self.endpoints: List[EndpointNode] = []
+        self.strings: List[StringNode] = []
+        self._widgets_by_path: Optional[Dict[str, WidgetNode]] = None
+
+    def widget_for_path(self, path: str) -> Optional[WidgetNode]:
+        """Get the widget recorded at a path, or None."""
+        if self._widgets_by_path is None:
+            self._widgets_by_path = {node.path: node for node in self.widgets}
+        return self._widgets_by_path.get(path)
+
+    def parent_widget(self, node) -> Optional[WidgetNode]:
+        """Get the enclosing widget of a node, or None at top level."""
+        return self.widgets[node.parent] if node.parent >= 0 else None
+
+
+def readable_identifier(item: Dict[str, Any], fallback_index: int) -> str:
+    """
+    Extract a readable identifier from a dictionary item.
+
+    Priority order: id, columnId, label (truncated), type, name, then [index].
+    """
+    # Priority 1: id
+    if 'id' in item and isinstance(item['id'], str) and item['id'].strip():
+        return f"id: {item['id']}"
+
+    # Priority 2: columnId
+    if 'columnId' in item and isinstance(item['columnId'], str) and item['columnId'].strip():
+        return f"columnId: {item['columnId']}"
+
+    # Priority 3: label
+    if 'label' in item and isinstance(item['label'], str) and item['label'].strip():
+        # Truncate long labels
+        label = item['label'][:40] + '...' if len(item['label']) > 40 else item['label']
+        return f"label: {label}"
+
+    # Priority 4: type
+    if 'type' in item and isinstance(item['type'], str) and item['type'].strip():
+        return f"type: {item['type']}"
+
+    # Priority 5: name (for endpoints, etc.)
+    if 'name' in item and isinstance(item['name'], str) and item['name'].strip():
+        return f"name: {item['name']}"
+
+    # Fallback: index
+    return f"[{fallback_index}]"
+
+
+def is_script_value(value: str) -> bool:
+    """Check whether a string contains a <% %> block (same as re.search(r'<%.*?%>'))."""
+    start = value.find('<%')
+    return start != -1 and value.find('%>', start + 2) != -1
+
+
+def _join(prefix: str, part) -> str:
+    return f"{prefix}.{part}" if prefix else str(part)
+
+
+def _model_items(model: BaseModel) -> Iterator[Tuple[str, Any]]:
+    """Iterate the exported fields of a pydantic model (model_dump order) without copying."""
+    for name, field in type(model).model_fields.items():
+        if not field.exclude:
+            yield name, getattr(model, name)
+
+
+class _PMDWalker:
+    """
+    Walks PMD data once, recording script fields with the same paths and display
+    names as the original recursive search, and widgets with the same semantics
+    as the presentation traversal.
+    """
+
+    def __init__(self, table: ModelWalkTable):
+        self.table = table
+
+    def walk_model(self, pmd_model) -> None:
+        for name, value in _model_items(pmd_model):
+            if name == 'presentation' and value is not None:
+                self._walk_presentation(value)
+            elif name in ('inboundEndpoints', 'outboundEndpoints') and isinstance(value, list):
+                for i, endpoint in enumerate(value):
+                    if isinstance(endpoint, dict):
+                        self.table.endpoints.append(EndpointNode(
+                            endpoint, f"{name}.{i}", f"{name}[{i}]->{readable_identifier(endpoint, i)}"))
+                self._walk_member(name, value, "", "", None, -1)
+            else:
+                self._walk_member(name, value, "", "", None, -1)
+
+    def _walk_presentation(self, presentation) -> None:
+        for section_name, section_data in _model_items(presentation):
+            path = f"presentation.{section_name}"
+            display = f"presentation->{section_name}"
+            if isinstance(section_data, dict):
+                context = _WidgetContext(section_name, "", None, False, section_name, section_name, path)
+                self._walk_dict(section_data, path, display, context, -1)
+            elif isinstance(section_data, list):
+                # Tabs: each tab item is traversed as its own section root
+                for i, item in enumerate(section_data):
+                    item_path = f"{path}.{i}"
+                    if isinstance(item, dict):
+                        readable_id = readable_identifier(item, i)
+                        context = _WidgetContext(f"{section_name}.{i}", "", None, False, section_name,
+                                                 f"{section_name}[{i}]->{readable_id}", item_path)
+                        self._walk_dict(item, item_path, f"{display}[{i}]->{readable_id}", context, -1)
+                    elif isinstance(item, str):
+                        self._record_string(item_path, item, f"{display}[{i}]", -1)
+            else:
+                self._walk_member(section_name, section_data, "presentation", "presentation", None, -1)
+
+    def walk_widgets(self, data: Dict[str, Any], base_path: str, parent_type: Optional[str]) -> None:
+        """Walk raw presentation data (used by Rule.traverse_presentation_structure)."""
+        context = _WidgetContext(base_path, "", parent_type, False, base_path, base_path, base_path)
+        self._walk_dict(data, base_path, base_path, context, -1)
+
+    def _record_string(self, path: str, value: str, display_name: str, parent: int) -> None:
+        self.table.strings.append(StringNode(path, value, parent))
+        if is_script_value(value):
+            self.table.script_fields.append(ScriptFieldNode(path, value, display_name, parent))
+
+    def _record_widget(self, widget, path, index, parent_type, container_name, context, display_name, field_path, parent) -> int:
+        self.table.widgets.append(WidgetNode(widget, path, index, parent_type, container_name,
+                                             context.section, display_name, field_path, parent))
+        return len(self.table.widgets) - 1
+
+    def _walk_member(self, key: str, value: Any, prefix: str, display_prefix: str,
+                     context: Optional[_WidgetContext], owner: int) -> None:
+        """Walk one member of an object; context is the member's widget traversal state."""
+        path = _join(prefix, key)
+        display = f"{display_prefix}->{key}" if display_prefix else key
+
+        if isinstance(value, str):
+            self._record_string(path, value, display, owner)
+        elif isinstance(value, dict):
+            self._walk_dict(value, path, display, context, owner)
+        elif isinstance(value, BaseModel):
+            self._walk_dict(dict(_model_items(value)), path, display, None, owner)
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                item_path = f"{path}.{i}"
+                if isinstance(item, BaseModel):
+                    item = dict(_model_items(item))
+                if isinstance(item, dict):
+                    readable_id = readable_identifier(item, i)
+                    item_context = None
+                    item_owner = owner
+                    if context is not None:
+                        widget_path = _join(context.path, i)
+                        widget_display = f"{context.display_name}->{key}[{i}]->{readable_id}"
+                        item_owner = self._record_widget(item, widget_path, i, context.parent_type, context.container_name,
+                                                         context, widget_display, item_path, owner)
+                        item_context = _WidgetContext(widget_path, "", item.get('type'), True, context.section,
+                                                      widget_display, item_path)
+                    self._walk_dict(item, item_path, f"{display}[{i}]->{readable_id}", item_context, item_owner)
+                elif isinstance(item, str):
+                    self._record_string(item_path, item, f"{display}[{i}]", owner)
+
+    def _walk_dict(self, data: Dict[str, Any], prefix: str, display_prefix: str,
+                   context: Optional[_WidgetContext], owner: int) -> None:
+        widget_type = ''
+        if context is not None:
+            # A dict reached directly (not as a list item) is a widget if it has a type
+            if 'type' in data and not context.already_yielded:
+                owner = self._record_widget(data, context.path, 0, context.parent_type, context.container_name,
+                                            context, context.display_name, context.field_path, owner)
+            widget_type = data.get('type', '')
+
+        for key, value in data.items():
+            child_context = None
+            if context is not None and isinstance(value, (dict, list)) and (
+                    key in WIDGET_CONTAINERS or (
+                        widget_type in LAYOUT_TYPES and isinstance(value, list) and value
+                        and isinstance(value[0], dict) and 'type' in value[0])):
+                # Readable paths name a list container on its items ("children[0]->...")
+                child_display = f"{context.display_name}->{key}" if isinstance(value, dict) else context.display_name
+                child_context = _WidgetContext(_join(context.path, key), key, widget_type, False, context.section,
+                                               child_display, _join(prefix, key))
+            self._walk_member(key, value, prefix, display_prefix, child_context, owner)
+
+
+class _PODWalker:
+    """
+    Walks POD endpoints and template once, recording script fields with the same
+    paths and display names as the original POD search, and widgets with the same
+    semantics as the POD widget collection.
+    """
+
+    def __init__(self, table: ModelWalkTable):
+        self.table = table
+
+    def walk_model(self, pod_model) -> None:
+        for i, endpoint in enumerate(pod_model.seed.endPoints or []):
+            if not isinstance(endpoint, dict):
+                continue
+            path = f"seed.endPoints[{i}]"
+            endpoint_name = endpoint.get('name', f'endpoint_{i}')
+            self.table.endpoints.append(EndpointNode(endpoint, path, f"endpoint->name: {endpoint_name}"))
+            for field_name, field_value in endpoint.items():
+                if isinstance(field_value, str):
+                    self._record_string(f"{path}.{field_name}", field_value,
+                                        f"endpoint->name: {endpoint_name}->{field_name}", -1)
+
+        if pod_model.seed.template:
+            self._walk_template(pod_model.seed.template, "seed.template", True, True, -1)
+
+    def _record_string(self, path: str, value: str, display_name: str, parent: int) -> None:
+        self.table.strings.append(StringNode(path, value, parent))
+        if is_script_value(value):
+            self.table.script_fields.append(ScriptFieldNode(path, value, display_name, parent))
+
+    def _walk_template(self, node: Any, path: str, script_search: bool, widget_search: bool, owner: int) -> None:
+        """
+        Walk a template node.
+
+        script_search: the node is visited by the script field search (dict widgets
+        and their dict children). widget_search: the node is visited by the widget
+        collection (typed widgets, their children, and lists).
+        """
+        if isinstance(node, dict):
+            is_widget = widget_search and 'type' in node
+            if is_widget:
+                self.table.widgets.append(WidgetNode(node, path, 0, None, "", 'template', path, path, owner))
+                owner = len(self.table.widgets) - 1
+            if script_search:
+                widget_type = node.get('type', 'unknown')
+                widget_id = node.get('id', 'unnamed')
+                for field_name, field_value in node.items():
+                    if isinstance(field_value, str):
+                        self._record_string(f"{path}.{field_name}", field_value,
+                                            f"{widget_type} widget->id: {widget_id}->{field_name}", owner)
+            children = node.get('children')
+            if (script_search or is_widget) and isinstance(children, list):
+                for i, child in enumerate(children):
+                    self._walk_template(child, f"{path}.children[{i}]",
+                                        script_search and isinstance(child, dict), is_widget, owner)
+        elif isinstance(node, list) and (script_search or widget_search):
+            for i, item in enumerate(node):
+                self._walk_template(item, f"{path}[{i}]", script_search and isinstance(item, dict), widget_search, owner)
+
+
+def build_pmd_walk_table(pmd_model) -> ModelWalkTable:
+    """Walk a PMD model once and return its node table."""
+    table = ModelWalkTable()
+    _PMDWalker(table).walk_model(pmd_model)
+    return table
+
+
+def build_pod_walk_table(pod_model) -> ModelWalkTable:
+    """Walk a POD model once and return its node table."""
+    table = ModelWalkTable()
+    _PODWalker(table).walk_model(pod_model)
+    return table
+
+
+def walk_presentation_widgets(data: Dict[str, Any], base_path: str = "", parent_type: str = None) -> List[WidgetNode]:
+    """Walk raw presentation data and return its widgets in document order."""
+    table = ModelWalkTable()
+    _PMDWalker(table).walk_widgets(data, base_path, parent_type)
+    return table.widgets
@@ -1,9 +1,17 @@
+import hashlib
+import os
+import threading
+import time
+from bisect import bisect_left
 from pydantic import BaseModel, Field, PrivateAttr
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Callable, Iterator, Set, Tuple, TYPE_CHECKING
 from lark import Tree
 
 if TYPE_CHECKING:
     from file_processing.context_tracker import AnalysisContext
+    from .json_source_index import JsonSourceIndex, JsonSpan
+    from .pmd_preprocessor import ScriptBlock
+    from .model_walker import ModelWalkTable
 
 # --- Lazy import for the Lark parser ---
 # This avoids a circular dependency if the parser ever needs the models.
@@ -17,10 +25,125 @@ def get_pmd_script_parser():
         _pmd_script_parser = parse_with_preprocessor
     return _pmd_script_parser
 
+def _freeze_hash_to_lines(hash_to_lines: Optional[Dict[str, List[List[int]]]]) -> Dict[str, Tuple[Tuple[int, ...], ...]]:
+    """Copy a hash -> line ranges mapping into tuples so lookups cannot consume it."""
+    return {content_hash: tuple(tuple(line_range) for line_range in line_ranges)
+            for content_hash, line_ranges in (hash_to_lines or {}).items()}
+
 # -----------------------------------------------------------------------------
 # 📄 Models for Individual File Types
 # -----------------------------------------------------------------------------
 
+class SourceIndexedModel(BaseModel):
+    """
+    Base for JSON file models (PMD, POD, AMD, SMD) that resolve JSON paths to source lines.
+    
+    The parser builds the index while parsing; models created directly (e.g. in tests)
+    build it lazily from source_content on first use.
+    """
+    _source_index: Optional['JsonSourceIndex'] = PrivateAttr(default=None)
+    _source_index_built: bool = PrivateAttr(default=False)
+    # <% %> block table from the preprocessor, in document order (PMD and POD only)
+    _script_blocks: Optional[List['ScriptBlock']] = PrivateAttr(default=None)
+    
+    def set_source_index(self, source_index: Optional['JsonSourceIndex']):
+        """Set the JSON path -> source span index built by the parser."""
+        self._source_index = source_index
+        self._source_index_built = True
+    
+    def get_source_index(self) -> Optional['JsonSourceIndex']:
+        """Get the source index, building it from source_content if needed."""
+        if not self._source_index_built:
+            from .json_source_index import build_json_source_index
+            self._source_index = build_json_source_index(getattr(self, 'source_content', ''))
+            self._source_index_built = True
+        return self._source_index
+    
+    def get_line_for_path(self, path) -> Optional[int]:
+        """
+        Get the source line for a JSON path.
+        
+        Args:
+            path: Tuple path (e.g. ("presentation", "body")) or path string
+                  (e.g. "seed.template.children[0]")
+            
+        Returns:
+            Line number (1-based), or None if the path is not in the source
+        """
+        source_index = self.get_source_index()
+        if source_index is None:
+            return None
+        if isinstance(path, str):
+            from .json_source_index import parse_json_path
+            path = parse_json_path(path)
+        return source_index.line_for_path(path)
+
+    def set_script_blocks(self, script_blocks: List['ScriptBlock']):
+        """Set the <% %> block table found by the preprocessor."""
+        self._script_blocks = script_blocks
+
+    def get_script_blocks(self) -> List['ScriptBlock']:
+        """Get the <% %> block table, building it from source_content if needed."""
+        if self._script_blocks is None:
+            from .pmd_preprocessor import extract_script_blocks
+            self._script_blocks = extract_script_blocks(getattr(self, 'source_content', ''))
+        return self._script_blocks
+
+    def json_path_for_field(self, field_path: str) -> tuple:
+        """Translate a model field path into the JSON path of the source file."""
+        from .json_source_index import parse_json_path
+        return parse_json_path(field_path)
+
+    def get_span_for_field(self, field_path: str) -> Optional['JsonSpan']:
+        """Get the source span of a model field path, or None if it is not in the source."""
+        source_index = self.get_source_index()
+        if source_index is None:
+            return None
+        return source_index.get_span(self.json_path_for_field(field_path))
+
+    def get_script_line_for_field(self, field_path: str, script_value: str) -> Optional[int]:
+        """
+        Get the line where AST line 1 of a script field starts, by source offset.
+        
+        The field's source span comes from the index and the first <% %> block
+        inside it from the block table, so duplicate or escaped scripts resolve
+        to their own occurrence without any text search.
+        
+        Args:
+            field_path: Model field path (e.g. "onLoad", "seed.endPoints[0].onReceive")
+            script_value: The field value, used to tell scripts from template expressions
+            
+        Returns:
+            Line number (1-based), or None if the field cannot be located
+        """
+        span = self.get_span_for_field(field_path)
+        if span is None:
+            return None
+        script_blocks = self.get_script_blocks()
+        position = bisect_left(script_blocks, (span.start_offset,))
+        if position == len(script_blocks) or script_blocks[position].start_offset >= span.end_offset:
+            return None
+        start_line = script_blocks[position].start_line
+        # Template expressions ("text <% expr %>") map AST line 1 to the block itself
+        if not script_value.startswith('<%'):
+            return start_line
+        # AST line 1 is the first code after <%, counting the (possibly escaped) newlines before it
+        after_open = script_value[2:]
+        leading = after_open[:len(after_open) - len(after_open.lstrip(' \t\r\n'))]
+        return start_line + leading.count('\n')
+
+    def release_source(self):
+        """
+        Drop the source text and its index, keeping the parsed model.
+
+        Used by low-memory analysis for models that stay alive as cross-file
+        summaries after their own file's findings have been emitted.
+        """
+        if hasattr(self, 'source_content'):
+            self.source_content = ""
+        self.set_source_index(None)
+        self.set_script_blocks([])
+
 class ScriptModel(BaseModel):
     """Represents the structure of a .script file."""
     source: str
@@ -36,7 +159,7 @@ class PMDPresentation(BaseModel):
     footer: Dict[str, Any] = Field(default_factory=dict)
     tabs: Optional[List[Dict[str, Any]]] = None
 
-class PMDModel(BaseModel):
+class PMDModel(SourceIndexedModel):
     """Represents the structure of a .pmd page file."""
     pageId: str
     securityDomains: Optional[List[str]] = Field(default_factory=list)
@@ -57,8 +180,10 @@ class PMDModel(BaseModel):
     _cached_script_fields: Optional[List[tuple]] = PrivateAttr(default=None)
     # Private attribute to store line mappings for script fields
     _line_mappings: Optional[Dict[str, List[int]]] = PrivateAttr(default=None)
-    # Private attribute to store hash-based line mappings (hash -> list of line ranges)
-    _hash_to_lines: Optional[Dict[str, List[List[int]]]] = PrivateAttr(default=None)
+    # Private attribute to store hash-based line mappings (hash -> line ranges by occurrence, read-only)
+    _hash_to_lines: Optional[Dict[str, Tuple[Tuple[int, ...], ...]]] = PrivateAttr(default=None)
+    # Private attribute to cache the single-pass walk table (script fields, widgets, endpoints, strings)
+    _walk_table: Optional['ModelWalkTable'] = PrivateAttr(default=None)
 
     def _parse_script(self, script_content: Optional[str], context: Optional['ProjectContext'] = None) -> Optional[Tree]:
         """A helper method to parse a script string using the custom Lark parser."""
@@ -70,7 +195,7 @@ class PMDModel(BaseModel):
         except Exception as e:
             # Failed to parse, log the error if context is available
             if context is not None:
-                context.parsing_errors.append(f"{self.file_path}: Script parsing failed - {str(e)}")
+                context.add_parsing_error(f"{self.file_path}: Script parsing failed - {str(e)}")
             return None
 
     def get_onLoad_ast(self, context: Optional['ProjectContext'] = None) -> Optional[Tree]:
@@ -90,10 +215,16 @@ class PMDModel(BaseModel):
         self._line_mappings = line_mappings
     
     def set_hash_to_lines_mapping(self, hash_to_lines: Dict[str, List[List[int]]]):
-        """Set the hash-based line mappings for precise line number tracking."""
-        self._hash_to_lines = hash_to_lines or {}
+        """
+        Set the hash-based line mappings for precise line number tracking.
+        
+        The mapping is frozen so that lookups never consume it: the nth occurrence
+        of a script always resolves to the same lines, however often (and from
+        however many threads) script fields are extracted.
+        """
+        self._hash_to_lines = _freeze_hash_to_lines(hash_to_lines)
     
-    def get_script_start_line(self, script_value: str) -> Optional[int]:
+    def get_script_start_line(self, script_value: str, occurrence: int = 0) -> Optional[int]:
         """
         Get the starting line number for a script value using hash-based mapping.
         
@@ -102,6 +233,7 @@ class PMDModel(BaseModel):
         
         Args:
             script_value: The full script content (including <% and %>)
+            occurrence: Which occurrence of this exact script to resolve (0 = first in the file)
             
         Returns:
             Line number (1-based) where AST line 1 starts, or None if not found
@@ -123,16 +255,13 @@ class PMDModel(BaseModel):
         # So we need to hash the script_value as-is (it already has real newlines)
         content_hash = hashlib.sha256(script_value.encode('utf-8')).hexdigest()
         
-        # Pop the next unused occurrence
-        if content_hash in self._hash_to_lines and self._hash_to_lines[content_hash]:
-            line_list = self._hash_to_lines[content_hash].pop(0)
-            
-            if line_list:
-                # Calculate the offset for AST line 1
-                # AST line 1 is the first line of code after <%
-                # Count newlines from start to the first code after <%
-                offset = self._calculate_ast_line_1_offset(script_value, line_list)
-                return offset
+        # Look up the requested occurrence without consuming it
+        line_ranges = self._hash_to_lines.get(content_hash, ())
+        if occurrence < len(line_ranges) and line_ranges[occurrence]:
+            # Calculate the offset for AST line 1
+            # AST line 1 is the first line of code after <%
+            # Count newlines from start to the first code after <%
+            return self._calculate_ast_line_1_offset(script_value, line_ranges[occurrence])
         
         return None
     
@@ -211,6 +340,28 @@ class PMDModel(BaseModel):
         # This could be enhanced to map specific lines within the script
         return self._line_mappings[field_path][0] if self._line_mappings[field_path] else processed_line
     
+    def get_walk_table(self) -> 'ModelWalkTable':
+        """Get the table of script fields, widgets, endpoints and strings, walking the model once."""
+        if self._walk_table is None:
+            from .model_walker import build_pmd_walk_table
+            self._walk_table = build_pmd_walk_table(self)
+        return self._walk_table
+    
+    def json_path_for_field(self, field_path: str) -> tuple:
+        """Translate a model field path into the JSON path of the source file."""
+        path = super().json_path_for_field(field_path)
+        if not path:
+            return path
+        if path[0] == 'inboundEndpoints':
+            return ('endPoints',) + path[1:]
+        if path[0] == 'outboundEndpoints':
+            return ('outboundData', 'outboundEndPoints') + path[1:]
+        if path[:2] == ('includes', 'scripts'):
+            return ('include',) + path[2:]
+        if path[:2] == ('presentation', 'attributes'):
+            return ('presentation',) + path[2:]
+        return path
+    
     def get_cached_script_fields(self) -> Optional[List[tuple]]:
         """Get the cached script fields if available."""
         return self._cached_script_fields
@@ -231,7 +382,7 @@ class PodSeed(BaseModel):
     # - Any widget that can have children arrays with nested widgets
     # Additional seed properties can be added as needed
 
-class PodModel(BaseModel):
+class PodModel(SourceIndexedModel):
     """Represents the structure of a .pod file."""
     podId: str
     seed: PodSeed
@@ -239,19 +390,24 @@ class PodModel(BaseModel):
     source_content: str = Field(default="", exclude=True)
     
     # Private attribute to store hash-based line mappings (same as PMDModel)
-    _hash_to_lines: Optional[Dict[str, List[List[int]]]] = PrivateAttr(default=None)
+    _hash_to_lines: Optional[Dict[str, Tuple[Tuple[int, ...], ...]]] = PrivateAttr(default=None)
+    # Private attribute to cache extracted script fields (same as PMDModel)
+    _cached_script_fields: Optional[List[tuple]] = PrivateAttr(default=None)
+    # Private attribute to cache the single-pass walk table (same as PMDModel)
+    _walk_table: Optional['ModelWalkTable'] = PrivateAttr(default=None)
     
     def set_hash_to_lines_mapping(self, hash_to_lines: Dict[str, List[List[int]]]):
         """Set the hash-based line mappings for precise line number tracking (same as PMDModel)."""
-        self._hash_to_lines = hash_to_lines or {}
+        self._hash_to_lines = _freeze_hash_to_lines(hash_to_lines)
     
-    def get_script_start_line(self, script_value: str) -> Optional[int]:
+    def get_script_start_line(self, script_value: str, occurrence: int = 0) -> Optional[int]:
         """
         Get the starting line number for a script value using hash-based mapping.
         Same implementation as PMDModel for consistency.
         
         Args:
             script_value: The full script content (including <% and %>)
+            occurrence: Which occurrence of this exact script to resolve (0 = first in the file)
             
         Returns:
             Line number (1-based) where AST line 1 starts, or None if not found
@@ -263,14 +419,11 @@ class PodModel(BaseModel):
         
         content_hash = hashlib.sha256(script_value.encode('utf-8')).hexdigest()
         
-        # Pop the next unused occurrence
-        if content_hash in self._hash_to_lines and self._hash_to_lines[content_hash]:
-            line_list = self._hash_to_lines[content_hash].pop(0)
-            
-            if line_list:
-                # Calculate the offset for AST line 1 (same logic as PMDModel)
-                offset = self._calculate_ast_line_1_offset(script_value, line_list)
-                return offset
+        # Look up the requested occurrence without consuming it
+        line_ranges = self._hash_to_lines.get(content_hash, ())
+        if occurrence < len(line_ranges) and line_ranges[occurrence]:
+            # Calculate the offset for AST line 1 (same logic as PMDModel)
+            return self._calculate_ast_line_1_offset(script_value, line_ranges[occurrence])
         
         return None
     
@@ -330,6 +483,21 @@ class PodModel(BaseModel):
             # This shouldn't happen in normal cases, but handle gracefully
             return line_list[-1] if line_list else 1
     
+    def get_walk_table(self) -> 'ModelWalkTable':
+        """Get the table of script fields, widgets, endpoints and strings, walking the model once."""
+        if self._walk_table is None:
+            from .model_walker import build_pod_walk_table
+            self._walk_table = build_pod_walk_table(self)
+        return self._walk_table
+    
+    def get_cached_script_fields(self) -> Optional[List[tuple]]:
+        """Get the cached script fields if available."""
+        return self._cached_script_fields
+    
+    def set_cached_script_fields(self, script_fields: List[tuple]):
+        """Set the cached script fields."""
+        self._cached_script_fields = script_fields
+    
     def get_template_widgets(self) -> List[Dict[str, Any]]:
         """
         Recursively extracts all widgets from the template, including nested children.
@@ -398,7 +566,7 @@ class AMDRoute(BaseModel):
     pageId: str
     parameters: Optional[List[str]] = Field(default_factory=list)
 
-class AMDModel(BaseModel):
+class AMDModel(SourceIndexedModel):
     """Represents the structure of an .amd application definition file."""
     routes: Dict[str, AMDRoute]
     baseUrls: Optional[Dict[str, str]] = Field(default_factory=dict)
@@ -407,7 +575,7 @@ class AMDModel(BaseModel):
     file_path: str = Field(..., exclude=True)
     source_content: str = Field(default="", exclude=True)
     
-class SMDModel(BaseModel):
+class SMDModel(SourceIndexedModel):
     """Model representing an SMD (Site Model Definition) file."""
     id: str
     applicationId: str
@@ -444,16 +612,29 @@ class SMDModel(BaseModel):
 # 🗂️ The Central Project Context
 # -----------------------------------------------------------------------------
 
+class ModelLoadError(Exception):
+    """Parsing the deferred files of a type failed as a whole (raised on their first access)."""
+
+
 class ProjectContext:
     """A central repository to hold all parsed models from the application."""
     def __init__(self):
-        self.pmds: Dict[str, PMDModel] = {}          # Maps pageId to PMDModel
-        self.scripts: Dict[str, ScriptModel] = {}    # Maps file name to ScriptModel
-        self.amd: AMDModel = None                    # Assumes one .amd file per app
-        self.pods: Dict[str, PodModel] = {}          # Maps podId to PodModel
-        self.smd: SMDModel = None                    # Assumes one .smd file per app
+        self._pmds: Dict[str, PMDModel] = {}         # Maps pageId to PMDModel
+        self._scripts: Dict[str, ScriptModel] = {}   # Maps file name to ScriptModel
+        self._amd: AMDModel = None                   # Assumes one .amd file per app
+        self._pods: Dict[str, PodModel] = {}         # Maps podId to PodModel
+        self._smd: SMDModel = None                   # Assumes one .smd file per app
         self.parsing_errors: List[str] = []          # To track files that failed validation
         
+        # Lazy model materialization: source files not yet parsed, keyed by extension
+        self._pending_sources: Dict[str, Dict[str, Any]] = {}
+        self._loading_extensions: set = set()
+        self._model_loader: Optional[Callable[[Dict[str, Any], 'ProjectContext'], None]] = None
+        self._materialize_lock = threading.RLock()
+        # Seconds spent parsing deferred files (and files parsed one at a time in low-memory
+        # mode), so entry points can report parsing apart from the analysis it happens in
+        self.parse_time: float = 0.0
+        
         # Context tracking for informing users about missing cross-file dependencies
         self.analysis_context: Optional['AnalysisContext'] = None
         
@@ -463,7 +644,223 @@ class ProjectContext:
         
         # Performance optimization: Cache ASTs to avoid repeated parsing
         self._cached_asts: Dict[str, Tree] = {}  # Maps script content hash to AST
+        # ASTs being parsed, so concurrent requests for the same script wait for one parse
+        self._pending_asts: Dict[int, threading.Event] = {}
+        # Guards the caches above, the parsing errors and the AST request count; rule and
+        # parse threads share them (scoped contexts share the lock with the caches)
+        self._cache_lock = threading.Lock()
+        
+        # Content digests by file path (see file_digests)
+        self._file_digests: Dict[str, str] = {}
+        self._file_sizes: Dict[str, int] = {}
+        
+        # Rule profiling: AST lookups served, and the file types read while model_reads is set
+        self.ast_requests: int = 0
+        self.model_reads: Optional[set] = None
+        
+        # Per-file pre-computation stats (set by parse workers on their temporary context)
+        self.precomputed_ast_count: int = 0
+        self.precomputed_ast_error_count: int = 0
+        # Pre-compute script fields and ASTs as deferred files are parsed (set by the rules
+        # engine when a run analyzes every file with rules that read scripts)
+        self.precompute_deferred: bool = False
+        # Files parsed, analyzed and released one at a time (low-memory mode; see parsed_files)
+        self.released_files: List[str] = []
 
+    # --- Lazy model materialization -----------------------------------------
+    
+    def set_lazy_sources(self, sources_by_extension: Dict[str, Dict[str, Any]],
+                         model_loader: Callable[[Dict[str, Any], 'ProjectContext'], None]):
+        """
+        Defer parsing until the models of a file type are first accessed.
+        
+        Args:
+            sources_by_extension: Maps extensions ('.pmd', '.pod', ...) to {file_path: SourceFile}
+            model_loader: Called once per extension with its source files and this context;
+                          must add the parsed models to the context
+        """
+        self._pending_sources = dict(sources_by_extension)
+        self._model_loader = model_loader
+    
+    def is_file_type_loaded(self, extension: str) -> bool:
+        """Check whether the models for a file type (e.g. '.script') have been parsed."""
+        return extension not in self._pending_sources and extension not in self._loading_extensions
+    
+    def materialize_all(self):
+        """Parse every file type that is still pending."""
+        for extension in list(self._pending_sources):
+            self._materialize(extension)
+    
+    def materialize(self, file_types: Set[str]):
+        """Parse the pending files of the given types (e.g. {'.pmd'}) now."""
+        for extension in sorted(file_types):
+            if extension in self._pending_sources:
+                self._materialize(extension)
+    
+    def present_file_types(self) -> Set[str]:
+        """The file types (e.g. '.pmd') with at least one file, parsed or pending, without parsing."""
+        present = {extension for extension, source_files in self._pending_sources.items() if source_files}
+        if self._pmds:
+            present.add('.pmd')
+        if self._pods:
+            present.add('.pod')
+        if self._scripts:
+            present.add('.script')
+        if self._amd is not None:
+            present.add('.amd')
+        if self._smd is not None:
+            present.add('.smd')
+        return present
+    
+    def parsed_files(self) -> List[str]:
+        """Paths of the files parsed so far, including released ones, without triggering any parsing."""
+        return [model.file_path for model in self.loaded_models()] + list(self.released_files)
+    
+    def loaded_models(self) -> Iterator[Any]:
+        """Iterate over all models parsed so far, without triggering any parsing."""
+        yield from list(self._pmds.values())
+        yield from list(self._pods.values())
+        yield from list(self._scripts.values())
+        if self._amd is not None:
+            yield self._amd
+        if self._smd is not None:
+            yield self._smd
+    
+    def _materialize(self, extension: str):
+        """Parse the pending source files for an extension on first access."""
+        if self.model_reads is not None:
+            self.model_reads.add(extension)
+        if extension not in self._pending_sources and extension not in self._loading_extensions:
+            return
+        with self._materialize_lock:
+            # Re-entrant access while loading (the loader adding models) must not load again.
+            # Other threads wait on the lock until the loader has finished.
+            if extension not in self._pending_sources or extension in self._loading_extensions:
+                return
+            source_files = self._pending_sources.pop(extension)
+            self._load_models(extension, source_files)
+    
+    def _materialize_file(self, file_path: str):
+        """Parse a single pending source file, leaving the other files of its type pending."""
+        extension = os.path.splitext(file_path)[1].lower()
+        if file_path not in self._pending_sources.get(extension, {}):
+            return
+        with self._materialize_lock:
+            pending = self._pending_sources.get(extension)
+            if not pending or file_path not in pending:
+                return
+            source_file = pending.pop(file_path)
+            if not pending:
+                del self._pending_sources[extension]
+            self._load_models(extension, {file_path: source_file})
+    
+    def _load_models(self, extension: str, source_files: Dict[str, Any]):
+        """Run the model loader (holding the materialize lock), timing it and reporting its failure."""
+        # Loads nested in another load (the loader reading other types) are timed by the outer one
+        outermost = not self._loading_extensions
+        self._loading_extensions.add(extension)
+        start = time.perf_counter()
+        try:
+            self._model_loader(source_files, self)
+        except Exception as e:
+            # Files that fail to parse are recorded by the loader; this is the loader itself failing
+            raise ModelLoadError(f"Could not parse the {extension} files: {e}") from e
+        finally:
+            self._loading_extensions.discard(extension)
+            if outermost:
+                self.parse_time += time.perf_counter() - start
+    
+    def file_paths(self, file_types: Optional[Set[str]] = None) -> List[str]:
+        """
+        Sorted paths of the files, parsed or pending, without parsing anything.
+        
+        Args:
+            file_types: Only the files of these types (None = every file)
+        """
+        paths = {path for extension, source_files in self._pending_sources.items()
+                 if file_types is None or extension in file_types for path in source_files}
+        paths.update(model.file_path for model in self.loaded_models()
+                     if file_types is None or os.path.splitext(model.file_path)[1].lower() in file_types)
+        return sorted(paths)
+    
+    def file_digests(self) -> Dict[str, str]:
+        """
+        SHA-256 digest of every file's content, keyed by path, without parsing anything.
+        
+        Pending files are hashed from their source, parsed ones from the model's source
+        text; a file whose source has been released has no digest.
+        """
+        for extension, source_files in list(self._pending_sources.items()):
+            for path, source_file in list(source_files.items()):
+                if path not in self._file_digests:
+                    self._file_digests[path] = hashlib.sha256(source_file.content.encode('utf-8')).hexdigest()
+        for model in self.loaded_models():
+            content = getattr(model, 'source_content', None) or getattr(model, 'source', None)
+            if model.file_path not in self._file_digests and content:
+                self._file_digests[model.file_path] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return dict(self._file_digests)
+    
+    def file_sizes(self) -> Dict[str, int]:
+        """
+        Length of every file's content (characters), keyed by path, without parsing anything.
+        
+        Like file_digests, a file whose source has been released has no size.
+        """
+        for extension, source_files in list(self._pending_sources.items()):
+            for path, source_file in list(source_files.items()):
+                if path not in self._file_sizes:
+                    self._file_sizes[path] = len(source_file.content)
+        for model in self.loaded_models():
+            content = getattr(model, 'source_content', None) or getattr(model, 'source', None)
+            if model.file_path not in self._file_sizes and content:
+                self._file_sizes[model.file_path] = len(content)
+        return dict(self._file_sizes)
+    
+    @property
+    def pmds(self) -> Dict[str, PMDModel]:
+        self._materialize('.pmd')
+        return self._pmds
+    
+    @pmds.setter
+    def pmds(self, value: Dict[str, PMDModel]):
+        self._pmds = value
+    
+    @property
+    def pods(self) -> Dict[str, PodModel]:
+        self._materialize('.pod')
+        return self._pods
+    
+    @pods.setter
+    def pods(self, value: Dict[str, PodModel]):
+        self._pods = value
+    
+    @property
+    def scripts(self) -> Dict[str, ScriptModel]:
+        self._materialize('.script')
+        return self._scripts
+    
+    @scripts.setter
+    def scripts(self, value: Dict[str, ScriptModel]):
+        self._scripts = value
+    
+    @property
+    def amd(self) -> Optional[AMDModel]:
+        self._materialize('.amd')
+        return self._amd
+    
+    @amd.setter
+    def amd(self, value: Optional[AMDModel]):
+        self._amd = value
+    
+    @property
+    def smd(self) -> Optional[SMDModel]:
+        self._materialize('.smd')
+        return self._smd
+    
+    @smd.setter
+    def smd(self, value: Optional[SMDModel]):
+        self._smd = value
+    
     def get_script_by_name(self, name: str) -> Optional[ScriptModel]:
         """Retrieves a script model by its file name (e.g., 'utils.script')."""
         return self.scripts.get(name)
@@ -487,6 +884,16 @@ class ProjectContext:
         if self.analysis_context:
             self.analysis_context.register_skipped_check(rule_name, check_name, reason)
 
+    def register_rule_timeout(self, rule_name: str, time_limit: float, files_completed: int, files_total: int) -> None:
+        """Record that a rule was cancelled after exceeding its time limit."""
+        if self.analysis_context:
+            self.analysis_context.register_rule_timeout(rule_name, time_limit, files_completed, files_total)
+
+    def register_rules_not_executed(self, rules: Dict[str, str]) -> None:
+        """Record the rules the engine skipped for missing file types (rule name -> reason)."""
+        if self.analysis_context:
+            self.analysis_context.register_rules_not_executed(rules)
+
     def get_pmd_by_id(self, page_id: str) -> Optional[PMDModel]:
         """Retrieves a PMD model by its pageId."""
         return self.pmds.get(page_id)
@@ -498,29 +905,169 @@ class ProjectContext:
     def get_smd(self) -> Optional[SMDModel]:
         """Retrieves the SMD model."""
         return self.smd
-    
+
+    def split_by_file(self, file_types: Optional[Set[str]] = None) -> Dict[str, 'ProjectContext']:
+        """
+        Build one context per file, each holding that file's model plus the SMD.
+
+        The SMD is the only cross-file input rules read, so a rule run against a file's
+        context reports the same findings for that file as against the whole project.
+        The file contexts share this context's analysis context and script field / AST
+        caches. Pending file types are parsed first.
+
+        Args:
+            file_types: Only parse pending files of these types (the SMD is always parsed);
+                        None parses every pending type
+
+        Returns:
+            Dictionary mapping file paths to their single-file ProjectContext
+        """
+        if file_types is None:
+            self.materialize_all()
+        else:
+            for extension in list(self._pending_sources):
+                if extension in file_types or extension == '.smd':
+                    self._materialize(extension)
+        file_contexts: Dict[str, ProjectContext] = {}
+
+        def file_context(file_path: str) -> 'ProjectContext':
+            if file_path not in file_contexts:
+                file_contexts[file_path] = self._scoped_context()
+            return file_contexts[file_path]
+
+        for page_id, pmd_model in self._pmds.items():
+            file_context(pmd_model.file_path)._pmds[page_id] = pmd_model
+        for pod_id, pod_model in self._pods.items():
+            file_context(pod_model.file_path)._pods[pod_id] = pod_model
+        for script_name, script_model in self._scripts.items():
+            file_context(script_model.file_path)._scripts[script_name] = script_model
+        if self._amd is not None:
+            file_context(self._amd.file_path)._amd = self._amd
+        if self._smd is not None:
+            file_context(self._smd.file_path)
+        return file_contexts
+
+    def file_context(self, file_path: str) -> Optional['ProjectContext']:
+        """
+        Build the context of a single file (its model plus the SMD), as split_by_file does.
+
+        Only that file (and the SMD) is parsed if still pending, so a caller visiting
+        files one by one parses just the files it visits.
+
+        Returns:
+            The single-file ProjectContext, or None if the file has no model (e.g. it failed to parse)
+        """
+        self._materialize_file(file_path)
+        scoped = self._scoped_context()
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == '.smd':
+            return scoped if scoped._smd is not None and scoped._smd.file_path == file_path else None
+        if extension == '.amd':
+            if self._amd is None or self._amd.file_path != file_path:
+                return None
+            scoped._amd = self._amd
+            return scoped
+        models, scoped_models = {
+            '.pmd': (self._pmds, scoped._pmds),
+            '.pod': (self._pods, scoped._pods),
+            '.script': (self._scripts, scoped._scripts),
+        }.get(extension, ({}, {}))
+        for key, model in list(models.items()):
+            if model.file_path == file_path:
+                scoped_models[key] = model
+        return scoped if scoped_models else None
+
+    def _scoped_context(self) -> 'ProjectContext':
+        """An empty context sharing the SMD, the analysis context and the caches of this one."""
+        scoped = ProjectContext()
+        scoped._smd = self.smd
+        scoped.analysis_context = self.analysis_context
+        scoped._cached_pmd_script_fields = self._cached_pmd_script_fields
+        scoped._cached_pod_script_fields = self._cached_pod_script_fields
+        scoped._cached_asts = self._cached_asts
+        scoped._pending_asts = self._pending_asts
+        scoped._cache_lock = self._cache_lock
+        return scoped
+
     def get_cached_pmd_script_fields(self, pmd_id: str) -> Optional[List[tuple]]:
         """Get cached script fields for a PMD model."""
-        return self._cached_pmd_script_fields.get(pmd_id)
+        with self._cache_lock:
+            return self._cached_pmd_script_fields.get(pmd_id)
     
     def set_cached_pmd_script_fields(self, pmd_id: str, script_fields: List[tuple]):
         """Cache script fields for a PMD model."""
-        self._cached_pmd_script_fields[pmd_id] = script_fields
+        with self._cache_lock:
+            self._cached_pmd_script_fields[pmd_id] = script_fields
     
     def get_cached_pod_script_fields(self, pod_id: str) -> Optional[List[tuple]]:
         """Get cached script fields for a POD model."""
-        return self._cached_pod_script_fields.get(pod_id)
+        with self._cache_lock:
+            return self._cached_pod_script_fields.get(pod_id)
     
     def set_cached_pod_script_fields(self, pod_id: str, script_fields: List[tuple]):
         """Cache script fields for a POD model."""
-        self._cached_pod_script_fields[pod_id] = script_fields
+        with self._cache_lock:
+            self._cached_pod_script_fields[pod_id] = script_fields
     
     def get_cached_ast(self, script_content: str) -> Optional[Tree]:
         """Get cached AST for script content."""
         content_hash = hash(script_content)
-        return self._cached_asts.get(content_hash)
+        with self._cache_lock:
+            self.ast_requests += 1
+            return self._cached_asts.get(content_hash)
     
     def set_cached_ast(self, script_content: str, ast: Tree):
         """Cache AST for script content."""
         content_hash = hash(script_content)
-        self._cached_asts[content_hash] = ast
\ No newline at end of file
+        with self._cache_lock:
+            self._cached_asts[content_hash] = ast
+    
+    def get_or_parse_ast(self, script_content: str, parse: Callable[[], Optional[Tree]]) -> Optional[Tree]:
+        """
+        The cached AST for script content, parsing it with parse() on the first request.
+        
+        Each script is parsed once however many threads request it: the first request
+        parses (outside the lock, so different scripts parse in parallel) and concurrent
+        requests for the same script wait for its result. A failed parse (None) is cached
+        too. parse() must not raise.
+        """
+        content_hash = hash(script_content)
+        with self._cache_lock:
+            self.ast_requests += 1
+            if content_hash in self._cached_asts:
+                return self._cached_asts[content_hash]
+            pending = self._pending_asts.get(content_hash)
+            if pending is None:
+                self._pending_asts[content_hash] = threading.Event()
+        
+        if pending is not None:
+            pending.wait()
+            with self._cache_lock:
+                return self._cached_asts.get(content_hash)
+        
+        ast = None
+        try:
+            ast = parse()
+        finally:
+            with self._cache_lock:
+                self._cached_asts[content_hash] = ast
+                self._pending_asts.pop(content_hash).set()
+        return ast
+    
+    def add_parsing_error(self, message: str):
+        """Record a file or script that failed to parse (safe to call from any thread)."""
+        with self._cache_lock:
+            self.parsing_errors.append(message)
+    
+    def merge_caches(self, other: 'ProjectContext'):
+        """Add the script fields, ASTs and parsing errors another context computed to this one."""
+        with other._cache_lock:
+            pmd_fields = dict(other._cached_pmd_script_fields)
+            pod_fields = dict(other._cached_pod_script_fields)
+            asts = dict(other._cached_asts)
+            errors = list(other.parsing_errors)
+        with self._cache_lock:
+            self._cached_pmd_script_fields.update(pmd_fields)
+            self._cached_pod_script_fields.update(pod_fields)
+            self._cached_asts.update(asts)
+            self.parsing_errors.extend(errors)
\ No newline at end of file
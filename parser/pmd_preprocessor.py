@@ -6,7 +6,19 @@ Key insight:
 
 import re
 import hashlib
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, NamedTuple
+
+class ScriptBlock(NamedTuple):
+    """
+    A <% %> block found in a FULL PMD/Pod file.
+    
+    Offsets are 0-based into the file content (end is exclusive), lines are 1-based.
+    """
+    start_offset: int
+    end_offset: int
+    start_line: int
+    end_line: int
+
 
 class PMDPreprocessor:
     def __init__(self, warn_ambiguous=True):
@@ -89,51 +101,48 @@ class PMDPreprocessor:
         Returns:
             Dict mapping SHA256 hash -> list of line number ranges
         """
+        hash_to_lines, _ = self._scan_script_blocks(code)
+        return hash_to_lines
+    
+    def _scan_script_blocks(self, code: str) -> Tuple[Dict[str, List[List[int]]], List[ScriptBlock]]:
+        """
+        Single pass over the FULL FILE recording every <% %> block.
+        
+        Returns:
+            tuple: (hash_to_lines, script_blocks) - the hash mapping and the block
+            table in document order
+        """
         hash_to_lines = {}
-        i = 0
+        script_blocks = []
         current_line = 1
+        i = 0
         
-        while i < len(code):
-            # Track line numbers
-            if code[i] == '\n':
-                current_line += 1
-                i += 1
-                continue
+        while True:
+            start_pos = code.find('<%', i)
+            if start_pos == -1:
+                break
             
-            # Look for script block start
-            if code[i:i+2] == '<%':
-                script_start_line = current_line
-                
-                # Find the end
-                end_pos = code.find('%>', i + 2)
-                if end_pos == -1:
-                    break  # Unclosed
-                
-                # Extract FULL block including <% %>
-                script_block = code[i:end_pos+2]
-                
-                # Count lines in this block
-                lines_in_block = script_block.count('\n')
-                script_end_line = current_line + lines_in_block
-                
-                # Create line range
-                line_range = list(range(script_start_line, script_end_line + 1))
-                
-                # Hash the ORIGINAL content (before any escaping)
-                content_hash = hashlib.sha256(script_block.encode('utf-8')).hexdigest()
-                
-                # Store mapping
-                if content_hash not in hash_to_lines:
-                    hash_to_lines[content_hash] = []
-                hash_to_lines[content_hash].append(line_range)
-                
-                # Move past this block
-                current_line = script_end_line
-                i = end_pos + 2
-            else:
-                i += 1
+            # Find the end
+            end_pos = code.find('%>', start_pos + 2)
+            if end_pos == -1:
+                break  # Unclosed
+            
+            current_line += code.count('\n', i, start_pos)
+            
+            # Extract FULL block including <% %>
+            script_block = code[start_pos:end_pos+2]
+            script_end_line = current_line + script_block.count('\n')
+            
+            # Hash the ORIGINAL content (before any escaping)
+            content_hash = hashlib.sha256(script_block.encode('utf-8')).hexdigest()
+            hash_to_lines.setdefault(content_hash, []).append(list(range(current_line, script_end_line + 1)))
+            script_blocks.append(ScriptBlock(start_pos, end_pos + 2, current_line, script_end_line))
+            
+            # Move past this block
+            current_line = script_end_line
+            i = end_pos + 2
         
-        return hash_to_lines
+        return hash_to_lines, script_blocks
     
     # ===== ALL YOUR EXISTING METHODS BELOW - UNCHANGED ===== 
     
@@ -497,17 +506,34 @@ def preprocess_pmd_content(content: str) -> Tuple[str, dict, Dict[str, List[List
     """
     Preprocess PMD/Pod FULL FILE content with line tracking.
     
-    This is called by the file parsers (app_parser.py) on FULL files.
-    
     Returns:
         tuple: (processed_content, line_mappings, hash_to_lines)
     """
-    preprocessor = PMDPreprocessor()
-    
-    # Use the line tracking method for full files
-    processed_content, hash_to_lines = preprocessor.preprocess_with_line_tracking(content)
+    processed_content, hash_to_lines, _ = preprocess_pmd_source(content)
     
     # Line mappings deprecated but kept for compatibility
     line_mappings = {}
     
-    return processed_content, line_mappings, hash_to_lines
\ No newline at end of file
+    return processed_content, line_mappings, hash_to_lines
+
+
+def preprocess_pmd_source(content: str) -> Tuple[str, Dict[str, List[List[int]]], List[ScriptBlock]]:
+    """
+    Preprocess PMD/Pod FULL FILE content, also returning the <% %> block table.
+    
+    This is called by the file parsers (app_parser.py) on FULL files. The block
+    table lets script fields be mapped to lines by source offset.
+    
+    Returns:
+        tuple: (processed_content, hash_to_lines, script_blocks)
+    """
+    preprocessor = PMDPreprocessor()
+    hash_to_lines, script_blocks = preprocessor._scan_script_blocks(content)
+    processed_content = preprocessor.preprocess(content)
+    return processed_content, hash_to_lines, script_blocks
+
+
+def extract_script_blocks(content: str) -> List[ScriptBlock]:
+    """Get the <% %> block table for FULL PMD/Pod file content."""
+    _, script_blocks = PMDPreprocessor(warn_ambiguous=False)._scan_script_blocks(content)
+    return script_blocks
\ No newline at end of file
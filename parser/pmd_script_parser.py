@@ -1,9 +1,14 @@
 # In pmd_script_parser.py
 from lark import Lark
 from pathlib import Path
+import logging
 import sys
+import threading
 from importlib import resources
 from .pmd_preprocessor import PMDPreprocessor
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 # Cache for grammar content and warning flags
 _cached_grammar = None
@@ -36,62 +41,72 @@ def load_grammar() -> str:
         _cached_grammar = _read_grammar_from_disk()
     return _cached_grammar
 
-# Global parser and preprocessor instances
+# Shared parser instances, built once on first use. Lark parsers keep no per-parse state
+# on the instance, so every thread parses with the same one; the lock only guards
+# building them. Preprocessors collect per-script warnings, so each parse gets its own.
 pmd_script_parser = None
-preprocessor = None
+_earley_parser = None
+_parser_lock = threading.Lock()
+
+_MINIMAL_GRAMMAR = "?program: source_elements?\n?source_elements: statement+\n?statement: IDENTIFIER"
+
+
+def _warn_once(message: str, *args) -> None:
+    """Report a grammar problem once per process."""
+    global _grammar_warned
+    if not _grammar_warned:
+        _grammar_warned = True
+        log.warning(message, *args)
+
 
 def get_pmd_script_parser():
     """Get the PMD script parser, creating it if necessary."""
-    global pmd_script_parser, preprocessor, _grammar_warned
-    if pmd_script_parser is None:
-        try:
-            pmd_script_grammar = load_grammar()
-            pmd_script_parser = Lark(pmd_script_grammar, start='program', parser='lalr', propagate_positions=True)
-            preprocessor = PMDPreprocessor()
-        except Exception as e:
-            if not _grammar_warned:
-                print(f"Warning: Failed to load grammar with LALR: {e}")
-                _grammar_warned = True
-            # Fallback to Earley if LALR fails
+    global pmd_script_parser
+    if pmd_script_parser is not None:
+        return pmd_script_parser
+    with _parser_lock:
+        if pmd_script_parser is None:
             try:
-                pmd_script_grammar = load_grammar()
-                pmd_script_parser = Lark(pmd_script_grammar, start='program', parser='earley', propagate_positions=True)
-                preprocessor = None
-                if not _grammar_warned:
-                    print("Fallback: Using Earley parser")
-                    _grammar_warned = True
-            except Exception as e2:
-                if not _grammar_warned:
-                    print(f"Warning: Failed to load grammar with Earley: {e2}")
-                    _grammar_warned = True
-                # Final fallback to minimal grammar
-                pmd_script_parser = Lark("?program: source_elements?\n?source_elements: statement+\n?statement: IDENTIFIER", start='program', parser='earley')
-                preprocessor = None
-    
+                pmd_script_parser = Lark(load_grammar(), start='program', parser='lalr', propagate_positions=True)
+            except Exception as e:
+                _warn_once("Failed to load grammar with LALR: %s", e)
+                # Fallback to Earley if LALR fails
+                try:
+                    pmd_script_parser = Lark(load_grammar(), start='program', parser='earley', propagate_positions=True)
+                except Exception as e2:
+                    log.warning("Failed to load grammar with Earley: %s", e2)
+                    # Final fallback to minimal grammar
+                    pmd_script_parser = Lark(_MINIMAL_GRAMMAR, start='program', parser='earley')
     return pmd_script_parser
 
+
+def _get_earley_parser():
+    """The Earley parser for scripts the LALR parser rejects, built once on first use."""
+    global _earley_parser
+    if _earley_parser is not None:
+        return _earley_parser
+    with _parser_lock:
+        if _earley_parser is None:
+            _earley_parser = Lark(load_grammar(), start='program', parser='earley', propagate_positions=True)
+    return _earley_parser
+
+
 def parse_with_preprocessor(code: str):
     """Parse code using the preprocessor and LALR parser, with fallback to Earley."""
-    global preprocessor, _grammar_warned
-    
-    # Ensure we have a preprocessor
-    if preprocessor is None:
-        try:
-            preprocessor = PMDPreprocessor()
-        except Exception as e:
-            if not _grammar_warned:
-                print(f"Warning: Failed to create preprocessor: {e}")
-                _grammar_warned = True
-            # Fallback to direct parsing if preprocessor creation fails
-            return get_pmd_script_parser().parse(code)
+    try:
+        preprocessor = PMDPreprocessor()
+    except Exception as e:
+        _warn_once("Failed to create preprocessor: %s", e)
+        # Fallback to direct parsing if preprocessor creation fails
+        return get_pmd_script_parser().parse(code)
     
     # Preprocess the code to disambiguate braces
     preprocessed_code = preprocessor.preprocess(code)
     
     # Log any warnings from preprocessing
-    if preprocessor.warnings:
+    if preprocessor.warnings and log.isEnabledFor(logging.DEBUG):
         for warning in preprocessor.warnings:
-            print(f"Preprocessor warning: {warning}")
+            log.debug("Preprocessor warning: %s", warning)
     
     # Try parsing with LALR first
     try:
@@ -99,20 +114,13 @@ def parse_with_preprocessor(code: str):
     except Exception as e:
         # If LALR fails (e.g., due to newline issues), fall back to Earley
         try:
-            from lark import Lark
-            grammar = load_grammar()  # Uses cached grammar
-            earley_parser = Lark(grammar, start='program', parser='earley', propagate_positions=True)
-            return earley_parser.parse(preprocessed_code)  # Use preprocessed code
+            return _get_earley_parser().parse(preprocessed_code)  # Use preprocessed code
         except Exception as e2:
-            if not _grammar_warned:
-                print(f"Warning: Both LALR and Earley parsing failed: {e2}")
-                _grammar_warned = True
+            _warn_once("Both LALR and Earley parsing failed: %s", e2)
             # Final fallback - try minimal parsing
             try:
-                minimal_parser = Lark("?program: source_elements?\n?source_elements: statement+\n?statement: IDENTIFIER", start='program', parser='earley')
+                minimal_parser = Lark(_MINIMAL_GRAMMAR, start='program', parser='earley')
                 return minimal_parser.parse(code)
             except Exception as e3:
-                if not _grammar_warned:
-                    print(f"Warning: All parsing attempts failed: {e3}")
-                    _grammar_warned = True
-                return None
\ No newline at end of file
+                log.debug("All parsing attempts failed: %s", e3)
+                return None
@@ -0,0 +1,141 @@
+"""
+Per-rule cost model for longest-first scheduling.
+
+The thread pool and the process pool used to take rules in discovery order, so a
+heavy rule submitted last set the makespan while the other workers idled. The engine
+now estimates what each rule will cost on the current input and submits the most
+expensive work first.
+
+A rule's cost is modelled as seconds of CPU time per MB of input (the files of its
+FILE_TYPES). The rate is learned from previous runs and persisted in a small JSON
+file (cost_profile); a rule with no recorded runs falls back to its static
+Rule.COST_HINT. The times measured during a run are folded into the rates once, at
+the end of the run, and smoothed, so one slow run on a busy machine does not reorder
+the next run on its own. Shared work done lazily (a script AST parsed on its first
+request) is charged to the rule that triggers it, as that rule does wait for it.
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.arcane_paths import user_root
+from utils.events import get_logger
+
+from .rules.script.shared.rule_base import ScriptVisitorGroup
+
+log = get_logger(__name__)
+
+COST_PROFILE_FORMAT = 1
+
+# Weight of the latest run in a rule's recorded rate
+SMOOTHING = 0.5
+
+BYTES_PER_MB = 1024 * 1024
+
+
+def default_cost_profile_path() -> str:
+    """The cost profile file in the per-user data directory."""
+    return os.path.join(user_root(), "cache", "rule_costs.json")
+
+
+def cost_key(rule: Any) -> str:
+    """Name a rule's cost is recorded under (a visitor group is measured as a whole)."""
+    return rule.__class__.__name__
+
+
+def input_bytes(rule: Any, file_sizes: Dict[str, int]) -> int:
+    """Size of the files a rule analyzes."""
+    file_types = rule.FILE_TYPES
+    return sum(size for path, size in file_sizes.items()
+               if os.path.splitext(path)[1].lower() in file_types)
+
+
+class RuleCostProfile:
+    """Learned per-rule cost rates, optionally persisted between runs."""
+
+    def __init__(self, path: Optional[str] = None, persist: bool = False):
+        """
+        Args:
+            path: Cost profile file (None = default_cost_profile_path())
+            persist: Load recorded rates from the file and write the updated ones back
+        """
+        self.path = path or default_cost_profile_path()
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._rates: Dict[str, Dict[str, Any]] = {}
+        # (seconds, input size) measured per rule since the last save
+        self._run_totals: Dict[str, Tuple[float, int]] = {}
+        self._loaded = not persist
+        self._dirty = False
+
+    def rate(self, rule: Any) -> float:
+        """Estimated seconds per MB of input: the recorded rate, else the static hint."""
+        with self._lock:
+            self._load()
+            recorded = self._rates.get(cost_key(rule))
+        if recorded is not None:
+            return recorded["seconds_per_mb"]
+        if isinstance(rule, ScriptVisitorGroup):
+            # One traversal for all members costs at most what they cost on their own
+            return sum(self.rate(member) for member in rule.rules)
+        return float(getattr(rule, "COST_HINT", 0.0))
+
+    def estimate(self, rule: Any, size: int) -> float:
+        """Estimated seconds for a rule on size bytes of input."""
+        return self.rate(rule) * size / BYTES_PER_MB
+
+    def record(self, rule: Any, seconds: float, size: int) -> None:
+        """Add the measured time of a rule on size bytes of input to the current run."""
+        if size <= 0:
+            return
+        with self._lock:
+            run_seconds, run_size = self._run_totals.get(cost_key(rule), (0.0, 0))
+            self._run_totals[cost_key(rule)] = (run_seconds + seconds, run_size + size)
+
+    def order(self, rules: Iterable[Any], file_sizes: Dict[str, int]) -> List[Any]:
+        """The rules, most expensive first (ties keep their order)."""
+        return sorted(rules, key=lambda rule: -self.estimate(rule, input_bytes(rule, file_sizes)))
+
+    def save(self) -> None:
+        """Fold the costs measured in the run into the rates, and write them if persisted."""
+        with self._lock:
+            self._load()
+            for key, (seconds, size) in self._run_totals.items():
+                measured = seconds * BYTES_PER_MB / size
+                previous = self._rates.get(key)
+                if previous is None:
+                    self._rates[key] = {"seconds_per_mb": measured, "runs": 1}
+                else:
+                    previous["seconds_per_mb"] = SMOOTHING * measured + (1 - SMOOTHING) * previous["seconds_per_mb"]
+                    previous["runs"] += 1
+            self._dirty = self._dirty or bool(self._run_totals)
+            self._run_totals = {}
+            if not self.persist or not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                temp_path = f"{self.path}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump({"format": COST_PROFILE_FORMAT, "rules": self._rates}, f, indent=1, sort_keys=True)
+                os.replace(temp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                log.warning("[RuleCosts] Could not write %s: %s", self.path, e)
+
+    def _load(self) -> None:
+        """Read the cost profile on first use; a missing or unreadable profile starts empty."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning("[RuleCosts] Ignoring unreadable cost profile %s: %s", self.path, e)
+            return
+        if isinstance(data, dict) and data.get("format") == COST_PROFILE_FORMAT and isinstance(data.get("rules"), dict):
+            self._rates = {key: value for key, value in data["rules"].items()
+                           if isinstance(value, dict) and isinstance(value.get("seconds_per_mb"), (int, float))}
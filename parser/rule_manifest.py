@@ -0,0 +1,96 @@
+"""
+Static manifest of the built-in rules for frozen (PyInstaller) builds.
+
+Walking the rule packages through the frozen importer imports every rule module just
+to discover classes and read their metadata, which dominates cold start. The build
+writes the rule metadata to a JSON manifest (the .spec files call
+write_rule_manifest() before analysis); frozen apps read it instead of walking the
+packages and import only the modules of the rules they run.
+
+Regenerate manually with: python -m parser.rule_manifest
+"""
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from utils.events import get_logger
+
+log = get_logger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = "rule_manifest.json"
+
+
+def get_rule_manifest_path() -> str:
+    """Path of the manifest inside the source tree or the PyInstaller bundle."""
+    from utils.arcane_paths import resource_path
+    return resource_path(os.path.join("parser", MANIFEST_FILENAME))
+
+
+def build_rule_manifest() -> Dict[str, Any]:
+    """
+    Discover the built-in rules and describe them for the manifest.
+
+    Returns:
+        Manifest dictionary with one entry per rule class, in discovery order
+    """
+    from .rule_registry import RuleRegistry
+    from __version__ import __version__
+
+    rule_entries = []
+    for metadata in RuleRegistry(manifest_path=None).get_builtin_metadata():
+        rule_entries.append({
+            "name": metadata.name,
+            "module": metadata.module,
+            "id": metadata.rule_id,
+            "description": metadata.description,
+            "severity": metadata.severity,
+            "available_settings": metadata.available_settings,
+            "documentation": metadata.documentation,
+        })
+    return {"version": MANIFEST_VERSION, "app_version": __version__, "rules": rule_entries}
+
+
+def write_rule_manifest(path: Optional[str] = None) -> str:
+    """
+    Generate the manifest and write it to disk.
+
+    Args:
+        path: Output path (defaults to parser/rule_manifest.json)
+
+    Returns:
+        The path written
+    """
+    path = path or get_rule_manifest_path()
+    manifest = build_rule_manifest()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    log.info("[RuleManifest] Wrote %d rule(s) to %s", len(manifest["rules"]), path)
+    return path
+
+
+def load_rule_manifest(path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Read the rule entries of a manifest.
+
+    Returns:
+        The rule entries, or None if the manifest is missing, unreadable or of another version
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        if os.path.exists(path):
+            log.warning("[RuleManifest] Ignoring unreadable manifest %s: %s", path, e)
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        log.warning("[RuleManifest] Ignoring manifest %s with unsupported version", path)
+        return None
+    return manifest.get("rules", [])
+
+
+if __name__ == "__main__":
+    from utils.events import configure_events
+    configure_events()
+    write_rule_manifest()
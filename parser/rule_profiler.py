@@ -0,0 +1,157 @@
+"""
+Per-rule and per-file cost profiling (--profile-rules).
+
+--timing reports analysis as a single stage. With profiling enabled, RulesEngine runs
+every rule file by file and records, for each (rule, file) unit, the wall and CPU time
+spent, whether the rule read the file's model, the script ASTs it requested and the
+findings it emitted. The profile aggregates them per rule and keeps the slowest
+(rule, file) units, for a console table, a JSON file and the web job results. Each
+rule's total is shown next to the time the scheduler estimated for it (see rule_costs).
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+# File path recorded for rules that run once against the whole project
+PROJECT_UNIT = "(project)"
+
+DEFAULT_TOP_N = 10
+
+
+class UnitProfile(NamedTuple):
+    """Cost of running one rule against one file (or the whole project)."""
+    rule: str
+    file_path: str
+    wall_time: float
+    cpu_time: float
+    files_visited: int
+    asts_consumed: int
+    findings: int
+
+
+class RuleProfiler:
+    """Collects unit profiles during a run and summarizes them per rule."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._units: List[UnitProfile] = []
+        # Estimated seconds per rule, set by the engine before the run
+        self.estimates: Dict[str, float] = {}
+
+    @property
+    def units(self) -> List[UnitProfile]:
+        with self._lock:
+            return list(self._units)
+
+    def profile_unit(self, rule_name: str, file_path: str, context, run: Callable[[], List[Any]],
+                     unit_files: Optional[Iterable[str]] = None) -> List[Any]:
+        """
+        Run one (rule, file) unit and record its cost.
+
+        Args:
+            rule_name: Class name of the rule
+            file_path: File the unit covers (PROJECT_UNIT for whole-project runs)
+            context: ProjectContext the rule runs against
+            run: Runs the rule and returns its findings
+            unit_files: Files the unit covers, to count the visited ones (defaults to file_path)
+
+        Returns:
+            The findings returned by run
+        """
+        context.model_reads = set()
+        asts_before = context.ast_requests
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            findings = run()
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.thread_time() - cpu_start
+            model_reads, context.model_reads = context.model_reads, None
+
+        files = [file_path] if unit_files is None else unit_files
+        files_visited = sum(1 for path in files if os.path.splitext(path)[1].lower() in model_reads)
+        self.record(UnitProfile(rule_name, file_path, wall_time, cpu_time, files_visited,
+                                context.ast_requests - asts_before, len(findings)))
+        return findings
+
+    def record(self, unit: UnitProfile) -> None:
+        """Add a unit profile."""
+        with self._lock:
+            self._units.append(unit)
+
+    def rule_totals(self) -> List[Dict[str, Any]]:
+        """Per-rule totals, slowest rule first."""
+        totals: Dict[str, Dict[str, Any]] = {}
+        for unit in self.units:
+            rule_total = totals.setdefault(unit.rule, {
+                "rule": unit.rule, "estimated_time": self.estimates.get(unit.rule),
+                "wall_time": 0.0, "cpu_time": 0.0,
+                "files_visited": 0, "asts_consumed": 0, "findings": 0,
+            })
+            rule_total["wall_time"] += unit.wall_time
+            rule_total["cpu_time"] += unit.cpu_time
+            rule_total["files_visited"] += unit.files_visited
+            rule_total["asts_consumed"] += unit.asts_consumed
+            rule_total["findings"] += unit.findings
+        return sorted(totals.values(), key=lambda rule_total: rule_total["wall_time"], reverse=True)
+
+    def slowest_units(self, top_n: int = DEFAULT_TOP_N) -> List[UnitProfile]:
+        """The top_n slowest (rule, file) units."""
+        return sorted(self.units, key=lambda unit: unit.wall_time, reverse=True)[:top_n]
+
+    def to_dict(self, top_n: int = DEFAULT_TOP_N) -> Dict[str, Any]:
+        """Serializable profile for the JSON file and web job results."""
+        rule_totals = self.rule_totals()
+        return {
+            "total_wall_time": round(sum(rule["wall_time"] for rule in rule_totals), 6),
+            "total_cpu_time": round(sum(rule["cpu_time"] for rule in rule_totals), 6),
+            "rules": [
+                dict(rule, wall_time=round(rule["wall_time"], 6), cpu_time=round(rule["cpu_time"], 6),
+                     estimated_time=None if rule["estimated_time"] is None else round(rule["estimated_time"], 6))
+                for rule in rule_totals
+            ],
+            "slowest_units": [
+                {
+                    "rule": unit.rule,
+                    "file_path": unit.file_path,
+                    "wall_time": round(unit.wall_time, 6),
+                    "cpu_time": round(unit.cpu_time, 6),
+                    "asts_consumed": unit.asts_consumed,
+                    "findings": unit.findings,
+                }
+                for unit in self.slowest_units(top_n)
+            ],
+        }
+
+    def format_table(self, top_n: int = DEFAULT_TOP_N) -> str:
+        """Console table of the per-rule totals and the slowest units."""
+        rule_totals = self.rule_totals()
+        total_wall = sum(rule["wall_time"] for rule in rule_totals)
+        name_width = max([len("Rule")] + [len(rule["rule"]) for rule in rule_totals])
+
+        lines = ["RULE PROFILE", "=" * 60]
+        lines.append(f"{'Rule':<{name_width}}  {'Est (s)':>8}  {'Wall (s)':>9}  {'%':>5}  {'CPU (s)':>8}  "
+                     f"{'Files':>5}  {'ASTs':>5}  {'Findings':>8}")
+        for rule in rule_totals:
+            share = (rule["wall_time"] / total_wall) * 100 if total_wall > 0 else 0
+            estimate = "-" if rule["estimated_time"] is None else f"{rule['estimated_time']:.3f}"
+            lines.append(f"{rule['rule']:<{name_width}}  {estimate:>8}  {rule['wall_time']:>9.3f}  {share:>5.1f}  "
+                         f"{rule['cpu_time']:>8.3f}  {rule['files_visited']:>5}  "
+                         f"{rule['asts_consumed']:>5}  {rule['findings']:>8}")
+
+        slowest = self.slowest_units(top_n)
+        if slowest:
+            lines.append("")
+            lines.append("Slowest (rule, file) pairs:")
+            for unit in slowest:
+                lines.append(f"  {unit.wall_time:>8.3f}s  {unit.rule}  {unit.file_path}")
+        lines.append("=" * 60)
+        return "\n".join(lines)
+
+    def write_json(self, path: str, top_n: int = DEFAULT_TOP_N) -> None:
+        """Write the profile to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(top_n), f, indent=2)
+            f.write("\n")
@@ -0,0 +1,226 @@
+"""
+Process-wide registry of rule classes.
+
+Discovering rules walks every built-in rule package and executes every user rule
+file. The registry does that once per process and reloads the user rule files only
+when their set or modification times change, so RulesEngine instances and the
+configuration endpoints read rule classes and metadata without rediscovering them.
+
+Frozen builds ship a static manifest of the built-in rules (see rule_manifest.py).
+There the registry reads the built-in metadata from the manifest and imports a rule's
+module only when its class is first requested.
+"""
+import importlib
+import importlib.util
+import inspect
+import os
+import pkgutil
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from . import rules
+from .rules.base import Rule
+from .rule_manifest import get_rule_manifest_path, load_rule_manifest
+from utils.arcane_paths import get_rule_dirs, is_frozen
+from utils.events import get_logger
+
+log = get_logger(__name__)
+
+
+class RuleMetadata(NamedTuple):
+    """What is known about a rule without instantiating it."""
+    name: str
+    module: str
+    rule_type: str  # "built-in" or "user"
+    rule_id: str
+    description: str
+    severity: str
+    available_settings: Dict[str, Any]
+    documentation: Dict[str, Any]
+
+
+def _metadata_for_class(rule_class: Type[Rule], rule_type: str) -> RuleMetadata:
+    return RuleMetadata(rule_class.__name__, rule_class.__module__, rule_type, rule_class.ID,
+                        rule_class.DESCRIPTION, rule_class.SEVERITY,
+                        rule_class.AVAILABLE_SETTINGS, rule_class.DOCUMENTATION)
+
+
+class RuleRegistry:
+    """Discovers rule classes once and caches them for the process."""
+
+    def __init__(self, manifest_path: Optional[str] = None):
+        """
+        Args:
+            manifest_path: Static rule manifest to read the built-in rules from instead of
+                           walking the rule packages (None = always walk the packages)
+        """
+        self._lock = threading.RLock()
+        self._manifest_path = manifest_path
+        self._builtin_metadata: Optional[List[RuleMetadata]] = None
+        self._builtin_classes: Dict[str, Type[Rule]] = {}
+        self._user_metadata: List[RuleMetadata] = []
+        self._user_classes: Dict[str, Type[Rule]] = {}
+        self._user_signature: Optional[Tuple[Tuple[str, int, int], ...]] = None
+
+    def get_rule_metadata(self) -> List[RuleMetadata]:
+        """Get the metadata of all concrete, non-example rules in discovery order."""
+        with self._lock:
+            return self.get_builtin_metadata() + self._get_user_metadata()
+
+    def get_builtin_metadata(self) -> List[RuleMetadata]:
+        """Get the metadata of the built-in rules, from the manifest if one is configured."""
+        with self._lock:
+            if self._builtin_metadata is None:
+                entries = load_rule_manifest(self._manifest_path) if self._manifest_path else None
+                if entries is not None:
+                    self._builtin_metadata = [
+                        RuleMetadata(entry["name"], entry["module"], "built-in", entry.get("id", ""),
+                                     entry.get("description", ""), entry.get("severity", "ADVICE"),
+                                     entry.get("available_settings", {}), entry.get("documentation", {}))
+                        for entry in entries
+                    ]
+                else:
+                    for rule_class in self._load_builtin_classes():
+                        self._builtin_classes[rule_class.__name__] = rule_class
+                    self._builtin_metadata = [_metadata_for_class(rule_class, "built-in")
+                                              for rule_class in self._builtin_classes.values()]
+            return list(self._builtin_metadata)
+
+    def get_rule_class(self, metadata: RuleMetadata) -> Optional[Type[Rule]]:
+        """
+        Get the class of a rule, importing its module on first use.
+
+        Returns:
+            The rule class, or None if its module cannot be imported
+        """
+        with self._lock:
+            if metadata.rule_type == "user":
+                return self._user_classes.get(metadata.name)
+            rule_class = self._builtin_classes.get(metadata.name)
+            if rule_class is None:
+                try:
+                    module = importlib.import_module(metadata.module)
+                    rule_class = getattr(module, metadata.name)
+                except Exception as e:
+                    log.error("[RulesEngine] Error loading built-in rule %s: %s", metadata.module, e)
+                    return None
+                self._builtin_classes[metadata.name] = rule_class
+            return rule_class
+
+    def get_rule_classes(self) -> List[Tuple[Type[Rule], str]]:
+        """
+        Get all concrete, non-example rule classes in discovery order.
+
+        Returns:
+            List of (rule class, rule type) tuples, where rule type is "built-in" or "user"
+        """
+        rule_classes = []
+        for metadata in self.get_rule_metadata():
+            rule_class = self.get_rule_class(metadata)
+            if rule_class is not None:
+                rule_classes.append((rule_class, metadata.rule_type))
+        return rule_classes
+
+    def get_rule_names(self) -> List[str]:
+        """Get the class names of all available rules."""
+        return [metadata.name for metadata in self.get_rule_metadata()]
+
+    def get_default_severities(self) -> Dict[str, str]:
+        """Get the default severity of every available rule, keyed by class name."""
+        return {metadata.name: metadata.severity for metadata in self.get_rule_metadata()}
+
+    def invalidate(self) -> None:
+        """Forget all discovered classes so the next lookup discovers them again."""
+        with self._lock:
+            self._builtin_metadata = None
+            self._builtin_classes = {}
+            self._user_metadata = []
+            self._user_classes = {}
+            self._user_signature = None
+
+    def _get_user_metadata(self) -> List[RuleMetadata]:
+        """Get the user rule metadata, reloading the user rule files if they changed."""
+        signature = self._get_user_rule_signature()
+        if signature != self._user_signature:
+            user_classes = self._load_user_classes(signature)
+            self._user_classes = {rule_class.__name__: rule_class for rule_class in user_classes}
+            self._user_metadata = [_metadata_for_class(rule_class, "user") for rule_class in user_classes]
+            self._user_signature = signature
+        return list(self._user_metadata)
+
+    def _load_builtin_classes(self) -> List[Type[Rule]]:
+        """Import the built-in rule packages and collect their rule classes."""
+        rule_classes = []
+        for _, name, _ in pkgutil.walk_packages(rules.__path__, f"{rules.__name__}."):
+            try:
+                module = __import__(name, fromlist="dummy")
+                rule_classes.extend(self._extract_rule_classes(module))
+            except Exception as e:
+                log.error("[RulesEngine] Error loading built-in rule %s: %s", name, e)
+        return rule_classes
+
+    def _get_user_rule_files(self) -> List[str]:
+        """List the user rule files of the custom rule directories."""
+        rule_files = []
+        for rule_dir in get_rule_dirs():
+            # Only process user custom directories (not built-in)
+            # Use basename check to avoid false positives if "custom" appears elsewhere in path
+            if os.path.basename(rule_dir) == "user" and os.path.isdir(rule_dir):
+                for file in os.listdir(rule_dir):
+                    if file.endswith(".py") and not file.startswith("__"):
+                        rule_files.append(os.path.join(rule_dir, file))
+        return rule_files
+
+    def _get_user_rule_signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Identify the current user rule files by path, modification time and size."""
+        signature = []
+        for path in self._get_user_rule_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _load_user_classes(self, signature: Tuple[Tuple[str, int, int], ...]) -> List[Type[Rule]]:
+        """Execute the user rule files and collect their rule classes."""
+        rule_classes = []
+        for path, _, _ in signature:
+            file = os.path.basename(path)
+            mod_name = os.path.splitext(file)[0]
+            try:
+                spec = importlib.util.spec_from_file_location(mod_name, path)
+                if spec and spec.loader:
+                    mod = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(mod)
+                    rule_classes.extend(self._extract_rule_classes(mod))
+            except Exception as e:
+                log.error("[RulesEngine] Error loading user rule %s from %s: %s", file, os.path.dirname(path), e)
+        return rule_classes
+
+    def _extract_rule_classes(self, module) -> List[Type[Rule]]:
+        """Extract the concrete rule classes defined or imported by a module."""
+        rule_classes = []
+        for member_name, member_obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(member_obj, Rule) and member_obj is not Rule:
+                # Skip abstract classes
+                if hasattr(member_obj, '__abstractmethods__') and member_obj.__abstractmethods__:
+                    continue
+
+                # Skip example rules (flagged with IS_EXAMPLE = True)
+                if hasattr(member_obj, 'IS_EXAMPLE') and member_obj.IS_EXAMPLE:
+                    continue
+
+                rule_classes.append(member_obj)
+        return rule_classes
+
+
+_rule_registry = None
+
+
+def get_rule_registry() -> RuleRegistry:
+    """Get the global rule registry instance (manifest-backed in frozen builds)."""
+    global _rule_registry
+    if _rule_registry is None:
+        _rule_registry = RuleRegistry(manifest_path=get_rule_manifest_path() if is_frozen() else None)
+    return _rule_registry
@@ -1,9 +1,13 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Generator, Dict, Any, List, Tuple, Optional
+from typing import Callable, Generator, Dict, Any, FrozenSet, Iterable, List, Tuple, Optional
 from dataclasses import dataclass
 from ..models import ProjectContext, PMDModel, PodModel
+from ..model_walker import WidgetNode, readable_identifier, walk_presentation_widgets
 from lark import Tree
-import re
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 @dataclass
 class Finding:
@@ -22,6 +26,31 @@ class Finding:
     def __repr__(self) -> str:
         return f"[{self.rule_id}:{self.line}] ({self.severity}) in '{self.file_path}': {self.message}"
 
+    @property
+    def sort_key(self) -> Tuple[str, int, str, str]:
+        """Stable ordering key: file, line, rule, then message."""
+        return (self.file_path or "", self.line or 0, self.rule_id, self.message)
+
+
+def sort_findings(findings: Iterable[Finding]) -> List[Finding]:
+    """Order findings deterministically by (file, line, rule, message)."""
+    return sorted(findings, key=lambda finding: finding.sort_key)
+
+# File types a rule can declare in FILE_TYPES / REQUIRED_FILE_TYPES
+ALL_FILE_TYPES: FrozenSet[str] = frozenset({'.pmd', '.pod', '.script', '.amd', '.smd'})
+
+# Categories of file content a rule can declare in FIELD_CATEGORIES
+FIELD_SCRIPTS = 'scripts'          # script fields and standalone scripts (parsed into ASTs)
+FIELD_ENDPOINTS = 'endpoints'      # inbound / outbound endpoint definitions
+FIELD_WIDGETS = 'widgets'          # presentation widget trees
+FIELD_DOCUMENT = 'document'        # other top-level fields and the raw source text
+ALL_FIELD_CATEGORIES: FrozenSet[str] = frozenset({FIELD_SCRIPTS, FIELD_ENDPOINTS, FIELD_WIDGETS, FIELD_DOCUMENT})
+
+
+def file_type_of(file_path: str) -> str:
+    """The file type (lower-case extension, e.g. '.pmd') of a file path."""
+    return os.path.splitext(file_path)[1].lower()
+
 # The abstract base class that all rule implementations must inherit from.
 class Rule(ABC):
     """Abstract base class for all analysis rules."""
@@ -29,7 +58,32 @@ class Rule(ABC):
     ID: str = "RULE000"
     DESCRIPTION: str = "This is a base rule."
     SEVERITY: str = "ADVICE" # Can be 'ADVICE', 'ACTION'
-    
+
+    # Rules that read more than one file's models (beyond the SMD) run once against the
+    # whole project instead of per (rule, file) unit. A rule that declares neither
+    # FILE_TYPES nor CONTEXT_FILE_TYPES (itself or through a base class) is taken to be
+    # cross-file, so it sees the same project on every execution path; declaring them
+    # opts in to per-file splitting (see __init_subclass__). Set CROSS_FILE to override.
+    CROSS_FILE: bool = False
+
+    # Applicability: the file types the rule analyzes and reports on, the categories of
+    # their content it reads, and the file types it cannot run without. The engine skips
+    # (rule, file) units outside FILE_TYPES, skips rules with none of their file types
+    # present or a required type missing (reporting the latter as not executed), and does
+    # not pre-parse script ASTs when no enabled rule reads FIELD_SCRIPTS. The defaults
+    # claim everything, so rules that do not declare them run as before.
+    FILE_TYPES: FrozenSet[str] = ALL_FILE_TYPES
+    FIELD_CATEGORIES: FrozenSet[str] = ALL_FIELD_CATEGORIES
+    REQUIRED_FILE_TYPES: FrozenSet[str] = frozenset()
+
+    # File types a per-file rule reads besides the file it analyzes (the SMD by default).
+    # Their content is part of the findings cache key of every unit of the rule.
+    CONTEXT_FILE_TYPES: FrozenSet[str] = frozenset({'.smd'})
+
+    # Static cost estimate in seconds per MB of input (the files of FILE_TYPES), used to
+    # schedule expensive rules first until runs have recorded the rule's actual cost
+    COST_HINT: float = 0.1
+
     # Dictionary defining available custom settings.
     # If empty, the rule does not support custom configuration.
     AVAILABLE_SETTINGS: Dict[str, Any] = {}
@@ -42,6 +96,20 @@ class Rule(ABC):
         'recommendation': '' # "Fix" or general advice on how to resolve violations
     }
 
+    def __init_subclass__(cls, **kwargs):
+        """Derive CROSS_FILE for rules that do not set it from their declared file types."""
+        super().__init_subclass__(**kwargs)
+        if 'CROSS_FILE' in cls.__dict__:
+            return
+        rule_classes = [klass for klass in cls.__mro__[1:] if klass is not Rule and issubclass(klass, Rule)]
+        explicit = next((klass.CROSS_FILE for klass in rule_classes
+                         if 'CROSS_FILE' in klass.__dict__ and not klass.__dict__.get('_CROSS_FILE_DERIVED')), None)
+        if explicit is None:
+            explicit = not any('FILE_TYPES' in klass.__dict__ or 'CONTEXT_FILE_TYPES' in klass.__dict__
+                               for klass in [cls] + rule_classes)
+        cls.CROSS_FILE = explicit
+        cls._CROSS_FILE_DERIVED = True
+
     @abstractmethod
     def analyze(self, context: ProjectContext) -> Generator[Finding, None, None]:
         """
@@ -118,37 +186,33 @@ class Rule(ABC):
         if not content:
             return None
         
-        # Use context-level caching if available
+        def parse() -> Optional[Tree]:
+            try:
+                from ..pmd_script_parser import parse_with_preprocessor
+                return parse_with_preprocessor(content)
+            except Exception as e:
+                log.debug("Failed to parse script content: %s", e)
+                return None
+        
+        # Use context-level caching if available (each script is parsed once across threads)
         if context is not None:
-            cache_key = hash(content)
-            cached_ast = context.get_cached_ast(cache_key)
-            if cached_ast is None:
-                try:
-                    from ..pmd_script_parser import parse_with_preprocessor
-                    parsed_ast = parse_with_preprocessor(content)
-                    context.set_cached_ast(cache_key, parsed_ast)
-                    return parsed_ast
-                except Exception as e:
-                    print(f"Failed to parse script content: {e}")
-                    context.set_cached_ast(cache_key, None)
-                    return None
-            else:
-                return cached_ast
-        else:
-            # Fallback to per-rule caching for backward compatibility
-            cache_key = hash(content)
-            if not hasattr(self, '_script_ast_cache'):
-                self._script_ast_cache = {}
-            
-            if cache_key not in self._script_ast_cache:
-                try:
-                    from ..pmd_script_parser import parse_with_preprocessor
-                    self._script_ast_cache[cache_key] = parse_with_preprocessor(content)
-                except Exception as e:
-                    print(f"Failed to parse script content: {e}")
-                    self._script_ast_cache[cache_key] = None
-            
-            return self._script_ast_cache[cache_key]
+            return context.get_or_parse_ast(hash(content), parse)
+        # Fallback to per-rule caching for backward compatibility
+        return self._rule_ast_cache_lookup(content, parse)
+    
+    def _rule_ast_cache_lookup(self, content: str, parse: Callable[[], Optional[Tree]]) -> Optional[Tree]:
+        """
+        The AST of content from the rule's own cache, parsing it on a miss.
+        
+        Used without a context. The cache is created atomically and entries are only
+        added with setdefault, so threads sharing the rule agree on one AST per script
+        (a script requested concurrently may be parsed twice).
+        """
+        cache = self.__dict__.setdefault('_script_ast_cache', {})
+        cache_key = hash(content)
+        if cache_key in cache:
+            return cache[cache_key]
+        return cache.setdefault(cache_key, parse())
     
     def _get_readable_identifier(self, item: Dict[str, Any], fallback_index: int) -> str:
         """
@@ -156,10 +220,11 @@ class Rule(ABC):
         
         Priority order:
         1. id (widget ID) - most specific
-        2. label - human-readable description
-        3. type - widget type
-        4. name - for endpoints and other named items
-        5. [index] - fallback to array index
+        2. columnId - column objects
+        3. label - human-readable description
+        4. type - widget type
+        5. name - for endpoints and other named items
+        6. [index] - fallback to array index
         
         Args:
             item: Dictionary to extract identifier from
@@ -168,30 +233,7 @@ class Rule(ABC):
         Returns:
             Human-readable identifier string
         """
-        # Priority 1: id
-        if 'id' in item and isinstance(item['id'], str) and item['id'].strip():
-            return f"id: {item['id']}"
-
-        # Priority 2: columnId
-        if 'columnId' in item and isinstance(item['columnId'], str) and item['columnId'].strip():
-            return f"columnId: {item['columnId']}"
-        
-        # Priority 3: label
-        if 'label' in item and isinstance(item['label'], str) and item['label'].strip():
-            # Truncate long labels
-            label = item['label'][:40] + '...' if len(item['label']) > 40 else item['label']
-            return f"label: {label}"
-        
-        # Priority 4: type
-        if 'type' in item and isinstance(item['type'], str) and item['type'].strip():
-            return f"type: {item['type']}"
-        
-        # Priority 5: name (for endpoints, etc.)
-        if 'name' in item and isinstance(item['name'], str) and item['name'].strip():
-            return f"name: {item['name']}"
-        
-        # Fallback: index
-        return f"[{fallback_index}]"
+        return readable_identifier(item, fallback_index)
     
     def _is_multiline_script_block(self, script_value: str) -> bool:
         """
@@ -221,109 +263,49 @@ class Rule(ABC):
 
     def _extract_script_fields(self, pmd_model: PMDModel) -> List[Tuple[str, str, str, int]]:
         """Internal method to extract script fields without caching."""
+        # Script fields come from the model's single-pass walk table
+        return self._resolve_script_field_lines(
+            pmd_model, pmd_model.get_walk_table().script_fields, self._calculate_script_line_offset)
+    
+    def _resolve_script_field_lines(self, model, field_nodes, fuzzy_line_offset) -> List[Tuple[str, str, str, int]]:
+        """
+        Attach line offsets to walked script fields.
+        
+        Lines resolve by source offset from the preprocessor's block table, then by
+        hash (exact line numbers), then by fuzzy search for edge cases.
+        
+        Args:
+            model: The PMD or POD model the fields belong to
+            field_nodes: ScriptFieldNode entries in document order
+            fuzzy_line_offset: Fuzzy search fallback for the model's file type
+        """
         script_fields = []
-        script_pattern = r'<%.*?%>'
+        file_content = getattr(model, 'source_content', '')
         
         # Track the last line found to search forward from there
         last_line_found = 0
         
-        # Track which hashes we've already used (for handling duplicates in order)
-        used_hashes = {}  # hash -> count of times used
+        # Occurrence index of each script value seen so far (duplicates resolve in document order)
+        occurrences = {}  # script value -> count seen
         
-        def _search_dict(data: Dict[str, Any], prefix: str = "", file_content: str = "", display_prefix: str = "") -> None:
-            """Recursively search a dictionary for script fields."""
-            nonlocal last_line_found, used_hashes
+        for field_path, value, display_name, _ in field_nodes:
+            occurrence_index = occurrences.get(value, 0)
+            occurrences[value] = occurrence_index + 1
             
-            for key, value in data.items():
-                if isinstance(value, str) and re.search(script_pattern, value, re.DOTALL):
-                    field_path = f"{prefix}.{key}" if prefix else key
-                    # Use human-readable display name
-                    display_name = f"{display_prefix}->{key}" if display_prefix else key
-                    
-                    # Try hash-based lookup first (exact line numbers for both multiline and single-line)
-                    line_offset = pmd_model.get_script_start_line(value)
-                    
-                    # Fallback to fuzzy search if hash lookup fails
-                    # This handles: POD files, edge cases, malformed scripts
-                    if line_offset is None:
-                        # Compute hash for tracking duplicates
-                        import hashlib
-                        value_hash = hashlib.sha256(value.encode('utf-8')).hexdigest()
-                        
-                        # Track occurrence index for duplicates
-                        occurrence_index = used_hashes.get(value_hash, 0)
-                        used_hashes[value_hash] = occurrence_index + 1
-                        
-                        # Use fuzzy search with duplicate handling
-                        line_offset = self._calculate_script_line_offset(
-                            file_content, value, 
-                            search_start_line=last_line_found,
-                            occurrence_index=occurrence_index
-                        ) if file_content else 1
-                    
-                    last_line_found = line_offset
-                    script_fields.append((field_path, value, display_name, line_offset))
-                elif isinstance(value, dict):
-                    new_prefix = f"{prefix}.{key}" if prefix else key
-                    new_display_prefix = f"{display_prefix}->{key}" if display_prefix else key
-                    _search_dict(value, new_prefix, file_content, new_display_prefix)
-                elif hasattr(value, 'model_dump'):  # Handle Pydantic models
-                    # Convert Pydantic model to dictionary
-                    model_dict = value.model_dump()
-                    new_prefix = f"{prefix}.{key}" if prefix else key
-                    new_display_prefix = f"{display_prefix}->{key}" if display_prefix else key
-                    _search_dict(model_dict, new_prefix, file_content, new_display_prefix)
-                elif isinstance(value, list):
-                    for i, item in enumerate(value):
-                        if isinstance(item, dict):
-                            # Create technical path with index
-                            new_prefix = f"{prefix}.{key}.{i}" if prefix else f"{key}.{i}"
-                            
-                            # Create human-readable path using priority: id -> label -> type -> name -> index
-                            readable_id = self._get_readable_identifier(item, i)
-                            new_display_prefix = f"{display_prefix}->{key}[{i}]->{readable_id}" if display_prefix else f"{key}[{i}]->{readable_id}"
-                            
-                            _search_dict(item, new_prefix, file_content, new_display_prefix)
-                        elif isinstance(item, str) and re.search(script_pattern, item, re.DOTALL):
-                            field_path = f"{prefix}.{key}.{i}" if prefix else f"{key}.{i}"
-                            # Use human-readable display name
-                            display_name = f"{display_prefix}->{key}[{i}]" if display_prefix else f"{key}[{i}]"
-                            
-                            # Try hash-based lookup first (exact line numbers)
-                            line_offset = pmd_model.get_script_start_line(item)
-                            
-                            # Fallback to fuzzy search if needed (POD files, edge cases)
-                            if line_offset is None:
-                                import hashlib
-                                value_hash = hashlib.sha256(item.encode('utf-8')).hexdigest()
-                                occurrence_index = used_hashes.get(value_hash, 0)
-                                used_hashes[value_hash] = occurrence_index + 1
-                                
-                                line_offset = self._calculate_script_line_offset(
-                                    file_content, item, 
-                                    search_start_line=last_line_found,
-                                    occurrence_index=occurrence_index
-                                ) if file_content else 1
-                            
-                            last_line_found = line_offset
-                            script_fields.append((field_path, item, display_name, line_offset))
-                        elif hasattr(item, 'model_dump'):  # Handle Pydantic models in lists
-                            # Convert Pydantic model to dictionary
-                            model_dict = item.model_dump()
-                            new_prefix = f"{prefix}.{key}.{i}" if prefix else f"{key}.{i}"
-                            
-                            # Create human-readable path using priority: id -> label -> type -> name -> index
-                            readable_id = self._get_readable_identifier(model_dict, i)
-                            new_display_prefix = f"{display_prefix}->{key}[{i}]->{readable_id}" if display_prefix else f"{key}[{i}]->{readable_id}"
-                            
-                            _search_dict(model_dict, new_prefix, file_content, new_display_prefix)
-        
-        # Get the source content from the PMD model
-        source_content = getattr(pmd_model, 'source_content', '')
-        
-        # Convert PMD model to dict for recursive search
-        pmd_dict = pmd_model.model_dump(exclude={'file_path', 'source_content'})
-        _search_dict(pmd_dict, file_content=source_content)
+            line_offset = model.get_script_line_for_field(field_path, value)
+            if line_offset is None:
+                line_offset = model.get_script_start_line(value, occurrence_index)
+            
+            # Fallback to fuzzy search with duplicate handling
+            if line_offset is None:
+                line_offset = fuzzy_line_offset(
+                    file_content, value,
+                    search_start_line=last_line_found,
+                    occurrence_index=occurrence_index
+                ) if file_content else 1
+            
+            last_line_found = line_offset
+            script_fields.append((field_path, value, display_name, line_offset))
         
         return script_fields
     
@@ -535,60 +517,24 @@ class Rule(ABC):
         """
         if not isinstance(presentation_data, dict):
             return
-            
-        # Known widget container field names
-        WIDGET_CONTAINERS = {
-            'children', 'primaryLayout', 'secondaryLayout', 'sections', 
-            'items', 'navigationTasks', 'cellTemplate', 'columns'
-        }
-        
-        # Known layout types that may contain nested structures
-        LAYOUT_TYPES = {
-            'areaLayout', 'basicFormLayout', 'section', 'hub',
-            'layout', 'panelList', 'grid', 'fieldSet'
-        }
-        
-        def _traverse_container(container_data: Any, container_path: str, container_name: str = "", already_yielded: bool = False, current_parent_type: str = None):
-            """Recursively traverse a container that may hold widgets."""
-            if isinstance(container_data, list):
-                # Direct list of widgets
-                for i, item in enumerate(container_data):
-                    if isinstance(item, dict):
-                        item_path = f"{container_path}.{i}" if container_path else str(i)
-                        yield (item, item_path, i, current_parent_type, container_name)
-                        
-                        # Recursively check for nested containers (mark as already yielded)
-                        # The item becomes the new parent
-                        item_type = item.get('type')
-                        yield from _traverse_container(item, item_path, "", already_yielded=True, current_parent_type=item_type)
-            elif isinstance(container_data, dict):
-                # If this dict has a 'type' field and hasn't been yielded yet, it's a top-level widget - yield it
-                if 'type' in container_data and not already_yielded:
-                    yield (container_data, container_path, 0, current_parent_type, container_name)
-                
-                # Check if this is a widget with nested containers
-                widget_type = container_data.get('type', '')
-                
-                # Look for known widget container fields
-                for field_name in WIDGET_CONTAINERS:
-                    if field_name in container_data:
-                        field_data = container_data[field_name]
-                        field_path = f"{container_path}.{field_name}" if container_path else field_name
-                        # Pass current widget type as parent for children
-                        yield from _traverse_container(field_data, field_path, field_name, already_yielded=False, current_parent_type=widget_type)
-                
-                # For layout types, also check for any array fields that might contain widgets
-                if widget_type in LAYOUT_TYPES:
-                    for key, value in container_data.items():
-                        if key not in WIDGET_CONTAINERS and isinstance(value, list):
-                            # Check if this list contains widget-like objects
-                            if value and isinstance(value[0], dict) and 'type' in value[0]:
-                                field_path = f"{container_path}.{key}" if container_path else key
-                                yield from _traverse_container(value, field_path, key, already_yielded=False, current_parent_type=widget_type)
-        
-        # Start traversal from the presentation data
-        yield from _traverse_container(presentation_data, base_path, "", False, parent_type)
+        
+        for node in walk_presentation_widgets(presentation_data, base_path, parent_type):
+            yield (node.widget, node.path, node.index, node.parent_type, node.container_name)
     
+    def find_presentation_widgets(self, pmd_model: PMDModel) -> List[WidgetNode]:
+        """
+        Find all widgets in every presentation section of a PMD model (including tabs).
+        
+        A view over the model's walk table, so the presentation is only walked once.
+        
+        Returns:
+            WidgetNode entries in document order with widget, path (relative to
+            presentation, e.g. "body.children.0"), index, parent_type, container_name,
+            section and a readable display_name
+        """
+        if not pmd_model.presentation:
+            return []
+        return pmd_model.get_walk_table().widgets
     
     def _parse_script_content(self, script_content: str, context=None):
         """Parse script content using the PMD script grammar with context-level caching support."""
@@ -611,7 +557,7 @@ class Rule(ABC):
                         try:
                             return preprocessor.preprocess_template_expression(stripped_content)
                         except Exception as e:
-                            print(f"Warning: Failed to parse template expression '{stripped_content[:50]}...': {e}")
+                            log.debug("Failed to parse template expression '%s...': %s", stripped_content[:50], e)
                             return None
                 
             
@@ -620,30 +566,25 @@ class Rule(ABC):
                 return self.get_cached_ast(content, context)
             else:
                 # Fallback to per-rule caching for backward compatibility
-                cache_key = hash(content)
-                if not hasattr(self, '_script_ast_cache'):
-                    self._script_ast_cache = {}
-                
-                if cache_key not in self._script_ast_cache:
-                    from ..pmd_script_parser import parse_with_preprocessor
-                    self._script_ast_cache[cache_key] = parse_with_preprocessor(content)
-                
-                return self._script_ast_cache[cache_key]
+                from ..pmd_script_parser import parse_with_preprocessor
+                return self._rule_ast_cache_lookup(content, lambda: parse_with_preprocessor(content))
         except Exception as e:
-            print(f"Failed to parse script content: {e}")
+            log.debug("Failed to parse script content: %s", e)
             # Add parsing error to context if available
             if context is not None:
-                context.parsing_errors.append(f"Script parsing failed: {str(e)}")
+                context.add_parsing_error(f"Script parsing failed: {str(e)}")
             return None
     
     # Pod-specific utility methods
     
-    def find_pod_script_fields(self, pod_model: PodModel) -> List[Tuple[str, str, str, int]]:
+    def find_pod_script_fields(self, pod_model: PodModel, context=None) -> List[Tuple[str, str, str, int]]:
         """
         Find all script content within Pod endpoints and template widgets.
+        Uses context-level caching to avoid repeated expensive walks (same as find_script_fields).
         
         Args:
             pod_model: The Pod model to search
+            context: ProjectContext for caching (optional)
             
         Returns:
             List of tuples containing:
@@ -652,98 +593,32 @@ class Rule(ABC):
             - display_name: Human-readable field name
             - line_offset: Line number where the script starts
         """
-        script_fields = []
-        script_pattern = r'<%.*?%>'
-        
-        # Track which hashes we've used (for duplicates)
-        used_hashes = {}
-        last_line_found = 0
-        
-        # Search endpoints in seed for script content (any field with <% %>)
-        if pod_model.seed.endPoints:
-            for i, endpoint in enumerate(pod_model.seed.endPoints):
-                if isinstance(endpoint, dict):
-                    for field_name, field_value in endpoint.items():
-                        if isinstance(field_value, str) and re.search(script_pattern, field_value, re.DOTALL):
-                            field_path = f"seed.endPoints[{i}].{field_name}"
-                            endpoint_name = endpoint.get('name', f'endpoint_{i}')
-                            display_name = f"endpoint->name: {endpoint_name}->{field_name}"
-                            
-                            # Try hash-based lookup first (exact line numbers)
-                            line_offset = pod_model.get_script_start_line(field_value)
-                            
-                            # Fallback to fuzzy search if needed
-                            if line_offset is None:
-                                import hashlib
-                                value_hash = hashlib.sha256(field_value.encode('utf-8')).hexdigest()
-                                occurrence_index = used_hashes.get(value_hash, 0)
-                                used_hashes[value_hash] = occurrence_index + 1
-                                
-                                line_offset = self._calculate_pod_script_line_offset(
-                                    pod_model.source_content, field_value,
-                                    search_start_line=last_line_found,
-                                    occurrence_index=occurrence_index
-                                )
-                            
-                            last_line_found = line_offset
-                            script_fields.append((field_path, field_value, display_name, line_offset))
-        
-        # Search template widgets for script content (e.g., onClick, onLoad handlers)
-        template_scripts = self._find_template_script_fields(pod_model, pod_model.seed.template, "seed.template", used_hashes, last_line_found)
-        script_fields.extend(template_scripts)
-        
-        return script_fields
-    
-    def _find_template_script_fields(self, pod_model: PodModel, widget_data: Any, path_prefix: str, used_hashes: dict, last_line_found: int) -> List[Tuple[str, str, str, int]]:
-        """Recursively search template widgets for script content."""
-        script_fields = []
-        script_pattern = r'<%.*?%>'
-        
-        def _search_widget(widget: Dict[str, Any], widget_path: str):
-            nonlocal last_line_found
-            # Search all widget fields for script content (any field with <% %>)
-            for field_name, field_value in widget.items():
-                if isinstance(field_value, str) and re.search(script_pattern, field_value, re.DOTALL):
-                    field_path = f"{widget_path}.{field_name}"
-                    widget_type = widget.get('type', 'unknown')
-                    widget_id = widget.get('id', 'unnamed')
-                    display_name = f"{widget_type} widget->id: {widget_id}->{field_name}"
-                    
-                    # Try hash-based lookup first (exact line numbers)
-                    line_offset = pod_model.get_script_start_line(field_value)
-                    
-                    # Fallback to fuzzy search if needed
-                    if line_offset is None:
-                        import hashlib
-                        value_hash = hashlib.sha256(field_value.encode('utf-8')).hexdigest()
-                        occurrence_index = used_hashes.get(value_hash, 0)
-                        used_hashes[value_hash] = occurrence_index + 1
-                        
-                        line_offset = self._calculate_pod_script_line_offset(
-                            pod_model.source_content, field_value,
-                            search_start_line=last_line_found,
-                            occurrence_index=occurrence_index
-                        )
-                    
-                    last_line_found = line_offset
-                    script_fields.append((field_path, field_value, display_name, line_offset))
+        # Use context-level caching if available
+        if context is not None:
+            cached_fields = context.get_cached_pod_script_fields(pod_model.podId)
+            if cached_fields is not None:
+                return cached_fields
             
-            # Recursively search children
-            if 'children' in widget and isinstance(widget['children'], list):
-                for i, child in enumerate(widget['children']):
-                    if isinstance(child, dict):
-                        child_path = f"{widget_path}.children[{i}]"
-                        _search_widget(child, child_path)
-        
-        if isinstance(widget_data, dict):
-            _search_widget(widget_data, path_prefix)
-        elif isinstance(widget_data, list):
-            for i, item in enumerate(widget_data):
-                if isinstance(item, dict):
-                    item_path = f"{path_prefix}[{i}]"
-                    _search_widget(item, item_path)
-        
-        return script_fields
+            # If not cached, extract and cache them
+            script_fields = self._extract_pod_script_fields(pod_model)
+            context.set_cached_pod_script_fields(pod_model.podId, script_fields)
+            return script_fields
+        else:
+            # Fallback to model-level caching
+            cached_fields = pod_model.get_cached_script_fields()
+            if cached_fields is not None:
+                return cached_fields
+            
+            # If not cached, extract and cache them
+            script_fields = self._extract_pod_script_fields(pod_model)
+            pod_model.set_cached_script_fields(script_fields)
+            return script_fields
+    
+    def _extract_pod_script_fields(self, pod_model: PodModel) -> List[Tuple[str, str, str, int]]:
+        """Internal method to extract Pod script fields without caching."""
+        # Endpoint fields then template widget fields, from the model's walk table
+        return self._resolve_script_field_lines(
+            pod_model, pod_model.get_walk_table().script_fields, self._calculate_pod_script_line_offset)
     
     def _calculate_pod_script_line_offset(self, file_content: str, script_content: str, search_start_line: int = 0, occurrence_index: int = 0) -> int:
         """
@@ -797,26 +672,7 @@ class Rule(ABC):
             - widget_path: Path to the widget (e.g., "seed.template.children[0]")
             - widget_data: The widget dictionary
         """
-        widgets = []
-        
-        def _collect_widgets(widget_data: Any, path: str):
-            if isinstance(widget_data, dict) and 'type' in widget_data:
-                widgets.append((path, widget_data))
-                
-                # Recursively search children
-                if 'children' in widget_data and isinstance(widget_data['children'], list):
-                    for i, child in enumerate(widget_data['children']):
-                        child_path = f"{path}.children[{i}]"
-                        _collect_widgets(child, child_path)
-            elif isinstance(widget_data, list):
-                for i, item in enumerate(widget_data):
-                    item_path = f"{path}[{i}]"
-                    _collect_widgets(item, item_path)
-        
-        if pod_model.seed.template:
-            _collect_widgets(pod_model.seed.template, "seed.template")
-        
-        return widgets
+        return [(node.path, node.widget) for node in pod_model.get_walk_table().widgets]
     
     @staticmethod
     def _create_endpoint_message(field_path: str, field_name: str, issue_description: str) -> str:
@@ -32,7 +32,18 @@ class ASTLineUtils:
 
 
 class PMDLineUtils:
-    """Utilities for finding line numbers in PMD JSON structure (unparsed source)."""
+    """
+    Utilities for finding line numbers in PMD JSON structure (unparsed source).
+    
+    Lookups go through the model's JSON source index (built at parse time) and only
+    fall back to scanning source_content when the index is unavailable or misses.
+    """
+    
+    @staticmethod
+    def _get_source_index(model: Any):
+        """Get the JSON source index for a model, or None if it has none."""
+        get_source_index = getattr(model, 'get_source_index', None)
+        return get_source_index() if get_source_index else None
     
     @staticmethod
     def find_field_line_number(pmd_model: PMDModel, field_name: str, field_value: str, 
@@ -53,6 +64,12 @@ class PMDLineUtils:
             if not pmd_model.source_content:
                 return 1
             
+            source_index = PMDLineUtils._get_source_index(pmd_model)
+            if source_index is not None:
+                line = source_index.line_for_value(field_name, field_value)
+                if line is not None:
+                    return line
+            
             lines = pmd_model.source_content.split('\n')
             
             # Search for the field with the specific value
@@ -84,6 +101,17 @@ class PMDLineUtils:
             if not pmd_model.source_content:
                 return 1
             
+            source_index = PMDLineUtils._get_source_index(pmd_model)
+            if source_index is not None:
+                entity_paths = source_index.paths_for_value(entity_field, entity_value)
+                if entity_paths:
+                    # The target field is a sibling of the entity field in the same object
+                    entity_path = entity_paths[0]
+                    target_line = source_index.line_for_path(entity_path[:-1] + (target_field,))
+                    if target_line is not None:
+                        return target_line
+                    return source_index.line_for_path(entity_path)
+            
             lines = pmd_model.source_content.split('\n')
             
             # Find the entity first
@@ -120,6 +148,12 @@ class PMDLineUtils:
             if not pmd_model.source_content:
                 return 1
             
+            source_index = PMDLineUtils._get_source_index(pmd_model)
+            if source_index is not None:
+                line = source_index.line_for_key(section_name)
+                if line is not None:
+                    return line
+            
             lines = pmd_model.source_content.split('\n')
             
             # Look for the section
@@ -180,6 +214,12 @@ class PMDLineUtils:
             if not pmd_model.source_content:
                 return 1
             
+            source_index = PMDLineUtils._get_source_index(pmd_model)
+            if source_index is not None:
+                line = source_index.line_for_value('id', widget_id)
+                if line is not None:
+                    return line
+            
             lines = pmd_model.source_content.split('\n')
             
             # Look for the widget ID directly
@@ -13,6 +13,7 @@ class ScriptLongBlockRule(ScriptRuleBase):
     DESCRIPTION = "Ensures non-function script blocks in PMD/POD files don't exceed maximum line count (max 30 lines). Excludes function definitions which are handled by ScriptLongFunctionRule."
     SEVERITY = "ADVICE"
     DETECTOR = LongScriptBlockDetector
+    COST_HINT = 1.0  # No per-node visitor pass: far cheaper than the AST-walking script rules
     AVAILABLE_SETTINGS = {
         'max_lines': {'type': 'int', 'default': 30, 'description': 'Maximum lines allowed per script block'},
         'skip_comments': {'type': 'bool', 'default': False, 'description': 'Skip comment lines when counting'},
@@ -1,45 +1,50 @@
 """Console log detection logic for ScriptConsoleLogRule."""
 
-from typing import Generator, List
+from typing import List
 from lark import Tree
 from ..shared.detector import ScriptDetector
+from ..shared.dispatch import WalkScope
 from ...common import Violation
 
 
 class ConsoleLogDetector(ScriptDetector):
     """Detects console method calls in script content."""
     
+    # Visited through the shared AST dispatcher (e.g., console.debug, console.info)
+    NODE_TYPES = frozenset({'member_dot_expression'})
+    
     def __init__(self, file_path: str = "", line_offset: int = 1):
         super().__init__(file_path, line_offset)
         self.console_methods = {'info', 'warn', 'error', 'debug'}
     
-    def detect(self, ast: Tree, field_name: str) -> Generator[Violation, None, None]:
+    def detect(self, ast: Tree, field_name: str) -> List[Violation]:
         """Detect console method calls in the AST."""
-        # Find all member_dot_expression nodes (e.g., console.debug, console.info)
-        member_expressions = ast.find_data('member_dot_expression')
-        
-        for member_expr in member_expressions:
-            if len(member_expr.children) >= 2:
-                object_node = member_expr.children[0]
-                method_node = member_expr.children[1]
+        return self.run_visitor(ast, field_name)
+    
+    def enter_member_dot_expression(self, member_expr: Tree, scope: WalkScope) -> None:
+        """Report member expressions that are console method calls."""
+        if len(member_expr.children) >= 2:
+            object_node = member_expr.children[0]
+            method_node = member_expr.children[1]
+            
+            # Check if it's a console method call
+            if self._is_console_method_call(object_node, method_node):
+                method_name = self._extract_method_name(method_node)
+                line_number = self.get_line_from_tree_node(member_expr)
+                field_name = self.visitor_field_name
+                
+                # Check if this console statement is inside a function
+                function_name = scope.function_name
+                
+                if function_name:
+                    message = f"File section '{field_name}' contains console.{method_name} statement in function '{function_name}'. Remove debug statements from production code."
+                else:
+                    message = f"File section '{field_name}' contains console.{method_name} statement. Remove debug statements from production code."
                 
-                # Check if it's a console method call
-                if self._is_console_method_call(object_node, method_node):
-                    method_name = self._extract_method_name(method_node)
-                    line_number = self.get_line_from_tree_node(member_expr)
-                    
-                    # Check if this console statement is inside a function
-                    function_name = self.get_function_context_for_node(member_expr, ast)
-                    
-                    if function_name:
-                        message = f"File section '{field_name}' contains console.{method_name} statement in function '{function_name}'. Remove debug statements from production code."
-                    else:
-                        message = f"File section '{field_name}' contains console.{method_name} statement. Remove debug statements from production code."
-                    
-                    yield Violation(
-                        message=message,
-                        line=line_number
-                    )
+                self.visitor_violations.append(Violation(
+                    message=message,
+                    line=line_number
+                ))
     
     def _is_console_method_call(self, object_node, method_node) -> bool:
         """Check if the member expression is a console method call."""
@@ -2,6 +2,7 @@
 
 from typing import Generator, Dict, Any, Optional
 from lark import Tree, Token
+from ..shared.ast_utils import find_data_nodes
 from ..shared.detector import ScriptDetector
 from ...common import Violation
 from ...common_validations import validate_script_variable_camel_case
@@ -16,7 +17,7 @@ class FunctionParameterNamingDetector(ScriptDetector):
     def detect(self, ast: Tree, field_name: str = "") -> Generator[Violation, None, None]:
         """Detect function parameters that don't follow naming conventions in the AST."""
         # Find all function expressions
-        function_expressions = ast.find_data('function_expression')
+        function_expressions = find_data_nodes(ast, 'function_expression')
         
         for func_expr in function_expressions:
             # Get the function name specific to THIS function expression
@@ -89,7 +90,7 @@ class FunctionParameterNamingDetector(ScriptDetector):
         func_line = self.get_line_from_tree_node(func_expr)
         
         # Find all variable statements and check which one contains this function expression
-        for var_stmt in ast.find_data('variable_statement'):
+        for var_stmt in find_data_nodes(ast, 'variable_statement'):
             if len(var_stmt.children) > 1:
                 var_declaration = var_stmt.children[1]
                 if hasattr(var_declaration, 'data') and var_declaration.data == 'variable_declaration':
@@ -4,6 +4,9 @@ from typing import Generator, Dict, Any
 from ...base import Finding
 from ...script.shared import ScriptRuleBase
 from .script_dead_code_detector import ScriptDeadCodeDetector
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class ScriptDeadCodeRule(ScriptRuleBase):
@@ -11,6 +14,7 @@ class ScriptDeadCodeRule(ScriptRuleBase):
 
     DESCRIPTION = "Detects and removes dead code from standalone script files"
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.script'})
     DETECTOR = ScriptDeadCodeDetector
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
@@ -109,4 +113,4 @@ const getCurrentTime = function() {
                 )
                 
         except Exception as e:
-            print(f"Warning: Failed to analyze script file {script_model.file_path}: {e}")
\ No newline at end of file
+            log.warning("Failed to analyze script file %s: %s", script_model.file_path, e)
\ No newline at end of file
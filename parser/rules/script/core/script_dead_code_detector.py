@@ -2,7 +2,7 @@
 
 from typing import Generator, Set, Dict, Any
 from lark import Tree
-from ...script.shared import ScriptDetector
+from ...script.shared import ScriptDetector, find_data_nodes
 from ...common import Violation
 
 
@@ -57,7 +57,7 @@ class ScriptDeadCodeDetector(ScriptDetector):
         function_vars = {}
         
         # Find all variable statements that are NOT top-level
-        all_var_statements = list(ast.find_data('variable_statement'))
+        all_var_statements = find_data_nodes(ast, 'variable_statement')
         top_level_statements = ast.children if hasattr(ast, 'children') else []
         
         for var_stmt in all_var_statements:
@@ -147,7 +147,7 @@ class ScriptDeadCodeDetector(ScriptDetector):
         
         try:
             # Find all function call expressions (arguments_expression nodes)
-            for call_expr in ast.find_data('arguments_expression'):
+            for call_expr in find_data_nodes(ast, 'arguments_expression'):
                 if len(call_expr.children) > 0:
                     function_node = call_expr.children[0]
                     
@@ -165,7 +165,7 @@ class ScriptDeadCodeDetector(ScriptDetector):
         """Check if a variable is used anywhere in the AST."""
         try:
             # Find all identifier_expression nodes that reference this variable
-            for node in ast.find_data('identifier_expression'):
+            for node in find_data_nodes(ast, 'identifier_expression'):
                 if len(node.children) > 0:
                     identifier = node.children[0]
                     if hasattr(identifier, 'value') and identifier.value == var_name:
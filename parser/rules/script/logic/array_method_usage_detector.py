@@ -1,61 +1,59 @@
 """Array method usage detection logic for ScriptArrayMethodUsageRule."""
 
-from typing import Generator, Dict, Any
+from typing import Dict, Any, List
 from lark import Tree
 from ...script.shared import ScriptDetector
+from ...script.shared.dispatch import WalkScope
 from ...common import Violation
 
 
 class ArrayMethodUsageDetector(ScriptDetector):
     """Detects manual loops that could be replaced with array higher-order methods."""
 
+    # Manual for loop types, visited through the shared AST dispatcher (PMD for...in loops excluded)
+    NODE_TYPES = frozenset({'for_statement', 'for_let_statement', 'for_var_statement'})
+
     def __init__(self, file_path: str = "", line_offset: int = 1):
         super().__init__(file_path, line_offset)
 
-    def detect(self, ast: Tree, field_name: str = "") -> Generator[Violation, None, None]:
+    def detect(self, ast: Tree, field_name: str = "") -> List[Violation]:
         """Detect manual for loops that could use array higher-order methods."""
         if ast is None:
-            return
-        yield from self._find_manual_for_loops(ast, field_name)
+            return []
+        return self.run_visitor(ast, field_name)
+
+    def enter_for_statement(self, for_stmt: Tree, scope: WalkScope) -> None:
+        self._check_manual_for_loop(for_stmt, scope)
 
-    def _find_manual_for_loops(self, ast: Tree, field_name: str):
-        """Find manual for loops that could use array higher-order methods using efficient AST traversal."""
-        # Define manual for loop types (exclude PMD for...in loops)
-        manual_for_types = {'for_statement', 'for_let_statement', 'for_var_statement'}
-        
-        # Use efficient traversal to find all manual for loops
-        for for_stmt in ast.find_data('for_statement'):
-            if self._is_counter_based_loop(for_stmt):
-                yield from self._create_violation(for_stmt, field_name, ast)
-        
-        for for_stmt in ast.find_data('for_let_statement'):
-            if self._is_counter_based_loop(for_stmt):
-                yield from self._create_violation(for_stmt, field_name, ast)
-        
-        for for_stmt in ast.find_data('for_var_statement'):
-            if self._is_counter_based_loop(for_stmt):
-                yield from self._create_violation(for_stmt, field_name, ast)
+    def enter_for_let_statement(self, for_stmt: Tree, scope: WalkScope) -> None:
+        self._check_manual_for_loop(for_stmt, scope)
 
-    def _create_violation(self, for_stmt: Tree, field_name: str, ast: Tree):
-        """Create a violation for a detected manual for loop."""
+    def enter_for_var_statement(self, for_stmt: Tree, scope: WalkScope) -> None:
+        self._check_manual_for_loop(for_stmt, scope)
+
+    def _check_manual_for_loop(self, for_stmt: Tree, scope: WalkScope) -> None:
+        """Record a violation for a counter-based for loop."""
+        if not self._is_counter_based_loop(for_stmt):
+            return
         # Get line number from the first token in the for statement
         line_number = self.get_line_from_tree_node(for_stmt)
+        field_name = self.visitor_field_name
         
         # Analyze the loop to suggest appropriate array higher-order method
         suggestion = self._suggest_array_method(for_stmt)
         
         # Check if this manual for loop is inside a function
-        function_name = self.get_function_context_for_node(for_stmt, ast)
+        function_name = scope.function_name
         
         if function_name:
             message = f"File section '{field_name}' uses manual for loop in function '{function_name}' that could be replaced with array higher-order method. Consider using {suggestion} instead for better readability and maintainability."
         else:
             message = f"File section '{field_name}' uses manual for loop that could be replaced with array higher-order method. Consider using {suggestion} instead for better readability and maintainability."
         
-        yield Violation(
+        self.visitor_violations.append(Violation(
             message=message,
             line=line_number
-        )
+        ))
 
     def _is_counter_based_loop(self, for_stmt: Tree) -> bool:
         """Check if a for loop is a counter-based loop that could use functional methods."""
@@ -2,9 +2,12 @@
 
 from typing import Generator, Dict, List
 from lark import Tree
-from ...script.shared import ScriptDetector
+from ...script.shared import ScriptDetector, ast_index, find_data_nodes
 from ...common import Violation
 import re
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class DescriptiveParameterDetector(ScriptDetector):
@@ -71,43 +74,51 @@ class DescriptiveParameterDetector(ScriptDetector):
         processed_arrow_functions = set()
         
         # Find all arguments expressions (which contain method calls with arrow functions)
-        arguments_expressions = ast.find_data('arguments_expression')
+        arguments_expressions = self._find_data(ast, 'arguments_expression')
         for args_expr in arguments_expressions:
             violations.extend(self._analyze_arguments_expression(args_expr, processed_arrow_functions))
         
         # Also find member_dot_expression nodes that might be functional method calls
-        member_expressions = ast.find_data('member_dot_expression')
+        member_expressions = self._find_data(ast, 'member_dot_expression')
         for member_expr in member_expressions:
             violations.extend(self._analyze_member_expression(member_expr, processed_arrow_functions))
         
         # Also find parenthesized_expression nodes that might contain arrow functions
-        paren_expressions = ast.find_data('parenthesized_expression')
+        paren_expressions = self._find_data(ast, 'parenthesized_expression')
         for paren_expr in paren_expressions:
             violations.extend(self._analyze_parenthesized_expression(paren_expr, processed_arrow_functions))
         
         # Also find multiplicative_expression nodes that might contain arrow functions
-        multiplicative_expressions = ast.find_data('multiplicative_expression')
+        multiplicative_expressions = self._find_data(ast, 'multiplicative_expression')
         for mult_expr in multiplicative_expressions:
             violations.extend(self._analyze_multiplicative_expression(mult_expr, processed_arrow_functions))
         
         # Also find expression_sequence nodes that might contain arrow functions
-        expression_sequences = ast.find_data('expression_sequence')
+        expression_sequences = self._find_data(ast, 'expression_sequence')
         for expr_seq in expression_sequences:
             violations.extend(self._analyze_expression_sequence(expr_seq, processed_arrow_functions))
         
         # Also find additive_expression nodes that might contain arrow functions
-        additive_expressions = ast.find_data('additive_expression')
+        additive_expressions = self._find_data(ast, 'additive_expression')
         for add_expr in additive_expressions:
             violations.extend(self._analyze_additive_expression(add_expr, processed_arrow_functions))
         
         # Also find all arrow functions and check if they're part of functional method calls
-        arrow_functions = ast.find_data('arrow_function_expression')
+        arrow_functions = self._find_data(ast, 'arrow_function_expression')
         for arrow_func in arrow_functions:
             if id(arrow_func) not in processed_arrow_functions:
                 violations.extend(self._analyze_arrow_function_context(arrow_func, ast))
         
         return violations
 
+    def _find_data(self, ast: Tree, node_type: str) -> List[Tree]:
+        """
+        Nodes of a type from the AST's shared index, innermost first (the order of
+        Tree.find_data, which the first-match heuristics of this detector rely on).
+        """
+        index = ast_index(ast)
+        return sorted(find_data_nodes(ast, node_type), key=lambda node: -index.depth(node))
+
     def _analyze_arguments_expression(self, args_expr: Tree, processed_arrow_functions: set) -> List[Dict]:
         """Analyze an arguments expression to find arrow function violations."""
         violations = []
@@ -377,8 +388,8 @@ class DescriptiveParameterDetector(ScriptDetector):
         node_line = self.get_line_from_tree_node(node)
         
         # Find all function declarations and variable declarations with function expressions
-        function_declarations = list(ast.find_data('function_declaration'))
-        variable_declarations = list(ast.find_data('variable_declaration'))
+        function_declarations = self._find_data(ast, 'function_declaration')
+        variable_declarations = self._find_data(ast, 'variable_declaration')
         
         # Check function declarations first
         for func_decl in function_declarations:
@@ -439,7 +450,7 @@ class DescriptiveParameterDetector(ScriptDetector):
         arrow_func_line = self.get_line_from_tree_node(arrow_func)
         
         # Find all variable declarations
-        variable_declarations = list(ast.find_data('variable_declaration'))
+        variable_declarations = self._find_data(ast, 'variable_declaration')
         
         for var_decl in variable_declarations:
             if hasattr(var_decl, 'children') and len(var_decl.children) >= 2:
@@ -476,7 +487,7 @@ class DescriptiveParameterDetector(ScriptDetector):
         arrow_func_line = self.get_line_from_tree_node(arrow_func)
         
         # Look for arguments_expression nodes that contain this arrow function
-        args_exprs = list(ast.find_data('arguments_expression'))
+        args_exprs = self._find_data(ast, 'arguments_expression')
         for args_expr in args_exprs:
             if self._contains_arrow_function_by_line(args_expr, arrow_func_line):
                 # This arrow function is in an arguments expression
@@ -489,7 +500,7 @@ class DescriptiveParameterDetector(ScriptDetector):
         
         # Look for parenthesized_expression nodes that contain this arrow function
         # This handles cases like: items.map(x => x * 2) where the arrow function is in a parenthesized_expression
-        paren_exprs = list(ast.find_data('parenthesized_expression'))
+        paren_exprs = self._find_data(ast, 'parenthesized_expression')
         for paren_expr in paren_exprs:
             if self._contains_arrow_function_by_line(paren_expr, arrow_func_line):
                 # This arrow function is in a parenthesized expression
@@ -503,7 +514,7 @@ class DescriptiveParameterDetector(ScriptDetector):
     def _find_nearby_functional_method(self, paren_expr: Tree, ast: Tree) -> str:
         """Find a functional method call that's likely associated with this parenthesized expression."""
         # Get all member_dot_expression nodes
-        member_exprs = list(ast.find_data('member_dot_expression'))
+        member_exprs = self._find_data(ast, 'member_dot_expression')
         
         # Look for functional methods or any method that takes a function parameter
         for member_expr in member_exprs:
@@ -525,7 +536,7 @@ class DescriptiveParameterDetector(ScriptDetector):
     def _find_likely_functional_method(self, ast: Tree) -> str:
         """Find the most likely functional method name from the AST."""
         # Get all member_dot_expression nodes and find functional methods
-        member_exprs = list(ast.find_data('member_dot_expression'))
+        member_exprs = self._find_data(ast, 'member_dot_expression')
         functional_methods_found = []
         
         for member_expr in member_exprs:
@@ -700,7 +711,7 @@ class DescriptiveParameterDetector(ScriptDetector):
             violations.extend(self._find_violations_by_pattern(lines))
             
         except Exception as e:
-            print(f"Warning: Error in pattern-based parameter analysis: {e}")
+            log.debug("Error in pattern-based parameter analysis: %s", e)
         
         return violations
 
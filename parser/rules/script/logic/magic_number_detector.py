@@ -2,6 +2,8 @@
 
 from typing import Generator, List, Optional
 from lark import Tree
+from ..shared.ast_index import ast_index
+from ..shared.ast_utils import find_data_nodes
 from ..shared.detector import ScriptDetector
 from ...common import Violation
 
@@ -72,32 +74,15 @@ class MagicNumberDetector(ScriptDetector):
             for child in node.children:
                 self._visit_node(child, field_name, findings, ast, parent=node)
     
-    def _find_all_variable_statements(self, node: Tree) -> List[Tree]:
-        """Manually find all variable_statement nodes in the tree."""
-        results = []
-        
-        if hasattr(node, 'data') and node.data == 'variable_statement':
-            results.append(node)
-        
-        if hasattr(node, 'children'):
-            for child in node.children:
-                if isinstance(child, Tree):
-                    results.extend(self._find_all_variable_statements(child))
-        
-        return results
-
     def _is_in_const_declaration(self, literal_node: Tree, ast: Tree) -> bool:
         """Check if this numeric literal is being assigned to a const variable."""
-        # Use manual traversal instead of find_data
-        var_stmts = self._find_all_variable_statements(ast)
-        
-        for var_stmt in var_stmts:
-            # Check if this is a const declaration
-            if not self._is_const_statement(var_stmt):
+        # Only the variable statements enclosing the literal can assign it
+        for var_stmt in ast_index(ast).ancestors(literal_node):
+            if var_stmt.data != 'variable_statement':
                 continue
             
-            # Check if this literal is inside this statement
-            if not self._is_descendant(var_stmt, literal_node):
+            # Check if this is a const declaration
+            if not self._is_const_statement(var_stmt):
                 continue
             
             # It's in a const statement - check if it's a direct value
@@ -256,7 +241,7 @@ class MagicNumberDetector(ScriptDetector):
         node_line = self.get_line_from_tree_node(node)
         
         # Find all variable statements and check which one contains this node
-        for var_stmt in ast.find_data('variable_statement'):
+        for var_stmt in find_data_nodes(ast, 'variable_statement'):
             if len(var_stmt.children) > 1:
                 var_declaration = var_stmt.children[1]
                 if hasattr(var_declaration, 'data') and var_declaration.data == 'variable_declaration':
@@ -292,7 +277,7 @@ class MagicNumberDetector(ScriptDetector):
         func_line = self.get_line_from_tree_node(func_expr)
         
         # Find all function expressions to determine boundaries
-        all_functions = list(ast.find_data('function_expression'))
+        all_functions = find_data_nodes(ast, 'function_expression')
         func_index = all_functions.index(func_expr)
         
         # If this is the last function, use a large number
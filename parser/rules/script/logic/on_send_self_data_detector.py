@@ -2,6 +2,7 @@
 
 from typing import Generator
 from lark import Tree
+from ..shared.ast_utils import find_data_nodes
 from ..shared.detector import ScriptDetector
 from ...common import Violation
 
@@ -25,7 +26,7 @@ class OnSendSelfDataDetector(ScriptDetector):
             Generator of Violation objects
         """
         # Find all assignment expressions in the AST
-        for assignment_expr in ast.find_data('assignment_expression'):
+        for assignment_expr in find_data_nodes(ast, 'assignment_expression'):
             if self._is_self_data_object_assignment(assignment_expr):
                 line_number = self.get_line_from_tree_node(assignment_expr)
                 
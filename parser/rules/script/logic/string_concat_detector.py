@@ -2,6 +2,7 @@
 
 from typing import Generator, List
 from lark import Tree
+from ..shared.ast_utils import find_data_nodes
 from ..shared.detector import ScriptDetector
 from ...common import Violation
 from ...base import Rule
@@ -16,7 +17,7 @@ class StringConcatDetector(ScriptDetector):
     def detect(self, ast: Tree, field_name: str = "") -> Generator[Violation, None, None]:
         """Detect string concatenation using + operator in the AST."""
         # Find all addition expressions in the AST
-        addition_expressions = ast.find_data('additive_expression')
+        addition_expressions = find_data_nodes(ast, 'additive_expression')
         
         # Track reported lines to avoid duplicate violations for nested concatenations
         reported_lines = set()
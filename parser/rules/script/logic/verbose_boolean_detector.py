@@ -1,73 +1,59 @@
 """Verbose boolean detection logic for ScriptVerboseBooleanCheckRule."""
 
-from typing import Generator, Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from lark import Tree
 from ..shared.detector import ScriptDetector
+from ..shared.dispatch import WalkScope
 from ...common import Violation
 
 
 class VerboseBooleanDetector(ScriptDetector):
     """Detects overly verbose boolean checks in script content."""
     
+    # Visited through the shared AST dispatcher (including nested ternaries)
+    NODE_TYPES = frozenset({'if_statement', 'ternary_expression'})
+    
     def __init__(self, file_path: str = "", line_offset: int = 1):
         super().__init__(file_path, line_offset)
         self._original_script_content = ""
     
-    def detect(self, ast: Tree, field_name: str = "") -> Generator[Violation, None, None]:
+    def detect(self, ast: Tree, field_name: str = "") -> List[Violation]:
         """Detect overly verbose boolean patterns in the AST."""
         # Find verbose boolean patterns in if statements and ternary expressions
-        yield from self._find_verbose_if_statements(ast, field_name)
-        yield from self._find_verbose_ternary_expressions(ast, field_name)
+        return self.run_visitor(ast, field_name)
     
     def set_original_content(self, content: str):
         """Set the original script content for operator detection."""
         self._original_script_content = content
     
-    def _find_verbose_if_statements(self, ast: Tree, field_name: str):
+    def enter_if_statement(self, if_stmt: Tree, scope: WalkScope) -> None:
         """Find verbose boolean patterns in if statements."""
-        # Find all if_statement nodes in the AST
-        if_statements = ast.find_data('if_statement')
-        for if_stmt in if_statements:
-            verbose_info = self._analyze_if_statement_for_verbosity(if_stmt)
-            if verbose_info:
-                # Get line number from the if statement
-                line_number = self.get_line_from_tree_node(if_stmt)
-                
-                # Check if this verbose boolean check is inside a function
-                function_name = self.get_function_context_for_node(if_stmt, ast)
-                
-                if function_name:
-                    message = f"File section '{field_name}' has verbose boolean check in function '{function_name}': '{verbose_info['pattern']}'. Consider simplifying to '{verbose_info['suggestion']}'."
-                else:
-                    message = f"File section '{field_name}' has verbose boolean check: '{verbose_info['pattern']}'. Consider simplifying to '{verbose_info['suggestion']}'."
-                
-                yield Violation(
-                    message=message,
-                    line=line_number
-                )
+        self._report_verbose_pattern(if_stmt, self._analyze_if_statement_for_verbosity(if_stmt), scope)
     
-    def _find_verbose_ternary_expressions(self, ast: Tree, field_name: str):
+    def enter_ternary_expression(self, ternary_expr: Tree, scope: WalkScope) -> None:
         """Find verbose boolean patterns in ternary expressions."""
-        # Find all ternary_expression nodes in the AST (including nested ones)
-        ternary_expressions = ast.find_data('ternary_expression')
-        for ternary_expr in ternary_expressions:
-            verbose_info = self._analyze_ternary_expression_for_verbosity(ternary_expr)
-            if verbose_info:
-                # Get line number from the ternary expression
-                line_number = self.get_line_from_tree_node(ternary_expr)
-                
-                # Check if this verbose boolean check is inside a function
-                function_name = self.get_function_context_for_node(ternary_expr, ast)
-                
-                if function_name:
-                    message = f"File section '{field_name}' has verbose boolean check in function '{function_name}': '{verbose_info['pattern']}'. Consider simplifying to '{verbose_info['suggestion']}'."
-                else:
-                    message = f"File section '{field_name}' has verbose boolean check: '{verbose_info['pattern']}'. Consider simplifying to '{verbose_info['suggestion']}'."
-                
-                yield Violation(
-                    message=message,
-                    line=line_number
-                )
+        self._report_verbose_pattern(ternary_expr, self._analyze_ternary_expression_for_verbosity(ternary_expr), scope)
+    
+    def _report_verbose_pattern(self, node: Tree, verbose_info, scope: WalkScope) -> None:
+        """Record a violation for a verbose if statement or ternary expression."""
+        if not verbose_info:
+            return
+        # Get line number from the if statement / ternary expression
+        line_number = self.get_line_from_tree_node(node)
+        field_name = self.visitor_field_name
+        
+        # Check if this verbose boolean check is inside a function
+        function_name = scope.function_name
+        
+        if function_name:
+            message = f"File section '{field_name}' has verbose boolean check in function '{function_name}': '{verbose_info['pattern']}'. Consider simplifying to '{verbose_info['suggestion']}'."
+        else:
+            message = f"File section '{field_name}' has verbose boolean check: '{verbose_info['pattern']}'. Consider simplifying to '{verbose_info['suggestion']}'."
+        
+        self.visitor_violations.append(Violation(
+            message=message,
+            line=line_number
+        ))
     
     def _analyze_if_statement_for_verbosity(self, if_node):
         if not hasattr(if_node, 'children') or len(if_node.children) < 5:
@@ -2,6 +2,7 @@
 
 from .violation import Violation
 from .detector import ScriptDetector
+from .ast_index import AstIndex, ast_index
 from .ast_utils import (
     extract_expression_text,
     find_member_access_chains,
@@ -18,6 +19,8 @@ __all__ = [
     'Violation',
     'ScriptDetector', 
     'ScriptRuleBase',
+    'AstIndex',
+    'ast_index',
     'extract_expression_text',
     'find_member_access_chains',
     'find_data_nodes',
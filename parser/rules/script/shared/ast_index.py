@@ -0,0 +1,159 @@
+"""Parent-linked index of a script AST, built once per tree and shared by detectors.
+
+Lark trees have no parent references, and Tree equality and hashing are structural
+(a deep comparison of the subtrees), so "which function is this node in" used to
+mean rebuilding a map of every function's nodes and searching it with recursive
+descendant checks. The index records each node's parent and depth and the named
+functions of the tree in one walk; lookups then follow parent links by object
+identity, in O(depth).
+
+The same walk lists the trees of each node type in document order and numbers
+them in preorder, so `find_data(node_type, within)` answers "all X in this
+subtree" with a binary search instead of another full traversal: one walk per
+script serves every type lookup of every detector.
+
+An index is built on first use and kept on the root it was built for, so every
+detector and rule analyzing the same (cached) AST shares it and it is released
+with the tree. Trees are never modified after parsing, so the index stays valid.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from lark import Tree
+
+# Function node types that open a named function scope when assigned in a variable statement
+FUNCTION_NODE_TYPES = ('function_expression', 'arrow_function_expression')
+
+_INDEX_ATTRIBUTE = '_ast_index'
+
+
+def declared_functions(node: Tree) -> Iterator[Tuple[Tree, str]]:
+    """
+    The (function node, name) pairs a variable statement declares, e.g. foo for
+    `var foo = function() {...}`; nothing for any other node.
+    """
+    if node.data != 'variable_statement' or len(node.children) <= 1:
+        return
+    var_declaration = node.children[1]
+    if not (isinstance(var_declaration, Tree) and var_declaration.data == 'variable_declaration'
+            and var_declaration.children):
+        return
+    name_token = var_declaration.children[0]
+    if not hasattr(name_token, 'value'):
+        return
+    for child in var_declaration.children:
+        if isinstance(child, Tree) and child.data in FUNCTION_NODE_TYPES:
+            yield child, name_token.value
+
+
+class AstIndex:
+    """Parents, depths, named functions and node types of the nodes (trees and tokens) of one AST."""
+
+    def __init__(self, root: Any):
+        self._root_id = id(root)
+        # id(node) -> parent tree, and id(node) -> depth below the root (root = 0)
+        self._parents: Dict[int, Tree] = {}
+        self._depths: Dict[int, int] = {id(root): 0}
+        # id(function node) -> name of the variable it is assigned to
+        self._function_names: Dict[int, str] = {}
+        # id(tree) -> preorder position, and position -> last position in the tree's subtree
+        self._positions: Dict[int, int] = {}
+        self._subtree_ends: List[int] = []
+        # node type -> trees of that type, and their positions, in document order
+        self._by_type: Dict[str, List[Tree]] = {}
+        self._type_positions: Dict[str, List[int]] = {}
+        self._build(root)
+
+    def _build(self, root: Any) -> None:
+        stack = [root] if isinstance(root, Tree) else []
+        preorder = []
+        while stack:
+            node = stack.pop()
+            position = len(preorder)
+            preorder.append(node)
+            self._positions[id(node)] = position
+            self._by_type.setdefault(node.data, []).append(node)
+            self._type_positions.setdefault(node.data, []).append(position)
+            depth = self._depths[id(node)] + 1
+            for function_node, name in declared_functions(node):
+                self._function_names[id(function_node)] = name
+            for child in node.children:
+                self._parents[id(child)] = node
+                self._depths[id(child)] = depth
+            stack.extend(child for child in reversed(node.children) if isinstance(child, Tree))
+        # A subtree ends where its last descendant does; children come after their parents
+        ends = list(range(len(preorder)))
+        for position in range(len(preorder) - 1, 0, -1):
+            parent_position = self._positions[id(self._parents[id(preorder[position])])]
+            ends[parent_position] = max(ends[parent_position], ends[position])
+        self._subtree_ends = ends
+
+    def contains(self, node: Any) -> bool:
+        """Whether the node (this very object) is part of the indexed AST."""
+        return id(node) in self._depths
+
+    def parent(self, node: Any) -> Optional[Tree]:
+        """The tree the node is a child of (None for the root and for foreign nodes)."""
+        return self._parents.get(id(node))
+
+    def depth(self, node: Any) -> Optional[int]:
+        """Number of links from the root to the node (None for foreign nodes)."""
+        return self._depths.get(id(node))
+
+    def ancestors(self, node: Any) -> Iterator[Tree]:
+        """The node's parent, its parent's parent, ... up to the root."""
+        parent = self._parents.get(id(node))
+        while parent is not None:
+            yield parent
+            parent = self._parents.get(id(parent))
+
+    def is_within(self, node: Any, ancestor: Any) -> bool:
+        """Whether node is ancestor or one of its descendants."""
+        return node is ancestor or any(parent is ancestor for parent in self.ancestors(node))
+
+    def find_data(self, node_type: str, within: Any = None) -> List[Tree]:
+        """
+        Trees of a node type in document order, like Tree.find_data but without a walk.
+
+        Args:
+            node_type: Node type (Tree.data) to look up
+            within: Only trees in this subtree of the AST, itself included (None = whole AST)
+        """
+        nodes = self._by_type.get(node_type, [])
+        if within is None:
+            return list(nodes)
+        start = self._positions.get(id(within))
+        if start is None:
+            # Not a tree of this AST: walk it instead
+            if not isinstance(within, Tree):
+                return []
+            return [node for node in within.iter_subtrees_topdown() if node.data == node_type]
+        positions = self._type_positions.get(node_type, [])
+        low = bisect_left(positions, start)
+        high = bisect_right(positions, self._subtree_ends[start], low)
+        return nodes[low:high]
+
+    def enclosing_function(self, node: Any) -> Optional[Tuple[Tree, str]]:
+        """The innermost named function that is or contains the node, with its name."""
+        if id(node) in self._function_names:
+            return node, self._function_names[id(node)]
+        for parent in self.ancestors(node):
+            if id(parent) in self._function_names:
+                return parent, self._function_names[id(parent)]
+        return None
+
+    def function_name(self, node: Any) -> Optional[str]:
+        """Name of the innermost named function that is or contains the node, or None at top level."""
+        enclosing = self.enclosing_function(node)
+        return enclosing[1] if enclosing else None
+
+
+def ast_index(root: Any) -> AstIndex:
+    """The index of an AST, built on first request and shared by every later one."""
+    index = getattr(root, _INDEX_ATTRIBUTE, None)
+    # A copied or unpickled tree carries its original's index, whose ids are stale
+    if index is None or index._root_id != id(root):
+        index = AstIndex(root)
+        if isinstance(root, Tree):
+            setattr(root, _INDEX_ATTRIBUTE, index)
+    return index
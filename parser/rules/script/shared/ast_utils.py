@@ -15,6 +15,7 @@ CONTROL_FLOW_NODES: Set[str] = {
 
 # Import from central common location
 from ...common import ASTLineUtils
+from .ast_index import ast_index
 
 
 def extract_expression_text(node: Any) -> str:
@@ -58,20 +59,15 @@ def find_member_access_chains(node: Any) -> List[List[str]]:
     return chains
 
 
-def find_data_nodes(ast: Any, node_type: str) -> List[Any]:
-    """Find all nodes of a specific type in the AST."""
-    nodes = []
-    
-    def traverse(n: Any):
-        if hasattr(n, 'data') and n.data == node_type:
-            nodes.append(n)
-        
-        if hasattr(n, 'children'):
-            for child in n.children:
-                traverse(child)
-    
-    traverse(ast)
-    return nodes
+def find_data_nodes(ast: Any, node_type: str, within: Any = None) -> List[Any]:
+    """
+    Find all nodes of a specific type in the AST, in document order.
+
+    Reads from the AST's shared node-type index (built on first use), so repeated
+    lookups on the same tree do not walk it again. Pass the root the detector was
+    given as ast and narrow the lookup to a subtree of it with within.
+    """
+    return ast_index(ast).find_data(node_type, within)
 
 
 def has_control_flow_structures(node: Any) -> bool:
@@ -4,7 +4,11 @@ import os
 from abc import ABC, abstractmethod
 from typing import Any, List
 from lark import Tree
+from .ast_index import ast_index
 from .violation import Violation
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class ScriptDetector(ABC):
@@ -59,22 +63,23 @@ class ScriptDetector(ABC):
     # Debug flag for line number calculations
     DEBUG_LINE_NUMBERS = os.environ.get('DEBUG_LINE_NUMBERS', 'false').lower() == 'true'
     
+    # Node types this detector visits through the single-traversal AST dispatcher
+    # (see dispatch.py). Visitor detectors implement enter_<type> / exit_<type> hooks
+    # and append to self.visitor_violations instead of walking the AST themselves.
+    NODE_TYPES: frozenset = frozenset()
+    
     def __init__(self, file_path: str = "", line_offset: int = 1, source_text: str = ""):
         """Initialize detector with file context."""
         self.file_path = file_path
         self.line_offset = line_offset
         self.source_text = source_text  # Store the original source text for physical line counting
-        # Cache for function context maps to avoid rebuilding for each violation
-        self._function_context_cache = {}
     
     def _debug_line_calc(self, ast_line: int, line_offset: int, result: int, context: str = ""):
         """Helper to log line number calculations."""
         if self.DEBUG_LINE_NUMBERS:
-            print(f"[{self.__class__.__name__}] {context}")
-            print(f"   ast.line={ast_line}, line_offset={line_offset}")
-            print(f"   formula: {line_offset} + {ast_line} - 1 = {result}")
-            if hasattr(self, 'file_path'):
-                print(f"   file: {self.file_path}")
+            log.info("[%s] %s\n   ast.line=%s, line_offset=%s\n   formula: %s + %s - 1 = %s\n   file: %s",
+                     self.__class__.__name__, context, ast_line, line_offset,
+                     line_offset, ast_line, result, getattr(self, 'file_path', ''))
     
     def detect(self, ast: Any) -> List[Violation]:
         """
@@ -97,6 +102,17 @@ class ScriptDetector(ABC):
         
         return violations
     
+    def begin_visit(self, ast: Any, field_name: str) -> None:
+        """Reset per-AST visitor state before a dispatched traversal."""
+        self.visitor_field_name = field_name
+        self.visitor_violations: List[Violation] = []
+    
+    def run_visitor(self, ast: Any, field_name: str) -> List[Violation]:
+        """Run this visitor detector on its own over an AST and return its violations."""
+        from .dispatch import dispatch_visitors
+        dispatch_visitors(ast, [self], field_name)
+        return self.visitor_violations
+    
     def _detect_template_expression(self, template_ast: Any) -> List[Violation]:
         """
         Analyze template expression by traversing each script block.
@@ -195,107 +211,8 @@ class ScriptDetector(ABC):
     
     def get_function_context_for_node(self, node: Any, ast: Any) -> str:
         """Get the function name that contains the given node, or None if not in a function."""
-        # Always rebuild function context map to avoid caching issues
-        function_contexts = self._build_function_context_map(ast)
-        
-        # Find the enclosing function name
-        return self._get_enclosing_function_name(node, function_contexts)
-    
-    def _build_function_context_map(self, ast: Any) -> dict:
-        """Build a map of AST nodes to their enclosing function names."""
-        function_contexts = {}
-        
-        # Recursively find all function expressions in the AST
-        self._find_and_map_functions(ast, function_contexts)
-        
-        return function_contexts
-    
-    def _find_and_map_functions(self, node: Any, function_contexts: dict):
-        """Recursively find function expressions and map their nodes."""
-        if hasattr(node, 'data'):
-            # Check if this is a variable statement that contains a function
-            if node.data == 'variable_statement' and len(node.children) > 1:
-                var_declaration = node.children[1]
-                if hasattr(var_declaration, 'data') and var_declaration.data == 'variable_declaration':
-                    # Check if this variable declaration contains a function expression
-                    for child in var_declaration.children:
-                        if hasattr(child, 'data') and child.data in ['function_expression', 'arrow_function_expression']:
-                            # Found a function! Get the variable name (function name)
-                            if len(var_declaration.children) > 0:
-                                var_name_token = var_declaration.children[0]
-                                if hasattr(var_name_token, 'value'):
-                                    function_name = var_name_token.value
-                                    # Map all nodes within this function to the function name
-                                    self._map_function_nodes(child, function_name, function_contexts)
-        
-        # Recursively process children
-        if hasattr(node, 'children'):
-            for child in node.children:
-                self._find_and_map_functions(child, function_contexts)
-    
-    def _map_function_nodes(self, function_node: Any, function_name: str, function_contexts: dict):
-        """Recursively map all nodes within a function to the function name."""
-        function_contexts[function_node] = function_name
-        
-        if hasattr(function_node, 'children'):
-            for child in function_node.children:
-                # Map both Tree nodes and Token nodes
-                function_contexts[child] = function_name
-                if hasattr(child, 'data'):  # Tree nodes - recurse
-                    self._map_function_nodes(child, function_name, function_contexts)
-    
-    def _get_enclosing_function_name(self, node: Any, function_contexts: dict) -> str:
-        """Find the name of the function that contains the given node."""
-        # Check if this node is directly mapped to a function
-        if node in function_contexts:
-            return function_contexts[node]
-        
-        # Check if any parent node is mapped to a function
-        # Since we don't have parent references, we'll use a different approach
-        # We'll check if the node is a descendant of any function node
-        # Find the closest (most specific) function by checking depth
-        closest_function = None
-        closest_depth = float('inf')
-        
-        for func_node, func_name in function_contexts.items():
-            if self._is_descendant(node, func_node):
-                # Calculate depth to find the closest function
-                depth = self._calculate_descendant_depth(node, func_node)
-                if depth < closest_depth:
-                    closest_depth = depth
-                    closest_function = func_name
-        
-        return closest_function
-    
-    def _calculate_descendant_depth(self, node: Any, ancestor: Any) -> int:
-        """Calculate the depth of a node within an ancestor (0 = direct child)."""
-        if node == ancestor:
-            return 0
-        
-        if hasattr(ancestor, 'children'):
-            for child in ancestor.children:
-                if hasattr(child, 'data'):  # Only check Tree nodes
-                    if self._is_descendant(node, child):
-                        return 1 + self._calculate_descendant_depth(node, child)
-        
-        return float('inf')
-    
-    def _is_descendant(self, node: Any, ancestor: Any) -> bool:
-        """Check if node is a descendant of ancestor."""
-        if node == ancestor:
-            return True
-        
-        if hasattr(ancestor, 'children'):
-            for child in ancestor.children:
-                if hasattr(child, 'data'):  # Only check Tree nodes
-                    if self._is_descendant(node, child):
-                        return True
-        
-        return False
-    
-    def clear_function_context_cache(self):
-        """Clear the function context cache. Useful for testing or processing multiple files."""
-        self._function_context_cache.clear()
+        # The AST's parent-linked index is built once and shared by every detector
+        return ast_index(ast).function_name(node)
     
     def extract_variable_from_empty_expression(self, node) -> str:
         """
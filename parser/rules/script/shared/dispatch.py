@@ -0,0 +1,100 @@
+"""Single-traversal AST dispatch for script detectors.
+
+Detectors that set NODE_TYPES are visitors: instead of walking the AST themselves
+with find_data / iter_subtrees, they implement enter_<node type> and/or
+exit_<node type> hooks. The dispatcher walks an AST once and calls the hooks of
+every interested visitor at each node, so N visitor detectors cost one traversal
+instead of N.
+
+Hooks receive the node and the shared WalkScope, which tracks the enclosing named
+function (the same function naming as ScriptDetector.get_function_context_for_node).
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from lark import Tree
+
+from .ast_index import FUNCTION_NODE_TYPES, declared_functions
+
+
+class WalkScope:
+    """Scope state maintained by the dispatcher while it walks an AST."""
+
+    def __init__(self):
+        self._function_names: List[str] = []
+        # id(function node) -> name, registered when its variable statement is entered
+        self._pending_functions: Dict[int, str] = {}
+
+    @property
+    def function_name(self) -> Optional[str]:
+        """Name of the innermost enclosing named function, or None at top level."""
+        return self._function_names[-1] if self._function_names else None
+
+    def _enter(self, node: Tree) -> bool:
+        """Update the scope for a node being entered; returns True if a function scope was opened."""
+        if node.data == 'variable_statement':
+            for function_node, name in declared_functions(node):
+                self._pending_functions[id(function_node)] = name
+        elif node.data in FUNCTION_NODE_TYPES:
+            function_name = self._pending_functions.pop(id(node), None)
+            if function_name is not None:
+                self._function_names.append(function_name)
+                return True
+        return False
+
+    def _exit(self) -> None:
+        self._function_names.pop()
+
+
+Hook = Callable[[Tree, WalkScope], None]
+
+
+class AstDispatcher:
+    """Walks an AST once, dispatching each node to the visitors interested in its type."""
+
+    def __init__(self, visitors: Sequence[Any]):
+        """
+        Args:
+            visitors: Detectors with NODE_TYPES and enter_<type> / exit_<type> hooks
+        """
+        self._enter_hooks: Dict[str, List[Hook]] = {}
+        self._exit_hooks: Dict[str, List[Hook]] = {}
+        for visitor in visitors:
+            for node_type in visitor.NODE_TYPES:
+                enter_hook = getattr(visitor, f"enter_{node_type}", None)
+                if enter_hook is not None:
+                    self._enter_hooks.setdefault(node_type, []).append(enter_hook)
+                exit_hook = getattr(visitor, f"exit_{node_type}", None)
+                if exit_hook is not None:
+                    self._exit_hooks.setdefault(node_type, []).append(exit_hook)
+
+    def walk(self, ast: Tree) -> None:
+        """Visit every subtree of the AST in document order (pre-order enter, post-order exit)."""
+        if not isinstance(ast, Tree):
+            return
+        enter_hooks, exit_hooks = self._enter_hooks, self._exit_hooks
+        scope = WalkScope()
+        # Stack entries: (node, opened function scope, exiting)
+        stack: List[Tuple[Tree, bool, bool]] = [(ast, False, False)]
+        while stack:
+            node, opened_scope, exiting = stack.pop()
+            if exiting:
+                for hook in exit_hooks.get(node.data, ()):
+                    hook(node, scope)
+                if opened_scope:
+                    scope._exit()
+                continue
+
+            opened_scope = scope._enter(node)
+            for hook in enter_hooks.get(node.data, ()):
+                hook(node, scope)
+            stack.append((node, opened_scope, True))
+            for child in reversed(node.children):
+                if isinstance(child, Tree):
+                    stack.append((child, False, False))
+
+
+def dispatch_visitors(ast: Tree, visitors: Sequence[Any], field_name: str) -> None:
+    """Run visitor detectors over an AST with a single traversal."""
+    for visitor in visitors:
+        visitor.begin_visit(ast, field_name)
+    AstDispatcher(visitors).walk(ast)
@@ -2,10 +2,18 @@
 
 from abc import ABC, abstractmethod
 from typing import Any, Generator, List, Tuple
-from ...base import Rule, Finding
+from ...base import Rule, Finding, FIELD_SCRIPTS
 from ....models import PMDModel, PodModel, ScriptModel
 from .violation import Violation
 from .detector import ScriptDetector
+from .dispatch import dispatch_visitors
+from utils.events import get_logger
+
+log = get_logger(__name__)
+
+# Analysis steps a rule must not override to share AST traversals with other rules
+_SHARED_DISPATCH_METHODS = ('analyze', '_analyze_pmd', '_analyze_pod', '_analyze_script',
+                            '_analyze_fields', '_check', '_create_detector')
 
 
 class ScriptRuleBase(Rule, ABC):
@@ -14,6 +22,14 @@ class ScriptRuleBase(Rule, ABC):
     # Subclasses must define these
     DETECTOR: type[ScriptDetector]
     
+    # Script rules read the script fields of pages and pods, and standalone scripts
+    FILE_TYPES = frozenset({'.pmd', '.pod', '.script'})
+    FIELD_CATEGORIES = frozenset({FIELD_SCRIPTS})
+    CONTEXT_FILE_TYPES = frozenset()
+    
+    # Script rules walk parsed ASTs, orders of magnitude slower than structure checks
+    COST_HINT = 25.0
+    
     @abstractmethod
     def get_description(self) -> str:
         """Get rule description - must be implemented by subclasses."""
@@ -33,16 +49,19 @@ class ScriptRuleBase(Rule, ABC):
     def analyze(self, context) -> Generator[Finding, None, None]:
         """Main analysis entry point."""
         # Analyze PMD files
-        for pmd in context.pmds.values():
-            yield from self._analyze_pmd(pmd, context)
+        if '.pmd' in self.FILE_TYPES:
+            for pmd in context.pmds.values():
+                yield from self._analyze_pmd(pmd, context)
         
         # Analyze POD files
-        for pod in context.pods.values():
-            yield from self._analyze_pod(pod, context)
+        if '.pod' in self.FILE_TYPES:
+            for pod in context.pods.values():
+                yield from self._analyze_pod(pod, context)
         
         # Analyze script files
-        for script in context.scripts.values():
-            yield from self._analyze_script(script, context)
+        if '.script' in self.FILE_TYPES:
+            for script in context.scripts.values():
+                yield from self._analyze_script(script, context)
     
     def _analyze_pmd(self, pmd_model: PMDModel, context) -> Generator[Finding, None, None]:
         """Analyze PMD file for script fields."""
@@ -51,7 +70,7 @@ class ScriptRuleBase(Rule, ABC):
     
     def _analyze_pod(self, pod_model: PodModel, context=None) -> Generator[Finding, None, None]:
         """Analyze POD file for script fields."""
-        script_fields = self.find_pod_script_fields(pod_model)
+        script_fields = self.find_pod_script_fields(pod_model, context)
         yield from self._analyze_fields(pod_model, script_fields, context)
     
     def _analyze_script(self, script_model: ScriptModel, context=None) -> Generator[Finding, None, None]:
@@ -65,7 +84,7 @@ class ScriptRuleBase(Rule, ABC):
                 context
             )
         except Exception as e:
-            print(f"Warning: Failed to analyze script file {script_model.file_path}: {e}")
+            log.warning("Failed to analyze script file %s: %s", script_model.file_path, e)
     
     def _analyze_fields(self, model, script_fields: List[Tuple[str, str, str, int]], context=None) -> Generator[Finding, None, None]:
         """Analyze script fields from a model."""
@@ -87,12 +106,7 @@ class ScriptRuleBase(Rule, ABC):
             return  # Return empty generator
         
         # Use detector to find violations
-        detector = self.DETECTOR(file_path, line_offset)
-        
-        # Apply custom settings to detector if available
-        if hasattr(self, '_custom_settings') and hasattr(detector, 'apply_settings'):
-            detector.apply_settings(self._custom_settings)
-        
+        detector = self._create_detector(file_path, line_offset)
         violations = detector.detect(ast, field_name)
         
         # Convert violations to findings
@@ -106,6 +120,28 @@ class ScriptRuleBase(Rule, ABC):
                     file_path=file_path
                 )
     
+    def _create_detector(self, file_path: str, line_offset: int) -> ScriptDetector:
+        """Instantiate the rule's detector with any custom settings applied."""
+        detector = self.DETECTOR(file_path, line_offset)
+        
+        # Apply custom settings to detector if available
+        if hasattr(self, '_custom_settings') and hasattr(detector, 'apply_settings'):
+            detector.apply_settings(self._custom_settings)
+        return detector
+    
+    def supports_shared_dispatch(self) -> bool:
+        """
+        Check whether the rule can run in a ScriptVisitorGroup.
+        
+        True when the detector is an AST visitor (sets NODE_TYPES) and the rule uses the
+        standard field / script analysis path, over the standard file types, unchanged.
+        """
+        if not getattr(self.DETECTOR, 'NODE_TYPES', None) or self.FILE_TYPES != ScriptRuleBase.FILE_TYPES:
+            return False
+        rule_class = type(self)
+        return all(getattr(rule_class, name) is getattr(ScriptRuleBase, name)
+                   for name in _SHARED_DISPATCH_METHODS)
+    
     def _extract_variable_from_empty_expression(self, node) -> str:
         """
         Extract variable name from empty expression nodes.
@@ -199,4 +235,101 @@ class ScriptRuleBase(Rule, ABC):
                     return clean_content
         
         # No tags found, return as-is
-        return script_content
\ No newline at end of file
+        return script_content
+
+
+class ScriptVisitorGroup:
+    """
+    Runs several visitor-based script rules with a single AST traversal per script.
+    
+    Each ScriptRuleBase rule otherwise walks every script AST on its own. The group finds
+    the script fields and parses each script once, creates every member rule's detector,
+    and dispatches all of them in one walk. Findings are attributed to the member rules.
+    """
+    
+    # Script rules only read the files they report on
+    CROSS_FILE = False
+    
+    # Members use the standard analysis path (see ScriptRuleBase.supports_shared_dispatch)
+    FILE_TYPES = ScriptRuleBase.FILE_TYPES
+    FIELD_CATEGORIES = ScriptRuleBase.FIELD_CATEGORIES
+    REQUIRED_FILE_TYPES = frozenset()
+    CONTEXT_FILE_TYPES = ScriptRuleBase.CONTEXT_FILE_TYPES
+    
+    def __init__(self, rules: List[ScriptRuleBase]):
+        self.rules = rules
+    
+    @staticmethod
+    def group_rules(rules: List[Rule]) -> List[Any]:
+        """
+        Replace the rules that support shared dispatch with one ScriptVisitorGroup.
+        
+        Returns:
+            The rules to run: the non-visitor rules, plus the group in place of the first
+            visitor rule (when at least two rules can share traversals)
+        """
+        visitor_rules = [rule for rule in rules
+                         if isinstance(rule, ScriptRuleBase) and rule.supports_shared_dispatch()]
+        if len(visitor_rules) < 2:
+            return list(rules)
+        grouped = []
+        group = ScriptVisitorGroup(visitor_rules)
+        for rule in rules:
+            if rule is visitor_rules[0]:
+                grouped.append(group)
+            elif rule not in visitor_rules:
+                grouped.append(rule)
+        return grouped
+    
+    def analyze(self, context) -> Generator[Finding, None, None]:
+        """Analyze every PMD, POD and script file for all member rules."""
+        lead = self.rules[0]
+        for pmd in context.pmds.values():
+            yield from self._analyze_fields(pmd, lead.find_script_fields(pmd, context), context)
+        
+        for pod in context.pods.values():
+            yield from self._analyze_fields(pod, lead.find_pod_script_fields(pod, context), context)
+        
+        for script in context.scripts.values():
+            try:
+                yield from self._check(script.source, "script", script.file_path, 1, context)
+            except Exception as e:
+                log.warning("Failed to analyze script file %s: %s", script.file_path, e)
+    
+    def _analyze_fields(self, model, script_fields: List[Tuple[str, str, str, int]], context=None) -> Generator[Finding, None, None]:
+        """Analyze script fields from a model."""
+        for field_path, field_value, field_name, line_offset in script_fields:
+            if field_value and field_value.strip():
+                yield from self._check(field_value, field_name, model.file_path, line_offset, context)
+    
+    def _check(self, script_content: str, field_name: str, file_path: str, line_offset: int = 1, context=None) -> Generator[Finding, None, None]:
+        """Parse the script once and run every member rule's detector in one traversal."""
+        lead = self.rules[0]
+        ast = lead._parse_script_content(lead._strip_script_tags(script_content), context)
+        if not ast:
+            return
+        
+        detectors = [rule._create_detector(file_path, line_offset) for rule in self.rules]
+        try:
+            dispatch_visitors(ast, detectors, field_name)
+            results = [detector.visitor_violations for detector in detectors]
+        except Exception as e:
+            # Isolate the failing detector: rerun each one on its own
+            log.warning("Shared script traversal failed in %s (%s); running detectors separately", file_path, e)
+            results = []
+            for rule, detector in zip(self.rules, detectors):
+                try:
+                    results.append(detector.run_visitor(ast, field_name))
+                except Exception as detector_error:
+                    log.error("Rule %s failed: %s", rule.__class__.__name__, detector_error)
+                    results.append([])
+        
+        for rule, violations in zip(self.rules, results):
+            for violation in violations:
+                yield Finding(
+                    rule=rule,
+                    message=violation.message,
+                    line=violation.line,
+                    file_path=file_path
+                )
+
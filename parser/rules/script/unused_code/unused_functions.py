@@ -1,9 +1,12 @@
 """Script unused functions rule using unified architecture."""
 
 from typing import Generator, Set, List, Tuple
-from ...script.shared import ScriptRuleBase
+from ...script.shared import ScriptRuleBase, find_data_nodes
 from ...base import Finding
 from .unused_functions_detector import UnusedFunctionsDetector
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class ScriptUnusedFunctionRule(ScriptRuleBase):
@@ -12,6 +15,7 @@ class ScriptUnusedFunctionRule(ScriptRuleBase):
     DESCRIPTION = "Ensures functions are not declared but never used"
     SEVERITY = "ADVICE"
     DETECTOR = UnusedFunctionsDetector
+    COST_HINT = 1.0  # No per-node visitor pass: far cheaper than the AST-walking script rules
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
@@ -166,14 +170,14 @@ class ScriptUnusedFunctionRule(ScriptRuleBase):
         
         try:
             # Find all variable declarations recursively (including nested ones)
-            for var_decl_node in ast.find_data('variable_statement'):
+            for var_decl_node in find_data_nodes(ast, 'variable_statement'):
                 # Look for variables that are assigned to functions
                 variable_names = self._extract_function_variable_names(var_decl_node)
                 declared_functions.update(variable_names)
             
             # Also check for assignment expressions that assign functions
             # This handles cases where the parser incorrectly parses function declarations as assignments
-            for assignment_node in ast.find_data('assignment_expression'):
+            for assignment_node in find_data_nodes(ast, 'assignment_expression'):
                 function_name = self._extract_function_from_assignment(assignment_node)
                 if function_name:
                     declared_functions.add(function_name)
@@ -198,20 +202,20 @@ class ScriptUnusedFunctionRule(ScriptRuleBase):
             # We'll filter by collecting identifiers used in various contexts
             
             # 1. Direct function calls
-            for call_node in ast.find_data('call_expression'):
+            for call_node in find_data_nodes(ast, 'call_expression'):
                 func_name = self._extract_identifier_from_expression(call_node.children[0] if call_node.children else None)
                 if func_name:
                     function_calls.add(func_name)
             
             # 2. Identifiers used as function arguments (e.g., array.map(myFunc))
-            for call_node in ast.find_data('arguments_expression'):
+            for call_node in find_data_nodes(ast, 'arguments_expression'):
                 # Get all identifiers in the arguments
-                for arg_node in call_node.find_data('identifier_expression'):
+                for arg_node in find_data_nodes(ast, 'identifier_expression', call_node):
                     if len(arg_node.children) > 0 and hasattr(arg_node.children[0], 'value'):
                         function_calls.add(arg_node.children[0].value)
             
             # 3. Identifiers in assignments (e.g., var x = myFunc)
-            for assignment_node in ast.find_data('assignment_expression'):
+            for assignment_node in find_data_nodes(ast, 'assignment_expression'):
                 if len(assignment_node.children) >= 2:
                     right_side = assignment_node.children[1]
                     func_name = self._extract_identifier_from_expression(right_side)
@@ -219,7 +223,7 @@ class ScriptUnusedFunctionRule(ScriptRuleBase):
                         function_calls.add(func_name)
             
             # 4. Return statements that return a function reference
-            for return_node in ast.find_data('return_statement'):
+            for return_node in find_data_nodes(ast, 'return_statement'):
                 if len(return_node.children) > 0:
                     func_name = self._extract_identifier_from_expression(return_node.children[0])
                     if func_name:
@@ -315,7 +319,7 @@ class ScriptUnusedFunctionRule(ScriptRuleBase):
             return False
             
         except Exception as e:
-            print(f"Exception in _is_function_assignment: {e}")
+            log.debug("Exception in _is_function_assignment: %s", e)
             return False
     
     def _extract_function_from_assignment(self, assignment_node) -> str:
@@ -2,7 +2,7 @@
 
 from typing import Any, List, Set
 from lark import Tree
-from ...script.shared import ScriptDetector, Violation
+from ...script.shared import ScriptDetector, Violation, find_data_nodes
 from ...common import ASTLineUtils
 
 
@@ -52,8 +52,8 @@ class UnusedFunctionsDetector(ScriptDetector):
     def _find_function_variable_declaration_line(self, ast: Any, var_name: str) -> int:
         """Find the line number where a function variable is declared."""
         try:
-            for var_statement in ast.find_data('variable_statement'):
-                for child in var_statement.iter_subtrees():
+            for var_statement in find_data_nodes(ast, 'variable_statement'):
+                for child in self._own_declarations(var_statement):
                     if child.data == 'variable_declaration':
                         if len(child.children) >= 1:
                             identifier = child.children[0]
@@ -66,6 +66,19 @@ class UnusedFunctionsDetector(ScriptDetector):
         except Exception:
             pass
         return self.line_offset
+
+    def _own_declarations(self, var_statement: Any) -> List[Any]:
+        """
+        The declarations of a variable statement itself, not those of statements nested
+        in its initializers (which are matched through their own statement).
+        """
+        declarations = []
+        for child in var_statement.children:
+            if isinstance(child, Tree) and child.data == 'variable_declaration_list':
+                declarations.extend(grandchild for grandchild in child.children if isinstance(grandchild, Tree))
+            elif isinstance(child, Tree):
+                declarations.append(child)
+        return declarations
     
     def _is_function_assignment(self, initializer_node: Any) -> bool:
         """Check if an initializer node assigns a function."""
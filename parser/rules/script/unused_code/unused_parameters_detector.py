@@ -1,7 +1,7 @@
 """Detector for unused function parameters in script code."""
 
 from typing import Any, List
-from ...script.shared import ScriptDetector, Violation
+from ...script.shared import ScriptDetector, Violation, find_data_nodes
 from ...common import ASTLineUtils
 
 
@@ -22,7 +22,7 @@ class UnusedParametersDetector(ScriptDetector):
         violations = []
         
         # Find all function expressions
-        for function_node in ast.find_data('function_expression'):
+        for function_node in find_data_nodes(ast, 'function_expression'):
             function_name = self._get_function_name(function_node, ast)
             parameters = self._get_function_parameters(function_node)
             function_body = self._get_function_body(function_node)
@@ -31,7 +31,7 @@ class UnusedParametersDetector(ScriptDetector):
                 continue
             
             # Find which parameters are used in the function body
-            used_parameters = self._find_used_parameters(function_body)
+            used_parameters = self._find_used_parameters(function_body, ast)
             
             # Check for unused parameters
             for param_name in parameters:
@@ -83,12 +83,12 @@ class UnusedParametersDetector(ScriptDetector):
             return node.children[2]
         return None
 
-    def _find_used_parameters(self, body_node: Any) -> set:
+    def _find_used_parameters(self, body_node: Any, ast: Any) -> set:
         """Find all parameter names used in the function body."""
         used_params = set()
         
         # Traverse the function body to find identifier expressions
-        for node in body_node.find_data('identifier_expression'):
+        for node in find_data_nodes(ast, 'identifier_expression', body_node):
             if hasattr(node, 'children') and node.children:
                 identifier = node.children[0]
                 if hasattr(identifier, 'value'):
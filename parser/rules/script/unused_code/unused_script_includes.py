@@ -5,6 +5,9 @@ from ...script.shared import ScriptRuleBase
 from ...base import Finding
 from ....models import PMDModel
 from .unused_script_includes_detector import ScriptUnusedIncludesRuleDetector
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class ScriptUnusedIncludesRule(ScriptRuleBase):
@@ -12,7 +15,9 @@ class ScriptUnusedIncludesRule(ScriptRuleBase):
 
     DESCRIPTION = "Ensures included script files are actually used (via script.function() calls)"
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd'})
     DETECTOR = ScriptUnusedIncludesRuleDetector
+    COST_HINT = 1.0  # No per-node visitor pass: far cheaper than the AST-walking script rules
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
@@ -87,7 +92,7 @@ class ScriptUnusedIncludesRule(ScriptRuleBase):
                 )
                 
         except Exception as e:
-            print(f"Warning: Failed to analyze script includes in {pmd_model.file_path}: {e}")
+            log.warning("Failed to analyze script includes in %s: %s", pmd_model.file_path, e)
 
     def _get_included_scripts(self, pmd_model: PMDModel) -> Set[str]:
         """Get included script files from PMD model."""
@@ -1,7 +1,7 @@
 """Detector for unused variables in script code."""
 
 from typing import Any, List, Set, Dict
-from ...script.shared import ScriptDetector, Violation
+from ...script.shared import ScriptDetector, Violation, find_data_nodes
 from ...common import ASTLineUtils
 
 
@@ -108,11 +108,11 @@ class UnusedVariableDetector(ScriptDetector):
         # Always analyze the top-level scope (whether it's global script or onSend/onLoad/etc.)
         # The is_global_scope parameter just determines the scope type name
         scope_type = 'global' if is_global_scope else 'script'
-        top_level_scope = self._analyze_scope(ast, scope_type, scope_type, global_functions)
+        top_level_scope = self._analyze_scope(ast, ast, scope_type, scope_type, global_functions)
         scopes.append(top_level_scope)
         
         # Function scopes - look for variable statements that contain function expressions
-        for node in ast.find_data('variable_statement'):
+        for node in find_data_nodes(ast, 'variable_statement'):
             # Check if this variable statement contains a function expression
             function_expr = None
             function_name = None
@@ -132,20 +132,20 @@ class UnusedVariableDetector(ScriptDetector):
                             break
             
             if function_expr and function_name:
-                function_scope = self._analyze_scope(function_expr, 'function', function_name, global_functions)
+                function_scope = self._analyze_scope(ast, function_expr, 'function', function_name, global_functions)
                 scopes.append(function_scope)
         
         return scopes
 
-    def _analyze_scope(self, ast: Any, scope_type: str, scope_name: str, global_functions: Set[str]) -> Dict:
-        """Analyze a specific scope for variable declarations and usage."""
+    def _analyze_scope(self, root_ast: Any, ast: Any, scope_type: str, scope_name: str, global_functions: Set[str]) -> Dict:
+        """Analyze a specific scope (the subtree ast of root_ast) for variable declarations and usage."""
         declared_vars = {}
         used_vars = set()
         
         if scope_type == 'global':
             # For global scope, only look for top-level variable statements
             # that are not inside function expressions
-            for node in ast.find_data('variable_statement'):
+            for node in find_data_nodes(root_ast, 'variable_statement', ast):
                 # Check if this variable statement is at the top level
                 # (not inside a function_expression)
                 if self._is_top_level_variable_statement(node, ast):
@@ -160,10 +160,10 @@ class UnusedVariableDetector(ScriptDetector):
         else:
             # For function scope, look for variable statements within the function
             # but exclude those that are inside nested functions
-            for node in ast.find_data('variable_statement'):
+            for node in find_data_nodes(root_ast, 'variable_statement', ast):
                 # Only include variable statements that are direct children of this function
                 # (not nested inside other function expressions)
-                if self._is_direct_child_of_function(node, ast):
+                if self._is_direct_child_of_function(node, ast, root_ast):
                     var_name = self._get_variable_name_from_statement(node)
                     if var_name:
                         declared_vars[var_name] = {
@@ -172,7 +172,7 @@ class UnusedVariableDetector(ScriptDetector):
                         }
         
         # Find function declarations within this scope
-        for node in ast.find_data('function_expression'):
+        for node in find_data_nodes(root_ast, 'function_expression', ast):
             func_name = self._get_function_name(node)
             if func_name:
                 declared_vars[func_name] = {
@@ -181,13 +181,13 @@ class UnusedVariableDetector(ScriptDetector):
                 }
         
         # Find variable usage
-        for node in ast.find_data('identifier_expression'):
+        for node in find_data_nodes(root_ast, 'identifier_expression', ast):
             var_name = self._get_identifier_name(node)
             if var_name:
                 used_vars.add(var_name)
         
         # Find variable usage in template literals
-        for node in ast.find_data('template_literal'):
+        for node in find_data_nodes(root_ast, 'template_literal', ast):
             template_vars = self._extract_variables_from_template(node)
             used_vars.update(template_vars)
         
@@ -224,11 +224,11 @@ class UnusedVariableDetector(ScriptDetector):
         
         return False
 
-    def _is_direct_child_of_function(self, node: Any, function_ast: Any) -> bool:
+    def _is_direct_child_of_function(self, node: Any, function_ast: Any, root_ast: Any) -> bool:
         """Check if a variable statement is a direct child of the function (not nested in other functions)."""
         # Find the function body and check if the variable statement is directly within it
         # Look for the function body (block_statement) within the function
-        for block_node in function_ast.find_data('block_statement'):
+        for block_node in find_data_nodes(root_ast, 'block_statement', function_ast):
             # Check if this variable statement is a direct child of the function body
             if hasattr(block_node, 'children'):
                 for child in block_node.children:
@@ -1,8 +1,11 @@
 from typing import Generator
-from ...base import Finding
+from ...base import Finding, FIELD_ENDPOINTS
 from ...common import PMDLineUtils
 from ....models import PMDModel, PodModel, ProjectContext
 from ..shared import StructureRuleBase
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class EndpointFailOnStatusCodesRule(StructureRuleBase):
@@ -10,6 +13,8 @@ class EndpointFailOnStatusCodesRule(StructureRuleBase):
     
     DESCRIPTION = "Ensures endpoints have failOnStatusCodes with minimum required codes 400 and 403"
     SEVERITY = "ACTION"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = frozenset({FIELD_ENDPOINTS})
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
@@ -104,12 +109,13 @@ class EndpointFailOnStatusCodesRule(StructureRuleBase):
                         code_int = int(code)
                         codes_found.add(code_int)
                     except (ValueError, TypeError):
-                        print(f"Warning: Invalid status code value '{code}' at index {i} in endpoint '{endpoint_name}' - must be a number")
+                        log.warning("Invalid status code value '%s' at index %d in endpoint '%s' - must be a number", code, i, endpoint_name)
                         continue
                 # Silently ignore entries with 'codeName' or other unexpected structures
                 continue
             else:
-                print(f"Warning: Unexpected failOnStatusCodes entry type at index {i} in endpoint '{endpoint_name}': {type(status_code_entry)} - {status_code_entry}")
+                log.warning("Unexpected failOnStatusCodes entry type at index %d in endpoint '%s': %s - %s",
+                            i, endpoint_name, type(status_code_entry), status_code_entry)
                 continue
         
         # Check for required codes 400 and 403 (as integers)
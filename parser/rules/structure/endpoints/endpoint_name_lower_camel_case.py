@@ -1,5 +1,5 @@
 from typing import Generator
-from ...base import Finding
+from ...base import Finding, FIELD_ENDPOINTS
 from ...common_validations import validate_lower_camel_case
 from ...common import PMDLineUtils
 from ....models import PMDModel, PodModel, ProjectContext
@@ -12,6 +12,8 @@ class EndpointNameLowerCamelCaseRule(StructureRuleBase):
     ID = "EndpointNameLowerCamelCaseRule"
     DESCRIPTION = "Ensures endpoint names follow lowerCamelCase naming convention (style guide)"
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = frozenset({FIELD_ENDPOINTS})
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
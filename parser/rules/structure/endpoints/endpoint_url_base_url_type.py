@@ -1,4 +1,4 @@
-from ...base import Finding
+from ...base import Finding, FIELD_ENDPOINTS
 from ....models import PMDModel, PodModel, ProjectContext
 from ..shared import StructureRuleBase
 
@@ -8,6 +8,8 @@ class EndpointBaseUrlTypeRule(StructureRuleBase):
     
     DESCRIPTION = "Ensures endpoint URLs for Workday APIs utilize dataProviders and baseUrlType"
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = frozenset({FIELD_ENDPOINTS})
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
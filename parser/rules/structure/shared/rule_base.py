@@ -6,13 +6,18 @@ that analyze PMD and POD files for structural compliance issues.
 """
 from abc import ABC, abstractmethod
 from typing import Generator, List, Dict, Any, Optional
-from ...base import Rule, Finding
+from ...base import Rule, Finding, FIELD_DOCUMENT, FIELD_ENDPOINTS, FIELD_WIDGETS
 from ....models import PMDModel, PodModel, ProjectContext
 
 
 class StructureRuleBase(Rule, ABC):
     """Base class for structure analysis rules with unified structure."""
     
+    # Structure rules visit pages, pods and the AMD; rules that leave visit_amd unimplemented
+    # narrow FILE_TYPES so the AMD is not loaded for them
+    FILE_TYPES = frozenset({'.pmd', '.pod', '.amd'})
+    FIELD_CATEGORIES = frozenset({FIELD_DOCUMENT, FIELD_ENDPOINTS, FIELD_WIDGETS})
+    
     @abstractmethod
     def get_description(self) -> str:
         """Get rule description - must be implemented by subclasses."""
@@ -21,15 +26,17 @@ class StructureRuleBase(Rule, ABC):
     def analyze(self, context: ProjectContext) -> Generator[Finding, None, None]:
         """Main analysis entry point."""
         # Analyze PMD files
-        for pmd_model in context.pmds.values():
-            yield from self._analyze_pmd(pmd_model, context)
+        if '.pmd' in self.FILE_TYPES:
+            for pmd_model in context.pmds.values():
+                yield from self._analyze_pmd(pmd_model, context)
         
         # Analyze POD files
-        for pod_model in context.pods.values():
-            yield from self._analyze_pod(pod_model, context)
+        if '.pod' in self.FILE_TYPES:
+            for pod_model in context.pods.values():
+                yield from self._analyze_pod(pod_model, context)
         
         # Analyze AMD file if present
-        if context.amd:
+        if '.amd' in self.FILE_TYPES and context.amd:
             yield from self._analyze_amd(context.amd, context)
     
     def _analyze_pmd(self, pmd_model: PMDModel, context: ProjectContext) -> Generator[Finding, None, None]:
@@ -85,11 +92,29 @@ class StructureRuleBase(Rule, ABC):
         from ...common import PMDLineUtils
         return PMDLineUtils.find_field_after_entity(model, entity_field, entity_value, target_field)
     
+    def get_path_line_number(self, model, path) -> Optional[int]:
+        """
+        Get line number for a JSON path from the model's source index.
+        
+        Args:
+            model: PMD/POD/AMD/SMD model
+            path: Tuple path or path string (e.g. "seed.template.children[0]")
+            
+        Returns:
+            Line number (1-based), or None if the path can't be resolved
+        """
+        get_line_for_path = getattr(model, 'get_line_for_path', None)
+        return get_line_for_path(path) if get_line_for_path else None
+    
     def find_pattern_line_number(self, model, pattern: str, case_sensitive: bool = False) -> int:
         """Find line number where a pattern appears in the source content."""
         if not hasattr(model, 'source_content') or not model.source_content:
             return 1
         
+        source_index = model.get_source_index() if hasattr(model, 'get_source_index') else None
+        if source_index is not None:
+            return source_index.line_for_text(pattern, case_sensitive) or 1
+        
         try:
             lines = model.source_content.split('\n')
             for i, line in enumerate(lines):
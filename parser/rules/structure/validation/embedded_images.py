@@ -10,9 +10,10 @@ data:image/[type];base64,[data]
 import re
 from typing import Generator, Any
 
-from ...base import Finding
+from ...base import Finding, ALL_FIELD_CATEGORIES
 from ....models import PMDModel, PodModel, ProjectContext
 from ..shared import StructureRuleBase
+from ...script.shared import find_data_nodes
 
 
 class EmbeddedImagesRule(StructureRuleBase):
@@ -29,6 +30,8 @@ class EmbeddedImagesRule(StructureRuleBase):
     ID = "EmbeddedImagesRule"
     DESCRIPTION = "Detects embedded images that should be stored as external files"
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = ALL_FIELD_CATEGORIES  # whole document, including parsed scripts
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
@@ -139,7 +142,7 @@ class EmbeddedImagesRule(StructureRuleBase):
         base64_image_pattern = r'^data:image/[^;]+;base64,[A-Za-z0-9+/=]{20,}$'
         
         # Extract all string literals from AST with context
-        for variable_decl in ast.find_data('variable_declaration'):
+        for variable_decl in find_data_nodes(ast, 'variable_declaration'):
             # Extract variable name
             var_name = None
             for child in variable_decl.children:
@@ -148,7 +151,7 @@ class EmbeddedImagesRule(StructureRuleBase):
                     break
             
             # Check string literals in this variable declaration
-            for literal_expr in variable_decl.find_data('literal_expression'):
+            for literal_expr in find_data_nodes(ast, 'literal_expression', variable_decl):
                 if hasattr(literal_expr, 'children') and len(literal_expr.children) > 0:
                     token = literal_expr.children[0]
                     if hasattr(token, 'value'):
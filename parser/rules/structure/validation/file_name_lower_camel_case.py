@@ -8,7 +8,7 @@ import re
 import os
 from typing import Generator
 
-from ...base import Finding, Rule
+from ...base import ALL_FILE_TYPES, Finding, Rule
 from ....models import ProjectContext
 from utils.file_path_utils import strip_uuid_prefix
 
@@ -31,6 +31,8 @@ class FileNameLowerCamelCaseRule(Rule):
     ID = "FileNameLowerCamelCaseRule"
     DESCRIPTION = "Ensures all file names follow lowerCamelCase naming convention"
     SEVERITY = "ADVICE"
+    FILE_TYPES = ALL_FILE_TYPES  # each file's name is checked on its own
+    FIELD_CATEGORIES = frozenset()  # checks file names only
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
@@ -1,5 +1,5 @@
 from typing import Generator
-from ...base import Finding
+from ...base import Finding, FIELD_WIDGETS
 from ...common import PMDLineUtils
 from ....models import PMDModel, PodModel, ProjectContext
 from ..shared import StructureRuleBase
@@ -10,6 +10,8 @@ class FooterPodRequiredRule(StructureRuleBase):
     
     DESCRIPTION = "Ensures footer uses pod structure (direct pod or footer with pod children). Excludes PMD pages with tabs, hub pages, and microConclusion pages."
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = frozenset({FIELD_WIDGETS})
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
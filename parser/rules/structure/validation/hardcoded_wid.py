@@ -9,9 +9,10 @@ A WID can be identified as a 32 character long string that is alphanumeric.
 """
 import re
 from typing import Generator, Any
-from ...base import Finding
+from ...base import Finding, ALL_FIELD_CATEGORIES
 from ....models import PMDModel, PodModel, ProjectContext
 from ..shared import StructureRuleBase
+from ...script.shared import find_data_nodes
 
 
 class HardcodedWidRule(StructureRuleBase):
@@ -27,6 +28,8 @@ class HardcodedWidRule(StructureRuleBase):
     ID = "HardcodedWidRule"
     DESCRIPTION = "Detects hardcoded WID values that should be configured in app attributes"
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = ALL_FIELD_CATEGORIES  # whole document, including parsed scripts
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
@@ -163,7 +166,7 @@ const query = "SELECT worker FROM allIndexedWorkers WHERE country = usaLocation"
         # Extract all string literals from AST with context
         wid_pattern = r'^[a-f0-9]{32}$'  # Exact match for literals
         
-        for variable_decl in ast.find_data('variable_declaration'):
+        for variable_decl in find_data_nodes(ast, 'variable_declaration'):
             # Extract variable name and check its value
             var_name = None
             for child in variable_decl.children:
@@ -172,7 +175,7 @@ const query = "SELECT worker FROM allIndexedWorkers WHERE country = usaLocation"
                     break
             
             # Check string literals in this variable declaration
-            for literal_expr in variable_decl.find_data('literal_expression'):
+            for literal_expr in find_data_nodes(ast, 'literal_expression', variable_decl):
                 if hasattr(literal_expr, 'children') and len(literal_expr.children) > 0:
                     token = literal_expr.children[0]
                     if hasattr(token, 'value'):
@@ -1,7 +1,10 @@
 from typing import Generator, List, Dict, Any
-from ...base import Rule, Finding
+from ...base import Rule, Finding, FIELD_DOCUMENT
 from ....models import ProjectContext, PMDModel
 import json
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 
 class PMDSectionOrderingRule(Rule):
@@ -9,6 +12,8 @@ class PMDSectionOrderingRule(Rule):
     
     DESCRIPTION = "Ensures PMD file root-level sections follow consistent ordering for better readability"
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd'})
+    FIELD_CATEGORIES = frozenset({FIELD_DOCUMENT})
     AVAILABLE_SETTINGS = {
         'section_order': {'type': 'list', 'default': ['id', 'securityDomains', 'include', 'script', 'endPoints', 'onSubmit', 'outboundData', 'onLoad', 'presentation'], 'description': 'Required order of PMD file root-level sections'}
     }
@@ -89,7 +94,7 @@ class PMDSectionOrderingRule(Rule):
             yield from self._check_section_ordering(actual_order, pmd_model)
             
         except Exception as e:
-            print(f"Warning: Failed to analyze section ordering in {pmd_model.file_path}: {e}")
+            log.warning("Failed to analyze section ordering in %s: %s", pmd_model.file_path, e)
 
     def _extract_root_key_order(self, pmd_model: PMDModel) -> List[str]:
         """Extract the order of root-level keys from the PMD source."""
@@ -1,5 +1,5 @@
 from typing import Generator
-from ...base import Rule, Finding
+from ...base import Rule, Finding, FIELD_DOCUMENT, FIELD_WIDGETS
 from ....models import ProjectContext, PMDModel
 
 
@@ -8,6 +8,8 @@ class PMDSecurityDomainRule(Rule):
     
     DESCRIPTION = "Ensures PMD pages have at least one security domain defined (excludes microConclusion and error pages unless strict mode is enabled)"
     SEVERITY = "ACTION"
+    FILE_TYPES = frozenset({'.pmd'})
+    FIELD_CATEGORIES = frozenset({FIELD_DOCUMENT, FIELD_WIDGETS})
     AVAILABLE_SETTINGS = {
         'strict': {'type': 'bool', 'default': False, 'description': 'When enabled, requires security domains for ALL PMD pages, including microConclusion and error pages'}
     }
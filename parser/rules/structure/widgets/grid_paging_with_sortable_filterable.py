@@ -8,7 +8,7 @@ This rule checks PMD and POD grid widgets.
 """
 from typing import Generator, Dict, Any
 
-from ...base import Finding
+from ...base import Finding, FIELD_WIDGETS
 from ....models import PMDModel, PodModel, ProjectContext
 from ..shared import StructureRuleBase
 
@@ -29,6 +29,8 @@ class GridPagingWithSortableFilterableRule(StructureRuleBase):
     ID = "GridPagingWithSortableFilterableRule"
     DESCRIPTION = "Detects grids with paging and sortableAndFilterable columns which can cause performance issues"
     SEVERITY = "ACTION"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = frozenset({FIELD_WIDGETS})
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
@@ -96,22 +98,10 @@ class GridPagingWithSortableFilterableRule(StructureRuleBase):
         if not pmd_model.presentation:
             return
         
-        # Use generic traversal to find all widgets
-        presentation_dict = pmd_model.presentation.__dict__
-        
-        for section_name, section_data in presentation_dict.items():
-            if isinstance(section_data, dict):
-                for widget, path, index, parent_type, container_name in self.traverse_presentation_structure(section_data, section_name):
-                    if isinstance(widget, dict) and widget.get('type') == 'grid':
-                        yield from self._check_grid_paging_and_sortable(widget, pmd_model, section_name, path)
-            elif isinstance(section_data, list):
-                # Handle tabs list (tabs is a list of section widgets)
-                for i, tab_item in enumerate(section_data):
-                    if isinstance(tab_item, dict):
-                        tab_path = f"{section_name}.{i}"
-                        for widget, path, index, parent_type, container_name in self.traverse_presentation_structure(tab_item, tab_path):
-                            if isinstance(widget, dict) and widget.get('type') == 'grid':
-                                yield from self._check_grid_paging_and_sortable(widget, pmd_model, section_name, path)
+        # Widgets of all presentation sections (including tabs) from the walk table
+        for node in self.find_presentation_widgets(pmd_model):
+            if node.widget.get('type') == 'grid':
+                yield from self._check_grid_paging_and_sortable(node.widget, pmd_model, node.section, node.path)
     
     def visit_pod(self, pod_model: PodModel, context: ProjectContext) -> Generator[Finding, None, None]:
         """Analyze POD model for grids with paging and sortableAndFilterable columns."""
@@ -1,5 +1,5 @@
 from typing import Generator, List
-from ...base import Finding
+from ...base import Finding, FIELD_WIDGETS
 from ...common_validations import validate_lower_camel_case
 from ...common import PMDLineUtils
 from ....models import PMDModel, PodModel, ProjectContext
@@ -12,6 +12,8 @@ class WidgetIdLowerCamelCaseRule(StructureRuleBase):
     ID = "WidgetIdLowerCamelCaseRule"
     DESCRIPTION = "Ensures widget IDs follow lowerCamelCase naming convention (style guide for PMD and POD files)"
     SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = frozenset({FIELD_WIDGETS})
     AVAILABLE_SETTINGS = {}  # This rule does not support custom configuration
     
     DOCUMENTATION = {
@@ -54,30 +56,14 @@ class WidgetIdLowerCamelCaseRule(StructureRuleBase):
         if not pmd_model.presentation:
             return
         
-        # Use generic traversal to handle different layout types
-        presentation_dict = pmd_model.presentation.__dict__
-        
-        # Traverse all presentation sections (body, title, footer, etc.)
-        for section_name, section_data in presentation_dict.items():
-            if isinstance(section_data, dict):
-                # Use generic traversal for each section
-                for widget, path, index, parent_type, container_name in self.traverse_presentation_structure(section_data, section_name):
-                    if isinstance(widget, dict) and 'id' in widget:
-                        # Skip widget types that are excluded from ID requirements
-                        widget_type = widget.get('type', 'unknown')
-                        if widget_type not in self.WIDGET_TYPES_WITHOUT_ID_REQUIREMENT:
-                            yield from self._check_widget_id_naming(widget, pmd_model, section_name, path, index)
-            elif isinstance(section_data, list):
-                # Handle tabs list (tabs is a list of section widgets)
-                for i, tab_item in enumerate(section_data):
-                    if isinstance(tab_item, dict):
-                        tab_path = f"{section_name}.{i}"
-                        for widget, path, index, parent_type, container_name in self.traverse_presentation_structure(tab_item, tab_path):
-                            if isinstance(widget, dict) and 'id' in widget:
-                                # Skip widget types that are excluded from ID requirements
-                                widget_type = widget.get('type', 'unknown')
-                                if widget_type not in self.WIDGET_TYPES_WITHOUT_ID_REQUIREMENT:
-                                    yield from self._check_widget_id_naming(widget, pmd_model, section_name, path, index)
+        # Widgets of all presentation sections (body, title, footer, tabs, etc.) from the walk table
+        for node in self.find_presentation_widgets(pmd_model):
+            widget = node.widget
+            if 'id' in widget:
+                # Skip widget types that are excluded from ID requirements
+                widget_type = widget.get('type', 'unknown')
+                if widget_type not in self.WIDGET_TYPES_WITHOUT_ID_REQUIREMENT:
+                    yield from self._check_widget_id_naming(widget, pmd_model, node.section, node.path, node.index)
     
     def visit_pod(self, pod_model: PodModel, context: ProjectContext) -> Generator[Finding, None, None]:
         """Analyze POD model for widget ID naming conventions."""
@@ -175,6 +161,12 @@ class WidgetIdLowerCamelCaseRule(StructureRuleBase):
                 # Fallback to just the widget identifier
                 return self._get_readable_identifier(widget, 0)
             
+            # PMD widgets carry their readable path in the model's walk table
+            if pmd_model:
+                node = pmd_model.get_walk_table().widget_for_path(widget_path)
+                if node is not None:
+                    return node.display_name
+            
             # Split the technical path into components
             path_parts = widget_path.split('.')
             
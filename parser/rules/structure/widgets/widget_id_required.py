@@ -8,8 +8,9 @@ Note: Basic structural validation (missing required fields, etc.) is handled by
 This tool focuses on structure and naming compliance for code reviewers.
 """
 from typing import Generator
-from ...base import Finding
+from ...base import Finding, FIELD_WIDGETS
 from ....models import PMDModel, PodModel, ProjectContext
+from ....json_source_index import parse_json_path
 from ...common import PMDLineUtils
 from ..shared import StructureRuleBase
 
@@ -19,6 +20,8 @@ class WidgetIdRequiredRule(StructureRuleBase):
     
     DESCRIPTION = "Ensures all widgets have an 'id' field set (structure validation for PMD and POD files)"
     SEVERITY = "ACTION"
+    FILE_TYPES = frozenset({'.pmd', '.pod'})
+    FIELD_CATEGORIES = frozenset({FIELD_WIDGETS})
     AVAILABLE_SETTINGS = {
         'excluded_widget_types': {'type': 'list', 'default': [], 'description': 'Additional widget types to exclude from ID requirements'}
     }
@@ -107,22 +110,9 @@ Built-in widget types that don't require IDs: `footer`, `item`, `group`, `title`
         if not pmd_model.presentation:
             return
 
-        # Use generic traversal to handle different layout types
-        presentation_dict = pmd_model.presentation.__dict__
-        
-        # Traverse all presentation sections (body, title, footer, etc.)
-        for section_name, section_data in presentation_dict.items():
-            if isinstance(section_data, dict):
-                # Use generic traversal for each section
-                for widget, path, index, parent_type, container_name in self.traverse_presentation_structure(section_data, section_name):
-                    yield from self._check_widget_id(widget, pmd_model.file_path, pmd_model, section_name, path, index, None, parent_type, container_name)
-            elif isinstance(section_data, list):
-                # Handle tabs list (tabs is a list of section widgets)
-                for i, tab_item in enumerate(section_data):
-                    if isinstance(tab_item, dict):
-                        tab_path = f"{section_name}.{i}"
-                        for widget, path, index, parent_type, container_name in self.traverse_presentation_structure(tab_item, tab_path):
-                            yield from self._check_widget_id(widget, pmd_model.file_path, pmd_model, section_name, path, index, None, parent_type, container_name)
+        # Widgets of all presentation sections (body, title, footer, tabs, etc.) from the walk table
+        for node in self.find_presentation_widgets(pmd_model):
+            yield from self._check_widget_id(node.widget, pmd_model.file_path, pmd_model, node.section, node.path, node.index, None, node.parent_type, node.container_name)
 
     def visit_pod(self, pod_model: PodModel, context: ProjectContext) -> Generator[Finding, None, None]:
         """Analyzes the template widgets within a POD model."""
@@ -238,11 +228,17 @@ Built-in widget types that don't require IDs: `footer`, `item`, `group`, `title`
         return False
     
     def _get_widget_line_number(self, pmd_model: PMDModel, widget_type: str, section: str, widget_path: str = "", widget_index: int = 0) -> int:
-        """Get approximate line number for a widget based on its location."""
+        """Get line number for a widget based on its location."""
         try:
             if not pmd_model.source_content:
                 return 1
             
+            # Exact lookup: widget paths are relative to the presentation section
+            if widget_path:
+                line = self.get_path_line_number(pmd_model, ('presentation',) + parse_json_path(widget_path))
+                if line is not None:
+                    return line
+            
             lines = pmd_model.source_content.split('\n')
             
             # Extract container context from widget_path (e.g., "cellTemplate" from "body.children.1.columns.0.cellTemplate")
@@ -297,11 +293,17 @@ Built-in widget types that don't require IDs: `footer`, `item`, `group`, `title`
             return base_line + widget_index * 2
 
     def _get_pod_widget_line_number(self, pod_model: PodModel, widget_type: str, widget_path: str = "", widget_index: int = 0) -> int:
-        """Get approximate line number for a widget in a POD file based on its location."""
+        """Get line number for a widget in a POD file based on its location."""
         try:
             if not pod_model.source_content:
                 return 1
             
+            # Exact lookup: POD widget paths are rooted at the file (e.g. "seed.template.children[0]")
+            if widget_path:
+                line = self.get_path_line_number(pod_model, widget_path)
+                if line is not None:
+                    return line
+            
             lines = pod_model.source_content.split('\n')
             
             # Look for the template section first
@@ -371,6 +373,12 @@ Built-in widget types that don't require IDs: `footer`, `item`, `group`, `title`
                 # Fallback to just the widget identifier
                 return self._get_readable_identifier(widget, 0)
             
+            # PMD widgets carry their readable path in the model's walk table
+            if pmd_model:
+                node = pmd_model.get_walk_table().widget_for_path(widget_path)
+                if node is not None:
+                    return node.display_name
+            
             # Split the technical path into components
             path_parts = widget_path.split('.')
             
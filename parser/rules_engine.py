@@ -1,16 +1,103 @@
-import inspect
-import pkgutil
-import importlib.util
+import json
+import logging
 import os
-from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 # --- Local Imports ---
 from .models import ProjectContext
-from . import rules
-from .rules.base import Rule, Finding
+from .rules.base import FIELD_SCRIPTS, Rule, Finding, file_type_of, sort_findings
 from .config import ArcaneAuditorConfig
-from utils.arcane_paths import get_rule_dirs
+from .rule_registry import get_rule_registry
+from .rule_profiler import PROJECT_UNIT, RuleProfiler
+from .findings_cache import FindingsCache, rule_code_digest
+from .rule_costs import RuleCostProfile, input_bytes
+from .rules.script.shared.rule_base import ScriptVisitorGroup
+from utils.concurrency import AUTO, PROCESS, SERIAL, THREAD
+from utils.events import get_logger
+
+log = get_logger(__name__)
+
+# State of a forked work-unit worker: the engine's rules and the per-file contexts. Set in
+# each worker by _init_work_unit_worker; the parent never sets it, so concurrent runs
+# (e.g. web jobs) cannot replace each other's state.
+_work_unit_rules: List[Rule] = []
+_work_unit_contexts: Dict[str, ProjectContext] = {}
+
+
+def _init_work_unit_worker(rules: List[Rule], file_contexts: Dict[str, ProjectContext]):
+    """Pool initializer: keep the rules and per-file contexts the worker inherited by forking."""
+    global _work_unit_rules, _work_unit_contexts
+    _work_unit_rules, _work_unit_contexts = rules, file_contexts
+
+
+def _run_work_unit(unit: Tuple[int, str]) -> Tuple[int, List[Tuple[str, int, str]], List[Tuple[str, str, str]], float]:
+    """Run one (rule index, file path) unit in a work-unit worker (see _analyze_work_unit)."""
+    rule_index, file_path = unit
+    return _analyze_work_unit(rule_index, _work_unit_rules[rule_index], _work_unit_contexts[file_path], file_path)
+
+
+def _analyze_work_unit(rule_index: int, rule: Rule, file_context: ProjectContext, file_path: str
+                       ) -> Tuple[int, List[Tuple[str, int, str]], List[Tuple[str, str, str]], float]:
+    """
+    Run one rule against one file.
+    
+    Findings and skipped checks are returned as plain tuples so that the rule objects
+    never cross the process boundary; the parent rebuilds the Findings.
+    
+    Returns:
+        Tuple of (rule index, [(message, line, file_path)], [(rule_name, check_name, reason)],
+        CPU seconds spent, or -1 if the rule failed)
+    """
+    analysis_context = file_context.analysis_context
+    skipped_before = len(analysis_context.skipped_checks) if analysis_context else 0
+    
+    findings = []
+    cpu_start = time.thread_time()
+    try:
+        for finding in rule.analyze(file_context):
+            # Findings reported against other files (e.g. the SMD) belong to that file's unit
+            if finding.file_path == file_path:
+                findings.append((finding.message, finding.line, finding.file_path))
+        cpu_time = time.thread_time() - cpu_start
+    except Exception as e:
+        log.error("Rule %s failed on %s: %s", rule.__class__.__name__, file_path, e)
+        cpu_time = -1.0
+    
+    skipped = []
+    if analysis_context:
+        skipped = [(skip.rule_name, skip.check_name, skip.reason)
+                   for skip in analysis_context.skipped_checks[skipped_before:]]
+    return rule_index, findings, skipped, cpu_time
+
+
+class RuleBudget:
+    """
+    Time a rule may spend during one analysis.
+    
+    Rules cannot be interrupted, so cancellation is cooperative: the engine checks the
+    budget between the files it hands a rule and between the findings the rule yields,
+    and skips the rule's remaining files once the budget is spent.
+    """
+    
+    def __init__(self, time_limit: float):
+        self.time_limit = time_limit
+        self.spent = 0.0
+        self.files_completed = 0
+        self.files_total = 0
+    
+    @property
+    def exhausted(self) -> bool:
+        return self.spent >= self.time_limit
+    
+    @property
+    def timed_out(self) -> bool:
+        return self.files_completed < self.files_total
+
 
 class RulesEngine:
     """Discovers, loads, and runs all analysis rules."""
@@ -18,76 +105,51 @@ class RulesEngine:
     def __init__(self, config: Optional[ArcaneAuditorConfig] = None):
         self.config = config or ArcaneAuditorConfig()
         self.rules = self._discover_rules()
+        # Per-rule cost profile, collected when profiling is enabled (--profile-rules)
+        self.profiler: Optional[RuleProfiler] = RuleProfiler() if self.config.profile_rules else None
+        # Time budgets of the rules with a time limit, keyed by class name (reset per run)
+        self._budgets: Dict[str, RuleBudget] = {}
+        # Rules with something to analyze in the current run (see _select_rules)
+        self._active_rules: Optional[List[Rule]] = None
+        # Findings of unchanged (rule, file) units from previous runs (--cache); profiling
+        # measures every unit, so it never reads the cache
+        self.findings_cache: Optional[FindingsCache] = None
+        if self.config.findings_cache and self.profiler is None:
+            self.findings_cache = FindingsCache(self.config.findings_cache_path or None)
+        self._rule_fingerprints: Dict[str, str] = {}
+        # Estimated rule costs, to schedule the most expensive work first; the rates
+        # learned from measured runs are kept between runs with cost_profile
+        self.costs = RuleCostProfile(self.config.cost_profile_path or None, persist=self.config.cost_profile)
+        # Set by run_fail_fast: how many rules it started, and the severities of the rules it never ran
+        self.fail_fast_rules_run = 0
+        self.fail_fast_skipped_severities: List[str] = []
 
     def _discover_rules(self) -> List[Rule]:
         """
-        Automatically finds and instantiates all Rule classes from both
-        built-in and user-defined rule directories.
+        Instantiates the enabled rules from the process-wide rule registry.
         
-        Note: This method runs once at initialization. If dynamic rule reloading
-        is implemented in the future, thread safety should be considered.
+        The registry discovers built-in and user-defined rule classes once per process
+        (user rule files are reloaded when they change), so creating an engine per job
+        or request only instantiates and configures the rules. In frozen builds only the
+        modules of enabled rules are imported.
         """
+        registry = get_rule_registry()
         discovered_rules = []
-
-        # 1. Load built-in rules using the original working approach
-        self._load_builtin_rules(discovered_rules)
+        for metadata in registry.get_rule_metadata():
+            # Check if rule is enabled in configuration using class name
+            if self.config.is_rule_enabled(metadata.name):
+                rule_class = registry.get_rule_class(metadata)
+                if rule_class is None:
+                    continue
+                log.debug("[RulesEngine] Discovered %s rule: %s", metadata.rule_type, metadata.name)
+                rule_instance = rule_class()
+                # Apply configuration overrides
+                self._apply_rule_config(rule_instance)
+                discovered_rules.append(rule_instance)
+            else:
+                log.debug("[RulesEngine] Skipping disabled %s rule: %s", metadata.rule_type, metadata.name)
         
-        # 2. Load user rules from custom directories
-        self._load_user_rules(discovered_rules)
-
         return discovered_rules
-
-    def _load_builtin_rules(self, discovered_rules: List[Rule]) -> None:
-        """Load built-in rules using the original pkgutil approach."""
-        # Use the original working approach for built-in rules
-        for _, name, _ in pkgutil.walk_packages(rules.__path__, f"{rules.__name__}."):
-            try:
-                module = __import__(name, fromlist="dummy")
-                self._extract_rules_from_module(module, discovered_rules, "built-in")
-            except Exception as e:
-                print(f"[RulesEngine] Error loading built-in rule {name}: {e}")
-
-    def _load_user_rules(self, discovered_rules: List[Rule]) -> None:
-        """Load user rules from custom directories."""
-        rule_dirs = get_rule_dirs()
-        for rule_dir in rule_dirs:
-            # Only process user custom directories (not built-in)
-            # Use basename check to avoid false positives if "custom" appears elsewhere in path
-            if os.path.basename(rule_dir) == "user" and os.path.isdir(rule_dir):
-                for file in os.listdir(rule_dir):
-                    if file.endswith(".py") and not file.startswith("__"):
-                        path = os.path.join(rule_dir, file)
-                        mod_name = os.path.splitext(file)[0]
-                        try:
-                            spec = importlib.util.spec_from_file_location(mod_name, path)
-                            if spec and spec.loader:
-                                mod = importlib.util.module_from_spec(spec)
-                                spec.loader.exec_module(mod)
-                                self._extract_rules_from_module(mod, discovered_rules, "user")
-                        except Exception as e:
-                            print(f"[RulesEngine] Error loading user rule {file} from {rule_dir}: {e}")
-
-    def _extract_rules_from_module(self, module, discovered_rules: List[Rule], rule_type: str) -> None:
-        """Extract and instantiate rules from a module."""
-        for member_name, member_obj in inspect.getmembers(module, inspect.isclass):
-            if issubclass(member_obj, Rule) and member_obj is not Rule:
-                # Skip abstract classes
-                if hasattr(member_obj, '__abstractmethods__') and member_obj.__abstractmethods__:
-                    continue
-                
-                # Skip example rules (flagged with IS_EXAMPLE = True)
-                if hasattr(member_obj, 'IS_EXAMPLE') and member_obj.IS_EXAMPLE:
-                    continue
-                
-                # Check if rule is enabled in configuration using class name
-                if self.config.is_rule_enabled(member_obj.__name__):
-                    print(f"[RulesEngine] Discovered {rule_type} rule: {member_obj.__name__}")
-                    rule_instance = member_obj()
-                    # Apply configuration overrides
-                    self._apply_rule_config(rule_instance)
-                    discovered_rules.append(rule_instance)
-                else:
-                    print(f"[RulesEngine] Skipping disabled {rule_type} rule: {member_obj.__name__}")
     
     def _apply_rule_config(self, rule: Rule) -> None:
         """Apply configuration overrides to a rule instance."""
@@ -97,7 +159,8 @@ class RulesEngine:
             configured_severity = self.config.get_rule_severity(rule.__class__.__name__, original_severity)
             if configured_severity != original_severity:
                 rule.SEVERITY = configured_severity
-                print(f"[CONFIG] Override severity for {rule.__class__.__name__}: {original_severity} -> {configured_severity}")
+                log.info("[CONFIG] Override severity for %s: %s -> %s",
+                         rule.__class__.__name__, original_severity, configured_severity)
         
         # Apply custom settings if the rule supports it
         custom_settings = self.config.get_rule_settings(rule.__class__.__name__)
@@ -113,53 +176,699 @@ class RulesEngine:
             context: The ProjectContext containing the entire application model.
 
         Returns:
-            A list of all findings from all rules.
+            A list of all findings from all rules, in (file, line, rule) order.
+        """
+        return sort_findings(list(self.run_iter(context)))
+    
+    def run_iter(self, context: ProjectContext) -> Iterator[Finding]:
+        """
+        Executes the rules and yields findings as the work they belong to completes.
+        
+        The work runs as in run(): on the configured rules executor (see
+        ExecutionConfig.rules), longest-first, with the learned rule costs updated at the
+        end. Threads and worker processes finish in no fixed order, so the stream is not
+        ordered; sort_findings gives the same (file, line, rule) order as run(). Rules
+        flagged CROSS_FILE run last, against the whole project.
+        
+        Args:
+            context: The ProjectContext containing the entire application model.
+        
+        Yields:
+            Findings, rule by rule ((rule, file) unit by unit with worker processes, the
+            findings cache or profiling).
+        """
+        if not self.rules:
+            log.warning("No rules were found to run.")
+            return
+        
+        log.info("Running %d rule(s)...", len(self.rules))
+        self._start_budgets()
+        rules = self._select_rules(context)
+        
+        try:
+            if self.profiler is not None:
+                log.info("Profiling rules: running each rule file by file, serially")
+                self._warn_execution_unused("Profiling runs")
+                yield from self._profile_rules(context, rules)
+            elif self.config.execution.rules.executor == PROCESS:
+                if self.findings_cache is not None:
+                    log.info("[RulesEngine] The findings cache is not used with worker processes")
+                context.precompute_deferred = self._needs_script_asts()
+                yield from self._iter_work_units(context, self.config.execution.rules.workers or -1)
+            elif self.findings_cache is not None:
+                self._warn_execution_unused("With the findings cache, runs")
+                yield from self._iter_units(context)
+            else:
+                # Every file of the types the rules read gets analyzed, so deferred files
+                # pre-compute their ASTs in the parse workers as they are loaded
+                context.precompute_deferred = self._needs_script_asts()
+                yield from self._iter_rules(context)
+        finally:
+            self._active_rules = None
+        
+        self._report_timeouts(context)
+        self._save_findings_cache()
+        self.costs.save()
+    
+    def run_fail_fast(self, context: ProjectContext, fail_severities: Tuple[str, ...] = ("ACTION",)) -> List[Finding]:
+        """
+        Runs only the rules that can fail the analysis and stops at the first failing finding.
+        
+        Gating CI jobs only need to know whether a failing finding exists. Rules run by
+        severity (configured severity overrides applied), in the order of fail_severities,
+        and within a severity (rule, file) unit by unit, in file order; the first finding cancels the
+        remaining units, so pending file types no rule has reached are never parsed.
+        
+        Args:
+            context: The ProjectContext containing the entire application model.
+            fail_severities: Severities that fail the analysis, scheduled in this order.
+        
+        Returns:
+            The first failing finding, or an empty list when no rule of those severities found anything.
+            fail_fast_rules_run and fail_fast_skipped_severities then describe what was not analyzed.
         """
-        all_findings = []
         if not self.rules:
-            print("No rules were found to run.")
+            log.warning("No rules were found to run.")
             return []
-            
-        print(f"\nRunning {len(self.rules)} rule(s)...")
         
-        # For small rule counts, use serial processing to avoid overhead
-        if len(self.rules) <= 5:
-            print("Using serial rule execution (small rule count)")
-            for rule in self.rules:
+        self._warn_execution_unused("Fail-fast runs")
+        self._start_budgets()
+        selected = self._select_rules(context)
+        not_run = list(selected)
+        self.fail_fast_rules_run = 0
+        try:
+            for severity in fail_severities:
+                self._active_rules = [rule for rule in selected if rule.SEVERITY == severity]
+                if not self._active_rules:
+                    continue
+                self.fail_fast_rules_run += len(self._active_rules)
+                not_run = [rule for rule in not_run if rule.SEVERITY != severity]
+                log.info("Fail-fast: running %d %s rule(s) file by file...", len(self._active_rules), severity)
+                units = self._iter_units(context)
                 try:
-                    # The 'analyze' method is a generator, so we consume it into a list.
-                    findings_from_rule = list(rule.analyze(context))
-                    if findings_from_rule:
-                        all_findings.extend(findings_from_rule)
-                except Exception as e:
-                    print(f"Rule {rule.__class__.__name__} failed: {e}")
+                    for finding in units:
+                        log.info("Fail-fast: stopping at the first %s finding (%s in %s)",
+                                 severity, finding.rule_id, finding.file_path)
+                        return [finding]
+                finally:
+                    units.close()
+        finally:
+            self._active_rules = None
+            self.fail_fast_skipped_severities = [severity for severity in ("ACTION", "ADVICE")
+                                                 if any(rule.SEVERITY == severity for rule in not_run)]
+            self._report_timeouts(context)
+            self._save_findings_cache()
+        return []
+    
+    def _warn_execution_unused(self, mode: str) -> None:
+        """Warn when explicit execution.rules settings do not apply to a run of units one at a time."""
+        execution = self.config.execution.rules
+        if execution.executor not in (AUTO, SERIAL) or execution.workers:
+            log.warning("[RulesEngine] %s (rule, file) units one at a time; the %s rule executor "
+                        "and worker count are not used", mode, execution.executor)
+    
+    def _iter_units(self, context: ProjectContext) -> Iterator[Finding]:
+        """
+        Run every (rule, file) unit in order, yielding each unit's findings when it completes.
+        
+        With the findings cache, units whose key is cached are answered from it and files
+        are parsed one at a time, only when one of their units misses.
+        """
+        rules_to_run = self._rules_to_run()
+        per_file_rules = [rule for rule in rules_to_run if not rule.CROSS_FILE]
+        cross_file_rules = [rule for rule in rules_to_run if rule.CROSS_FILE]
+        
+        if self.findings_cache is None:
+            file_contexts = context.split_by_file(self._needed_file_types())
+            file_paths, get_file_context = sorted(file_contexts), file_contexts.get
+            digests = {}
         else:
-            # Use parallel processing for larger rule sets
-            max_workers = min(8, len(self.rules))  # Cap at 8 workers for rules
+            file_paths, get_file_context = context.file_paths(self._needed_file_types()), context.file_context
+            digests = context.file_digests()
+        
+        for file_path in file_paths:
+            file_context = None
+            file_type = file_type_of(file_path)
+            for rule in per_file_rules:
+                if file_type not in rule.FILE_TYPES:
+                    continue
+                cache_key = self._unit_cache_key(rule, [file_path], digests)
+                findings = self._cached_findings(cache_key, context)
+                if findings is None:
+                    if file_context is None:
+                        file_context = get_file_context(file_path)
+                        if file_context is None:
+                            # The file has no model (e.g. it failed to parse)
+                            break
+                    if cache_key is None:
+                        findings = self._run_unit(rule, file_path, file_context)
+                    else:
+                        findings = self._run_and_cache(rule, file_context, cache_key)
+                for finding in findings:
+                    # Findings reported against other files (e.g. the SMD) belong to that file's unit
+                    if finding.file_path == file_path:
+                        yield finding
+        
+        for rule in cross_file_rules:
+            cache_key = self._unit_cache_key(
+                rule, [path for path in digests if file_type_of(path) in rule.FILE_TYPES], digests)
+            cached = self._cached_findings(cache_key, context)
+            if cached is not None:
+                yield from cached
+            elif cache_key is not None:
+                yield from self._run_and_cache(rule, context, cache_key)
+            else:
+                project_files = [model.file_path for model in context.loaded_models()]
+                yield from self._run_unit(rule, PROJECT_UNIT, context, project_files)
+    
+    def _unit_cache_key(self, rule: Any, unit_files: List[str], digests: Dict[str, str]) -> Optional[str]:
+        """
+        Findings cache key of a unit: the rule's fingerprint and the digests of the unit's
+        files plus the files of the rule's CONTEXT_FILE_TYPES. None when the cache is off
+        or a file has no digest.
+        """
+        if self.findings_cache is None:
+            return None
+        context_types = rule.CONTEXT_FILE_TYPES
+        file_paths = set(unit_files) | {path for path in digests if file_type_of(path) in context_types}
+        if any(path not in digests for path in file_paths):
+            return None
+        return self.findings_cache.key(self._rule_fingerprint(rule),
+                                       [(path, digests[path]) for path in file_paths])
+    
+    def _rule_fingerprint(self, rule: Any) -> str:
+        """
+        What a rule's findings depend on besides its files: its class and code, its
+        (configured) severity and its custom settings. A visitor group combines its members.
+        """
+        members = rule.rules if isinstance(rule, ScriptVisitorGroup) else [rule]
+        fingerprints = []
+        for member in members:
+            rule_name = member.__class__.__name__
+            if rule_name not in self._rule_fingerprints:
+                self._rule_fingerprints[rule_name] = json.dumps(
+                    [member.__class__.__module__, rule_name, member.SEVERITY,
+                     self.config.get_rule_settings(rule_name), rule_code_digest(member.__class__)],
+                    sort_keys=True, default=str)
+            fingerprints.append(self._rule_fingerprints[rule_name])
+        return "|".join(fingerprints)
+    
+    def _cached_findings(self, cache_key: Optional[str], context: ProjectContext) -> Optional[List[Finding]]:
+        """The cached findings of a unit, re-registering its skipped checks, or None on a miss."""
+        if cache_key is None:
+            return None
+        cached = self.findings_cache.get(cache_key)
+        if cached is None:
+            return None
+        findings, skipped_checks = cached
+        rules_by_name = {rule.__class__.__name__: rule for rule in self._run_rules}
+        if any(rule_name not in rules_by_name for rule_name, _, _, _ in findings):
+            return None
+        for rule_name, check_name, reason in skipped_checks:
+            context.register_skipped_check(rule_name, check_name, reason)
+        return [Finding(rule=rules_by_name[rule_name], message=message, line=line, file_path=file_path)
+                for rule_name, message, line, file_path in findings]
+    
+    def _run_and_cache(self, rule: Any, context: ProjectContext, cache_key: str) -> List[Finding]:
+        """
+        Run a unit and cache its findings and skipped checks if it ran to completion.
+        
+        A unit that failed or was cancelled by its time limit is not cached, so the next
+        run analyzes it again.
+        """
+        analysis_context = context.analysis_context
+        budget = self._budgets.get(rule.__class__.__name__)
+        completed_before = (budget.files_completed, budget.files_total) if budget else None
+        # Collect the unit's own skipped checks, including those an earlier unit registered
+        skipped_before = None
+        if analysis_context is not None:
+            skipped_before, analysis_context.skipped_checks = analysis_context.skipped_checks, []
+        try:
+            findings, completed = self._run_rule_checked(rule, context)
+        finally:
+            unit_skipped = []
+            if analysis_context is not None:
+                unit_skipped, analysis_context.skipped_checks = analysis_context.skipped_checks, skipped_before
+                for skipped in unit_skipped:
+                    analysis_context.register_skipped_check(skipped.rule_name, skipped.check_name, skipped.reason)
+        if budget is not None:
+            completed = completed and (budget.files_completed - completed_before[0]
+                                       == budget.files_total - completed_before[1])
+        if completed:
+            self.findings_cache.put(
+                cache_key,
+                [(finding.rule_id, finding.message, finding.line, finding.file_path) for finding in findings],
+                [(skipped.rule_name, skipped.check_name, skipped.reason) for skipped in unit_skipped])
+        return findings
+    
+    def _save_findings_cache(self) -> None:
+        """Write the findings cache after a run and report how much of the run it answered."""
+        if self.findings_cache is None:
+            return
+        log.info("[RulesEngine] Findings cache: %d unit(s) reused, %d analyzed",
+                 self.findings_cache.hits, self.findings_cache.misses,
+                 extra={"event": "findings_cache", "hits": self.findings_cache.hits,
+                        "misses": self.findings_cache.misses})
+        self.findings_cache.hits = self.findings_cache.misses = 0
+        self.findings_cache.save()
+    
+    def _run_unit(self, rule: Rule, file_path: str, context: ProjectContext,
+                  unit_files: Optional[List[str]] = None) -> List[Finding]:
+        """Run one rule against one file's context, profiling it when profiling is enabled."""
+        if self.profiler is None:
+            return self._run_rule_safe(rule, context)
+        return self.profiler.profile_unit(rule.__class__.__name__, file_path, context,
+                                          lambda: self._run_rule_safe(rule, context), unit_files)
+    
+    def _rules_to_run(self, file_type: Optional[str] = None) -> List[Any]:
+        """
+        The rules to execute, with the visitor-based script rules merged into one group.
+        
+        The group shares one parse and one AST traversal per script. Rules with a time
+        budget run on their own so their time can be measured, and so does every rule
+        when profiling.
+        
+        Args:
+            file_type: Only the rules that analyze this file type (None = every active rule)
+        """
+        rules = [rule for rule in self._run_rules
+                 if file_type is None or file_type in rule.FILE_TYPES]
+        if self.profiler is not None:
+            return rules
+        budgeted_rules = [rule for rule in rules if rule.__class__.__name__ in self._budgets]
+        return ScriptVisitorGroup.group_rules(
+            [rule for rule in rules if rule.__class__.__name__ not in self._budgets]) + budgeted_rules
+    
+    @property
+    def _run_rules(self) -> List[Rule]:
+        """The rules selected for the current run, or every enabled rule outside a run."""
+        return self._active_rules if self._active_rules is not None else self.rules
+    
+    def _select_rules(self, context: ProjectContext, present_types: Optional[Set[str]] = None) -> List[Rule]:
+        """
+        Select the rules with something to analyze for this run (see Rule.FILE_TYPES).
+        
+        Rules missing a file type in their REQUIRED_FILE_TYPES are registered as not
+        executed; rules with none of their FILE_TYPES present are left out silently, as
+        there is nothing for them to check. An empty project keeps every rule.
+        
+        Args:
+            context: The ProjectContext of the run (file types are read without parsing)
+            present_types: The file types present, when the context does not hold them yet
+        
+        Returns:
+            The selected rules, also used by the rest of the run
+        """
+        present = context.present_file_types() if present_types is None else present_types
+        selected, not_executed = [], {}
+        for rule in self.rules:
+            missing = rule.REQUIRED_FILE_TYPES - present
+            if missing:
+                missing_types = " and ".join(sorted(file_type.lstrip('.').upper() for file_type in missing))
+                not_executed[rule.__class__.__name__] = f"Requires {missing_types} file"
+            elif not present or rule.FILE_TYPES & present:
+                selected.append(rule)
+        
+        skipped = len(self.rules) - len(selected)
+        if skipped:
+            log.info("[RulesEngine] Skipping %d rule(s) with no applicable files "
+                     "(%d missing a required file type)", skipped, len(not_executed))
+        context.register_rules_not_executed(not_executed)
+        self._active_rules = selected
+        return selected
+    
+    def _needed_file_types(self) -> Set[str]:
+        """The file types at least one rule of the current run analyzes."""
+        return {file_type for rule in self._run_rules for file_type in rule.FILE_TYPES}
+    
+    def _needs_script_asts(self) -> bool:
+        """Whether any rule of the current run reads scripts (so pre-parsing ASTs pays off)."""
+        return any(FIELD_SCRIPTS in rule.FIELD_CATEGORIES for rule in self._run_rules)
+    
+    def run_work_units(self, context: ProjectContext, max_workers: int = -1) -> List[Finding]:
+        """
+        Executes the rules as (rule, file) work units on a process pool.
+        
+        Rule-level threading leaves one heavy rule setting the makespan while the other
+        cores idle, and its file loop runs under the GIL. Here every per-file rule is
+        split into one work unit per file and the units are spread over worker processes.
+        Workers are forked after parsing, so they share the parsed models instead of
+        receiving them; each unit runs against a context holding just its file and the
+        SMD (see ProjectContext.split_by_file). Rules flagged CROSS_FILE run afterwards,
+        in this process, against the whole project.
+        
+        Platforms without fork, and processes running other threads (forking those can
+        hang the children), fall back to the thread-pool execution.
+        
+        Args:
+            context: The ProjectContext containing the entire application model.
+            max_workers: Number of worker processes (-1 = one per CPU).
+        
+        Returns:
+            A list of all findings, per-file rules first.
+        """
+        return list(self._iter_work_units(context, max_workers))
+    
+    def _iter_work_units(self, context: ProjectContext, max_workers: int = -1) -> Iterator[Finding]:
+        """
+        Run the (rule, file) work units on a process pool (see run_work_units), yielding
+        each unit's findings as its result arrives.
+        
+        If the pool breaks, the units it did not finish run in this process, so no
+        findings are lost or repeated.
+        """
+        if max_workers < 0:
+            max_workers = os.cpu_count() or 1
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            log.warning("[RulesEngine] Process pool needs the fork start method; using thread-pool rule execution")
+            yield from self._iter_rules(context)
+            return
+        if threading.active_count() > 1:
+            # A child forked while another thread holds a lock (logging, I/O) can hang on it
+            log.warning("[RulesEngine] Process pool cannot fork a multi-threaded process (e.g. the web server); "
+                        "using thread-pool rule execution")
+            yield from self._iter_rules(context)
+            return
+        
+        if self._budgets:
+            log.warning("[RulesEngine] Rule time limits are not enforced for work units run on the process pool")
+        rules = self._active_rules if self._active_rules is not None else self._select_rules(context)
+        per_file_rules = [i for i, rule in enumerate(rules) if not rule.CROSS_FILE]
+        cross_file_rules = [rule for rule in rules if rule.CROSS_FILE]
+        
+        file_contexts = context.split_by_file(self._needed_file_types())
+        file_sizes = context.file_sizes()
+        rates = {rule_index: self.costs.rate(rules[rule_index]) for rule_index in per_file_rules}
+        file_rules = {file_path: sorted((rule_index for rule_index in per_file_rules
+                                         if file_type_of(file_path) in rules[rule_index].FILE_TYPES),
+                                        key=lambda rule_index: -rates[rule_index])
+                      for file_path in file_contexts}
+        # File-major order keeps a file's units together, so workers reuse its cached ASTs.
+        # Files are scheduled longest-first (estimated cost), so the chunks handed out last
+        # are the cheap ones and no worker is left finishing a heavy file alone.
+        scheduled_files = sorted(file_contexts, key=lambda file_path: (
+            -sum(rates[rule_index] for rule_index in file_rules[file_path]) * file_sizes.get(file_path, 0), file_path))
+        units = [(rule_index, file_path) for file_path in scheduled_files for rule_index in file_rules[file_path]]
+        log.info("Running %d (rule, file) work unit(s) on %d process(es)", len(units), max_workers)
+        
+        completed = 0
+        try:
+            # The workers get the rules and contexts by forking, through the initializer,
+            # so nothing here is shared with other runs while findings are yielded
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('fork'),
+                                     initializer=_init_work_unit_worker,
+                                     initargs=(rules, file_contexts)) as executor:
+                chunksize = max(1, len(units) // (max_workers * 4))
+                for result in executor.map(_run_work_unit, units, chunksize=chunksize):
+                    yield from self._work_unit_findings(rules, units[completed], result, context, file_sizes)
+                    completed += 1
+        except (BrokenProcessPool, OSError) as e:
+            log.warning("[RulesEngine] Process pool failed (%s); running the remaining %d work unit(s) "
+                        "in this process", e, len(units) - completed)
+            for rule_index, file_path in units[completed:]:
+                result = _analyze_work_unit(rule_index, rules[rule_index], file_contexts[file_path], file_path)
+                yield from self._work_unit_findings(rules, (rule_index, file_path), result, context, file_sizes)
+        
+        # Cross-file rules need the whole project, so they run last in this process
+        for rule in cross_file_rules:
+            yield from self._run_rule_timed(rule, context, None, file_sizes)
+    
+    def _work_unit_findings(self, rules: List[Rule], unit: Tuple[int, str], result: Tuple,
+                            context: ProjectContext, file_sizes: Dict[str, int]) -> List[Finding]:
+        """Rebuild a work unit's findings, register its skipped checks and record its cost."""
+        _, unit_file = unit
+        rule_index, findings, skipped, cpu_time = result
+        rule = rules[rule_index]
+        for rule_name, check_name, reason in skipped:
+            context.register_skipped_check(rule_name, check_name, reason)
+        if cpu_time >= 0:
+            self._record_cost(rule, cpu_time, file_sizes.get(unit_file, 0))
+        return [Finding(rule=rule, message=message, line=line, file_path=file_path)
+                for message, line, file_path in findings]
+    
+    def run_file_major(self, source_files_map: Dict[str, Any], model_parser=None,
+                       on_file_complete: Optional[Callable[[str, List[Finding], ProjectContext], None]] = None
+                       ) -> Tuple[List[Finding], ProjectContext]:
+        """
+        Parses and analyzes the application one file at a time (low-memory mode).
+        
+        Each file is parsed into its own ProjectContext and every rule runs against it.
+        Once the file's findings are handed to on_file_complete, the context is dropped
+        together with the model, source text, script fields and ASTs, so peak memory is
+        bounded by the largest file rather than the whole application.
+        
+        The SMD is the only cross-file input rules read (applicationId, error pages), so
+        it is analyzed first and then kept, with its source released, as the summary
+        every later file sees. Entries are removed from source_files_map as they are
+        processed so the caller does not keep the source text alive either.
+        
+        Args:
+            source_files_map: Dictionary mapping file paths to SourceFile objects (consumed)
+            model_parser: ModelParser to use (a new one is created if not given)
+            on_file_complete: Optional callback(file_path, findings, file_context) invoked
+                              while the file's models and source are still available
+        
+        Returns:
+            Tuple of (all findings in (file, line, rule) order, summary ProjectContext with the SMD, analysis context
+            and parsing errors)
+        """
+        from .app_parser import ModelParser
+        model_parser = model_parser or ModelParser(self.config.execution.parsing)
+        
+        summary_context = ProjectContext()
+        model_parser._initialize_analysis_context(summary_context, source_files_map)
+        
+        if not self.rules:
+            log.warning("No rules were found to run.")
+            return [], summary_context
+        
+        log.info("Running %d rule(s) file by file (low-memory mode)...", len(self.rules))
+        if self.findings_cache is not None:
+            log.info("[RulesEngine] The findings cache is not used in low-memory mode")
+        self._start_budgets()
+        self._select_rules(summary_context, {file_type_of(file_path) for file_path in source_files_map})
+        needed_file_types = self._needed_file_types()
+        precompute = self._needs_script_asts()
+        
+        all_findings = []
+        file_paths = sorted(source_files_map, key=lambda path: not path.lower().endswith('.smd'))
+        for file_path in file_paths:
+            source_file = source_files_map.pop(file_path)
+            file_type = file_type_of(file_path)
+            # Files no rule analyzes are not parsed (the SMD is still needed as the summary)
+            if file_type not in needed_file_types and file_type != '.smd':
+                del source_file
+                continue
+            file_context = ProjectContext()
+            file_context.analysis_context = summary_context.analysis_context
+            file_context.smd = summary_context.smd
+            
+            parsed = True
+            parse_start = time.perf_counter()
+            try:
+                model_parser._parse_single_file(file_path, source_file, file_context)
+                if precompute:
+                    model_parser._precompute_file_analysis(file_context)
+            except Exception as e:
+                log.warning("Failed to parse %s: %s", file_path, e)
+                file_context.add_parsing_error(f"{file_path}: {e}")
+                parsed = False
+            summary_context.parse_time += time.perf_counter() - parse_start
+            del source_file
+            
+            is_summary_file = file_context.smd is not None and file_context.smd is not summary_context.smd
+            
+            # Findings reported against other files (e.g. the summary SMD) belong to that file's own pass
+            if self.profiler is not None:
+                file_findings = [finding for rule in self._rules_to_run(file_type)
+                                 for finding in self._run_unit(rule, file_path, file_context)]
+            else:
+                file_findings = self._execute_rules(file_context, split_files=False, file_type=file_type)
+            file_findings = [finding for finding in file_findings if finding.file_path == file_path]
+            
+            if on_file_complete:
+                on_file_complete(file_path, file_findings, file_context)
+            
+            all_findings.extend(file_findings)
+            summary_context.parsing_errors.extend(file_context.parsing_errors)
+            if is_summary_file:
+                file_context.smd.release_source()
+                summary_context.smd = file_context.smd
+            elif parsed:
+                summary_context.released_files.append(file_path)
             
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all rule execution tasks
-                future_to_rule = {
-                    executor.submit(self._run_rule_safe, rule, context): rule
-                    for rule in self.rules
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_rule):
-                    rule = future_to_rule[future]
-                    try:
-                        findings_from_rule = future.result()
-                        if findings_from_rule:
-                            all_findings.extend(findings_from_rule)
-                    except Exception as e:
-                        print(f"Error running rule {rule.__class__.__name__}: {e}")
-        
-        return all_findings
-    
-    def _run_rule_safe(self, rule: Rule, context: ProjectContext) -> List[Finding]:
+            del file_context
+            self._release_rule_caches()
+        
+        self._active_rules = None
+        self._report_timeouts(summary_context)
+        self.costs.save()
+        return sort_findings(all_findings), summary_context
+    
+    def _execute_rules(self, context: ProjectContext, split_files: bool = True,
+                       file_type: Optional[str] = None) -> List[Finding]:
+        """Run every rule against the context, serially or in a thread pool (see _iter_rules)."""
+        return list(self._iter_rules(context, split_files, file_type))
+    
+    def _iter_rules(self, context: ProjectContext, split_files: bool = True,
+                    file_type: Optional[str] = None) -> Iterator[Finding]:
+        """
+        Run every rule against the context, serially or in a thread pool, yielding each
+        rule's findings as it completes.
+        
+        Rules with a time budget run file by file (split_files) so the budget can be
+        checked between files; the context is split once and shared by those rules.
+        A single-file context gives its file_type so only the rules for it run.
+        """
+        file_contexts = context.split_by_file(self._needed_file_types()) if self._budgets and split_files else None
+        # Parse the pending file types up front, so the first rule to read one is not
+        # charged for parsing it
+        context.materialize(self._needed_file_types())
+        file_sizes = context.file_sizes()
+        rules_to_run = self.costs.order(self._rules_to_run(file_type), file_sizes)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[RulesEngine] Rule schedule (longest first): %s", ", ".join(
+                f"{rule.__class__.__name__} ~{self.costs.estimate(rule, input_bytes(rule, file_sizes)):.3f}s"
+                for rule in rules_to_run))
+        
+        execution = self.config.execution.rules
+        if execution.executor == PROCESS:
+            # Reached without the process pool (no fork, low-memory mode): size a thread pool instead
+            execution = execution.model_copy(update={"executor": AUTO})
+        plan = execution.plan(len(rules_to_run), sum(file_sizes.values()), 8)
+        
+        # For small inputs, use serial processing to avoid overhead
+        if plan.executor != THREAD:
+            log.debug("Using serial rule execution (%d rules)", len(rules_to_run))
+            for rule in rules_to_run:
+                yield from self._run_rule_timed(rule, context, file_contexts, file_sizes)
+            return
+        
+        # Use parallel processing for larger inputs
+        log.debug("Using parallel rule execution (%d workers for %d rules)", plan.workers, len(rules_to_run))
+        executor = ThreadPoolExecutor(max_workers=plan.workers)
+        try:
+            # Submitted longest-first, so the most expensive rules start first and the
+            # cheap ones fill in the workers that free up
+            future_to_rule = {
+                executor.submit(self._run_rule_timed, rule, context, file_contexts, file_sizes): rule
+                for rule in rules_to_run
+            }
+            
+            # Yield results as they complete
+            for future in as_completed(future_to_rule):
+                rule = future_to_rule[future]
+                try:
+                    findings_from_rule = future.result()
+                except Exception as e:
+                    log.error("Error running rule %s: %s", rule.__class__.__name__, e)
+                    continue
+                yield from findings_from_rule
+        finally:
+            # A consumer that stops early does not wait for the rules not yet started
+            executor.shutdown(cancel_futures=True)
+    
+    def _release_rule_caches(self) -> None:
+        """Drop per-rule AST caches (used when a rule parses without a context)."""
+        for rule in self.rules:
+            rule.__dict__.pop('_script_ast_cache', None)
+    
+    def _run_rule_timed(self, rule: Any, context: ProjectContext,
+                        file_contexts: Optional[Dict[str, ProjectContext]],
+                        file_sizes: Dict[str, int]) -> List[Finding]:
+        """Run a single rule, recording its CPU time against the size of its input."""
+        cpu_start = time.thread_time()
+        findings, completed = self._run_rule_checked(rule, context, file_contexts)
+        if completed:
+            self._record_cost(rule, time.thread_time() - cpu_start, input_bytes(rule, file_sizes))
+        return findings
+    
+    def _record_cost(self, rule: Any, seconds: float, size: int) -> None:
+        """Record a rule's measured cost, unless its time limit cut the run short."""
+        budget = self._budgets.get(rule.__class__.__name__)
+        if budget is None or not budget.timed_out:
+            self.costs.record(rule, seconds, size)
+    
+    def _profile_rules(self, context: ProjectContext, rules: List[Rule]) -> List[Finding]:
+        """
+        Run every unit under the profiler, which reports each rule's estimated time next
+        to the measured one, and record the measured costs.
+        """
+        file_sizes = context.file_sizes()
+        self.profiler.estimates = {rule.__class__.__name__: self.costs.estimate(rule, input_bytes(rule, file_sizes))
+                                   for rule in rules}
+        findings = list(self._iter_units(context))
+        cpu_times = {rule_total["rule"]: rule_total["cpu_time"] for rule_total in self.profiler.rule_totals()}
+        for rule in rules:
+            if rule.__class__.__name__ in cpu_times:
+                self._record_cost(rule, cpu_times[rule.__class__.__name__], input_bytes(rule, file_sizes))
+        return findings
+    
+    def _run_rule_safe(self, rule: Rule, context: ProjectContext,
+                       file_contexts: Optional[Dict[str, ProjectContext]] = None) -> List[Finding]:
         """Thread-safe wrapper for running a single rule."""
+        return self._run_rule_checked(rule, context, file_contexts)[0]
+    
+    def _run_rule_checked(self, rule: Rule, context: ProjectContext,
+                          file_contexts: Optional[Dict[str, ProjectContext]] = None) -> Tuple[List[Finding], bool]:
+        """Run a single rule, returning its findings and False if it failed."""
         try:
-            return list(rule.analyze(context))
+            budget = self._budgets.get(rule.__class__.__name__)
+            if budget is not None:
+                return self._run_rule_within_budget(rule, context, file_contexts, budget), True
+            # The 'analyze' method is a generator, so we consume it into a list.
+            return list(rule.analyze(context)), True
         except Exception as e:
-            print(f"Rule {rule.__class__.__name__} failed: {e}")
-            return []
\ No newline at end of file
+            log.error("Rule %s failed: %s", rule.__class__.__name__, e)
+            return [], False
+    
+    def _run_rule_within_budget(self, rule: Rule, context: ProjectContext,
+                                file_contexts: Optional[Dict[str, ProjectContext]],
+                                budget: RuleBudget) -> List[Finding]:
+        """
+        Run a rule until its time budget is spent, checking it between files and findings.
+        
+        Findings already yielded are kept when the rule is cancelled; files it did not
+        finish are counted against it when the timeouts are reported.
+        """
+        if file_contexts and not rule.CROSS_FILE:
+            units = [(file_contexts[file_path], 1) for file_path in sorted(file_contexts)
+                     if file_type_of(file_path) in rule.FILE_TYPES]
+        else:
+            # Cross-file rules (or an already single-file context) run as one unit
+            units = [(context, len(file_contexts) if file_contexts else 1)]
+        
+        findings = []
+        for unit_context, file_count in units:
+            budget.files_total += file_count
+            if budget.exhausted:
+                continue
+            started = time.monotonic()
+            completed = True
+            for finding in rule.analyze(unit_context):
+                findings.append(finding)
+                if budget.spent + (time.monotonic() - started) >= budget.time_limit:
+                    completed = False
+                    break
+            budget.spent += time.monotonic() - started
+            if completed:
+                budget.files_completed += file_count
+        return findings
+    
+    def _start_budgets(self) -> None:
+        """Create fresh time budgets for the rules with a configured time limit."""
+        self._budgets = {}
+        for rule in self.rules:
+            rule_name = rule.__class__.__name__
+            time_limit = self.config.get_rule_time_limit(rule_name)
+            if time_limit and time_limit > 0:
+                self._budgets[rule_name] = RuleBudget(time_limit)
+    
+    def _report_timeouts(self, context: ProjectContext) -> None:
+        """Report the rules whose budget ran out before they finished every file."""
+        for rule_name, budget in self._budgets.items():
+            if budget.timed_out:
+                log.warning("[RulesEngine] Rule %s exceeded its %gs time limit; cancelled after %d of %d file(s)",
+                            rule_name, budget.time_limit, budget.files_completed, budget.files_total)
+                context.register_rule_timeout(rule_name, budget.time_limit,
+                                              budget.files_completed, budget.files_total)
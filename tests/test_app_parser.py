@@ -332,6 +332,47 @@ class TestModelParser:
         # Check no parsing errors
         assert len(result.parsing_errors) == 0
 
+    
+    def test_parse_files_lazy_parses_file_types_on_first_access(self):
+        """Test that lazy parsing only parses a file type when its models are read."""
+        source_files_map = {
+            "main.pmd": Mock(content='{"id": "mainPage", "presentation": {"body": {"type": "section"}}}'),
+            "utils.script": Mock(content="var y = 2;"),
+            "app.amd": Mock(content='{"routes": {"main": {"pageId": "mainPage"}}}')
+        }
+        
+        result = self.parser.parse_files(source_files_map, lazy=True)
+        
+        assert not result.is_file_type_loaded('.pmd')
+        assert not result.is_file_type_loaded('.script')
+        assert result.analysis_context.files_present == {"PMD", "SCRIPT", "AMD"}
+        
+        assert "mainPage" in result.pmds
+        assert result.is_file_type_loaded('.pmd')
+        assert not result.is_file_type_loaded('.script')
+        assert list(result.loaded_models()) == [result.pmds["mainPage"]]
+        
+        result.materialize_all()
+        assert "utils.script" in result.scripts
+        assert result.amd.routes["main"].pageId == "mainPage"
+        assert len(result.parsing_errors) == 0
+    
+    def test_deferred_files_precompute_asts_when_requested(self):
+        """Test that deferred files pre-compute their ASTs without loading other pending file types."""
+        source_files_map = {
+            "main.pmd": Mock(content='{"id": "mainPage", "script": "<% var x = 1; %>", '
+                                     '"presentation": {"body": {"type": "section"}}}'),
+            "utils.script": Mock(content="var y = 2;")
+        }
+        
+        result = self.parser.parse_files(source_files_map, lazy=True)
+        result.precompute_deferred = True
+        
+        assert "mainPage" in result.pmds
+        assert result.get_cached_pmd_script_fields("mainPage")
+        assert len(result._cached_asts) == 1
+        assert not result.is_file_type_loaded('.script')
+        assert len(result.parsing_errors) == 0
 
 if __name__ == "__main__":
     pytest.main([__file__])
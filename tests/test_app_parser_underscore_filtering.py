@@ -134,6 +134,36 @@ class TestUnderscoreKeyFiltering:
         }
         assert filtered == expected
 
+    def test_load_json_drops_underscore_keys_while_decoding(self):
+        """Test that _load_json filters commented keys at every nesting level."""
+        content = '''
+        {
+            "_root": {"anything": 1},
+            "items": [
+                {"_temp": 1, "real": 2},
+                [{"_deep": true, "kept": "yes"}]
+            ],
+            "nested": {"_ignored": "x", "valid": {"_also": 1}}
+        }
+        '''
+
+        loaded = self.parser._load_json(content)
+
+        assert loaded == {
+            "items": [
+                {"real": 2},
+                [{"kept": "yes"}]
+            ],
+            "nested": {"valid": {}}
+        }
+
+    def test_load_json_matches_filter_commented_keys(self):
+        """Test that decode-time filtering matches the post-decode filter."""
+        import json
+        content = '{"a": [{"_b": 1, "c": {"_d": 2, "e": [1, {"_f": 3}]}}], "_g": null}'
+
+        assert self.parser._load_json(content) == self.parser._filter_commented_keys(json.loads(content))
+
 
 class TestPMDFileFiltering:
     """Test PMD file parsing with underscore keys."""
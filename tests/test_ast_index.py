@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared script AST index (parent links and node types)."""
+
+import copy
+
+from lark import Token, Tree
+
+from parser.pmd_script_parser import parse_with_preprocessor
+from parser.rules.script.shared.ast_index import ast_index
+from parser.rules.script.shared.ast_utils import find_data_nodes
+from parser.rules.script.shared.detector import ScriptDetector
+
+
+SCRIPT = """
+var top = 1;
+var outer = function(a) {
+  var inner = function(b) {
+    return b + 7;
+  };
+  return inner(a);
+};
+var other = function(b) {
+  return b + 7;
+};
+"""
+
+
+def nodes_of(ast, node_type, predicate=lambda node: True):
+    """Nodes of a type, in document order, matching a predicate."""
+    return [node for node in ast.iter_subtrees_topdown() if node.data == node_type and predicate(node)]
+
+
+class TestAstIndex:
+    """Test cases for ast_index and AstIndex."""
+
+    def setup_method(self):
+        self.ast = parse_with_preprocessor(SCRIPT)
+        self.index = ast_index(self.ast)
+
+    def test_index_is_built_once_per_tree(self):
+        """Later requests for the same tree share the first index."""
+        assert ast_index(self.ast) is self.index
+
+    def test_copied_tree_gets_its_own_index(self):
+        """A copy carries its original's index but is re-indexed on request."""
+        copied = copy.deepcopy(self.ast)
+        assert ast_index(copied) is not self.index
+        assert ast_index(copied).contains(copied)
+
+    def test_nodes_resolve_to_innermost_named_function(self):
+        """Nested functions win over their enclosing function; top-level nodes have none."""
+        functions = nodes_of(self.ast, 'function_expression')
+        names = [self.index.function_name(function) for function in functions]
+        assert names == ['outer', 'inner', 'other']
+        top_statement = nodes_of(self.ast, 'variable_statement')[0]
+        assert self.index.function_name(top_statement) is None
+
+    def test_structurally_equal_bodies_resolve_by_identity(self):
+        """Equal subtrees in different functions each resolve to their own function."""
+        returns = nodes_of(self.ast, 'return_statement')
+        assert returns[0] == returns[2]
+        assert self.index.function_name(returns[0]) == 'inner'
+        assert self.index.function_name(returns[2]) == 'other'
+
+    def test_tokens_are_indexed(self):
+        """Tokens have parents and depths, so they resolve like trees."""
+        token = next(token for token in self.ast.scan_values(lambda value: isinstance(value, Token))
+                     if token == '7')
+        assert self.index.function_name(token) == 'inner'
+        assert self.index.depth(token) == self.index.depth(self.index.parent(token)) + 1
+
+    def test_ancestors_and_is_within(self):
+        """Ancestors run up to the root; is_within follows them."""
+        inner_function = nodes_of(self.ast, 'function_expression')[1]
+        body = inner_function.children[-1]
+        assert list(self.index.ancestors(body))[-1] is self.ast
+        assert self.index.is_within(body, inner_function)
+        assert not self.index.is_within(inner_function, body)
+        assert self.index.parent(self.ast) is None
+
+    def test_foreign_nodes_are_not_resolved(self):
+        """Nodes of another tree, even equal ones, are not part of the index."""
+        foreign = parse_with_preprocessor(SCRIPT)
+        foreign_function = nodes_of(foreign, 'function_expression')[0]
+        assert not self.index.contains(foreign_function)
+        assert self.index.function_name(foreign_function) is None
+        assert self.index.depth(Tree('literal_expression', [])) is None
+
+    def test_find_data_lists_nodes_in_document_order(self):
+        """Type lookups return the same trees as Tree.find_data, in document order."""
+        for node_type in ('variable_statement', 'function_expression', 'return_statement', 'identifier_expression'):
+            found = self.index.find_data(node_type)
+            assert found == nodes_of(self.ast, node_type)
+            assert {id(node) for node in found} == {id(node) for node in self.ast.find_data(node_type)}
+
+    def test_find_data_within_a_subtree(self):
+        """A subtree lookup returns only that subtree's trees, the subtree root included."""
+        functions = nodes_of(self.ast, 'function_expression')
+        outer, inner, other = functions
+        assert self.index.find_data('function_expression', outer) == [outer, inner]
+        assert self.index.find_data('function_expression', other) == [other]
+        returns = self.index.find_data('return_statement', outer)
+        assert [self.index.function_name(node) for node in returns] == ['inner', 'outer']
+        assert self.index.find_data('no_such_type', outer) == []
+
+    def test_find_data_within_a_foreign_tree_walks_it(self):
+        """Trees outside the index are searched directly rather than through the index."""
+        foreign = parse_with_preprocessor(SCRIPT)
+        assert len(self.index.find_data('function_expression', foreign)) == 3
+
+    def test_find_data_nodes_reads_from_the_shared_index(self):
+        """The ast_utils helper answers from the index cached on the tree."""
+        assert find_data_nodes(self.ast, 'return_statement') == self.index.find_data('return_statement')
+        assert ast_index(self.ast) is self.index
+
+    def test_detector_context_uses_the_index(self):
+        """ScriptDetector.get_function_context_for_node resolves through the index."""
+        returns = nodes_of(self.ast, 'return_statement')
+        detector = ScriptDetector.__new__(ScriptDetector)
+        assert detector.get_function_context_for_node(returns[1], self.ast) == 'outer'
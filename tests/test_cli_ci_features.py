@@ -11,10 +11,12 @@ from pathlib import Path
 import tempfile
 import json
 import os
+import re
+import time
 from unittest.mock import patch, MagicMock
 
 # Import the main CLI app
-from main import app
+from main import app, _execution_overrides
 
 runner = CliRunner()
 
@@ -117,6 +119,145 @@ class TestCLICIFeatures:
         assert "CI mode" in help_text or "fail-on-advice" in help_text
 
 
+    def test_fail_fast_stops_at_first_action_issue(self, tmp_path):
+        """--fail-fast exits 1 with a report holding only the first ACTION issue."""
+        (tmp_path / "first.pod").write_text(
+            '{"podId": "first", "seed": {"endPoints": [{"name": "a", "url": "https://foo.workday.com/a"}]}}')
+        (tmp_path / "second.pod").write_text(
+            '{"podId": "second", "seed": {"endPoints": [{"name": "b", "url": "https://foo.workday.com/b"}]}}')
+        output_file = tmp_path / "report.json"
+
+        result = runner.invoke(app, ["review-app", str(tmp_path), "--fail-fast", "--quiet",
+                                     "--format", "json", "--output", str(output_file)])
+
+        assert result.exit_code == 1
+        assert "Fail-fast: analysis stopped at the first failing issue" in result.output
+        findings = json.loads(output_file.read_text())["findings"]
+        assert len(findings) == 1
+        assert findings[0]["severity"] == "ACTION"
+        assert findings[0]["file_path"].endswith("first.pod")
+
+    def test_fail_fast_report_counts_only_the_rules_that_ran(self, tmp_path):
+        """A clean --fail-fast report counts the ACTION rules it ran and says the ADVICE rules were skipped."""
+        (tmp_path / "first.pod").write_text('{"podId": "first"}')
+
+        result = runner.invoke(app, ["review-app", str(tmp_path), "--fail-fast", "--quiet", "--format", "json"])
+
+        assert result.exit_code == 0
+        summary = json.loads(result.stdout)["summary"]
+        assert summary["skipped_severities"] == ["ADVICE"]
+        full = runner.invoke(app, ["review-app", str(tmp_path), "--quiet", "--format", "json"])
+        assert 0 < summary["total_rules"] < json.loads(full.stdout)["summary"]["total_rules"]
+
+        result = runner.invoke(app, ["review-app", str(tmp_path), "--fail-fast", "--quiet"])
+
+        assert result.exit_code == 0
+        assert f"Rules executed: {summary['total_rules']}" in result.stdout
+        assert "ADVICE rules were skipped (--fail-fast)" in result.stdout
+        assert "Your code looks great" not in result.stdout
+
+    def test_files_that_fail_to_parse_are_not_counted(self, tmp_path):
+        """The report counts the parsed PMD/script/AMD files, in the default and low-memory modes."""
+        (tmp_path / "good.pmd").write_text('{"id": "good", "presentation": {"body": {"type": "section"}}}')
+        (tmp_path / "broken.pmd").write_text('{"id": ')
+
+        for flags in ([], ["--low-memory"]):
+            result = runner.invoke(app, ["review-app", str(tmp_path), "--quiet", "--format", "json"] + flags)
+
+            assert json.loads(result.stdout)["summary"]["total_files"] == 1
+
+    def test_deferred_parsing_failures_are_reported_as_parsing_errors(self, tmp_path):
+        """A file type that cannot be parsed on first use exits 3 with a parsing error, as eager parsing did."""
+        (tmp_path / "good.pmd").write_text('{"id": "good", "presentation": {"body": {"type": "section"}}}')
+
+        with patch("parser.app_parser.ModelParser._parse_into_context", side_effect=MemoryError("out of memory")):
+            result = runner.invoke(app, ["review-app", str(tmp_path), "--quiet"])
+
+        assert result.exit_code == 3
+        assert "Parsing Error: Could not parse the .pmd files: out of memory" in result.output
+
+    def test_timing_reports_parsing_done_during_the_analysis(self, tmp_path):
+        """--timing counts the files parsed on first use as parsing, not as analysis."""
+        (tmp_path / "good.pmd").write_text('{"id": "good", "presentation": {"body": {"type": "section"}}}')
+
+        from parser.app_parser import ModelParser
+        load = ModelParser._load_deferred_files
+
+        def slow_load(self, source_files_map, context):
+            time.sleep(0.3)
+            load(self, source_files_map, context)
+
+        with patch("parser.app_parser.ModelParser._load_deferred_files", slow_load):
+            result = runner.invoke(app, ["review-app", str(tmp_path), "--quiet", "--timing"])
+
+        on_first_use = float(re.search(r"File parsing \(on first use\): ([\d.]+)s", result.output).group(1))
+        analysis = float(re.search(r"Analysis execution: ([\d.]+)s", result.output).group(1))
+        assert on_first_use >= 0.3 > analysis
+
+    def test_quiet_json_stdout_is_only_the_report(self, tmp_path):
+        """With --quiet, progress events stay off stdout so the JSON report parses as is."""
+        (tmp_path / "first.pod").write_text(
+            '{"podId": "first", "seed": {"endPoints": [{"name": "a", "url": "https://foo.workday.com/a"}]}}')
+
+        result = runner.invoke(app, ["review-app", str(tmp_path), "--quiet", "--format", "json"])
+
+        assert result.exit_code == 1
+        report = json.loads(result.stdout)
+        assert report["summary"]["total_findings"] == len(report["findings"]) > 0
+
+    def test_profile_table_keeps_json_stdout_parseable(self, tmp_path):
+        """--profile-rules prints its table to stderr, not into a JSON report on stdout."""
+        (tmp_path / "first.pod").write_text(
+            '{"podId": "first", "seed": {"endPoints": [{"name": "a", "url": "https://foo.workday.com/a"}]}}')
+
+        result = runner.invoke(app, ["review-app", str(tmp_path), "--quiet", "--format", "json", "--profile-rules",
+                                     "--profile-output", str(tmp_path / "profile.json")])
+
+        assert result.exit_code == 1
+        assert json.loads(result.stdout)["findings"]
+        assert "Rule" in result.stderr
+        assert (tmp_path / "profile.json").exists()
+
+    def test_cost_profile_follows_the_config_unless_a_flag_is_given(self, tmp_path):
+        """The config's cost_profile applies by default; --cost-profile/--no-cost-profile override it."""
+        (tmp_path / "first.pod").write_text('{"podId": "first"}')
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"cost_profile": True, "cost_profile_path": str(tmp_path / "costs.json")}))
+        seen = []
+
+        class RecordingEngine:
+            def __init__(self, config):
+                seen.append(config.cost_profile)
+                raise RuntimeError("stop after configuration")
+
+        with patch("main.RulesEngine", RecordingEngine):
+            for flags in ([], ["--no-cost-profile"]):
+                runner.invoke(app, ["review-app", str(tmp_path), "--quiet", "--config", str(config_file), *flags])
+            runner.invoke(app, ["review-app", str(tmp_path), "--quiet", "--cost-profile"])
+
+        assert seen == [True, False, True]
+
+    def test_execution_options_set_each_stage(self):
+        """--executor/--jobs apply to every stage, or to one with a stage= prefix."""
+        overrides = _execution_overrides(["thread", "rules=process"], ["2", "rules=-1"])
+        
+        assert overrides == {
+            "ingestion": {"executor": "thread", "workers": 2},
+            "parsing": {"executor": "thread", "workers": 2},
+            "rules": {"executor": "process", "workers": -1},
+        }
+        assert _execution_overrides(["process"], None) == {"rules": {"executor": "process"}}
+
+    def test_invalid_execution_options_are_usage_errors(self, tmp_path):
+        """A bad executor or worker count exits with code 2 before any analysis."""
+        (tmp_path / "first.pod").write_text('{"podId": "first"}')
+        
+        for options in (["--jobs", "many"], ["--executor", "parsing=process"], ["--executor", "fibers"]):
+            result = runner.invoke(app, ["review-app", str(tmp_path), "--quiet", *options])
+            assert result.exit_code == 2, options
+            assert "Usage Error" in result.output
+
+
 class TestCLIExitCodes:
     """Test CLI exit code behavior."""
 
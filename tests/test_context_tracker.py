@@ -108,7 +108,30 @@ class TestAnalysisContext:
         context.register_skipped_check("Rule2", "check1", "reason2")
         
         assert len(context.skipped_checks) == 3
-    
+
+    def test_register_duplicate_skipped_check_once(self):
+        """Test that the same skipped check reported repeatedly is recorded once."""
+        context = AnalysisContext(analysis_type="individual_files")
+
+        context.register_skipped_check("Rule1", "check1", "reason1")
+        context.register_skipped_check("Rule1", "check1", "reason1")
+
+        assert len(context.skipped_checks) == 1
+
+    def test_register_rule_timeout_merges_per_rule(self):
+        """Test that repeated timeouts of a rule (low-memory mode) are merged into one entry."""
+        context = AnalysisContext(analysis_type="full_app")
+
+        context.register_rule_timeout("SlowRule", 5.0, 2, 4)
+        context.register_rule_timeout("SlowRule", 5.0, 0, 1)
+
+        assert len(context.timed_out_rules) == 1
+        assert context.timed_out_rules[0].files_completed == 2
+        assert context.timed_out_rules[0].files_total == 5
+        assert context.to_dict()["impact"]["rules_timed_out"] == [
+            {"rule": "SlowRule", "time_limit": 5.0, "files_completed": 2, "files_total": 5}
+        ]
+
     def test_rules_not_executed_with_amd(self):
         """Test rules_not_executed when AMD present."""
         context = AnalysisContext(
@@ -182,6 +205,7 @@ class TestAnalysisContext:
         assert "POD" in result["files_missing"]
         assert len(result["impact"]["rules_not_executed"]) == 0
         assert len(result["impact"]["rules_partially_executed"]) == 0
+        assert result["impact"]["rules_timed_out"] == []
     
     def test_to_dict_partial_analysis(self):
         """Test to_dict() for partial analysis with skipped checks."""
@@ -0,0 +1,82 @@
+"""
+Unit tests for the leveled event channel (utils/events.py).
+"""
+
+import io
+import json
+import logging
+
+import pytest
+
+from utils.events import configure_events, get_logger, SINK_CONSOLE, SINK_JSONL, SINK_QUIET
+
+
+class _CountingArg:
+    """Argument that records whether the message was ever formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+
+class TestEvents:
+    """Test sink selection, levels and formatting of events."""
+
+    def setup_method(self):
+        self.stream = io.StringIO()
+        self.log = get_logger("tests.events")
+
+    def teardown_method(self):
+        configure_events(SINK_CONSOLE, "info")
+
+    def test_console_sink_writes_plain_messages(self):
+        configure_events(SINK_CONSOLE, "info", stream=self.stream)
+        self.log.info("Parsed %s", "page.pmd")
+        self.log.debug("Hidden %s", "detail")
+        assert self.stream.getvalue() == "Parsed page.pmd\n"
+
+    def test_jsonl_sink_emits_one_object_per_event(self):
+        configure_events(SINK_JSONL, "debug", stream=self.stream)
+        self.log.debug("Parsed %s", "page.pmd", extra={"event": "file_parsed", "file": "page.pmd"})
+        self.log.warning("Slow rule")
+
+        events = [json.loads(line) for line in self.stream.getvalue().splitlines()]
+        assert [event["level"] for event in events] == ["debug", "warning"]
+        assert events[0]["logger"] == "tests.events"
+        assert events[0]["message"] == "Parsed page.pmd"
+        assert events[0]["event"] == "file_parsed"
+        assert events[0]["file"] == "page.pmd"
+        assert "event" not in events[1]
+
+    def test_quiet_sink_keeps_errors_only(self):
+        configure_events(SINK_QUIET, "debug", stream=self.stream)
+        self.log.info("progress")
+        self.log.warning("warning")
+        self.log.error("failure")
+        assert self.stream.getvalue() == "failure\n"
+
+    def test_disabled_level_does_not_format(self):
+        configure_events(SINK_CONSOLE, "warning", stream=self.stream)
+        arg = _CountingArg()
+        self.log.debug("value %s", arg)
+        self.log.info("value %s", arg)
+        assert arg.formatted == 0
+        assert not self.log.isEnabledFor(logging.DEBUG)
+        assert self.stream.getvalue() == ""
+
+    def test_reconfiguring_replaces_the_sink(self):
+        first = io.StringIO()
+        configure_events(SINK_CONSOLE, "info", stream=first)
+        configure_events(SINK_CONSOLE, "info", stream=self.stream)
+        self.log.info("once")
+        assert first.getvalue() == ""
+        assert self.stream.getvalue() == "once\n"
+
+    def test_invalid_sink_or_level_raises(self):
+        with pytest.raises(ValueError, match="sink"):
+            configure_events("syslog")
+        with pytest.raises(ValueError, match="level"):
+            configure_events(SINK_CONSOLE, "verbose")
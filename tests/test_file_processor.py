@@ -252,6 +252,22 @@ def test_macos_artifacts_excluded_from_directory():
         assert len(result) == 2, f"Expected 2 files, got {len(result)}: {list(result_keys)}"
 
 
+def test_threaded_reading_matches_serial_reading():
+    """Reading on a thread pool returns the same files, in the same order, as serial reading."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        for index in range(12):
+            (tmp_path / f'page{index}.pmd').write_text(f'{{"id": "page{index}"}}')
+        (tmp_path / 'empty.script').write_text('')
+
+        serial = FileProcessor(executor="serial").process_directory(tmp_path)
+        threaded = FileProcessor(executor="thread", workers=4).process_directory(tmp_path)
+
+        assert len(serial) == 12
+        assert list(threaded) == list(serial)
+        assert [f.content for f in threaded.values()] == [f.content for f in serial.values()]
+
+
 def main():
     """Run all tests."""
     print("🚀 Starting Simplified File Processor Tests")
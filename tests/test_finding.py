@@ -2,7 +2,7 @@
 Unit tests for the Finding class.
 """
 import pytest
-from parser.rules.base import Finding, Rule
+from parser.rules.base import Finding, Rule, sort_findings
 
 
 class MockRule(Rule):
@@ -188,6 +188,23 @@ class TestFinding:
         assert finding.message == "Test finding message"
         assert finding.line == 10
         assert finding.file_path == "test.pmd"
+    
+    def test_sort_findings_orders_by_file_line_rule(self):
+        """Test that sort_findings gives a deterministic (file, line, rule, message) order."""
+        findings = [
+            Finding(rule=self.rule, message="b", line=3, file_path="b.pmd"),
+            Finding(rule=self.rule, message="z", line=12, file_path="a.pmd"),
+            Finding(rule=self.rule, message="y", line=2, file_path="a.pmd"),
+            Finding(rule=self.rule, message="x", line=2, file_path="a.pmd"),
+            Finding(rule=self.rule, message="no file"),
+        ]
+        
+        ordered = sort_findings(findings)
+        
+        assert [(f.file_path, f.line, f.message) for f in ordered] == [
+            ("", 0, "no file"), ("a.pmd", 2, "x"), ("a.pmd", 2, "y"), ("a.pmd", 12, "z"), ("b.pmd", 3, "b"),
+        ]
+        assert sort_findings(reversed(findings)) == ordered
 
 
 if __name__ == "__main__":
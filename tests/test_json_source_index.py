@@ -0,0 +1,105 @@
+"""Unit tests for the JSON path -> source span index built during parsing."""
+
+from parser.json_source_index import build_json_source_index, parse_json_path
+from parser.app_parser import ModelParser
+from parser.models import ProjectContext
+from parser.rules.common import PMDLineUtils
+from file_processing.models import SourceFile
+
+
+PMD_SOURCE = '''{
+  "id": "testPage",
+  "endPoints": [
+    {
+      "name": "getWorkers",
+      "url": "workers",
+      "failOnStatusCodes": [{"code": "400"}]
+    },
+    {
+      "name": "getOrgs",
+      "url": "orgs"
+    }
+  ],
+  "_commented": {"name": "getWorkers"},
+  "presentation": {
+    "body": {
+      "type": "section",
+      "children": [
+        {
+          "type": "text",
+          "id": "first"
+        },
+        {
+          "type": "text",
+          "onChange": "<%
+            let x = 1;
+          %>"
+        }
+      ]
+    }
+  }
+}'''
+
+
+class TestJsonSourceIndex:
+    """Test cases for span recording and lookups."""
+
+    def setup_method(self):
+        self.index = build_json_source_index(PMD_SOURCE)
+
+    def test_parse_json_path(self):
+        assert parse_json_path("body.children.1.columns.0") == ("body", "children", 1, "columns", 0)
+        assert parse_json_path("seed.template.children[0]") == ("seed", "template", "children", 0)
+        assert parse_json_path("") == ()
+
+    def test_object_member_and_array_element_spans(self):
+        assert self.index.line_for_path(("endPoints",)) == 3
+        assert self.index.line_for_path(("endPoints", 1)) == 9
+        assert self.index.line_for_path(("endPoints", 1, "url")) == 11
+        span = self.index.get_span(("presentation", "body", "children", 0))
+        assert (span.start_line, span.end_line) == (19, 22)
+
+    def test_multiline_script_values_are_tolerated(self):
+        span = self.index.get_span(("presentation", "body", "children", 1, "onChange"))
+        assert (span.start_line, span.end_line) == (25, 27)
+
+    def test_value_lookup_uses_document_order(self):
+        assert self.index.line_for_value("name", "getWorkers") == 5
+        assert self.index.line_for_value("name", "getOrgs") == 10
+        assert self.index.line_for_value("name", "missing") is None
+
+    def test_commented_keys_are_not_indexed(self):
+        assert self.index.line_for_key("_commented") is None
+        assert self.index.paths_for_value("name", "getWorkers") == [("endPoints", 0, "name")]
+
+    def test_line_for_text(self):
+        assert self.index.line_for_text("let x = 1") == 26
+        assert self.index.line_for_text("LET X", case_sensitive=False) == 26
+        assert self.index.line_for_text("not present") is None
+
+    def test_invalid_content_returns_none(self):
+        assert build_json_source_index("") is None
+        assert build_json_source_index("{ not json") is None
+        assert build_json_source_index('{"a": 1} trailing') is None
+
+
+class TestSourceIndexLineResolution:
+    """Test that parsed models resolve lines through the index."""
+
+    def setup_method(self):
+        context = ProjectContext()
+        source_file = SourceFile(path="testPage.pmd", content=PMD_SOURCE, size=len(PMD_SOURCE))
+        ModelParser()._parse_single_file("testPage.pmd", source_file, context)
+        self.pmd_model = context.pmds["testPage"]
+
+    def test_parser_attaches_index(self):
+        assert self.pmd_model.get_source_index() is not None
+        assert self.pmd_model.get_line_for_path("presentation.body.children.1") == 23
+
+    def test_field_after_entity_stays_within_entity_object(self):
+        # getOrgs has no failOnStatusCodes; must not resolve to the one in getWorkers
+        assert PMDLineUtils.find_field_after_entity(self.pmd_model, "name", "getWorkers", "failOnStatusCodes") == 7
+        assert PMDLineUtils.find_field_after_entity(self.pmd_model, "name", "getOrgs", "failOnStatusCodes") == 10
+
+    def test_section_lookup_matches_keys_only(self):
+        assert PMDLineUtils.find_section_line_number(self.pmd_model, "body") == 16
@@ -0,0 +1,120 @@
+"""Unit tests for the single-pass PMD/POD model walker."""
+
+from parser.app_parser import ModelParser
+from parser.models import ProjectContext
+from parser.rules.base import Rule
+from file_processing.models import SourceFile
+
+
+PMD_SOURCE = '''{
+  "id": "walkerPage",
+  "endPoints": [
+    {"name": "getWorkers", "url": "<% 'workers' %>"}
+  ],
+  "presentation": {
+    "title": {"type": "title", "label": "Walker"},
+    "body": {
+      "type": "section",
+      "id": "mainSection",
+      "children": [
+        {"type": "text", "id": "first", "onChange": "<% let x = 1; %>"},
+        {
+          "type": "grid",
+          "id": "workersGrid",
+          "columns": [
+            {"type": "column", "columnId": "nameCol", "cellTemplate": {"type": "text", "value": "<% row.name %>"}}
+          ]
+        }
+      ]
+    }
+  }
+}'''
+
+POD_SOURCE = '''{
+  "podId": "walkerPod",
+  "seed": {
+    "endPoints": [{"name": "getData", "url": "<% 'data' %>"}],
+    "template": {
+      "type": "section",
+      "children": [
+        {"type": "text", "id": "podText", "value": "<% data.label %>"}
+      ]
+    }
+  }
+}'''
+
+
+class _WalkerRule(Rule):
+    """Minimal concrete rule for exercising the walker-backed helpers."""
+
+    DESCRIPTION = "Walker test rule"
+
+    def get_description(self) -> str:
+        return self.DESCRIPTION
+
+    def analyze(self, context):
+        return iter(())
+
+
+class TestModelWalker:
+    """Test cases for the walk table and the Rule helpers built on it."""
+
+    def setup_method(self):
+        context = ProjectContext()
+        parser = ModelParser()
+        parser._parse_single_file("walkerPage.pmd", SourceFile(path="walkerPage.pmd", content=PMD_SOURCE, size=len(PMD_SOURCE)), context)
+        parser._parse_single_file("walkerPod.pod", SourceFile(path="walkerPod.pod", content=POD_SOURCE, size=len(POD_SOURCE)), context)
+        self.pmd_model = context.pmds["walkerPage"]
+        self.pod_model = context.pods["walkerPod"]
+        self.rule = _WalkerRule()
+
+    def test_pmd_table_is_built_once(self):
+        assert self.pmd_model.get_walk_table() is self.pmd_model.get_walk_table()
+
+    def test_pmd_script_fields_in_document_order(self):
+        paths = [node.path for node in self.pmd_model.get_walk_table().script_fields]
+        assert paths == [
+            "inboundEndpoints.0.url",
+            "presentation.body.children.0.onChange",
+            "presentation.body.children.1.columns.0.cellTemplate.value",
+        ]
+
+    def test_pmd_widgets_carry_section_and_readable_path(self):
+        table = self.pmd_model.get_walk_table()
+        grid = next(node for node in table.widgets if node.widget.get('id') == 'workersGrid')
+        assert grid.section == 'body'
+        assert grid.path == 'body.children.1'
+        assert grid.parent_type == 'section'
+        assert grid.container_name == 'children'
+        assert table.widget_for_path('body.children.1') is grid
+        assert table.parent_widget(grid).widget.get('id') == 'mainSection'
+
+    def test_script_field_parent_is_enclosing_widget(self):
+        table = self.pmd_model.get_walk_table()
+        field = table.script_fields[1]
+        assert table.parent_widget(field).widget.get('id') == 'first'
+
+    def test_find_presentation_widgets_matches_traversal(self):
+        from_table = [(node.section, node.path) for node in self.rule.find_presentation_widgets(self.pmd_model)]
+        traversed = []
+        for section_name, section_data in self.pmd_model.presentation.__dict__.items():
+            if isinstance(section_data, dict):
+                for widget, path, index, parent_type, container_name in self.rule.traverse_presentation_structure(section_data, section_name):
+                    traversed.append((section_name, path))
+        assert sorted(from_table) == sorted(traversed)
+
+    def test_pod_widgets_and_script_fields(self):
+        table = self.pod_model.get_walk_table()
+        assert [path for path, _ in self.rule.find_pod_widgets(self.pod_model)] == [
+            "seed.template", "seed.template.children[0]"
+        ]
+        assert [node.path for node in table.script_fields] == [
+            "seed.endPoints[0].url", "seed.template.children[0].value"
+        ]
+        assert table.endpoints[0].display_name == "endpoint->name: getData"
+
+    def test_span_lookup_for_walked_field(self):
+        field = self.pmd_model.get_walk_table().script_fields[1]
+        span = self.pmd_model.get_span_for_field(field.path)
+        assert span is not None
+        assert span.start_line == 12
@@ -253,6 +253,16 @@ class TestPMDPreprocessor(unittest.TestCase):
         # Should remain unchanged since it's detected as a block
         self.assertEqual(result, code)
         self.assertEqual(len(self.preprocessor.warnings), 0)
+    
+    def test_script_block_table_records_offsets_and_lines(self):
+        """Test that the block table and hash mapping come from the same scan"""
+        code = '{\n  "a": "<% x %>",\n  "b": "<%\n    y\n  %>"\n}'
+        hash_to_lines, blocks = self.preprocessor._scan_script_blocks(code)
+        self.assertEqual([(b.start_line, b.end_line) for b in blocks], [(2, 2), (3, 5)])
+        for block in blocks:
+            self.assertTrue(code.startswith('<%', block.start_offset))
+            self.assertTrue(code[:block.end_offset].endswith('%>'))
+        self.assertEqual(sorted(hash_to_lines.values()), [[[2]], [[3, 4, 5]]])
 
 if __name__ == '__main__':
     unittest.main()
@@ -137,6 +137,70 @@ def test_pod_multiline_script_exact_line():
         print(f"    [OK] Within expected range (7-9)")
 
 
+
+def test_pod_hash_mapping_is_not_consumed_by_extraction():
+    """Test that duplicate scripts keep their own lines across repeated and concurrent extraction."""
+    from concurrent.futures import ThreadPoolExecutor
+    source = """{
+  "podId": "testPod",
+  "seed": {
+    "endPoints": [
+      {"name": "first", "onSend": "<% 'a' + b %>"},
+      {"name": "second", "onSend": "<% 'a' + b %>"}
+    ],
+    "template": {}
+  }
+}"""
+    processed_content, line_mappings, hash_to_lines = preprocess_pmd_content(source)
+    pod_data = json.loads(processed_content)
+    pod_model = PodModel(
+        podId="testPod",
+        seed=PodSeed(endPoints=pod_data['seed']['endPoints'], template={}),
+        file_path="test.pod",
+        source_content=source
+    )
+    pod_model.set_hash_to_lines_mapping(hash_to_lines)
+    # Resolve through the hash mapping only
+    pod_model.set_source_index(None)
+
+    assert pod_model.get_script_start_line("<% 'a' + b %>", 1) == 6
+    assert pod_model.get_script_start_line("<% 'a' + b %>", 1) == 6
+    assert pod_model.get_script_start_line("<% 'a' + b %>", 2) is None
+
+    rule = ScriptStringConcatRule()
+    expected = [(path, line) for path, _, _, line in rule._extract_pod_script_fields(pod_model)]
+    assert expected == [("seed.endPoints[0].onSend", 5), ("seed.endPoints[1].onSend", 6)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: rule._extract_pod_script_fields(pod_model), range(8)))
+    for fields in results:
+        assert [(path, line) for path, _, _, line in fields] == expected
+
+
+
+def test_pod_script_fields_are_extracted_once_per_context():
+    """Test that script rules share the context's cached POD script fields."""
+    from parser.rules.script.core.variable_naming import ScriptVariableNamingRule
+    pod_model = PodModel(
+        podId="testPod",
+        seed=PodSeed(endPoints=[{"name": "first", "onSend": "<% 'a' + b %>"}], template={}),
+        file_path="test.pod",
+        source_content=""
+    )
+    context = ProjectContext()
+    context.pods = {'testPod': pod_model}
+
+    extractions = []
+    for rule_class in (ScriptStringConcatRule, ScriptVariableNamingRule):
+        rule = rule_class()
+        original = rule._extract_pod_script_fields
+        rule._extract_pod_script_fields = lambda model, original=original: extractions.append(model) or original(model)
+        list(rule.analyze(context))
+
+    assert len(extractions) == 1
+    assert context.get_cached_pod_script_fields('testPod')[0][0] == "seed.endPoints[0].onSend"
+
+
 if __name__ == "__main__":
     test_pod_single_line_script_exact_line()
     test_pod_multiline_script_exact_line()
@@ -1,10 +1,24 @@
 """
 Unit tests for the RulesEngine class.
 """
+import importlib
+import json
+import logging
+import os
+import time
 import pytest
+import parser.rules_engine as rules_engine_module
 from parser.rules_engine import RulesEngine
+from parser.config import ArcaneAuditorConfig, ExecutionConfig, RuleConfig, RuleExecutionConfig
+from file_processing.context_tracker import AnalysisContext
+from parser.rule_registry import RuleRegistry
+from parser.rule_manifest import write_rule_manifest
 from parser.models import ProjectContext, PMDModel
-from parser.rules.base import Rule, Finding
+from parser.rules.base import Rule, Finding, sort_findings
+from parser.app_parser import ModelParser
+from parser.findings_cache import FindingsCache
+from parser.rule_costs import BYTES_PER_MB, RuleCostProfile
+from file_processing.models import SourceFile
 
 
 class MockRule(Rule):
@@ -200,5 +214,810 @@ class TestRulesEngine:
         assert isinstance(engine.rules[0], MockRule)
 
 
+
+LOW_MEMORY_APP = {
+    "app.smd": '{"id": "site", "applicationId": "myApp_abcdef", "siteId": "site"}',
+    "home.pmd": '''{
+  "id": "home",
+  "endPoints": [{"name": "Get_Workers", "url": "<% 'myApp_abcdef' %>"}],
+  "onLoad": "<%
+    var count = 1;
+    console.log(count);
+  %>",
+  "presentation": {"body": {"type": "section", "children": [{"type": "text", "value": "Hi"}]}}
+}''',
+    "card.pod": '''{
+  "podId": "card",
+  "seed": {"template": {"type": "text", "value": "<% var unused = 2; %>"}}
+}''',
+    "util.script": "var helper = function() { console.log('x'); };\n{ \"helper\": helper }",
+}
+
+
+def _source_files_map():
+    return {path: SourceFile(path=path, content=content, size=len(content))
+            for path, content in LOW_MEMORY_APP.items()}
+
+
+def _finding_keys(findings):
+    return sorted((f.file_path, f.line, f.rule_id, f.message) for f in findings)
+
+
+class TestRunFileMajor:
+    """Test cases for the low-memory, file-by-file analysis mode."""
+    
+    def setup_method(self):
+        self.engine = RulesEngine()
+    
+    def test_matches_rule_major_findings(self):
+        """File-major analysis reports exactly what the full-context run reports."""
+        context = ModelParser().parse_files(_source_files_map())
+        expected = _finding_keys(self.engine.run(context))
+        
+        findings, summary_context = self.engine.run_file_major(_source_files_map())
+        
+        assert expected
+        assert _finding_keys(findings) == expected
+        # SMD-dependent checks still see the application id
+        assert any(f.rule_id == "HardcodedApplicationIdRule" and f.file_path == "home.pmd" for f in findings)
+        assert summary_context.smd is not None and summary_context.smd.source_content == ""
+        assert summary_context.pmds == {}
+    
+    def test_consumes_source_map_and_reports_each_file(self):
+        """Each file is handed to the callback once, with its models, and the map is drained."""
+        source_files_map = _source_files_map()
+        completed = []
+        
+        def on_file_complete(file_path, file_findings, file_context):
+            assert all(f.file_path == file_path for f in file_findings)
+            assert file_path not in source_files_map
+            completed.append(file_path)
+        
+        self.engine.run_file_major(source_files_map, on_file_complete=on_file_complete)
+        
+        assert completed[0] == "app.smd"
+        assert sorted(completed) == sorted(LOW_MEMORY_APP)
+        assert source_files_map == {}
+
+
+USER_RULE_SOURCE = '''
+from parser.rules.base import Rule
+
+class {name}(Rule):
+    DESCRIPTION = "User rule"
+    SEVERITY = "ACTION"
+
+    def analyze(self, context):
+        yield from []
+'''
+
+
+class TestRuleRegistry:
+    """Test cases for the process-wide rule class registry."""
+    
+    def setup_method(self):
+        self.registry = RuleRegistry()
+    
+    def test_builtin_classes_are_discovered_once(self, monkeypatch):
+        """Built-in packages are walked on first use only."""
+        first = self.registry.get_rule_classes()
+        monkeypatch.setattr("parser.rule_registry.pkgutil.walk_packages",
+                            lambda *args, **kwargs: pytest.fail("built-in rules rediscovered"))
+        
+        assert self.registry.get_rule_classes() == first
+        assert all(rule_type == "built-in" for _, rule_type in first)
+        assert self.registry.get_default_severities()["ScriptConsoleLogRule"] == "ACTION"
+    
+    def test_user_rules_reload_when_files_change(self, monkeypatch, tmp_path):
+        """User rule files are re-executed only when their set or mtime changes."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        rule_file = user_dir / "my_rule.py"
+        rule_file.write_text(USER_RULE_SOURCE.format(name="FirstUserRule"))
+        monkeypatch.setattr("parser.rule_registry.get_rule_dirs", lambda: [str(user_dir)])
+        
+        user_names = lambda: [cls.__name__ for cls, rule_type in self.registry.get_rule_classes() if rule_type == "user"]
+        assert user_names() == ["FirstUserRule"]
+        first_class = self.registry.get_rule_classes()[-1][0]
+        assert self.registry.get_rule_classes()[-1][0] is first_class
+        
+        rule_file.write_text(USER_RULE_SOURCE.format(name="RenamedUserRule"))
+        os.utime(rule_file, ns=(rule_file.stat().st_atime_ns, rule_file.stat().st_mtime_ns + 1_000_000_000))
+        assert user_names() == ["RenamedUserRule"]
+        
+        rule_file.unlink()
+        assert user_names() == []
+    
+    def test_manifest_progress_goes_to_the_event_log(self, capsys, caplog, tmp_path):
+        """Writing the manifest reports through the event logger, keeping stdout clean."""
+        caplog.set_level(logging.INFO, logger="arcane")
+        
+        manifest_path = write_rule_manifest(str(tmp_path / "rule_manifest.json"))
+        
+        assert capsys.readouterr().out == ""
+        assert f"rule(s) to {manifest_path}" in caplog.text
+    
+    def test_manifest_registry_imports_only_requested_rules(self, monkeypatch, tmp_path):
+        """A manifest-backed registry serves metadata without importing rule modules."""
+        manifest_path = write_rule_manifest(str(tmp_path / "rule_manifest.json"))
+        registry = RuleRegistry(manifest_path=manifest_path)
+        expected_names = self.registry.get_rule_names()
+        expected_severities = self.registry.get_default_severities()
+        imported = []
+        real_import = importlib.import_module
+        monkeypatch.setattr("parser.rule_registry.importlib.import_module",
+                            lambda name, *args: (name.startswith("parser.rules.") and imported.append(name))
+                            or real_import(name, *args))
+        monkeypatch.setattr("parser.rule_registry.pkgutil.walk_packages",
+                            lambda *args, **kwargs: pytest.fail("manifest registry walked the rule packages"))
+        
+        assert registry.get_rule_names() == expected_names
+        assert registry.get_default_severities() == expected_severities
+        assert imported == []
+        
+        console_log = next(m for m in registry.get_rule_metadata() if m.name == "ScriptConsoleLogRule")
+        assert registry.get_rule_class(console_log).__name__ == "ScriptConsoleLogRule"
+        assert imported == [console_log.module]
+    
+    def test_missing_manifest_falls_back_to_package_walk(self, tmp_path):
+        """A build without a manifest still discovers the built-in rules."""
+        registry = RuleRegistry(manifest_path=str(tmp_path / "missing.json"))
+        
+        assert registry.get_rule_names() == self.registry.get_rule_names()
+    
+    def test_engines_instantiate_their_own_rules(self):
+        """Engines share the classes but never rule instances."""
+        first, second = RulesEngine(), RulesEngine()
+        
+        assert [type(rule) for rule in first.rules] == [type(rule) for rule in second.rules]
+        assert not set(map(id, first.rules)) & set(map(id, second.rules))
+
+
+class CrossFileCountRule(Rule):
+    """Rule that needs every file at once."""
+    ID = "CROSS001"
+    DESCRIPTION = "Counts the files of the project"
+    SEVERITY = "ADVICE"
+    CROSS_FILE = True
+    
+    def analyze(self, context):
+        yield Finding(rule=self, message=f"{len(context.pmds) + len(context.pods)} files", file_path="app.smd")
+
+
+class TestRunWorkUnits:
+    """Test cases for the (rule, file) work-unit process pool."""
+    
+    def setup_method(self):
+        self.engine = RulesEngine()
+    
+    def test_matches_rule_major_findings(self):
+        """Work units report exactly what the rule-per-thread run reports."""
+        expected = _finding_keys(self.engine.run(ModelParser().parse_files(_source_files_map())))
+        
+        context = ModelParser().parse_files(_source_files_map(), lazy=True)
+        findings = self.engine.run_work_units(context, max_workers=2)
+        
+        assert expected
+        assert _finding_keys(findings) == expected
+    
+    def test_a_run_started_while_streaming_units_does_not_wait(self):
+        """Work-unit state is not held across yields, so a run started mid-stream completes."""
+        expected = _finding_keys(RulesEngine().run(ModelParser().parse_files(_source_files_map())))
+        context = ModelParser().parse_files(_source_files_map(), lazy=True)
+        nested = []
+        
+        streamed = []
+        for finding in self.engine._iter_work_units(context, max_workers=2):
+            if not nested:
+                nested = RulesEngine().run_work_units(ModelParser().parse_files(_source_files_map()), max_workers=2)
+            streamed.append(finding)
+        
+        assert _finding_keys(streamed) == _finding_keys(nested) == expected
+    
+    def test_multi_threaded_processes_use_threads_instead_of_forking(self, monkeypatch, caplog):
+        """With other threads running (e.g. the web server), work units are not forked."""
+        expected = _finding_keys(self.engine.run(ModelParser().parse_files(_source_files_map())))
+        monkeypatch.setattr(rules_engine_module.threading, "active_count", lambda: 2)
+        monkeypatch.setattr(rules_engine_module, "ProcessPoolExecutor",
+                            lambda *args, **kwargs: pytest.fail("forked a multi-threaded process"))
+        
+        findings = self.engine.run_work_units(ModelParser().parse_files(_source_files_map()), max_workers=2)
+        
+        assert _finding_keys(findings) == expected
+        assert "cannot fork a multi-threaded process" in caplog.text
+    
+    def test_config_selects_work_units_and_cross_file_rules_see_whole_project(self):
+        """The process executor routes run() to the pool; CROSS_FILE rules get the full context."""
+        self.engine.config.execution.rules = RuleExecutionConfig(executor="process", workers=2)
+        self.engine.rules = [CrossFileCountRule(), MockRuleNoFindings()]
+        
+        findings = self.engine.run(ModelParser().parse_files(_source_files_map()))
+        
+        assert [f.message for f in findings] == ["2 files"]
+    
+    def test_process_executor_selects_work_units(self, monkeypatch):
+        """execution.rules with the process executor routes run() to the pool."""
+        self.engine.config.execution.rules = RuleExecutionConfig(executor="process", workers=2)
+        pools = []
+        monkeypatch.setattr(self.engine, "_iter_work_units",
+                            lambda context, max_workers: pools.append(max_workers) or iter(()))
+        
+        self.engine.run(ModelParser().parse_files(_source_files_map()))
+        
+        assert pools == [2]
+    
+    def test_settings_a_unit_by_unit_run_cannot_use_are_reported(self, caplog):
+        """Fail-fast runs units one at a time, and says so when a thread pool was configured."""
+        self.engine.config.execution.rules = RuleExecutionConfig(executor="thread", workers=4)
+        
+        self.engine.run_fail_fast(ModelParser().parse_files(_source_files_map()))
+        
+        assert "thread rule executor and worker count are not used" in caplog.text
+    
+    def test_execution_overrides_are_validated(self):
+        """Processes are for rules only, and unknown stages are rejected."""
+        execution = ExecutionConfig().with_overrides({"rules": {"executor": "process", "workers": -1}})
+        assert execution.rules.executor == "process"
+        assert execution.parsing == ExecutionConfig().parsing
+        
+        with pytest.raises(ValueError):
+            ExecutionConfig().with_overrides({"parsing": {"executor": "process"}})
+        with pytest.raises(ValueError, match="Unknown execution stage"):
+            ExecutionConfig().with_overrides({"linking": {"workers": 2}})
+
+
+class PageEchoRule(Rule):
+    """Rule that reports every page it sees."""
+    ID = "ECHO001"
+    DESCRIPTION = "Reports each page"
+    SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd'})
+    
+    def analyze(self, context):
+        for pmd in context.pmds.values():
+            yield Finding(rule=self, message="seen", file_path=pmd.file_path)
+
+class TestCrossFileDefault:
+    """Test cases for deriving Rule.CROSS_FILE from the declared file types."""
+    
+    def test_rules_without_declared_file_types_see_the_whole_project(self):
+        """Undeclared rules are cross-file; declaring file types opts in to splitting."""
+        class UndeclaredRule(Rule):
+            def analyze(self, context):
+                yield from []
+        
+        class SplitRule(UndeclaredRule):
+            CONTEXT_FILE_TYPES = frozenset()
+        
+        class ExplicitRule(UndeclaredRule):
+            CROSS_FILE = False
+        
+        class ExplicitChildRule(ExplicitRule):
+            pass
+        
+        assert UndeclaredRule.CROSS_FILE
+        assert not SplitRule.CROSS_FILE
+        assert not PageEchoRule.CROSS_FILE
+        assert not ExplicitRule.CROSS_FILE and not ExplicitChildRule.CROSS_FILE
+    
+    def test_undeclared_rule_findings_do_not_depend_on_the_executor(self):
+        """A rule reading across files reports the same on the thread and process paths."""
+        class PageCountRule(Rule):
+            def analyze(self, context):
+                for pmd in context.pmds.values():
+                    yield Finding(rule=self, message=f"{len(context.pmds)} pages", file_path=pmd.file_path)
+        
+        files = {f"page{i}.pmd": '{"id": "page%d", "presentation": {"body": {}}}' % i for i in range(2)}
+        source_files = lambda: {path: SourceFile(path=path, content=content, size=len(content))
+                                for path, content in files.items()}
+        results = []
+        for executor in ("serial", "process"):
+            engine = RulesEngine()
+            engine.config.execution.rules = RuleExecutionConfig(executor=executor, workers=2)
+            engine.rules = [PageCountRule()]
+            results.append([f.message for f in engine.run(ModelParser().parse_files(source_files(), lazy=True))])
+        
+        assert results == [["2 pages", "2 pages"]] * 2
+
+class TestRunIter:
+    """Test cases for the streaming findings API."""
+    
+    def setup_method(self):
+        self.engine = RulesEngine()
+    
+    def test_streams_same_findings_as_run_in_stable_order(self):
+        """run_iter yields run()'s findings on every executor, and run() is sorted."""
+        findings = self.engine.run(ModelParser().parse_files(_source_files_map()))
+        assert [f.sort_key for f in findings] == sorted(f.sort_key for f in findings)
+        
+        for executor, workers in (("serial", 0), ("thread", 4)):
+            self.engine.config.execution.rules = RuleExecutionConfig(executor=executor, workers=workers)
+            streamed = list(self.engine.run_iter(ModelParser().parse_files(_source_files_map(), lazy=True)))
+            assert [f.sort_key for f in sort_findings(streamed)] == [f.sort_key for f in findings]
+    
+    def test_stream_runs_on_the_configured_thread_pool_and_learns_costs(self, monkeypatch):
+        """run_iter sizes its pool from execution.rules and saves the measured rule costs."""
+        self.engine.config.execution.rules = RuleExecutionConfig(executor="thread", workers=3)
+        pools, saves = [], []
+        
+        class RecordingPool(rules_engine_module.ThreadPoolExecutor):
+            def __init__(self, max_workers=None):
+                pools.append(max_workers)
+                super().__init__(max_workers)
+        
+        monkeypatch.setattr(rules_engine_module, "ThreadPoolExecutor", RecordingPool)
+        monkeypatch.setattr(self.engine.costs, "save", lambda: saves.append(True))
+        
+        list(self.engine.run_iter(ModelParser().parse_files(_source_files_map())))
+        
+        assert pools == [3]
+        assert saves == [True]
+    
+    def test_yields_before_later_units_run(self):
+        """Findings of a finished unit are available before the remaining units run."""
+        class CostlyPageEchoRule(PageEchoRule):
+            COST_HINT = 10.0  # scheduled before the cross-file rule
+        
+        self.engine.rules = [CostlyPageEchoRule(), CrossFileCountRule()]
+        
+        stream = self.engine.run_iter(ModelParser().parse_files(_source_files_map()))
+        first = next(stream)
+        
+        assert (first.file_path, first.message) == ("home.pmd", "seen")
+        assert [f.message for f in stream] == ["2 files"]
+
+class SlowPerFileRule(Rule):
+    """Rule that takes a while on every file."""
+    ID = "SLOW001"
+    DESCRIPTION = "Sleeps on each file"
+    SEVERITY = "ADVICE"
+    
+    def analyze(self, context):
+        for pmd in context.pmds.values():
+            time.sleep(0.05)
+            yield Finding(rule=self, message="slow", file_path=pmd.file_path)
+
+
+class TestRuleTimeLimits:
+    """Test cases for per-rule time limits with cooperative cancellation."""
+    
+    def _context(self, page_count):
+        context = ProjectContext()
+        context.analysis_context = AnalysisContext(analysis_type="full_app")
+        for index in range(page_count):
+            page_id = f"page{index}"
+            context.pmds[page_id] = PMDModel(pageId=page_id, file_path=f"{page_id}.pmd", source_content="")
+        return context
+    
+    def test_slow_rule_is_cancelled_between_files_and_others_kept(self):
+        """A rule over its limit stops between files and is reported; other rules finish."""
+        config = ArcaneAuditorConfig()
+        # Rules without a RulesConfig field (e.g. user rules) are configured from the JSON data
+        config._original_config_data = {'rules': {'SlowPerFileRule': {'time_limit': 0.12}}}
+        engine = RulesEngine(config)
+        engine.rules = [SlowPerFileRule(), MockRuleNoFindings(), MockRule()]
+        context = self._context(6)
+        
+        findings = engine.run(context)
+        
+        slow_findings = [f for f in findings if f.rule_id == "SlowPerFileRule"]
+        assert 1 <= len(slow_findings) < 6
+        assert len([f for f in findings if f.rule_id == "MockRule"]) == 2
+        timeouts = context.analysis_context.timed_out_rules
+        assert [t.rule_name for t in timeouts] == ["SlowPerFileRule"]
+        assert timeouts[0].files_total == 6
+        assert timeouts[0].files_completed < 6
+    
+    def test_rule_within_limit_is_not_reported(self):
+        """A global limit that is not reached leaves the results untouched."""
+        engine = RulesEngine(ArcaneAuditorConfig(rule_time_limit=30))
+        engine.rules = [SlowPerFileRule()]
+        context = self._context(2)
+        
+        findings = engine.run(context)
+        
+        assert len(findings) == 2
+        assert context.analysis_context.timed_out_rules == []
+    
+    def test_rule_limit_overrides_global_limit(self):
+        """A rule's own time_limit takes precedence over rule_time_limit."""
+        config = ArcaneAuditorConfig(rule_time_limit=10)
+        config.rules.ScriptConsoleLogRule = RuleConfig(time_limit=0)
+        
+        assert config.get_rule_time_limit("ScriptConsoleLogRule") == 0
+        assert config.get_rule_time_limit("ScriptVarUsageRule") == 10
+
+class TestRuleProfiling:
+    """Test cases for per-rule and per-file profiling (--profile-rules)."""
+    
+    def setup_method(self):
+        self.engine = RulesEngine(ArcaneAuditorConfig(profile_rules=True))
+    
+    def test_profiled_run_matches_findings_and_records_units(self):
+        """Profiling reports the same findings and one unit per applicable (rule, file)."""
+        expected = _finding_keys(RulesEngine().run(ModelParser().parse_files(_source_files_map())))
+        
+        findings = self.engine.run(ModelParser().parse_files(_source_files_map(), lazy=True))
+        
+        assert _finding_keys(findings) == expected
+        units = self.engine.profiler.units
+        assert len(units) == sum(1 for rule in self.engine.rules for file_path in LOW_MEMORY_APP
+                                 if os.path.splitext(file_path)[1] in rule.FILE_TYPES)
+        var_units = [u for u in units if u.rule == "ScriptVarUsageRule"]
+        # The script rule reads PMDs, PODs and scripts (not the SMD), and parses their script fields
+        assert {u.file_path: u.findings for u in var_units} == {
+            "card.pod": 1, "home.pmd": 1, "util.script": 1}
+        assert all(u.files_visited and u.asts_consumed > 0 for u in var_units)
+    
+    def test_profile_summary_and_cross_file_rules(self, tmp_path):
+        """Cross-file rules are one project unit; the JSON report aggregates per rule."""
+        self.engine.rules = [CrossFileCountRule(), MockRuleNoFindings()]
+        
+        self.engine.run(ModelParser().parse_files(_source_files_map()))
+        
+        profile = self.engine.profiler.to_dict(top_n=2)
+        rules = {rule["rule"]: rule for rule in profile["rules"]}
+        assert rules["CrossFileCountRule"]["findings"] == 1
+        assert rules["CrossFileCountRule"]["files_visited"] == 2
+        assert rules["MockRuleNoFindings"]["findings"] == 0
+        assert len(profile["slowest_units"]) == 2
+        assert "(project)" in [u.file_path for u in self.engine.profiler.units]
+        
+        report_path = tmp_path / "profile.json"
+        self.engine.profiler.write_json(str(report_path))
+        assert json.loads(report_path.read_text())["rules"][0]["rule"] in rules
+        assert "CrossFileCountRule" in self.engine.profiler.format_table()
+
+class PodOnlyRule(Rule):
+    """Rule that only analyzes pods."""
+    ID = "POD001"
+    DESCRIPTION = "Reports each pod"
+    SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pod'})
+    FIELD_CATEGORIES = frozenset({'widgets'})
+    
+    def analyze(self, context):
+        for pod in context.pods.values():
+            yield Finding(rule=self, message="pod", file_path=pod.file_path)
+
+class NeedsAmdRule(PageEchoRule):
+    """Page rule that cannot run without an AMD."""
+    ID = "AMD001"
+    REQUIRED_FILE_TYPES = frozenset({'.amd'})
+
+class RecordingModelParser(ModelParser):
+    """Model parser that records the files it parses and pre-computes."""
+    
+    def __init__(self):
+        super().__init__()
+        self.parsed, self.precomputed = [], 0
+    
+    def _parse_single_file(self, file_path, source_file, context):
+        self.parsed.append(file_path)
+        return super()._parse_single_file(file_path, source_file, context)
+    
+    def _precompute_file_analysis(self, context):
+        self.precomputed += 1
+        return super()._precompute_file_analysis(context)
+
+class TestRuleApplicability:
+    """Test cases for skipping work no enabled rule needs (Rule.FILE_TYPES and friends)."""
+    
+    def setup_method(self):
+        self.engine = RulesEngine()
+    
+    def test_units_and_file_types_outside_the_rules_are_skipped(self):
+        """Only the file types the rules analyze are parsed, and only their units run."""
+        self.engine.rules = [PodOnlyRule()]
+        context = ModelParser().parse_files(_source_files_map(), lazy=True)
+        
+        findings = list(self.engine.run_iter(context))
+        
+        assert [(f.file_path, f.message) for f in findings] == [("card.pod", "pod")]
+        assert not context.is_file_type_loaded('.pmd')
+        assert not context.is_file_type_loaded('.script')
+    
+    def test_missing_required_file_type_is_reported_not_executed(self):
+        """Rules missing a required file type do not run and are reported precisely."""
+        self.engine.rules = [NeedsAmdRule(), PageEchoRule()]
+        context = ModelParser().parse_files(_source_files_map())
+        
+        findings = self.engine.run(context)
+        
+        assert [f.rule_id for f in findings] == ["PageEchoRule"]
+        assert context.analysis_context.rules_not_executed == [
+            {"rule": "NeedsAmdRule", "reason": "Requires AMD file"}]
+    
+    def test_smd_present_runs_smd_dependent_rule(self):
+        """With an SMD, HardcodedApplicationIdRule runs and nothing is reported as not executed."""
+        context = ModelParser().parse_files(_source_files_map())
+        
+        findings = self.engine.run(context)
+        
+        assert any(f.rule_id == "HardcodedApplicationIdRule" for f in findings)
+        assert context.analysis_context.rules_not_executed == []
+    
+    def test_low_memory_mode_skips_unneeded_parsing_and_asts(self):
+        """File-major runs neither parse unneeded files nor pre-compute ASTs no rule reads."""
+        self.engine.rules = [PodOnlyRule()]
+        model_parser = RecordingModelParser()
+        
+        findings, _ = self.engine.run_file_major(_source_files_map(), model_parser)
+        
+        assert [f.file_path for f in findings] == ["card.pod"]
+        assert model_parser.parsed == ["app.smd", "card.pod"]
+        assert model_parser.precomputed == 0
+
+class ActionPageRule(PageEchoRule):
+    """ACTION page rule that counts the pages it analyzes."""
+    ID = "ACTION001"
+    SEVERITY = "ACTION"
+    
+    def __init__(self):
+        self.pages = 0
+    
+    def analyze(self, context):
+        for finding in super().analyze(context):
+            self.pages += 1
+            yield finding
+
+class TestRunFailFast:
+    """Test cases for stopping at the first failing finding (--fail-fast)."""
+    
+    def setup_method(self):
+        self.engine = RulesEngine()
+    
+    def test_action_rules_run_first_and_stop_at_first_finding(self):
+        """ADVICE rules are not run, and the first ACTION finding cancels the rest."""
+        advice_rule, action_rule = PodOnlyRule(), ActionPageRule()
+        self.engine.rules = [advice_rule, action_rule]
+        files = {f"page{i}.pmd": '{"id": "page%d", "presentation": {"body": {}}}' % i for i in range(3)}
+        context = ModelParser().parse_files({path: SourceFile(path=path, content=content, size=len(content))
+                                             for path, content in files.items()}, lazy=True)
+        
+        findings = self.engine.run_fail_fast(context)
+        
+        assert [(f.rule_id, f.file_path) for f in findings] == [("ActionPageRule", "page0.pmd")]
+        assert action_rule.pages == 1
+    
+    def test_severity_override_makes_rule_fail(self):
+        """Rules raised to ACTION by severity_override are scheduled as failing rules."""
+        config = ArcaneAuditorConfig()
+        config.rules.ScriptVarUsageRule = RuleConfig(severity_override="ACTION")
+        engine = RulesEngine(config)
+        engine.rules = [rule for rule in engine.rules if rule.__class__.__name__ == "ScriptVarUsageRule"]
+        
+        findings = engine.run_fail_fast(ModelParser().parse_files(_source_files_map(), lazy=True))
+        
+        assert [(f.rule_id, f.severity, f.file_path) for f in findings] == [
+            ("ScriptVarUsageRule", "ACTION", "card.pod")]
+    
+    def test_no_failing_findings(self):
+        """Without failing findings the result is empty; ADVICE findings can fail when requested."""
+        self.engine.rules = [PodOnlyRule()]
+        
+        assert self.engine.run_fail_fast(ModelParser().parse_files(_source_files_map())) == []
+        findings = self.engine.run_fail_fast(ModelParser().parse_files(_source_files_map()), ("ACTION", "ADVICE"))
+        assert [f.message for f in findings] == ["pod"]
+    
+    def test_rules_run_and_skipped_severities_are_recorded(self):
+        """The engine records how many rules fail-fast ran and which severities it never reached."""
+        self.engine.rules = [PodOnlyRule()]
+        
+        self.engine.run_fail_fast(ModelParser().parse_files(_source_files_map()))
+        assert (self.engine.fail_fast_rules_run, self.engine.fail_fast_skipped_severities) == (0, ["ADVICE"])
+        
+        self.engine.run_fail_fast(ModelParser().parse_files(_source_files_map()), ("ACTION", "ADVICE"))
+        assert (self.engine.fail_fast_rules_run, self.engine.fail_fast_skipped_severities) == (1, [])
+
+class SelfContainedPodRule(PodOnlyRule):
+    """Pod rule that reads nothing besides the pod it analyzes."""
+    ID = "POD002"
+    CONTEXT_FILE_TYPES = frozenset()
+
+class PageOnlyRule(PageEchoRule):
+    """Page rule that only analyzes pages."""
+    ID = "PAGE001"
+    FILE_TYPES = frozenset({'.pmd'})
+
+class FlakyPageRule(PageEchoRule):
+    """Page rule that fails while fail is set."""
+    ID = "FLAKY001"
+    
+    def __init__(self, fail):
+        self.fail = fail
+    
+    def analyze(self, context):
+        if self.fail:
+            raise RuntimeError("flaky")
+        yield from super().analyze(context)
+
+class TestFindingsCache:
+    """Test cases for reusing the findings of unchanged units across runs (--cache)."""
+    
+    def _engine(self, tmp_path, rules=None):
+        config = ArcaneAuditorConfig(findings_cache=True, findings_cache_path=str(tmp_path / "cache.json"))
+        engine = RulesEngine(config)
+        if rules is not None:
+            engine.rules = rules
+        return engine
+    
+    def _run(self, engine, files=None):
+        model_parser = RecordingModelParser()
+        source_files = {path: SourceFile(path=path, content=content, size=len(content))
+                        for path, content in (files or LOW_MEMORY_APP).items()}
+        findings = engine.run(model_parser.parse_files(source_files, lazy=True))
+        return _finding_keys(findings), model_parser.parsed
+    
+    def test_warm_run_reuses_findings_without_parsing(self, tmp_path):
+        """A second run over unchanged files reports the same findings and parses nothing."""
+        expected = _finding_keys(RulesEngine().run(ModelParser().parse_files(_source_files_map())))
+        
+        cold, cold_parsed = self._run(self._engine(tmp_path))
+        warm, warm_parsed = self._run(self._engine(tmp_path))
+        
+        assert expected and cold == expected and warm == expected
+        assert cold_parsed
+        assert warm_parsed == []
+    
+    def test_changed_files_are_analyzed_again(self, tmp_path):
+        """Only units reading a changed file miss; an SMD change reaches rules that read it."""
+        rules = lambda: [PageOnlyRule(), SelfContainedPodRule()]
+        self._run(self._engine(tmp_path, rules()))
+        
+        changed_page = dict(LOW_MEMORY_APP, **{"home.pmd": LOW_MEMORY_APP["home.pmd"].replace("Hi", "Hello")})
+        _, parsed = self._run(self._engine(tmp_path, rules()), changed_page)
+        assert "home.pmd" in parsed and "card.pod" not in parsed
+        
+        changed_smd = dict(LOW_MEMORY_APP, **{"app.smd": LOW_MEMORY_APP["app.smd"].replace("site", "other")})
+        findings, parsed = self._run(self._engine(tmp_path, rules()), changed_smd)
+        assert "home.pmd" in parsed and "card.pod" not in parsed
+        assert [key[2] for key in findings] == ["SelfContainedPodRule", "PageOnlyRule"]
+    
+    def test_severity_change_invalidates_rule_entries(self, tmp_path):
+        """Findings cached under one severity are not reused once the severity changes."""
+        self._run(self._engine(tmp_path, [PageEchoRule()]))
+        rule = PageEchoRule()
+        rule.SEVERITY = "ACTION"
+        engine = self._engine(tmp_path, [rule])
+        
+        findings = engine.run(ModelParser().parse_files(_source_files_map(), lazy=True))
+        
+        assert [f.severity for f in findings] == ["ACTION"]
+    
+    def test_failed_units_are_not_cached(self, tmp_path):
+        """A unit whose rule failed runs again on the next run."""
+        findings, _ = self._run(self._engine(tmp_path, [FlakyPageRule(fail=True)]))
+        assert findings == []
+        
+        findings, parsed = self._run(self._engine(tmp_path, [FlakyPageRule(fail=False)]))
+        assert [key[0] for key in findings] == ["home.pmd"]
+        assert "home.pmd" in parsed
+    
+    def test_entries_of_other_tool_versions_are_ignored(self, tmp_path):
+        """Cache entries are keyed by tool version and survive a save and reload."""
+        path = str(tmp_path / "cache.json")
+        cache = FindingsCache(path, tool_version="1.0")
+        cache.put(cache.key("rule", [("a.pmd", "digest")]), [("Rule", "msg", 3, "a.pmd")], [])
+        cache.save()
+        
+        assert FindingsCache(path, tool_version="1.0").get(cache.key("rule", [("a.pmd", "digest")])) == (
+            [("Rule", "msg", 3, "a.pmd")], [])
+        other = FindingsCache(path, tool_version="2.0")
+        assert other.get(other.key("rule", [("a.pmd", "digest")])) is None
+    
+    def test_warm_runs_do_not_rewrite_the_cache(self, tmp_path, monkeypatch):
+        """Hits alone leave the file alone; only a run with new entries writes it."""
+        path = str(tmp_path / "cache.json")
+        cache = FindingsCache(path, tool_version="1.0")
+        cache.put("a", [], [])
+        cache.save()
+        writes = []
+        monkeypatch.setattr("parser.findings_cache.atomic_write_json", lambda *args, **kwargs: writes.append(args))
+        
+        warm = FindingsCache(path, tool_version="1.0")
+        assert warm.get("a") == ([], [])
+        warm.save()
+        
+        assert writes == []
+        assert os.listdir(tmp_path) == ["cache.json"]
+    
+    def test_least_recently_used_entries_are_evicted(self, tmp_path, monkeypatch):
+        """Entries used by a later run outlive entries that were written after them."""
+        monkeypatch.setattr("parser.findings_cache.MAX_ENTRIES", 2)
+        path = str(tmp_path / "cache.json")
+        cache = FindingsCache(path, tool_version="1.0")
+        cache.put("a", [], [])
+        cache.put("b", [], [])
+        cache.save()
+        
+        cache = FindingsCache(path, tool_version="1.0")
+        cache.get("a")
+        cache.put("c", [], [])
+        cache.save()
+        
+        cache = FindingsCache(path, tool_version="1.0")
+        assert [key for key in ("a", "b", "c") if cache.get(key) is not None] == ["a", "c"]
+
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+class QuickPageRule(Rule):
+    """Page rule with a low static cost estimate that records when it starts."""
+    ID = "QUICK001"
+    DESCRIPTION = "Cheap page rule"
+    SEVERITY = "ADVICE"
+    FILE_TYPES = frozenset({'.pmd'})
+    COST_HINT = 0.01
+    started = []
+    
+    def analyze(self, context):
+        QuickPageRule.started.append(self.__class__.__name__)
+        yield from []
+
+
+class SlowPageRule(QuickPageRule):
+    """Page rule with a high static cost estimate."""
+    ID = "SLOW001"
+    DESCRIPTION = "Expensive page rule"
+    COST_HINT = 50.0
+
+
+class TestCostScheduling:
+    """Test cases for longest-first scheduling from estimated rule costs."""
+    
+    def setup_method(self):
+        QuickPageRule.started = []
+        self.file_sizes = {"home.pmd": BYTES_PER_MB // 2, "util.script": BYTES_PER_MB}
+    
+    def test_static_hints_order_expensive_rules_first(self):
+        """Without recorded runs, COST_HINT times the size of the rule's files is the estimate."""
+        costs = RuleCostProfile()
+        
+        ordered = costs.order([QuickPageRule(), SlowPageRule()], self.file_sizes)
+        
+        assert [type(rule) for rule in ordered] == [SlowPageRule, QuickPageRule]
+        assert costs.estimate(SlowPageRule(), self.file_sizes["home.pmd"]) == pytest.approx(25.0)
+    
+    def test_recorded_costs_are_smoothed_and_persisted(self, tmp_path):
+        """A run's measured cost replaces the hint and is averaged with later runs."""
+        path = str(tmp_path / "rule_costs.json")
+        costs = RuleCostProfile(path, persist=True)
+        costs.record(SlowPageRule(), 0.5, BYTES_PER_MB // 2)
+        costs.record(SlowPageRule(), 0.5, BYTES_PER_MB // 2)
+        assert costs.rate(SlowPageRule()) == pytest.approx(50.0)
+        costs.save()
+        
+        reloaded = RuleCostProfile(path, persist=True)
+        assert reloaded.rate(SlowPageRule()) == pytest.approx(1.0)
+        reloaded.record(SlowPageRule(), 3.0, BYTES_PER_MB)
+        reloaded.save()
+        assert reloaded.rate(SlowPageRule()) == pytest.approx(2.0)
+        assert RuleCostProfile(path, persist=False).rate(SlowPageRule()) == pytest.approx(50.0)
+    
+    def test_engine_runs_longest_first_and_learns_costs(self, tmp_path):
+        """The engine starts the most expensive rule first and records what each rule cost."""
+        path = tmp_path / "rule_costs.json"
+        engine = RulesEngine(ArcaneAuditorConfig(cost_profile=True, cost_profile_path=str(path)))
+        engine.rules = [QuickPageRule(), SlowPageRule()]
+        
+        engine.run(ModelParser().parse_files(_source_files_map(), lazy=True))
+        
+        assert QuickPageRule.started == ["SlowPageRule", "QuickPageRule"]
+        recorded = json.loads(path.read_text())["rules"]
+        assert set(recorded) == {"QuickPageRule", "SlowPageRule"}
+        assert recorded["SlowPageRule"]["runs"] == 1
+    
+    def test_profile_reports_estimated_and_actual_times(self):
+        """The rule profile shows each rule's estimated time next to the measured one."""
+        engine = RulesEngine(ArcaneAuditorConfig(profile_rules=True))
+        engine.rules = [SlowPageRule()]
+        context = ModelParser().parse_files(_source_files_map(), lazy=True)
+        pages_size = sum(size for path, size in context.file_sizes().items() if path.endswith('.pmd'))
+        
+        engine.run(context)
+        
+        rule_profile = engine.profiler.to_dict()["rules"][0]
+        assert rule_profile["estimated_time"] == pytest.approx(50.0 * pages_size / BYTES_PER_MB, abs=1e-6)
+        assert "Est (s)" in engine.profiler.format_table()
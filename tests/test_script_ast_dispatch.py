@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Unit tests for single-traversal script AST dispatch."""
+
+from parser.models import PMDModel, ProjectContext
+from parser.pmd_script_parser import parse_with_preprocessor
+from parser.rules.script.core.console_log import ScriptConsoleLogRule
+from parser.rules.script.core.var_usage import ScriptVarUsageRule
+from parser.rules.script.logic.string_concat import ScriptStringConcatRule
+from parser.rules.script.logic.verbose_boolean import ScriptVerboseBooleanCheckRule
+from parser.rules.script.shared.dispatch import AstDispatcher, dispatch_visitors
+from parser.rules.script.shared.rule_base import ScriptVisitorGroup
+
+
+class RecordingVisitor:
+    """Visitor that records the hooks it receives."""
+
+    NODE_TYPES = frozenset({'variable_statement', 'member_dot_expression'})
+
+    def __init__(self):
+        self.events = []
+
+    def begin_visit(self, ast, field_name):
+        self.events.append(('begin', field_name))
+
+    def enter_variable_statement(self, node, scope):
+        self.events.append(('enter', node.data, scope.function_name))
+
+    def exit_variable_statement(self, node, scope):
+        self.events.append(('exit', node.data, scope.function_name))
+
+    def enter_member_dot_expression(self, node, scope):
+        self.events.append(('enter', node.data, scope.function_name))
+
+
+SCRIPT = """
+var outer = 1;
+var helper = function(x) {
+  var inner = x;
+  console.info(inner);
+  return inner;
+};
+"""
+
+
+class TestAstDispatcher:
+    """Test cases for AstDispatcher."""
+
+    def test_hooks_called_in_document_order_with_scope(self):
+        """Enter hooks run pre-order, exit hooks post-order, with the enclosing function name."""
+        visitor = RecordingVisitor()
+        dispatch_visitors(parse_with_preprocessor(SCRIPT), [visitor], 'script')
+
+        assert visitor.events[0] == ('begin', 'script')
+        statements = [event for event in visitor.events if event[1] == 'variable_statement']
+        assert statements == [
+            ('enter', 'variable_statement', None),
+            ('exit', 'variable_statement', None),
+            ('enter', 'variable_statement', None),
+            ('enter', 'variable_statement', 'helper'),
+            ('exit', 'variable_statement', 'helper'),
+            ('exit', 'variable_statement', None),
+        ]
+        assert ('enter', 'member_dot_expression', 'helper') in visitor.events
+
+    def test_single_walk_serves_all_visitors(self):
+        """Each visitor receives the same hooks as when walked on its own."""
+        ast = parse_with_preprocessor(SCRIPT)
+        alone = RecordingVisitor()
+        dispatch_visitors(ast, [alone], 'script')
+
+        first, second = RecordingVisitor(), RecordingVisitor()
+        dispatch_visitors(ast, [first, second], 'script')
+
+        assert first.events == alone.events
+        assert second.events == alone.events
+
+    def test_non_tree_ast_is_ignored(self):
+        """Walking something that is not a tree does nothing."""
+        AstDispatcher([RecordingVisitor()]).walk(None)
+
+
+class TestScriptVisitorGroup:
+    """Test cases for ScriptVisitorGroup."""
+
+    def setup_method(self):
+        self.rules = [ScriptConsoleLogRule(), ScriptVarUsageRule(),
+                      ScriptVerboseBooleanCheckRule(), ScriptStringConcatRule()]
+        self.context = ProjectContext()
+        self.context.pmds["testPage"] = PMDModel(
+            pageId="testPage",
+            file_path="test.pmd",
+            source_content="",
+            script="<%\n  var flag = true;\n  var check = function(a) {\n"
+                   "    console.debug(a);\n    return a ? true : false;\n  };\n"
+                   "  var label = 'a' + flag;\n%>"
+        )
+
+    def test_groups_only_visitor_rules(self):
+        """Visitor-based rules are replaced by one group; other rules are kept."""
+        grouped = ScriptVisitorGroup.group_rules(self.rules)
+
+        assert len(grouped) == 2
+        assert isinstance(grouped[0], ScriptVisitorGroup)
+        assert grouped[0].rules == self.rules[:3]
+        assert grouped[1] is self.rules[3]
+
+    def test_single_visitor_rule_is_not_grouped(self):
+        """A lone visitor rule runs on its own."""
+        rules = [ScriptConsoleLogRule(), ScriptStringConcatRule()]
+        assert ScriptVisitorGroup.group_rules(rules) == rules
+
+    def test_group_findings_match_individual_rules(self):
+        """The group reports the same findings, attributed to the same rules."""
+        visitor_rules = self.rules[:3]
+        expected = sorted((type(finding.rule).__name__, finding.line, finding.message)
+                          for rule in visitor_rules for finding in rule.analyze(self.context))
+
+        group = ScriptVisitorGroup(visitor_rules)
+        actual = sorted((type(finding.rule).__name__, finding.line, finding.message)
+                        for finding in group.analyze(self.context))
+
+        assert expected
+        assert {name for name, _, _ in expected} == {type(rule).__name__ for rule in visitor_rules}
+        assert actual == expected
@@ -290,3 +290,63 @@ class TestLineOffsetEdgeCases:
         # The important part is that the violation is detected
         assert findings[0].line >= 1, f"Line number should be positive, got {findings[0].line}"
 
+
+
+class TestScriptBlockOffsetResolution:
+    """Test that parsed models resolve script lines from the preprocessor's block table."""
+
+    def _parse(self, source: str) -> PMDModel:
+        from parser.app_parser import ModelParser
+        from file_processing.models import SourceFile
+        context = ProjectContext()
+        source_file = SourceFile(path="testPage.pmd", content=source, size=len(source))
+        ModelParser()._parse_single_file("testPage.pmd", source_file, context)
+        return context.pmds["testPage"]
+
+    def test_escaped_duplicate_scripts_resolve_to_own_lines(self):
+        """Identical escaped scripts miss the hash lookup but still map to their own lines."""
+        source = """{
+  "id": "testPage",
+  "endPoints": [
+    {
+      "name": "first",
+      "url": "<% \\"/api/\\" + id %>"
+    },
+    {
+      "name": "second",
+      "url": "<% \\"/api/\\" + id %>"
+    }
+  ],
+  "presentation": {
+    "body": {"type": "section", "children": []}
+  }
+}"""
+        pmd_model = self._parse(source)
+
+        fields = ScriptStringConcatRule().find_script_fields(pmd_model)
+        lines = {path: line for path, _, _, line in fields}
+
+        assert lines["inboundEndpoints.0.url"] == 6
+        assert lines["inboundEndpoints.1.url"] == 10
+
+    def test_multiline_and_template_expression_fields(self):
+        """AST line 1 skips the <% line; template expressions map to their block."""
+        source = """{
+  "id": "testPage",
+  "onLoad": "<%
+    pageVariables.x = 1;
+  %>",
+  "presentation": {
+    "title": {
+      "type": "title",
+      "label": "Hello <% pageVariables.name %>"
+    },
+    "body": {"type": "section", "children": []}
+  }
+}"""
+        pmd_model = self._parse(source)
+
+        assert pmd_model.get_script_line_for_field("onLoad", pmd_model.onLoad) == 4
+        label = pmd_model.presentation.title["label"]
+        assert pmd_model.get_script_line_for_field("presentation.title.label", label) == 9
+        assert pmd_model.get_script_line_for_field("presentation.title.type", "title") is None
@@ -7,6 +7,7 @@ the deterministic code-context shown alongside each finding.
 import pytest
 from types import SimpleNamespace
 
+from parser.models import ProjectContext
 from web.services.jobs import extract_snippet, build_source_map
 
 
@@ -145,8 +146,8 @@ class TestExtractSnippetEdgeCases:
 class TestBuildSourceMap:
     @staticmethod
     def _make_context(pmds=None, pods=None, scripts=None, amd=None, smd=None):
-        """Build a minimal context-like object for testing."""
-        ctx = SimpleNamespace()
+        """Build a minimal context for testing."""
+        ctx = ProjectContext()
         ctx.pmds = pmds or {}
         ctx.pods = pods or {}
         ctx.scripts = scripts or {}
@@ -214,6 +215,16 @@ class TestBuildSourceMap:
         source_map = build_source_map(ctx)
         assert "app/service.smd" in source_map
 
+    def test_does_not_parse_deferred_file_types(self):
+        """Building the map must not force parsing of file types no rule has read."""
+        pmd = SimpleNamespace(source_content="pmd content", file_path="a.pmd")
+        ctx = self._make_context(pmds={"p": pmd})
+        loaded = []
+        ctx.set_lazy_sources({".script": {"c.script": None}}, lambda files, context: loaded.append(files))
+        source_map = build_source_map(ctx)
+        assert list(source_map) == ["a.pmd"]
+        assert loaded == []
+
     def test_empty_context(self):
         ctx = self._make_context()
         source_map = build_source_map(ctx)
@@ -0,0 +1,201 @@
+"""
+Stress tests for the state shared between analysis threads.
+
+The thread switch interval is lowered to a microsecond so that, even with the GIL,
+threads interleave inside the code under test; on a free-threaded build they also run
+in parallel.
+"""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from file_processing.context_tracker import AnalysisContext
+from parser.config import ArcaneAuditorConfig, RuleExecutionConfig
+from parser.models import ProjectContext, ScriptModel
+from parser.pmd_script_parser import parse_with_preprocessor
+from parser.rules.base import Rule
+from parser.rules_engine import RulesEngine
+from utils.concurrency import ExecutionPlan, gil_enabled, plan_execution, thread_pool_size
+
+THREADS = 16
+
+SCRIPT = """<%
+    var total = 0;
+    var addAll = function(items) {
+        return items.length + total;
+    };
+    addAll([1, 2, 3]);
+%>"""
+
+
+def run_concurrently(task, count=THREADS):
+    """Run task(index) on count threads started together and return the results in order."""
+    barrier = threading.Barrier(count)
+
+    def wait_then_run(index):
+        barrier.wait()
+        return task(index)
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(wait_then_run, range(count)))
+
+
+class _AstRule(Rule):
+    """Minimal rule used to reach the shared AST cache."""
+    DESCRIPTION = "AST cache access"
+    SEVERITY = "ADVICE"
+
+    def analyze(self, context):
+        return iter(())
+
+
+class TestThreadSafety:
+    """Concurrent use of the parse caches, the analysis context and the engine."""
+
+    def setup_method(self):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def teardown_method(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_concurrent_requests_parse_a_script_once(self):
+        context = ProjectContext()
+        calls = []
+
+        def parse():
+            calls.append(threading.get_ident())
+            time.sleep(0.05)
+            return "tree"
+
+        results = run_concurrently(lambda index: context.get_or_parse_ast(SCRIPT, parse))
+
+        assert results == ["tree"] * THREADS
+        assert len(calls) == 1
+        assert context.ast_requests == THREADS
+        assert context.get_cached_ast(SCRIPT) == "tree"
+
+    def test_failed_parse_is_cached_and_shared(self):
+        context = ProjectContext()
+        calls = []
+
+        def parse():
+            calls.append(1)
+            time.sleep(0.05)
+            return None
+
+        results = run_concurrently(lambda index: context.get_or_parse_ast(SCRIPT, parse))
+
+        assert results == [None] * THREADS
+        assert len(calls) == 1
+
+    def test_rules_share_one_ast_per_script(self):
+        context = ProjectContext()
+        rules = [_AstRule() for _ in range(THREADS)]
+
+        asts = run_concurrently(lambda index: rules[index].get_cached_ast(SCRIPT, context))
+
+        assert asts[0] is not None
+        assert all(ast is asts[0] for ast in asts)
+
+    def test_rule_cache_without_context_agrees_on_one_ast(self):
+        rule = _AstRule()
+
+        asts = run_concurrently(lambda index: rule.get_cached_ast(SCRIPT))
+
+        assert asts[0] is not None
+        assert all(ast is asts[0] for ast in asts)
+
+    def test_concurrent_parses_match_a_serial_parse(self):
+        scripts = [SCRIPT[2:-2].replace("total", f"total{index}") for index in range(THREADS)]
+
+        trees = run_concurrently(lambda index: parse_with_preprocessor(scripts[index]))
+
+        assert None not in trees
+        assert trees == [parse_with_preprocessor(script) for script in scripts]
+
+    def test_concurrent_registrations_keep_one_entry_each(self):
+        analysis_context = AnalysisContext(analysis_type="full_app")
+
+        def register(index):
+            for check in range(50):
+                analysis_context.register_skipped_check("SomeRule", f"check{check}", "missing AMD")
+            analysis_context.register_rule_timeout("SlowRule", 10.0, 1, 2)
+            analysis_context.register_rules_not_executed({"OtherRule": "disabled"})
+
+        run_concurrently(register)
+
+        assert len(analysis_context.skipped_checks) == 50
+        assert len(analysis_context.timed_out_rules) == 1
+        assert analysis_context.timed_out_rules[0].files_completed == THREADS
+        assert analysis_context.unexecuted_rules == [{"rule": "OtherRule", "reason": "disabled"}]
+
+    def test_threaded_engine_matches_serial_engine(self):
+        def build_context():
+            context = ProjectContext()
+            for index in range(12):
+                source = SCRIPT.replace("total", f"total{index}").replace("addAll", f"unused{index}")
+                context.scripts[f"lib{index}.script"] = ScriptModel(source=source, file_path=f"lib{index}.script")
+            return context
+
+        def run(executor, workers):
+            config = ArcaneAuditorConfig()
+            config.execution.rules = RuleExecutionConfig(executor=executor, workers=workers)
+            findings = RulesEngine(config).run(build_context())
+            return sorted(str(finding) for finding in findings)
+
+        serial = run("serial", 1)
+        assert serial
+        assert run("thread", THREADS) == serial
+
+
+class TestPoolSizing:
+    """Thread pool sizes on builds with and without the GIL."""
+
+    def test_gil_build_keeps_the_cap(self):
+        with patch("utils.concurrency.gil_enabled", return_value=True), \
+             patch("utils.concurrency.os.cpu_count", return_value=64):
+            assert thread_pool_size(100, 8) == 8
+            assert thread_pool_size(3, 8) == 3
+
+    def test_free_threaded_build_uses_every_cpu(self):
+        with patch("utils.concurrency.gil_enabled", return_value=False), \
+             patch("utils.concurrency.os.cpu_count", return_value=64):
+            assert thread_pool_size(100, 8) == 64
+            assert thread_pool_size(20, 8) == 20
+        with patch("utils.concurrency.gil_enabled", return_value=False), \
+             patch("utils.concurrency.os.cpu_count", return_value=2):
+            assert thread_pool_size(100, 8) == 8
+
+    def test_pool_has_at_least_one_thread(self):
+        assert thread_pool_size(0, 8) == 1
+
+    def test_gil_enabled_reflects_the_interpreter(self):
+        expected = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+        assert gil_enabled() is expected
+
+
+class TestExecutionPlan:
+    """Executor and worker count chosen for a stage from its settings and input size."""
+
+    def test_auto_runs_small_inputs_serially_whatever_the_task_count(self):
+        assert plan_execution("auto", 0, 40, 60_000, 65536, 8) == ExecutionPlan("serial", 1)
+
+    def test_auto_sizes_threads_from_the_input(self):
+        with patch("utils.concurrency.gil_enabled", return_value=True):
+            assert plan_execution("auto", 0, 40, 3 * 65536, 65536, 8) == ExecutionPlan("thread", 3)
+            assert plan_execution("auto", 0, 40, 100 * 65536, 65536, 8) == ExecutionPlan("thread", 8)
+            assert plan_execution("auto", 0, 2, 100 * 65536, 65536, 8) == ExecutionPlan("thread", 2)
+
+    def test_explicit_settings_are_kept(self):
+        assert plan_execution("serial", 4, 40, 10 ** 9, 65536, 8) == ExecutionPlan("serial", 1)
+        assert plan_execution("thread", 3, 40, 10, 65536, 8) == ExecutionPlan("thread", 3)
+        assert plan_execution("process", 2, 1, 10, 65536, 8) == ExecutionPlan("process", 2)
+        with patch("utils.concurrency.os.cpu_count", return_value=6):
+            assert plan_execution("process", 0, 40, 10, 65536, 8) == ExecutionPlan("process", 6)
+            assert plan_execution("thread", -1, 40, 10, 65536, 8) == ExecutionPlan("thread", 6)
+
+    def test_single_task_runs_serially(self):
+        assert plan_execution("thread", 4, 1, 10 ** 9, 65536, 8) == ExecutionPlan("serial", 1)
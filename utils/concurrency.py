@@ -0,0 +1,81 @@
+"""
+Executor selection and thread-pool sizing for standard and free-threaded CPython.
+
+On standard builds the GIL runs one thread's Python code at a time, so the thread
+pools mostly overlap waiting and are kept small; the process executor for the rules is
+the way to use more cores. Free-threaded builds (3.13t and later, with the GIL
+disabled) run the threads of a pool in parallel, so the pools grow to one thread per CPU.
+
+plan_execution turns a stage's execution settings (see ExecutionConfig in
+parser.config) into the executor and worker count for one run.
+"""
+import os
+import sys
+from typing import NamedTuple
+
+
+def gil_enabled() -> bool:
+    """Whether the GIL is active (always on builds without free-threading support)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def thread_pool_size(tasks: int, gil_cap: int) -> int:
+    """
+    Number of threads for a pool running the given number of tasks.
+
+    Args:
+        tasks: Tasks the pool will run
+        gil_cap: Most threads worth starting while the GIL serializes them
+    """
+    cap = gil_cap if gil_enabled() else max(gil_cap, os.cpu_count() or 1)
+    return max(1, min(tasks, cap))
+
+
+# Executors a stage of the analysis can run on
+AUTO = "auto"
+SERIAL = "serial"
+THREAD = "thread"
+PROCESS = "process"
+
+
+class ExecutionPlan(NamedTuple):
+    """How one stage runs: its executor (serial, thread or process) and worker count."""
+    executor: str
+    workers: int
+
+
+def plan_execution(executor: str, workers: int, tasks: int, input_bytes: int,
+                   bytes_per_worker: int, gil_cap: int) -> ExecutionPlan:
+    """
+    Resolve a stage's configured executor and worker count for one run.
+    
+    auto gives each thread bytes_per_worker of input, so small inputs run serially
+    whatever their file or rule count; an explicit thread executor without a worker
+    count sizes the pool by tasks alone.
+    
+    Args:
+        executor: auto, serial, thread or process
+        workers: Configured workers (0 = derived, -1 = one per CPU)
+        tasks: Independent tasks the stage runs (files, rules)
+        input_bytes: Size of the stage's input
+        bytes_per_worker: Input each automatically sized thread is given
+        gil_cap: Most threads worth starting while the GIL serializes them
+    """
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    if executor == SERIAL:
+        return ExecutionPlan(SERIAL, 1)
+    if executor == PROCESS:
+        return ExecutionPlan(PROCESS, workers or os.cpu_count() or 1)
+    if tasks <= 1:
+        return ExecutionPlan(SERIAL, 1)
+    if workers:
+        workers = min(workers, tasks)
+    elif executor == AUTO:
+        workers = thread_pool_size(min(tasks, -(-input_bytes // max(1, bytes_per_worker))), gil_cap)
+    else:
+        workers = thread_pool_size(tasks, gil_cap)
+    if executor == AUTO and workers <= 1:
+        return ExecutionPlan(SERIAL, 1)
+    return ExecutionPlan(THREAD, workers)
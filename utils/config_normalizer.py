@@ -49,16 +49,10 @@ def get_runtime_rule_names() -> list[str]:
         list[str]: List of rule class names discovered from the rules engine.
     """
     try:
-        from parser.rules_engine import RulesEngine
-        from parser.config import ArcaneAuditorConfig
+        from parser.rule_registry import get_rule_registry
         
-        # Create a config that enables all rules for discovery
-        config = ArcaneAuditorConfig()
-        engine = RulesEngine(config)
-        
-        # Extract rule class names
-        rule_names = [rule.__class__.__name__ for rule in engine.rules]
-        return rule_names
+        # Rule classes are discovered once per process by the registry
+        return get_rule_registry().get_rule_names()
     except Exception:
         # Fallback: return empty list if discovery fails
         return []
@@ -129,6 +123,9 @@ def normalize_config_rules(
                 production_rule.get("custom_settings"),
                 current_rule.get("custom_settings"),
             )
+
+            if current_rule.get("time_limit") is not None:
+                normalized_rule["time_limit"] = current_rule["time_limit"]
         else:
             # Rule missing from user's config - treat as new default rule
             normalized_rule["enabled"] = default_enabled
@@ -0,0 +1,101 @@
+"""
+Leveled event channel for the parser, rules engine and entry points.
+
+Modules log through get_logger(__name__) instead of print(). Loggers are standard
+logging loggers under the "arcane" namespace, so a disabled level costs one cached
+isEnabledFor check and the message is never formatted: pass arguments lazily
+(log.debug("Parsed %s", path)) and guard anything expensive to build with
+log.isEnabledFor(logging.DEBUG).
+
+Each entry point picks a sink with configure_events():
+
+- quiet: errors only (on stderr)
+- console: plain messages on stderr, as the old prints read
+- jsonl: one JSON object per event on stderr (time, level, logger, message, event and
+  any extra fields passed with extra={...}), for tools that consume the stream
+
+Events always go to stderr so stdout carries only the report. Until an entry point
+configures a sink, warnings and errors reach stderr through logging's default handler.
+"""
+import json
+import logging
+import sys
+from typing import Any, Dict, Optional, TextIO
+
+EVENT_NAMESPACE = "arcane"
+
+SINK_QUIET = "quiet"
+SINK_CONSOLE = "console"
+SINK_JSONL = "jsonl"
+SINKS = (SINK_QUIET, SINK_CONSOLE, SINK_JSONL)
+
+LEVELS = ("debug", "info", "warning", "error")
+
+# Attributes every LogRecord has; anything else on a record came from extra={...}
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """The event logger of a module (pass __name__)."""
+    return logging.getLogger(f"{EVENT_NAMESPACE}.{name}")
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each event as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        event: Dict[str, Any] = {
+            "time": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "logger": record.name[len(EVENT_NAMESPACE) + 1:] if record.name.startswith(EVENT_NAMESPACE + ".") else record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                event[key] = value
+        if record.exc_info:
+            event["exception"] = self.formatException(record.exc_info)
+        return json.dumps(event, default=str)
+
+
+class _StderrHandler(logging.StreamHandler):
+    """Writes to the current sys.stderr, which test runners and hosts may swap after configuration."""
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def configure_events(sink: str = SINK_CONSOLE, level: str = "info", stream: Optional[TextIO] = None) -> None:
+    """
+    Route all events to one sink, replacing the previous one.
+
+    Args:
+        sink: quiet, console or jsonl
+        level: Lowest level emitted by the console and jsonl sinks (debug, info, warning, error)
+        stream: Where events are written (default: sys.stderr)
+    """
+    if sink not in SINKS:
+        raise ValueError(f"Unknown event sink '{sink}' (expected one of: {', '.join(SINKS)})")
+    if level.lower() not in LEVELS:
+        raise ValueError(f"Unknown event level '{level}' (expected one of: {', '.join(LEVELS)})")
+
+    logger = logging.getLogger(EVENT_NAMESPACE)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    # Events never reach the root logger, so hosts that configure logging (uvicorn)
+    # neither duplicate nor reformat them
+    logger.propagate = False
+
+    handler = logging.StreamHandler(stream) if stream is not None else _StderrHandler()
+    if sink == SINK_JSONL:
+        handler.setFormatter(JsonLinesFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.ERROR if sink == SINK_QUIET else getattr(logging, level.upper()))
+
@@ -8,14 +8,14 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 
 def atomic_write_json(
     target_path: Union[str, Path],
     data: Any,
     *,
-    indent: int = 2,
+    indent: Optional[int] = 2,
     encoding: str = "utf-8",
 ) -> None:
     """Atomically write JSON data to a target path.
@@ -23,7 +23,7 @@ def atomic_write_json(
     Args:
         target_path: Destination path for the JSON document.
         data: JSON-serialisable data.
-        indent: Indentation level for emitted JSON.
+        indent: Indentation level for emitted JSON (None for compact output).
         encoding: Text encoding for the file.
 
     Raises:
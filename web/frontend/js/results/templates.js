@@ -481,6 +481,24 @@ export const Templates = {
             `;
         }
         
+        // Impact analysis (rules cancelled by their time limit)
+        if (contextData.impact && contextData.impact.rules_timed_out && contextData.impact.rules_timed_out.length > 0) {
+            html += `
+                <div class="context-impact context-impact-partial">
+                    <h4>⏱️ Rules Timed Out</h4>
+                    <p class="context-impact-subtitle">Some validations ran out of time and were cancelled; their findings are partial.</p>
+                    <div class="context-impact-list">
+                        ${contextData.impact.rules_timed_out.map(rule => `
+                            <div class="context-impact-item">
+                                <strong>⏱️ ${rule.rule}</strong>
+                                <span>Exceeded ${rule.time_limit}s — ${rule.files_completed} of ${rule.files_total} file(s) analyzed.</span>
+                            </div>
+                        `).join('')}
+                    </div>
+                </div>
+            `;
+        }
+
         // Tip (magical guidance)
         if (!isComplete) {
             const requiredFiles = (contextData.files_missing || []).filter(type => ['AMD', 'SMD'].includes(type));
@@ -419,7 +419,7 @@ async def revalidate(request: RevalidateRequest):
 
     try:
         parser = ModelParser()
-        context = parser.parse_files(source_files_map)
+        context = parser.parse_files(source_files_map, lazy=True)
 
         config_manager = ConfigurationManager(project_root)
         config = config_manager.load_config(request.config)
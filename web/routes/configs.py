@@ -18,8 +18,7 @@ from utils.preferences_manager import get_new_rule_default_enabled
 from utils.config_normalizer import get_production_rules, normalize_config_rules
 from utils.json_io import atomic_write_json
 from web.services.config_loader import get_dynamic_config_info
-from parser.rules_engine import RulesEngine
-from parser.config import ArcaneAuditorConfig
+from parser.rule_registry import get_rule_registry
 
 router = APIRouter()
 
@@ -59,14 +58,12 @@ def _read_config_document(path: Path) -> Dict[str, Any]:
 
 def _get_runtime_rules_list() -> list[str]:
     """
-    Instantiate RulesEngine (lightweight) and return a list of all rule class names.
+    Return a list of all rule class names from the process-wide rule registry.
     
     Returns:
         list[str]: List of rule class names discovered at runtime.
     """
-    config = ArcaneAuditorConfig()
-    engine = RulesEngine(config)
-    return [rule.__class__.__name__ for rule in engine.rules]
+    return get_rule_registry().get_rule_names()
 
 
 def _normalize_document(document: Dict[str, Any]) -> Dict[str, Any]:
@@ -144,21 +141,8 @@ def _resolve_target_directory(target: str) -> tuple[str, Path]:
 
 
 def get_rule_default_severities():
-    """Get default severities for all rules by loading them from rule classes."""
-    from parser.rules_engine import RulesEngine
-    from parser.config import ArcaneAuditorConfig
-    
-    # Create a default config to discover all rules
-    config = ArcaneAuditorConfig()
-    engine = RulesEngine(config)
-    
-    # Build a map of rule name -> default severity
-    severities = {}
-    for rule in engine.rules:
-        rule_name = rule.__class__.__name__
-        severities[rule_name] = rule.SEVERITY
-    
-    return severities
+    """Get default severities for all rules from the cached rule classes."""
+    return get_rule_registry().get_default_severities()
 
 
 @router.get("/api/configs")
@@ -39,12 +39,13 @@ from utils.arcane_paths import (
     is_frozen,
     user_root,
 )
+from utils.events import configure_events, SINKS, SINK_CONSOLE
 
 # Import routers
 from web.routes import configs, analysis, health, preferences, ai
 
 # Import services
-from web.services.jobs import cleanup_orphaned_files, cleanup_old_jobs
+from web.services.jobs import cleanup_orphaned_files, cleanup_old_jobs, set_analysis_execution
 
 # Import version from centralized module
 from __version__ import __version__
@@ -168,7 +169,10 @@ def load_web_config(cli_args=None):
         "host": "127.0.0.1",
         "port": 8080,
         "open_browser": True,
-        "log_level": "info"
+        "log_level": "info",
+        "log_sink": "console",
+        "analysis_log_level": "warning",
+        "execution": {}
     }
 
     # Determine config path based on mode
@@ -212,6 +216,8 @@ def load_web_config(cli_args=None):
             config["open_browser"] = False
         if cli_args.log_level:
             config["log_level"] = cli_args.log_level
+        if cli_args.log_sink:
+            config["log_sink"] = cli_args.log_sink
 
     return config
 
@@ -224,6 +230,7 @@ def parse_args():
     parser.add_argument("--open-browser", action="store_true", help="Open browser automatically on startup")
     parser.add_argument("--no-browser", action="store_true", help="Do not open browser automatically on startup")
     parser.add_argument("--log-level", type=str, choices=["info", "debug", "warning", "error"], help="Set logging verbosity")
+    parser.add_argument("--log-sink", type=str, choices=list(SINKS), help="Where parser and engine events go: console, jsonl or quiet (default from config or console)")
 
     return parser.parse_args()
 
@@ -236,6 +243,19 @@ def main():
     host = cfg.get("host", "127.0.0.1")
     port = cfg.get("port", 8080)
     open_browser = cfg.get("open_browser", True)
+
+    # Parser and engine events of analysis jobs go to stderr alongside the server log
+    try:
+        configure_events(cfg.get("log_sink", SINK_CONSOLE), cfg.get("analysis_log_level", "warning"))
+    except ValueError as e:
+        print(f"Invalid event settings in web config ({e}); using console warnings.")
+        configure_events(SINK_CONSOLE, "warning")
+    
+    # Executor and workers per analysis stage, over those of the analysis configurations
+    try:
+        set_analysis_execution(cfg.get("execution") or {})
+    except ValueError as e:
+        print(f"Invalid execution settings in web config ({e}); using those of each analysis configuration.")
   
     if open_browser:
         # Open browser after a short delay
@@ -255,7 +275,7 @@ def main():
         app,
         host=host,
         port=port,
-        log_level="info"
+        log_level=cfg.get("log_level", "info")
     )
 
 
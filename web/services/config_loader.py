@@ -9,30 +9,28 @@ from pathlib import Path
 from utils.arcane_paths import get_config_dirs
 from utils.preferences_manager import get_new_rule_default_enabled
 from utils.config_normalizer import get_production_rules, normalize_config_rules
-from parser.rules_engine import RulesEngine
-from parser.config import ArcaneAuditorConfig
+from parser.rule_registry import get_rule_registry
 
 
 def get_dynamic_config_info():
     """Dynamically discover configuration information from all config directories."""
     config_info = {}
     
-    # Instantiate RulesEngine once at the top to get runtime rule names
-    config = ArcaneAuditorConfig()
-    engine = RulesEngine(config)
-    runtime_rule_names = [rule.__class__.__name__ for rule in engine.rules]
+    # Read the rule metadata once from the process-wide registry (no rule imports in frozen builds)
+    rule_metadata = get_rule_registry().get_rule_metadata()
+    runtime_rule_names = [metadata.name for metadata in rule_metadata]
     
-    # Map Rule Class Name -> Rule Class (for accessing AVAILABLE_SETTINGS)
+    # Map Rule Class Name -> Rule Metadata (for accessing AVAILABLE_SETTINGS)
     # Note: normalized_rules uses class names as keys (from get_runtime_rule_names)
-    rule_class_map = {
-        type(r).__name__: type(r)
-        for r in engine.rules
+    rule_metadata_map = {
+        metadata.name: metadata
+        for metadata in rule_metadata
     }
     
     # Map Rule Class Name -> Boolean (Has Settings)
     rule_settings_map = {
-        rule_name: bool(getattr(rule_class, 'AVAILABLE_SETTINGS', {}))
-        for rule_name, rule_class in rule_class_map.items()
+        rule_name: bool(metadata.available_settings)
+        for rule_name, metadata in rule_metadata_map.items()
     }
     
     # Search in priority order: personal, teams, presets
@@ -69,10 +67,10 @@ def get_dynamic_config_info():
                 # Add supports_config flag and merge default settings with user settings
                 for rule_name, rule_config in normalized_rules.items():
                     # 1. Get the class metadata (Source of Truth for "What is possible")
-                    rule_class = rule_class_map.get(rule_name)
+                    metadata = rule_metadata_map.get(rule_name)
                     available_settings = {}
-                    if rule_class:
-                        available_settings = getattr(rule_class, 'AVAILABLE_SETTINGS', {})
+                    if metadata:
+                        available_settings = metadata.available_settings or {}
                     
                     # 2. Build the Defaults Dictionary
                     defaults = {
@@ -95,7 +93,7 @@ def get_dynamic_config_info():
                     normalized_rules[rule_name]['settings_schema'] = available_settings
                     
                     # 7. Inject documentation for UI Grimoire
-                    documentation = getattr(rule_class, 'DOCUMENTATION', {}) if rule_class else {}
+                    documentation = metadata.documentation if metadata else {}
                     normalized_rules[rule_name]['documentation'] = documentation
                     
                     # Add supports_config flag
@@ -4,16 +4,36 @@ Job management service for Arcane Auditor.
 Handles analysis job creation, execution, and cleanup.
 """
 
-import sys
 import threading
 import time
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
+
+from utils.events import get_logger
+
+log = get_logger(__name__)
 
 # Global job management for async analysis
 analysis_jobs: Dict[str, 'AnalysisJob'] = {}
 job_lock = threading.Lock()
 
+# Per-stage execution settings from the web service config ("execution"); they take
+# precedence over the execution section of the analysis configuration a job uses
+analysis_execution: Dict[str, Dict[str, Any]] = {}
+
+
+def set_analysis_execution(overrides: Dict[str, Dict[str, Any]]):
+    """
+    Set the execution settings analysis jobs run with, e.g. {"rules": {"executor": "process"}}.
+    
+    Raises:
+        ValueError: If a stage or setting is unknown or invalid
+    """
+    from parser.config import ExecutionConfig
+    ExecutionConfig().with_overrides(overrides)
+    analysis_execution.clear()
+    analysis_execution.update(overrides)
+
 
 class AnalysisJob:
     """Represents an analysis job with status tracking."""
@@ -30,6 +50,7 @@ class AnalysisJob:
         self.thread = None
         self.is_zip = True  # True for ZIP files, False for individual files
         self.individual_files = []  # List of Path objects for individual files
+        self.findings_found = 0  # Findings streamed so far while the job is running
     
     def to_dict(self):
         """Convert job to dictionary for JSON serialization."""
@@ -40,6 +61,7 @@ class AnalysisJob:
             "error": self.error,
             "start_time": self.start_time,
             "end_time": self.end_time,
+            "findings_found": self.findings_found,
             "config": self.config
         }
 
@@ -60,13 +82,13 @@ def cleanup_orphaned_files():
                 try:
                     file_path.unlink()
                     files_deleted += 1
-                    print(f"Cleaned up orphaned file: {file_path.name} (age: {file_age/60:.1f} minutes)")
+                    log.info("Cleaned up orphaned file: %s (age: %.1f minutes)", file_path.name, file_age / 60)
                 except Exception as e:
-                    print(f"Failed to clean up {file_path.name}: {e}")
+                    log.warning("Failed to clean up %s: %s", file_path.name, e)
             else:
-                print(f"Keeping file: {file_path.name} (age: {file_age/60:.1f} minutes)")
+                log.debug("Keeping file: %s (age: %.1f minutes)", file_path.name, file_age / 60)
         
-        print(f"Cleanup summary: {files_found} files found, {files_deleted} files deleted")
+        log.info("Cleanup summary: %d files found, %d files deleted", files_found, files_deleted)
 
 
 def cleanup_old_jobs():
@@ -84,12 +106,12 @@ def cleanup_old_jobs():
             # Clean up any remaining temporary files
             if job.is_zip and job.zip_path and job.zip_path.exists():
                 job.zip_path.unlink()
-                print(f"Cleaned up remaining ZIP file: {job.zip_path.name}")
+                log.debug("Cleaned up remaining ZIP file: %s", job.zip_path.name)
             elif not job.is_zip and job.individual_files:
                 for file_path in job.individual_files:
                     if file_path.exists():
                         file_path.unlink()
-                        print(f"Cleaned up remaining file: {file_path.name}")
+                        log.debug("Cleaned up remaining file: %s", file_path.name)
 
 
 def extract_snippet(source_map: dict, file_path: str, line: int, context_lines: int | None = None) -> dict | None:
@@ -126,22 +148,17 @@ def extract_snippet(source_map: dict, file_path: str, line: int, context_lines:
 
 
 def build_source_map(context) -> dict:
-    """Build a file_path -> lines mapping from all models in a ProjectContext."""
+    """
+    Build a file_path -> lines mapping from all models in a ProjectContext.
+
+    Only models that have been parsed are included; file types that no rule read
+    are not parsed just to build the map.
+    """
     source_map = {}
-    for pmd in context.pmds.values():
-        if pmd.source_content and pmd.file_path:
-            source_map[pmd.file_path] = pmd.source_content.split('\n')
-    for pod in context.pods.values():
-        if pod.source_content and pod.file_path:
-            source_map[pod.file_path] = pod.source_content.split('\n')
-    for script in context.scripts.values():
-        content = getattr(script, 'source_content', None) or getattr(script, 'source', None)
-        if content and script.file_path:
-            source_map[script.file_path] = content.split('\n')
-    if context.amd and hasattr(context.amd, 'source_content') and context.amd.source_content:
-        source_map[context.amd.file_path] = context.amd.source_content.split('\n')
-    if context.smd and hasattr(context.smd, 'source_content') and context.smd.source_content:
-        source_map[context.smd.file_path] = context.smd.source_content.split('\n')
+    for model in context.loaded_models():
+        content = getattr(model, 'source_content', None) or getattr(model, 'source', None)
+        if content and getattr(model, 'file_path', None):
+            source_map[model.file_path] = content.split('\n')
     return source_map
 
 
@@ -155,11 +172,24 @@ def run_analysis_background(job: AnalysisJob):
         from file_processing.processor import FileProcessor
         from parser.app_parser import ModelParser
         from parser.rules_engine import RulesEngine
+        from parser.rules.base import sort_findings
         from parser.config_manager import ConfigurationManager
 
+        # Load the configuration first: it decides how files are read and parsed, and
+        # whether they are parsed up front
+        config_start = time.time()
+        project_root = Path(__file__).parent.parent.parent
+        config_manager = ConfigurationManager(project_root)
+        config = config_manager.load_config(job.config)
+        config.execution = config.execution.with_overrides(analysis_execution)
+        rules_engine = RulesEngine(config)
+        config_time = time.time() - config_start
+
         # Process files based on job type
         file_processing_start = time.time()
-        processor = FileProcessor()
+        ingestion = config.execution.ingestion
+        processor = FileProcessor(executor=ingestion.executor, workers=ingestion.workers,
+                                  bytes_per_worker=ingestion.bytes_per_worker)
 
         if job.is_zip:
             # ZIP file mode
@@ -168,7 +198,7 @@ def run_analysis_background(job: AnalysisJob):
             # Delete ZIP file immediately after successful processing
             if job.zip_path and job.zip_path.exists():
                 job.zip_path.unlink()
-                print(f"Deleted processed ZIP file: {job.zip_path.name}")
+                log.debug("Deleted processed ZIP file: %s", job.zip_path.name)
         else:
             # Individual files mode
             source_files_map = processor.process_individual_files(job.individual_files)
@@ -177,7 +207,7 @@ def run_analysis_background(job: AnalysisJob):
             for file_path in job.individual_files:
                 if file_path.exists():
                     file_path.unlink()
-                    print(f"Deleted processed file: {file_path.name}")
+                    log.debug("Deleted processed file: %s", file_path.name)
 
         file_processing_time = time.time() - file_processing_start
 
@@ -187,35 +217,53 @@ def run_analysis_background(job: AnalysisJob):
             job.end_time = time.time()
             return
 
-        # Create project context
-        parsing_start = time.time()
-        parser = ModelParser()
-        context = parser.parse_files(source_files_map)
-        parsing_time = time.time() - parsing_start
-
-        # Run analysis with specified configuration
-        config_start = time.time()
-        project_root = Path(__file__).parent.parent.parent
-        config_manager = ConfigurationManager(project_root)
-        config = config_manager.load_config(job.config)
-        rules_engine = RulesEngine(config)
-        config_time = time.time() - config_start
-
-        analysis_start = time.time()
-        findings = rules_engine.run(context)
-        analysis_time = time.time() - analysis_start
+        parser = ModelParser(config.execution.parsing)
+        snippets = {}
+        if config.low_memory_mode:
+            # Parse and analyze file by file; snippets are extracted before each file is released
+            def collect_snippets(file_path, file_findings, file_context):
+                file_source_map = build_source_map(file_context)
+                for finding in file_findings:
+                    snippets[id(finding)] = extract_snippet(file_source_map, finding.file_path, finding.line)
+                job.findings_found += len(file_findings)
+
+            parsing_time = 0.0
+            analysis_start = time.time()
+            findings, context = rules_engine.run_file_major(source_files_map, parser, collect_snippets)
+            parsing_time = context.parse_time
+            analysis_time = max(0.0, time.time() - analysis_start - parsing_time)
+        else:
+            # Create project context
+            parsing_start = time.time()
+            context = parser.parse_files(source_files_map, lazy=True)
+            parsing_time = time.time() - parsing_start
+
+            analysis_start = time.time()
+            # Stream findings so the job status reports progress while rules run
+            findings = []
+            for finding in rules_engine.run_iter(context):
+                findings.append(finding)
+                job.findings_found = len(findings)
+            findings = sort_findings(findings)
+            job.findings_found = len(findings)
+            # Files are parsed on first use, while the rules run
+            parsing_time += context.parse_time
+            analysis_time = max(0.0, time.time() - analysis_start - context.parse_time)
+
+            # Build source content map for snippet extraction
+            source_map = build_source_map(context)
+            for finding in findings:
+                if finding.file_path not in source_map and finding.file_path in source_files_map:
+                    # Files answered from the findings cache were never parsed
+                    source_map[finding.file_path] = source_files_map[finding.file_path].content.split('\n')
+                snippets[id(finding)] = extract_snippet(source_map, finding.file_path, finding.line)
 
         # Log performance metrics
         total_time = time.time() - job.start_time
-        print(f"Performance metrics for job {job.job_id}:")
-        print(f"  File processing: {file_processing_time:.2f}s")
-        print(f"  Parsing: {parsing_time:.2f}s")
-        print(f"  Config loading: {config_time:.2f}s")
-        print(f"  Analysis: {analysis_time:.2f}s")
-        print(f"  Total: {total_time:.2f}s")
-
-        # Build source content map for snippet extraction
-        source_map = build_source_map(context)
+        log.info("Performance metrics for job %s: file processing %.2fs, parsing %.2fs, "
+                 "config loading %.2fs, analysis %.2fs, total %.2fs",
+                 job.job_id, file_processing_time, parsing_time, config_time, analysis_time, total_time,
+                 extra={"event": "job_metrics", "job_id": job.job_id, "total_time": round(total_time, 3)})
 
         # Convert findings to serializable format
         result = {
@@ -227,7 +275,7 @@ def run_analysis_background(job: AnalysisJob):
                     "message": finding.message,
                     "file_path": finding.file_path,
                     "line": finding.line,
-                    "snippet": extract_snippet(source_map, finding.file_path, finding.line),
+                    "snippet": snippets.get(id(finding)),
                 }
                 for finding in findings
             ],
@@ -243,6 +291,10 @@ def run_analysis_background(job: AnalysisJob):
             "config_source": job.config_source
         }
 
+        # Per-rule cost profile when the configuration enables profile_rules
+        if rules_engine.profiler is not None:
+            result["profile"] = rules_engine.profiler.to_dict()
+
         # Add context awareness information if available
         if context.analysis_context:
             result["context"] = context.analysis_context.to_dict()
@@ -255,5 +307,5 @@ def run_analysis_background(job: AnalysisJob):
         job.error = str(e)
         job.status = "failed"
         job.end_time = time.time()
-        print(f"Analysis failed: {e}", file=sys.stderr)
+        log.error("Analysis failed: %s", e)
 